@@ -4,7 +4,9 @@ from typing import Any
 
 from web3 import Web3
 
+from ...names import namehash
 from ...network import Network
+from ...tokens import format_units
 from ...wallet_providers import EvmWalletProvider
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
@@ -17,7 +19,8 @@ from .constants import (
     REGISTRAR_ABI,
     REGISTRATION_DURATION,
 )
-from .schemas import RegisterBasenameSchema
+from .registrar import quote_basenames
+from .schemas import CheckBasenamesSchema, RegisterBasenameSchema
 
 
 class BasenameActionProvider(ActionProvider[EvmWalletProvider]):
@@ -27,13 +30,71 @@ class BasenameActionProvider(ActionProvider[EvmWalletProvider]):
         """Initialize the Basename action provider."""
         super().__init__("basename", [])
 
+    @staticmethod
+    def _suffix(wallet_provider: EvmWalletProvider) -> tuple[bool, str]:
+        is_mainnet = wallet_provider.get_network().network_id == "base-mainnet"
+        return is_mainnet, ".base.eth" if is_mainnet else ".basetest.eth"
+
+    @staticmethod
+    def _registrar_address(is_mainnet: bool) -> str:
+        return Web3.to_checksum_address(
+            BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_MAINNET
+            if is_mainnet
+            else BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_TESTNET
+        )
+
+    @create_action(
+        name="check_basename_availability",
+        description="""
+This tool will check whether Basenames can be registered and what registering each costs, without sending a transaction.
+It takes a list of candidate Basenames and checks all of them at once.
+When your network ID is 'base-mainnet' (also sometimes known simply as 'base'), the names end with .base.eth, and when your network ID is 'base-sepolia', they end with .basetest.eth.
+Use this before register_basename, and pass several candidates to find an available name in one step.
+""",
+        schema=CheckBasenamesSchema,
+    )
+    def check_basename_availability(
+        self, wallet_provider: EvmWalletProvider, args: dict[str, Any]
+    ) -> str:
+        """Check the availability and price of candidate Basenames.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        try:
+            is_mainnet, suffix = self._suffix(wallet_provider)
+            labels = [basename.removesuffix(suffix) for basename in args["basenames"]]
+
+            quotes = quote_basenames(wallet_provider, self._registrar_address(is_mainnet), labels)
+
+            lines = []
+            for quote in quotes:
+                if not quote.available:
+                    lines.append(f"{quote.label}{suffix}: already registered")
+                elif quote.price is None:
+                    lines.append(f"{quote.label}{suffix}: available, price unavailable")
+                else:
+                    lines.append(
+                        f"{quote.label}{suffix}: available for "
+                        f"{format_units(quote.price, 18)} ETH per year"
+                    )
+            return "\n".join(lines)
+        except Exception as e:
+            return f"Error checking basenames: {e!s}"
+
     @create_action(
         name="register_basename",
         description="""
 This tool will register a Basename for the agent. The agent should have a wallet associated to register a Basename.
 When your network ID is 'base-mainnet' (also sometimes known simply as 'base'), the name must end with .base.eth, and when your network ID is 'base-sepolia', it must ends with .basetest.eth.
-Do not suggest any alternatives and never try to register a Basename with another postfix. The prefix of the name must be unique so if the registration of the
-Basename fails, you should prompt to try again with a more unique name.
+Do not suggest any alternatives and never try to register a Basename with another postfix.
+The name's availability and price are checked before sending, and exactly the registration price is paid. If the name is already registered, nothing is sent;
+use check_basename_availability with several more unique candidates to find an available name.
 """,
         schema=RegisterBasenameSchema,
     )
@@ -50,26 +111,38 @@ Basename fails, you should prompt to try again with a more unique name.
         """
         try:
             address = Web3.to_checksum_address(wallet_provider.get_address())
-            is_mainnet = wallet_provider.get_network().network_id == "base-mainnet"
+            is_mainnet, suffix = self._suffix(wallet_provider)
 
-            suffix = ".base.eth" if is_mainnet else ".basetest.eth"
             if not args["basename"].endswith(suffix):
                 args["basename"] += suffix
 
             l2_resolver_address = Web3.to_checksum_address(
                 L2_RESOLVER_ADDRESS_MAINNET if is_mainnet else L2_RESOLVER_ADDRESS_TESTNET
             )
-            contract_address = Web3.to_checksum_address(
-                BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_MAINNET
-                if is_mainnet
-                else BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_TESTNET
+            contract_address = self._registrar_address(is_mainnet)
+
+            # Check the name first, so a taken name or a low amount never costs a reverted tx
+            (quote,) = quote_basenames(
+                wallet_provider, contract_address, [args["basename"].removesuffix(suffix)]
             )
+            if not quote.available:
+                return f"Error registering basename: {args['basename']} is already registered"
+            if quote.price is None:
+                return f"Error registering basename: could not get the price of {args['basename']}"
+            if (
+                args.get("amount") is not None
+                and Web3.to_wei(args["amount"], "ether") < quote.price
+            ):
+                return (
+                    f"Error registering basename: {args['basename']} costs "
+                    f"{format_units(quote.price, 18)} ETH, more than {args['amount']} ETH"
+                )
 
             w3 = Web3()
             resolver_contract = w3.eth.contract(abi=L2_RESOLVER_ABI)
             registrar_contract = w3.eth.contract(abi=REGISTRAR_ABI)
 
-            name_hash = w3.ens.namehash(args["basename"])
+            name_hash = namehash(args["basename"])
 
             address_data = resolver_contract.encode_abi("setAddr", args=[name_hash, address])
             name_data = resolver_contract.encode_abi("setName", args=[name_hash, args["basename"]])
@@ -89,7 +162,7 @@ Basename fails, you should prompt to try again with a more unique name.
                 {
                     "to": contract_address,
                     "data": data,
-                    "value": Web3.to_wei(args["amount"], "ether"),
+                    "value": quote.price,
                 }
             )
 
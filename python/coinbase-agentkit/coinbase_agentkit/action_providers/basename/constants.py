@@ -54,5 +54,22 @@ REGISTRAR_ABI = [
         "outputs": [],
         "stateMutability": "payable",
         "type": "function",
-    }
+    },
+    {
+        "inputs": [{"internalType": "string", "name": "name", "type": "string"}],
+        "name": "available",
+        "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "string", "name": "name", "type": "string"},
+            {"internalType": "uint256", "name": "duration", "type": "uint256"},
+        ],
+        "name": "registerPrice",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
 ]
@@ -0,0 +1,63 @@
+"""Pre-flight reads of the Basenames registrar controller."""
+
+from dataclasses import dataclass
+
+from ...multicall import Call, multicall
+from ...wallet_providers import EvmWalletProvider
+from .constants import REGISTRAR_ABI, REGISTRATION_DURATION
+
+
+@dataclass(frozen=True)
+class BasenameQuote:
+    """Whether a Basename can be registered and what registering it costs."""
+
+    label: str
+    available: bool
+    price: int | None
+
+
+def quote_basenames(
+    wallet_provider: EvmWalletProvider,
+    registrar_address: str,
+    labels: list[str],
+    duration: int = int(REGISTRATION_DURATION),
+) -> list[BasenameQuote]:
+    """Check the availability and registration price of several Basenames at once.
+
+    ``available`` and ``registerPrice`` of every label are read in one multicall.
+
+    Args:
+        wallet_provider (EvmWalletProvider): The wallet provider used for reads.
+        registrar_address (str): The registrar controller address.
+        labels (list[str]): The names to check, without the Basename suffix.
+        duration (int): The registration duration in seconds.
+
+    Returns:
+        list[BasenameQuote]: One quote per label, in the same order. The price is None
+            if it could not be read, e.g. for a name that is too short.
+
+    Raises:
+        Exception: If the availability of a name could not be read.
+
+    """
+    results = multicall(
+        wallet_provider,
+        [
+            call
+            for label in labels
+            for call in (
+                Call(registrar_address, REGISTRAR_ABI, "available", (label,)),
+                Call(registrar_address, REGISTRAR_ABI, "registerPrice", (label, duration)),
+            )
+        ],
+    )
+
+    quotes = []
+    for i, label in enumerate(labels):
+        available, price = results[2 * i : 2 * i + 2]
+        if not available.success:
+            raise Exception(f"Failed to check availability of {label}: {available.error}")
+        quotes.append(
+            BasenameQuote(label, bool(available.value), price.value if price.success else None)
+        )
+    return quotes
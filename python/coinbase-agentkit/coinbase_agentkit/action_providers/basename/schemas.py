@@ -10,6 +10,17 @@ class RegisterBasenameSchema(BaseModel):
         ...,
         description="The Basename to assign to the agent (e.g., `example.base.eth` or `example.basetest.eth`)",
     )
-    amount: str = Field(
-        ..., description="The amount of Eth to pay for registration. The default is set to 0.002."
+    amount: str | None = Field(
+        None,
+        description="The maximum amount of Eth to pay for registration. Defaults to the registration price.",
+    )
+
+
+class CheckBasenamesSchema(BaseModel):
+    """Input argument schema for checking Basenames before registering one."""
+
+    basenames: list[str] = Field(
+        ...,
+        min_length=1,
+        description="The candidate Basenames to check (e.g., `example.base.eth` or `example`)",
     )
@@ -3,8 +3,9 @@
 import os
 from typing import Any
 
-from cdp import Cdp, ExternalAddress
+from cdp import ExternalAddress
 
+from ...cdp_client import configure_cdp
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
 from ...wallet_providers.cdp_wallet_provider import CdpProviderConfig
@@ -31,13 +32,7 @@ class CdpApiActionProvider(ActionProvider[EvmWalletProvider]):
                 config.api_key_private_key if config else os.getenv("CDP_API_KEY_PRIVATE_KEY")
             )
 
-            if api_key_name and api_key_private_key:
-                Cdp.configure(
-                    api_key_name=api_key_name,
-                    private_key=api_key_private_key.replace("\\n", "\n"),
-                )
-            else:
-                Cdp.configure_from_json()
+            configure_cdp(api_key_name, api_key_private_key)
         except Exception as e:
             raise ValueError(f"Failed to initialize CDP client: {e!s}") from e
 
@@ -37,4 +37,98 @@ ERC20_ABI = [
             },
         ],
     },
+    {
+        "type": "function",
+        "name": "decimals",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [
+            {
+                "type": "uint8",
+            },
+        ],
+    },
+    {
+        "type": "function",
+        "name": "symbol",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [
+            {
+                "type": "string",
+            },
+        ],
+    },
+    {
+        "type": "function",
+        "name": "allowance",
+        "stateMutability": "view",
+        "inputs": [
+            {
+                "name": "owner",
+                "type": "address",
+            },
+            {
+                "name": "spender",
+                "type": "address",
+            },
+        ],
+        "outputs": [
+            {
+                "type": "uint256",
+            },
+        ],
+    },
+    {
+        "type": "function",
+        "name": "approve",
+        "stateMutability": "nonpayable",
+        "inputs": [
+            {
+                "name": "spender",
+                "type": "address",
+            },
+            {
+                "name": "amount",
+                "type": "uint256",
+            },
+        ],
+        "outputs": [
+            {
+                "type": "bool",
+            },
+        ],
+    },
 ]
+
+# Disperse (disperse.app) contract addresses by chain ID. Only chains where the
+# deployment address is verified are listed; other chains use pipelined transfers.
+DISPERSE_ADDRESSES = {
+    "1": "0xD152f549545093347A162Dce210e7293f1452150",
+}
+
+DISPERSE_ABI = [
+    {
+        "type": "function",
+        "name": "disperseToken",
+        "stateMutability": "nonpayable",
+        "inputs": [
+            {
+                "name": "token",
+                "type": "address",
+            },
+            {
+                "name": "recipients",
+                "type": "address[]",
+            },
+            {
+                "name": "values",
+                "type": "uint256[]",
+            },
+        ],
+        "outputs": [],
+    },
+]
+
+# Maximum number of recipients per disperse transaction, to stay well under block gas limits
+MAX_RECIPIENTS_PER_DISPERSE = 200
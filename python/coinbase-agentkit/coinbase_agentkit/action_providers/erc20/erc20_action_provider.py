@@ -4,20 +4,41 @@ from typing import Any
 
 from web3 import Web3
 
+from ...multicall import Call, get_function_codec, multicall
+from ...names import resolve_address, resolve_addresses
 from ...network import Network
+from ...tokens import TokenRegistry
 from ...wallet_providers import EvmWalletProvider
+from ...wallet_providers.transaction_batch import send_transactions
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
-from .constants import ERC20_ABI
-from .schemas import GetBalanceSchema, TransferSchema
+from .constants import (
+    DISPERSE_ABI,
+    DISPERSE_ADDRESSES,
+    ERC20_ABI,
+    MAX_RECIPIENTS_PER_DISPERSE,
+)
+from .schemas import (
+    BatchTransferSchema,
+    GetBalanceSchema,
+    GetBalancesSchema,
+    TransferSchema,
+)
 
 
 class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
     """Action provider for ERC20 tokens."""
 
-    def __init__(self) -> None:
-        """Initialize the ERC20 action provider."""
+    def __init__(self, token_registry: TokenRegistry | None = None) -> None:
+        """Initialize the ERC20 action provider.
+
+        Args:
+            token_registry (TokenRegistry | None): Registry used to resolve token symbols and
+                decimals. Defaults to a registry persisted in the AgentKit cache directory.
+
+        """
         super().__init__("erc20", [])
+        self.token_registry = token_registry or TokenRegistry()
 
     @create_action(
         name="get_balance",
@@ -47,10 +68,93 @@ class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
                 args=[wallet_provider.get_address()],
             )
 
-            return f"Balance of {validated_args.contract_address} is {balance}"
+            try:
+                token = self.token_registry.resolve(
+                    wallet_provider, [validated_args.contract_address]
+                )[validated_args.contract_address]
+            except Exception:
+                token = None
+
+            if token is None:
+                return f"Balance of {validated_args.contract_address} is {balance}"
+
+            return (
+                f"Balance of {validated_args.contract_address} is {balance} "
+                f"({token.format_amount(balance)} {token.symbol})"
+            )
         except Exception as e:
             return f"Error getting balance: {e!s}"
 
+    @create_action(
+        name="get_balances",
+        description="""
+        This tool will get the balances of several ERC20 assets in one request. It takes the following inputs:
+        - contract_addresses: The contract addresses of the tokens
+        - holders: Optional addresses to get the balances of. Defaults to the wallet's address
+
+        Balances are returned in whole token units, e.g. 1.5 rather than 1500000 for USDC.
+        """,
+        schema=GetBalancesSchema,
+    )
+    def get_balances(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Get the balances of several ERC20 tokens for one or more holders.
+
+        Balances and the metadata of tokens missing from the token registry are read in
+        a single multicall.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        try:
+            validated_args = GetBalancesSchema(**args)
+
+            tokens = [Web3.to_checksum_address(a) for a in validated_args.contract_addresses]
+            holders = [
+                Web3.to_checksum_address(a)
+                for a in (validated_args.holders or [wallet_provider.get_address()])
+            ]
+
+            chain_id = wallet_provider.get_network().chain_id
+            metadata = {token: self.token_registry.get(chain_id, token) for token in tokens}
+            unknown = [token for token, token_metadata in metadata.items() if not token_metadata]
+
+            calls = [call for token in unknown for call in TokenRegistry.metadata_calls(token)]
+            calls.extend(
+                Call(token, ERC20_ABI, "balanceOf", (holder,))
+                for token in tokens
+                for holder in holders
+            )
+
+            results = multicall(wallet_provider, calls)
+            for i, token in enumerate(unknown):
+                metadata[token] = self.token_registry.from_results(
+                    chain_id, token, results[i * 3 : i * 3 + 3]
+                )
+            balances = iter(results[len(unknown) * 3 :])
+
+            rows = ["token | holder | balance"]
+            for token in tokens:
+                token_metadata = metadata[token]
+                label = f"{token_metadata.symbol} ({token})" if token_metadata else token
+                for holder in holders:
+                    balance = next(balances)
+                    if not balance.success:
+                        amount = f"error: {balance.error}"
+                    elif token_metadata:
+                        amount = token_metadata.format_amount(balance.value)
+                    else:
+                        amount = f"{balance.value} (raw, decimals unknown)"
+                    rows.append(f"{label} | {holder} | {amount}")
+
+            return "Balances:\n" + "\n".join(rows)
+        except Exception as e:
+            return f"Error getting balances: {e!s}"
+
     @create_action(
         name="transfer",
         description="""
@@ -80,11 +184,10 @@ class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
         """
         try:
             validated_args = TransferSchema(**args)
+            destination = resolve_address(wallet_provider, validated_args.destination)
 
             contract = Web3().eth.contract(address=validated_args.contract_address, abi=ERC20_ABI)
-            data = contract.encode_abi(
-                "transfer", [validated_args.destination, int(validated_args.amount)]
-            )
+            data = contract.encode_abi("transfer", [destination, int(validated_args.amount)])
 
             tx_hash = wallet_provider.send_transaction(
                 {
@@ -97,12 +200,178 @@ class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
 
             return (
                 f"Transferred {validated_args.amount} of {validated_args.contract_address} "
-                f"to {validated_args.destination}.\n"
+                f"to {destination}.\n"
                 f"Transaction hash for the transfer: {tx_hash}"
             )
         except Exception as e:
             return f"Error transferring the asset: {e!s}"
 
+    @create_action(
+        name="batch_transfer",
+        description="""
+        This tool will transfer an ERC20 token from the wallet to many onchain addresses at once.
+
+        It takes the following inputs:
+        - contract_address: The contract address of the token to transfer
+        - transfers: A list of transfers, each with a destination and an amount in wei
+
+        Important notes:
+        - Use this instead of calling transfer repeatedly when paying several destinations
+        - Ensure sufficient balance of the token for the sum of all amounts, and of the native asset for gas
+        """,
+        schema=BatchTransferSchema,
+    )
+    def batch_transfer(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Transfer ERC20 tokens to many destination addresses.
+
+        Where a Disperse contract is known for the chain, the token is approved once if
+        needed and sent to every destination in one transaction per chunk of recipients.
+        Otherwise the transfers are estimated in one batched request and sent back to back
+        with locally tracked nonces, without waiting for each one to be mined.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        try:
+            validated_args = BatchTransferSchema(**args)
+
+            token = Web3.to_checksum_address(validated_args.contract_address)
+            destinations = resolve_addresses(
+                wallet_provider, [transfer.destination for transfer in validated_args.transfers]
+            )
+            transfers = [
+                (destination, int(transfer.amount))
+                for destination, transfer in zip(
+                    destinations, validated_args.transfers, strict=True
+                )
+            ]
+            total = sum(amount for _, amount in transfers)
+
+            owner = wallet_provider.get_address()
+            disperse_address = (
+                DISPERSE_ADDRESSES.get(wallet_provider.get_network().chain_id)
+                if len(transfers) > 1
+                else None
+            )
+
+            calls = [Call(token, ERC20_ABI, "balanceOf", (owner,))]
+            if disperse_address:
+                calls.append(Call(token, ERC20_ABI, "allowance", (owner, disperse_address)))
+            results = multicall(wallet_provider, calls)
+
+            balance = results[0]
+            if balance.success and balance.value < total:
+                return (
+                    f"Error batch transferring the asset: insufficient balance of {token}, "
+                    f"have {balance.value} but the transfers total {total}"
+                )
+
+            if disperse_address:
+                allowance = results[1].value if results[1].success else 0
+                lines = self._disperse_transfers(
+                    wallet_provider, token, transfers, disperse_address, allowance
+                )
+            else:
+                lines = self._pipelined_transfers(wallet_provider, token, transfers)
+
+            header = f"Batch transfer of {total} of {token} to {len(transfers)} destinations:"
+            return "\n".join([header, *lines])
+        except Exception as e:
+            return f"Error batch transferring the asset: {e!s}"
+
+    def _disperse_transfers(
+        self,
+        wallet_provider: EvmWalletProvider,
+        token: str,
+        transfers: list[tuple[str, int]],
+        disperse_address: str,
+        allowance: int,
+    ) -> list[str]:
+        """Send transfers through the Disperse contract, approving it first if needed.
+
+        A partial allowance is reset to zero before approving the total, since tokens
+        such as USDT revert on changing a non-zero allowance to another non-zero value.
+        If sending a chunk fails, the chunks already sent are still reported.
+        """
+        lines = []
+        total = sum(amount for _, amount in transfers)
+
+        if allowance < total:
+            approve_codec = get_function_codec(ERC20_ABI, "approve")
+            amounts = [0, total] if allowance > 0 else [total]
+            for amount in amounts:
+                approve_hash = wallet_provider.send_transaction(
+                    {
+                        "to": token,
+                        "data": Web3.to_hex(approve_codec.encode([disperse_address, amount])),
+                    }
+                )
+                receipt = wallet_provider.wait_for_transaction_receipt(approve_hash)
+                if receipt.get("status") == 0:
+                    raise Exception(f"Approval of {disperse_address} failed: {approve_hash}")
+                lines.append(f"Approved {amount} for {disperse_address}: {approve_hash}")
+
+        disperse_codec = get_function_codec(DISPERSE_ABI, "disperseToken")
+        chunks = [
+            transfers[i : i + MAX_RECIPIENTS_PER_DISPERSE]
+            for i in range(0, len(transfers), MAX_RECIPIENTS_PER_DISPERSE)
+        ]
+
+        tx_hashes = []
+        send_error = None
+        for chunk in chunks:
+            data = disperse_codec.encode(
+                [token, [destination for destination, _ in chunk], [amount for _, amount in chunk]]
+            )
+            try:
+                tx_hashes.append(
+                    wallet_provider.send_transaction(
+                        {"to": disperse_address, "data": Web3.to_hex(data)}
+                    )
+                )
+            except Exception as e:
+                send_error = e
+                break
+
+        for chunk, tx_hash in zip(chunks, tx_hashes, strict=False):
+            try:
+                receipt = wallet_provider.wait_for_transaction_receipt(tx_hash)
+                status = "failed" if receipt.get("status") == 0 else "success"
+            except Exception as e:
+                status = f"error waiting for receipt: {e!s}"
+            lines.append(f"Dispersed to {len(chunk)} destinations ({status}): {tx_hash}")
+
+        if send_error is not None:
+            failed_chunk, *unsent_chunks = chunks[len(tx_hashes) :]
+            lines.append(f"Error dispersing to {len(failed_chunk)} destinations: {send_error!s}")
+            if unsent_chunks:
+                unsent = sum(len(chunk) for chunk in unsent_chunks)
+                lines.append(f"Not sent to the remaining {unsent} destinations")
+
+        return lines
+
+    def _pipelined_transfers(
+        self, wallet_provider: EvmWalletProvider, token: str, transfers: list[tuple[str, int]]
+    ) -> list[str]:
+        """Send one transfer per destination without waiting between transactions."""
+        transfer_codec = get_function_codec(ERC20_ABI, "transfer")
+        transactions = [
+            {"to": token, "data": Web3.to_hex(transfer_codec.encode([destination, amount]))}
+            for destination, amount in transfers
+        ]
+
+        result = send_transactions(wallet_provider, transactions)
+
+        return [
+            f"{destination} | {amount} | {outcome.describe()}"
+            for (destination, amount), outcome in zip(transfers, result.outcomes, strict=True)
+        ]
+
     def supports_network(self, network: Network) -> bool:
         """Check if the network is supported by this action provider.
 
@@ -116,11 +385,14 @@ class ERC20ActionProvider(ActionProvider[EvmWalletProvider]):
         return network.protocol_family == "evm"
 
 
-def erc20_action_provider() -> ERC20ActionProvider:
+def erc20_action_provider(token_registry: TokenRegistry | None = None) -> ERC20ActionProvider:
     """Create a new instance of the ERC20 action provider.
 
+    Args:
+        token_registry (TokenRegistry | None): Registry used to resolve token symbols and decimals.
+
     Returns:
         A new ERC20 action provider instance.
 
     """
-    return ERC20ActionProvider()
+    return ERC20ActionProvider(token_registry)
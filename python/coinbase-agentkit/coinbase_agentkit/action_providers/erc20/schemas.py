@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel, Field, field_validator
 
+from ...validators.eth import validate_eth_address_or_name
 from .validators import wei_amount_validator
 
 
@@ -14,6 +15,20 @@ class GetBalanceSchema(BaseModel):
     )
 
 
+class GetBalancesSchema(BaseModel):
+    """Schema for getting the balances of several ERC20 tokens."""
+
+    contract_addresses: list[str] = Field(
+        ...,
+        min_length=1,
+        description="The contract addresses of the tokens to get the balances for",
+    )
+    holders: list[str] | None = Field(
+        None,
+        description="The addresses to get the balances of, defaults to the wallet's address",
+    )
+
+
 class TransferSchema(BaseModel):
     """Schema for transferring ERC20 tokens."""
 
@@ -26,3 +41,39 @@ class TransferSchema(BaseModel):
     def validate_wei_amount(cls, v: str) -> str:
         """Validate wei amount."""
         return wei_amount_validator(v)
+
+    @field_validator("destination")
+    @classmethod
+    def validate_destination(cls, v: str) -> str:
+        """Validate the destination address or name."""
+        return validate_eth_address_or_name(v)
+
+
+class BatchTransferItem(BaseModel):
+    """A single transfer in a batch transfer."""
+
+    destination: str = Field(description="The destination to transfer the funds")
+    amount: str = Field(description="The amount of the asset to transfer in wei")
+
+    @field_validator("amount")
+    @classmethod
+    def validate_wei_amount(cls, v: str) -> str:
+        """Validate wei amount."""
+        return wei_amount_validator(v)
+
+    @field_validator("destination")
+    @classmethod
+    def validate_destination(cls, v: str) -> str:
+        """Validate the destination address or name."""
+        return validate_eth_address_or_name(v)
+
+
+class BatchTransferSchema(BaseModel):
+    """Schema for transferring ERC20 tokens to many destinations."""
+
+    contract_address: str = Field(description="The contract address of the token to transfer")
+    transfers: list[BatchTransferItem] = Field(
+        ...,
+        min_length=1,
+        description="The destinations and amounts in wei to transfer",
+    )
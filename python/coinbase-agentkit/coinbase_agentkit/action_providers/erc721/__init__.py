@@ -1,5 +1,7 @@
 """ERC721 action provider for NFT interactions."""
 
 from .erc721_action_provider import Erc721ActionProvider, erc721_action_provider
+from .indexer import Erc721Indexer
+from .reader import Erc721Reader
 
-__all__ = ["Erc721ActionProvider", "erc721_action_provider"]
+__all__ = ["Erc721ActionProvider", "Erc721Indexer", "Erc721Reader", "erc721_action_provider"]
@@ -1,5 +1,8 @@
 """Constants for ERC721 action provider."""
 
+# keccak256("Transfer(address,address,uint256)")
+TRANSFER_EVENT_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
 ERC721_ABI = [
     {
         "inputs": [
@@ -144,6 +147,25 @@ ERC721_ABI = [
         "stateMutability": "view",
         "type": "function",
     },
+    {
+        "inputs": [
+            {
+                "internalType": "uint256",
+                "name": "tokenId",
+                "type": "uint256",
+            },
+        ],
+        "name": "tokenURI",
+        "outputs": [
+            {
+                "internalType": "string",
+                "name": "",
+                "type": "string",
+            },
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
     {
         "inputs": [
             {
@@ -5,20 +5,39 @@ from typing import Any
 from eth_typing import HexStr
 from web3 import Web3
 
+from ...multicall import get_function_codec
+from ...names import resolve_address, resolve_addresses
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
+from ...wallet_providers.transaction_batch import send_transactions
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
 from .constants import ERC721_ABI
-from .schemas import GetBalanceSchema, MintSchema, TransferSchema
+from .indexer import Erc721Indexer
+from .reader import Erc721Reader
+from .schemas import (
+    BatchMintSchema,
+    BatchTransferSchema,
+    GetBalanceSchema,
+    ListTokensSchema,
+    MintSchema,
+    TransferSchema,
+)
 
 
 class Erc721ActionProvider(ActionProvider[EvmWalletProvider]):
     """Action provider for ERC721 contract interactions."""
 
-    def __init__(self) -> None:
-        """Initialize the ERC721 action provider."""
+    def __init__(self, indexer: Erc721Indexer | None = None) -> None:
+        """Initialize the ERC721 action provider.
+
+        Args:
+            indexer (Erc721Indexer | None): Index of NFT holdings used by list_tokens.
+                Defaults to an indexer persisting to the AgentKit cache directory.
+
+        """
         super().__init__("erc721", [])
+        self.indexer = indexer or Erc721Indexer()
 
     @create_action(
         name="mint",
@@ -41,8 +60,9 @@ Do not use the contract address as the destination address. If you are unsure of
 
         """
         try:
+            destination = resolve_address(wallet_provider, MintSchema(**args).destination)
             contract = Web3().eth.contract(address=args["contract_address"], abi=ERC721_ABI)
-            data = contract.encode_abi("mint", args=[args["destination"], 1])
+            data = contract.encode_abi("mint", args=[destination, 1])
 
             tx_hash = wallet_provider.send_transaction(
                 {
@@ -53,10 +73,58 @@ Do not use the contract address as the destination address. If you are unsure of
 
             wallet_provider.wait_for_transaction_receipt(tx_hash)
 
-            return f"Successfully minted NFT {args['contract_address']} to {args['destination']}"
+            return f"Successfully minted NFT {args['contract_address']} to {destination}"
         except Exception as e:
             return f"Error minting NFT {args['contract_address']} to {args['destination']}: {e}"
 
+    @create_action(
+        name="batch_mint",
+        description="""
+This tool will mint one NFT (ERC-721) to each of many destination addresses onchain.
+It takes the contract address of the NFT onchain and the list of destination addresses onchain that will each receive an NFT.
+Use this instead of calling mint repeatedly when minting to more than one destination.
+Do not use the contract address as a destination address. If you are unsure of the destination addresses, please ask the user before proceeding.
+""",
+        schema=BatchMintSchema,
+    )
+    def batch_mint(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Mint an NFT (ERC-721) to each of many destination addresses.
+
+        All mint transactions are sent back to back before any receipt is awaited.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the result of each mint and the batch throughput.
+
+        """
+        try:
+            validated_args = BatchMintSchema(**args)
+            contract_address = Web3.to_checksum_address(validated_args.contract_address)
+            destinations = resolve_addresses(wallet_provider, validated_args.destinations)
+
+            mint_codec = get_function_codec(ERC721_ABI, "mint")
+            transactions = [
+                {
+                    "to": contract_address,
+                    "data": Web3.to_hex(mint_codec.encode([destination, 1])),
+                }
+                for destination in destinations
+            ]
+
+            result = send_transactions(wallet_provider, transactions)
+
+            lines = [
+                f"{destination} | {outcome.describe()}"
+                for destination, outcome in zip(destinations, result.outcomes, strict=True)
+            ]
+            header = f"Batch mint of NFT {contract_address} to {len(destinations)} destinations:"
+            return "\n".join([header, *lines, result.summary()])
+        except Exception as e:
+            return f"Error batch minting NFT {args['contract_address']}: {e!s}"
+
     @create_action(
         name="transfer",
         description="""
@@ -86,12 +154,13 @@ Important notes:
 
         """
         try:
+            destination = resolve_address(wallet_provider, TransferSchema(**args).destination)
             contract = Web3().eth.contract(address=args["contract_address"], abi=ERC721_ABI)
             from_address = args.get("from_address") or wallet_provider.get_address()
 
             data = contract.encode_abi(
                 "transferFrom",
-                args=[from_address, args["destination"], int(args["token_id"])],
+                args=[from_address, destination, int(args["token_id"])],
             )
 
             tx_hash = wallet_provider.send_transaction(
@@ -105,7 +174,7 @@ Important notes:
 
             return (
                 f"Successfully transferred NFT {args['contract_address']} with tokenId "
-                f"{args['token_id']} to {args['destination']}"
+                f"{args['token_id']} to {destination}"
             )
         except Exception as e:
             return (
@@ -113,6 +182,73 @@ Important notes:
                 f"{args['token_id']} to {args['destination']}: {e}"
             )
 
+    @create_action(
+        name="batch_transfer",
+        description="""
+This tool will transfer many NFTs (ERC721 tokens) of one contract from the wallet to other onchain addresses.
+
+It takes the following inputs:
+- contractAddress: The NFT contract address
+- transfers: The list of transfers, each with the tokenId of the NFT to transfer and the destination onchain address
+- fromAddress: (Optional) The address to transfer from. If not provided, uses the wallet's address
+
+Important notes:
+- Use this instead of calling transfer repeatedly when transferring more than one NFT
+- Ensure you have ownership of the NFTs before attempting transfer
+- Ensure there is sufficient native token balance for gas fees
+""",
+        schema=BatchTransferSchema,
+    )
+    def batch_transfer(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Transfer many NFTs (ERC721 tokens) of one contract to destination addresses.
+
+        All transfer transactions are sent back to back before any receipt is awaited.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the result of each transfer and the batch throughput.
+
+        """
+        try:
+            validated_args = BatchTransferSchema(**args)
+            contract_address = Web3.to_checksum_address(validated_args.contract_address)
+            from_address = validated_args.from_address or wallet_provider.get_address()
+            destinations = resolve_addresses(
+                wallet_provider, [transfer.destination for transfer in validated_args.transfers]
+            )
+
+            transfer_codec = get_function_codec(ERC721_ABI, "transferFrom")
+            transactions = [
+                {
+                    "to": contract_address,
+                    "data": Web3.to_hex(
+                        transfer_codec.encode([from_address, destination, int(transfer.token_id)])
+                    ),
+                }
+                for transfer, destination in zip(
+                    validated_args.transfers, destinations, strict=True
+                )
+            ]
+
+            result = send_transactions(wallet_provider, transactions)
+
+            lines = [
+                f"{transfer.token_id} | {destination} | {outcome.describe()}"
+                for transfer, destination, outcome in zip(
+                    validated_args.transfers, destinations, result.outcomes, strict=True
+                )
+            ]
+            header = (
+                f"Batch transfer of {len(validated_args.transfers)} NFTs of contract "
+                f"{contract_address}:"
+            )
+            return "\n".join([header, *lines, result.summary()])
+        except Exception as e:
+            return f"Error batch transferring NFTs of contract {args['contract_address']}: {e!s}"
+
     @create_action(
         name="get_balance",
         description="""
@@ -129,7 +265,7 @@ It takes the following inputs:
 
         This function queries an ERC721 NFT contract to get the token balance for a specific address.
         It uses the standard ERC721 balanceOf function which returns the number of tokens owned by
-        the given address for that NFT collection.
+        the given address for that NFT collection, read with a single eth_call.
 
         Args:
             wallet_provider (EvmWalletProvider): The wallet provider to use for making the contract call
@@ -143,21 +279,11 @@ It takes the following inputs:
                 - The NFT balance details if successful
                 - An error message if the balance check fails
 
-        Raises:
-            Exception: If the contract call fails for any reason
-
         """
         try:
             address = args.get("address") or wallet_provider.get_address()
 
-            balance = wallet_provider.read_contract(
-                {
-                    "address": HexStr(args["contract_address"]),
-                    "abi": ERC721_ABI,
-                    "function_name": "balanceOf",
-                    "args": [address],
-                }
-            )
+            balance = Erc721Reader(wallet_provider, args["contract_address"]).balance_of(address)
 
             return (
                 f"Balance of NFTs for contract {args['contract_address']} at address {address} is "
@@ -166,6 +292,58 @@ It takes the following inputs:
         except Exception as e:
             return f"Error getting NFT balance for contract {args['contract_address']}: {e}"
 
+    @create_action(
+        name="list_tokens",
+        description="""
+This tool will list the token IDs of the NFTs (ERC721 tokens) a given address holds in a contract.
+
+It takes the following inputs:
+- contractAddress: The NFT contract address to list token IDs for
+- address: (Optional) The address to list token IDs for. If not provided, uses the wallet's address
+- fromBlock: (Optional) The block to start scanning from on the first lookup. If not provided, the contract's deployment block is looked up
+
+Important notes:
+- The first lookup for a contract and address scans the contract's Transfer events and may take a while
+- Later lookups only read blocks produced since the previous one
+""",
+        schema=ListTokensSchema,
+    )
+    def list_tokens(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """List the token IDs an address holds in an ERC721 contract.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the token IDs or error details.
+
+        """
+        try:
+            validated_args = ListTokensSchema(**args)
+            address = validated_args.address or wallet_provider.get_address()
+
+            token_ids = self.indexer.list_tokens(
+                wallet_provider,
+                validated_args.contract_address,
+                address,
+                from_block=validated_args.from_block,
+            )
+
+            if not token_ids:
+                return (
+                    f"Address {address} holds no NFTs for contract "
+                    f"{validated_args.contract_address}"
+                )
+
+            return (
+                f"Address {address} holds {len(token_ids)} NFTs for contract "
+                f"{validated_args.contract_address} with token IDs: "
+                f"{', '.join(str(token_id) for token_id in token_ids)}"
+            )
+        except Exception as e:
+            return f"Error listing NFTs for contract {args['contract_address']}: {e!s}"
+
     def supports_network(self, network: Network) -> bool:
         """Check if the ERC721 action provider supports the given network.
 
@@ -179,11 +357,14 @@ It takes the following inputs:
         return network.protocol_family == "evm"
 
 
-def erc721_action_provider() -> Erc721ActionProvider:
+def erc721_action_provider(indexer: Erc721Indexer | None = None) -> Erc721ActionProvider:
     """Create an instance of the ERC721 action provider.
 
+    Args:
+        indexer (Erc721Indexer | None): Index of NFT holdings used by list_tokens.
+
     Returns:
         An instance of the ERC721 action provider.
 
     """
-    return Erc721ActionProvider()
+    return Erc721ActionProvider(indexer)
@@ -0,0 +1,263 @@
+"""Index ERC721 holdings from Transfer event logs."""
+
+import threading
+import time
+
+from web3 import Web3
+from web3.types import FilterParams, LogReceipt
+
+from ...cache import JsonFileStore, KeyValueStore
+from ...indexing import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_CONFIRMATIONS,
+    LogScanner,
+    find_deployment_block,
+    is_historical_state_error,
+)
+from ...wallet_providers import EvmWalletProvider
+from .constants import TRANSFER_EVENT_TOPIC
+
+DEFAULT_STORE_NAME = "erc721_holdings"
+
+# Minimum number of seconds between two syncs of the same holdings
+DEFAULT_SYNC_INTERVAL = 10.0
+
+# Selector of balanceOf(address), called to find the block a contract was deployed at
+BALANCE_OF_SELECTOR = "0x70a08231"
+
+
+def _address_topic(address: str) -> str:
+    return "0x" + bytes.fromhex(address[2:].lower()).rjust(32, b"\0").hex()
+
+
+def _topic_to_int(topic: bytes | str) -> int:
+    return int(topic.hex() if isinstance(topic, bytes) else topic, 16)
+
+
+class Erc721Indexer:
+    """Tracks the token IDs an address holds in an ERC721 contract.
+
+    Holdings are rebuilt from the contract's Transfer logs to and from the owner, starting
+    at the contract's deployment block. The token IDs and the last scanned block are
+    persisted per (chain, contract, owner) only up to ``confirmations`` blocks behind the
+    head; the newer blocks are rescanned on every sync, so a reorganized block cannot
+    leave a stale transfer in the index. After the first scan only those blocks and the
+    ones produced since the previous sync are read, and lookups within ``sync_interval``
+    seconds of a sync make no RPC calls at all.
+    """
+
+    def __init__(
+        self,
+        store: KeyValueStore | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+        confirmations: int = DEFAULT_CONFIRMATIONS,
+    ):
+        """Initialize the indexer.
+
+        Args:
+            store (KeyValueStore | None): Persistent store for holdings. Defaults to a
+                JSON file in the AgentKit cache directory, opened on first use.
+            chunk_size (int): Maximum number of blocks requested per eth_getLogs call.
+            sync_interval (float): Minimum seconds between two syncs of the same holdings.
+            confirmations (int): Number of blocks behind the head after which transfers
+                are persisted as final.
+
+        """
+        self._store = store
+        self._scanner = LogScanner(chunk_size)
+        self._sync_interval = sync_interval
+        self._confirmations = confirmations
+        self._synced: dict[str, tuple[float, list[int]]] = {}
+        # Contracts whose deployment block could not be found, scanned from block 0
+        self._deployment_block_fallbacks: set[str] = set()
+        # One lock per holdings key, so a scan does not block other holdings or cached reads
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def store(self) -> KeyValueStore:
+        """The persistent store for holdings."""
+        if self._store is None:
+            self._store = JsonFileStore.named(DEFAULT_STORE_NAME)
+        return self._store
+
+    @staticmethod
+    def _key(chain_id: str, contract_address: str, owner: str) -> str:
+        return f"{chain_id}:{contract_address.lower()}:{owner.lower()}"
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _fresh(self, key: str) -> list[int] | None:
+        with self._lock:
+            synced = self._synced.get(key)
+        if synced is not None and time.monotonic() - synced[0] < self._sync_interval:
+            return synced[1]
+        return None
+
+    def _deployment_block(
+        self, wallet_provider: EvmWalletProvider, contract_address: str, owner: str, latest: int
+    ) -> int:
+        """Find the block a contract was deployed at by bisecting calls to it.
+
+        The bisection calls the contract at old blocks, which needs archive state. On an
+        endpoint without it, the scan starts at block 0 instead; eth_getLogs does not
+        need archive state, and the blocks before deployment hold no logs of the contract.
+        That fallback is remembered in memory only, so the bisection is not repeated for
+        the contract but is retried on a new indexer, e.g. with an archive endpoint.
+        """
+        chain_id = wallet_provider.get_network().chain_id
+        key = f"{chain_id}:{contract_address.lower()}:deployment_block"
+        entry = self.store.get(key)
+        if entry is not None:
+            return entry["block"]
+        with self._lock:
+            if key in self._deployment_block_fallbacks:
+                return 0
+
+        probe = {
+            "to": Web3.to_checksum_address(contract_address),
+            "data": BALANCE_OF_SELECTOR + _address_topic(owner)[2:],
+        }
+        try:
+            block = find_deployment_block(wallet_provider, probe, latest)
+        except Exception as e:
+            if not is_historical_state_error(e):
+                raise
+            with self._lock:
+                self._deployment_block_fallbacks.add(key)
+            return 0
+        if block is None:
+            raise ValueError(f"No ERC721 contract is deployed at {contract_address}")
+
+        self.store.set(key, {"block": block})
+        return block
+
+    @staticmethod
+    def _filters(contract_address: str, owner: str) -> list[FilterParams]:
+        contract_address = Web3.to_checksum_address(contract_address)
+        owner_topic = _address_topic(owner)
+        return [
+            {"address": contract_address, "topics": [TRANSFER_EVENT_TOPIC, None, owner_topic]},
+            {"address": contract_address, "topics": [TRANSFER_EVENT_TOPIC, owner_topic]},
+        ]
+
+    @staticmethod
+    def _apply(token_ids: set[int], logs: list[LogReceipt], owner_topic: str) -> None:
+        for log in logs:
+            topics = log["topics"]
+            # ERC20 Transfer events share the topic but do not index a token ID
+            if len(topics) != 4:
+                continue
+
+            token_id = _topic_to_int(topics[3])
+            if _topic_to_int(topics[2]) == int(owner_topic, 16):
+                token_ids.add(token_id)
+            else:
+                token_ids.discard(token_id)
+
+    def get_cached_tokens(
+        self, chain_id: str, contract_address: str, owner: str
+    ) -> list[int] | None:
+        """Get the indexed token IDs of an owner without making RPC calls.
+
+        Holdings synced by this indexer include transfers not yet confirmed; otherwise the
+        persisted, confirmed holdings are returned.
+
+        Args:
+            chain_id (str): The chain ID.
+            contract_address (str): The ERC721 contract address.
+            owner (str): The owner address.
+
+        Returns:
+            list[int] | None: The token IDs, or None if the holdings were never scanned.
+
+        """
+        key = self._key(chain_id, contract_address, owner)
+        with self._lock:
+            synced = self._synced.get(key)
+        if synced is not None:
+            return synced[1]
+
+        entry = self.store.get(key)
+        return None if entry is None else entry["token_ids"]
+
+    def list_tokens(
+        self,
+        wallet_provider: EvmWalletProvider,
+        contract_address: str,
+        owner: str,
+        from_block: int | None = None,
+        refresh: bool = False,
+    ) -> list[int]:
+        """Get the token IDs an address holds, scanning only blocks not yet indexed.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider used to read logs.
+            contract_address (str): The ERC721 contract address.
+            owner (str): The owner address.
+            from_block (int | None): The block to start the first scan at. Defaults to the
+                contract's deployment block, which is looked up once per contract, or to
+                block 0 on endpoints without archive state. Ignored once the holdings have
+                been scanned.
+            refresh (bool): Whether to sync even if the holdings were synced recently.
+
+        Returns:
+            list[int]: The token IDs, in ascending order.
+
+        Raises:
+            ValueError: If no contract is deployed at the address.
+
+        """
+        key = self._key(wallet_provider.get_network().chain_id, contract_address, owner)
+
+        fresh = None if refresh else self._fresh(key)
+        if fresh is not None:
+            return fresh
+
+        with self._key_lock(key):
+            # Another caller may have synced the same holdings while this one waited
+            fresh = None if refresh else self._fresh(key)
+            if fresh is not None:
+                return fresh
+
+            entry = self.store.get(key)
+            token_ids = set(entry["token_ids"]) if entry else set()
+            latest = wallet_provider.get_block_number()
+            if entry is not None:
+                start = entry["last_block"] + 1
+            elif from_block is not None:
+                start = from_block
+            else:
+                start = self._deployment_block(wallet_provider, contract_address, owner, latest)
+            confirmed = latest - self._confirmations
+
+            owner_topic = _address_topic(owner)
+            unconfirmed: list[LogReceipt] = []
+            for chunk in self._scanner.scan(
+                wallet_provider, self._filters(contract_address, owner), start, latest
+            ):
+                logs = [log for log in chunk.logs if log["blockNumber"] <= confirmed]
+                unconfirmed.extend(log for log in chunk.logs if log["blockNumber"] > confirmed)
+                self._apply(token_ids, logs, owner_topic)
+                # Persist progress whenever holdings change so an interrupted scan resumes
+                if logs:
+                    self.store.set(
+                        key,
+                        {
+                            "last_block": min(chunk.to_block, confirmed),
+                            "token_ids": sorted(token_ids),
+                        },
+                    )
+
+            if start <= confirmed:
+                self.store.set(key, {"last_block": confirmed, "token_ids": sorted(token_ids)})
+
+            # Transfers in the unconfirmed blocks are applied on top of the persisted holdings
+            self._apply(token_ids, unconfirmed, owner_topic)
+            result = sorted(token_ids)
+            with self._lock:
+                self._synced[key] = (time.monotonic(), result)
+            return result
@@ -0,0 +1,81 @@
+"""Typed reads of ERC721 contracts through precompiled codecs."""
+
+from typing import Any
+
+from web3 import Web3
+from web3.types import BlockIdentifier, ChecksumAddress
+
+from ...multicall import FunctionCodec, get_function_codec
+from ...wallet_providers import EvmWalletProvider
+from .constants import ERC721_ABI
+
+BALANCE_OF = get_function_codec(ERC721_ABI, "balanceOf")
+OWNER_OF = get_function_codec(ERC721_ABI, "ownerOf")
+TOKEN_URI = get_function_codec(ERC721_ABI, "tokenURI")
+
+
+class Erc721Reader:
+    """Reads an ERC721 contract with one eth_call per read.
+
+    Selectors and result decoders are built once at import time, so a read only
+    encodes its arguments, makes the call and decodes the output.
+    """
+
+    def __init__(self, wallet_provider: EvmWalletProvider, contract_address: str):
+        """Initialize the reader.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider used to make calls.
+            contract_address (str): The ERC721 contract address.
+
+        """
+        self.wallet_provider = wallet_provider
+        self.contract_address: ChecksumAddress = Web3.to_checksum_address(contract_address)
+
+    def _call(
+        self, codec: FunctionCodec, args: list[Any], block_identifier: BlockIdentifier
+    ) -> Any:
+        data = self.wallet_provider.call(
+            {"to": self.contract_address, "data": Web3.to_hex(codec.encode(args))},
+            block_identifier,
+        )
+        return codec.decode(data)
+
+    def balance_of(self, owner: str, block_identifier: BlockIdentifier = "latest") -> int:
+        """Get the number of tokens an address owns.
+
+        Args:
+            owner (str): The owner address.
+            block_identifier (BlockIdentifier): The block to read at, defaults to 'latest'.
+
+        Returns:
+            int: The number of tokens.
+
+        """
+        return self._call(BALANCE_OF, [Web3.to_checksum_address(owner)], block_identifier)
+
+    def owner_of(self, token_id: int, block_identifier: BlockIdentifier = "latest") -> str:
+        """Get the owner of a token.
+
+        Args:
+            token_id (int): The token ID.
+            block_identifier (BlockIdentifier): The block to read at, defaults to 'latest'.
+
+        Returns:
+            str: The checksummed owner address.
+
+        """
+        return self._call(OWNER_OF, [token_id], block_identifier)
+
+    def token_uri(self, token_id: int, block_identifier: BlockIdentifier = "latest") -> str:
+        """Get the metadata URI of a token.
+
+        Args:
+            token_id (int): The token ID.
+            block_identifier (BlockIdentifier): The block to read at, defaults to 'latest'.
+
+        Returns:
+            str: The token URI.
+
+        """
+        return self._call(TOKEN_URI, [token_id], block_identifier)
@@ -1,6 +1,8 @@
 """Schemas for ERC721 action provider."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from ...validators.eth import validate_eth_address_or_name
 
 
 class GetBalanceSchema(BaseModel):
@@ -21,6 +23,12 @@ class MintSchema(BaseModel):
         description="The onchain destination address that will receive the NFT"
     )
 
+    @field_validator("destination")
+    @classmethod
+    def validate_destination(cls, v: str) -> str:
+        """Validate the destination address or name."""
+        return validate_eth_address_or_name(v)
+
 
 class TransferSchema(BaseModel):
     """Input schema for NFT (ERC721) transfer action."""
@@ -37,3 +45,69 @@ class TransferSchema(BaseModel):
         None,
         description="The address to transfer from. If not provided, defaults to the wallet's default address",
     )
+
+    @field_validator("destination")
+    @classmethod
+    def validate_destination(cls, v: str) -> str:
+        """Validate the destination address or name."""
+        return validate_eth_address_or_name(v)
+
+
+class ListTokensSchema(BaseModel):
+    """Input schema for list NFT (ERC721) token IDs action."""
+
+    contract_address: str = Field(description="The NFT contract address to list token IDs for")
+    address: str | None = Field(
+        None,
+        description="The address to list token IDs for. If not provided, uses the wallet's default address",
+    )
+    from_block: int | None = Field(
+        None,
+        ge=0,
+        description="The block to start scanning Transfer events from on the first lookup. If not provided, the contract's deployment block is looked up",
+    )
+
+
+class BatchMintSchema(BaseModel):
+    """Input schema for batch mint NFT (ERC721) action."""
+
+    contract_address: str = Field(description="The contract address of the NFT to mint")
+    destinations: list[str] = Field(
+        ...,
+        min_length=1,
+        description="The onchain destination addresses that will each receive an NFT",
+    )
+
+    @field_validator("destinations")
+    @classmethod
+    def validate_destinations(cls, v: list[str]) -> list[str]:
+        """Validate the destination addresses or names."""
+        return [validate_eth_address_or_name(destination) for destination in v]
+
+
+class BatchTransferItem(BaseModel):
+    """A single NFT transfer in a batch transfer."""
+
+    token_id: str = Field(description="The ID of the NFT to transfer")
+    destination: str = Field(description="The destination to transfer the NFT")
+
+    @field_validator("destination")
+    @classmethod
+    def validate_destination(cls, v: str) -> str:
+        """Validate the destination address or name."""
+        return validate_eth_address_or_name(v)
+
+
+class BatchTransferSchema(BaseModel):
+    """Input schema for batch NFT (ERC721) transfer action."""
+
+    contract_address: str = Field(description="The NFT contract address to interact with")
+    transfers: list[BatchTransferItem] = Field(
+        ...,
+        min_length=1,
+        description="The token IDs to transfer and their destinations",
+    )
+    from_address: str | None = Field(
+        None,
+        description="The address to transfer from. If not provided, defaults to the wallet's default address",
+    )
@@ -10,10 +10,14 @@ from coinbase_agentkit.action_providers.action_provider import ActionProvider
 from coinbase_agentkit.action_providers.morpho.constants import METAMORPHO_ABI
 from coinbase_agentkit.action_providers.morpho.schemas import (
     MorphoDepositSchema,
+    MorphoGetVaultPositionSchema,
     MorphoWithdrawSchema,
 )
-from coinbase_agentkit.action_providers.morpho.utils import approve
+from coinbase_agentkit.action_providers.morpho.utils import approve, get_allowance
+from coinbase_agentkit.action_providers.morpho.vaults import MorphoVaultReader, VaultPosition
+from coinbase_agentkit.names import resolve_address
 from coinbase_agentkit.network import Network
+from coinbase_agentkit.tokens import parse_units
 from coinbase_agentkit.wallet_providers import EvmWalletProvider
 
 SUPPORTED_NETWORKS = ["base-mainnet", "base-sepolia"]
@@ -22,8 +26,16 @@ SUPPORTED_NETWORKS = ["base-mainnet", "base-sepolia"]
 class MorphoActionProvider(ActionProvider[EvmWalletProvider]):
     """Provides actions for interacting with Morpho Vaults."""
 
-    def __init__(self):
+    def __init__(self, vault_reader: MorphoVaultReader | None = None):
+        """Initialize the Morpho action provider.
+
+        Args:
+            vault_reader (MorphoVaultReader | None): Reader used for vault positions and
+                the decimals of vault assets.
+
+        """
         super().__init__("morpho", [])
+        self.vault_reader = vault_reader or MorphoVaultReader()
 
     @create_action(
         name="deposit",
@@ -40,7 +52,10 @@ It takes:
 - token_address: The address of the token to approve
 Important notes:
 - Make sure to use the exact amount provided. Do not convert units for assets for this action.
-- Please use a token address (example 0x4200000000000000000000000000000000000006) for the token_address field. If you are unsure of the token address, please clarify what the requested token address is before continuing.""",
+- Please use a token address (example 0x4200000000000000000000000000000000000006) for the token_address field. If you are unsure of the token address, please clarify what the requested token address is before continuing.
+- The token_address must be the vault's underlying asset; deposits of any other token are rejected.
+- The vault is only approved to spend the token when its current allowance does not cover the deposit.
+- The amount is converted with the decimals of the vault's underlying asset, e.g. 6 for USDC.""",
         schema=MorphoDepositSchema,
     )
     def deposit(self, wallet: EvmWalletProvider, args: dict[str, Any]) -> str:
@@ -60,12 +75,29 @@ Important notes:
             return "Error: Assets amount must be greater than 0"
 
         try:
-            atomic_assets = Web3.to_wei(assets, "ether")
+            asset = self.vault_reader.get_asset(wallet, args["vault_address"])
+            if Web3.to_checksum_address(args["token_address"]) != Web3.to_checksum_address(
+                asset.address
+            ):
+                return (
+                    f"Error: Token {args['token_address']} is not the asset of Morpho Vault "
+                    f"{args['vault_address']}, which takes {asset.symbol} ({asset.address})"
+                )
+            atomic_assets = parse_units(assets, asset.decimals)
 
             try:
-                approve(wallet, args["token_address"], args["vault_address"], atomic_assets)
-            except Exception as e:
-                return f"Error approving Morpho Vault as spender: {e!s}"
+                allowance = get_allowance(
+                    wallet, args["token_address"], wallet.get_address(), args["vault_address"]
+                )
+            except Exception:
+                allowance = 0
+
+            # Only approve when the vault cannot already spend the deposit
+            if allowance < atomic_assets:
+                try:
+                    approve(wallet, args["token_address"], args["vault_address"], atomic_assets)
+                except Exception as e:
+                    return f"Error approving Morpho Vault as spender: {e!s}"
 
             morpho_contract = Web3().eth.contract(address=args["vault_address"], abi=METAMORPHO_ABI)
 
@@ -91,8 +123,14 @@ Important notes:
         description="""
 This tool allows withdrawing assets from a Morpho Vault. It takes:
 - vault_address: The address of the Morpho Vault to withdraw from
-- assets: The amount of assets to withdraw in atomic units
-- receiver: The address to receive the shares
+- assets: The amount of assets to withdraw in whole units
+    Examples for USDC:
+    - 1 USDC
+    - 0.1 USDC
+- receiver: The address to receive the withdrawn assets
+Important notes:
+- Make sure to use the exact amount provided. Do not convert units for assets for this action.
+- The amount is converted with the decimals of the vault's underlying asset, e.g. 6 for USDC.
 """,
         schema=MorphoWithdrawSchema,
     )
@@ -112,14 +150,15 @@ This tool allows withdrawing assets from a Morpho Vault. It takes:
         if assets <= Decimal("0.0"):
             return "Error: Assets amount must be greater than 0"
 
-        atomic_assets = Web3.to_wei(assets, "ether")
+        try:
+            asset = self.vault_reader.get_asset(wallet, args["vault_address"])
+            atomic_assets = parse_units(assets, asset.decimals)
 
-        contract = Web3().eth.contract(address=args["vault_address"], abi=METAMORPHO_ABI)
-        encoded_data = contract.encode_abi(
-            "withdraw", args=[atomic_assets, args["receiver"], args["receiver"]]
-        )
+            contract = Web3().eth.contract(address=args["vault_address"], abi=METAMORPHO_ABI)
+            encoded_data = contract.encode_abi(
+                "withdraw", args=[atomic_assets, args["receiver"], args["receiver"]]
+            )
 
-        try:
             params = {
                 "to": args["vault_address"],
                 "data": encoded_data,
@@ -133,6 +172,62 @@ This tool allows withdrawing assets from a Morpho Vault. It takes:
         except Exception as e:
             return f"Error withdrawing from Morpho Vault: {e!s}"
 
+    @create_action(
+        name="get_vault_position",
+        description="""
+This tool reads the state of one or more Morpho Vaults and an address's position in each. It takes:
+- vault_addresses: The addresses of the Morpho Vaults to read
+- owner: The address holding the vault shares (optional, defaults to the wallet address)
+It returns, per vault, the shares held, the assets they are worth, the maximum amount withdrawable right now, the vault's total assets and its share price, all in atomic units.
+Important notes:
+- Use this before withdrawing to find out how much can be withdrawn.""",
+        schema=MorphoGetVaultPositionSchema,
+    )
+    def get_vault_position(self, wallet: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Get positions in Morpho Vaults.
+
+        Args:
+            wallet (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        try:
+            validated_args = MorphoGetVaultPositionSchema(**args)
+            owner = (
+                resolve_address(wallet, validated_args.owner)
+                if validated_args.owner
+                else wallet.get_address()
+            )
+            positions = self.vault_reader.get_positions(
+                wallet, validated_args.vault_addresses, owner
+            )
+
+            block_number = next(
+                (p.block_number for p in positions if isinstance(p, VaultPosition)), None
+            )
+            at_block = "" if block_number is None else f" at block {block_number}"
+            lines = [f"Morpho Vault positions of {owner}{at_block}:"]
+            for vault_address, position in zip(
+                validated_args.vault_addresses, positions, strict=True
+            ):
+                if isinstance(position, Exception):
+                    lines.append(f"{vault_address}: error: {position!s}")
+                    continue
+                lines.append(
+                    f"{position.vault_address}: {position.shares} shares worth "
+                    f"{position.assets} of asset {position.asset}, "
+                    f"max withdraw {position.max_withdraw}, "
+                    f"total assets {position.total_assets}, "
+                    f"{position.assets_per_share} assets per 1e18 shares"
+                )
+            return "\n".join(lines)
+
+        except Exception as e:
+            return f"Error reading Morpho Vault positions: {e!s}"
+
     def supports_network(self, network: Network) -> bool:
         """Check if the network is supported by this action provider.
 
@@ -146,11 +241,15 @@ This tool allows withdrawing assets from a Morpho Vault. It takes:
         return network.protocol_family == "evm" and network.network_id in SUPPORTED_NETWORKS
 
 
-def morpho_action_provider() -> MorphoActionProvider:
+def morpho_action_provider(vault_reader: MorphoVaultReader | None = None) -> MorphoActionProvider:
     """Create a new Morpho action provider.
 
+    Args:
+        vault_reader (MorphoVaultReader | None): Reader used for vault positions and
+            the decimals of vault assets.
+
     Returns:
         MorphoActionProvider: A new Morpho action provider instance.
 
     """
-    return MorphoActionProvider()
+    return MorphoActionProvider(vault_reader)
@@ -1,6 +1,8 @@
 """Schemas for Morpho action provider."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from ...validators.eth import validate_eth_address_or_name
 
 
 class MorphoDepositSchema(BaseModel):
@@ -21,5 +23,33 @@ class MorphoWithdrawSchema(BaseModel):
     """Input schema for Morpho Vault withdraw action."""
 
     vault_address: str = Field(..., description="The address of the Morpho Vault to withdraw from")
-    assets: str = Field(..., description="The amount of assets to withdraw in atomic units")
+    assets: str = Field(..., description="The amount of assets to withdraw, in whole units")
     receiver: str = Field(..., description="The address to receive the withdrawn assets")
+
+
+class MorphoGetVaultPositionSchema(BaseModel):
+    """Input schema for Morpho Vault position action."""
+
+    vault_addresses: list[str] = Field(
+        ..., description="The addresses of the Morpho Vaults to read", min_length=1
+    )
+    owner: str | None = Field(
+        None, description="The address holding the vault shares, defaults to the wallet address"
+    )
+
+    @field_validator("owner")
+    @classmethod
+    def validate_owner(cls, v: str | None) -> str | None:
+        """Validate that the owner is a valid Ethereum address or name.
+
+        Args:
+            v (str | None): The owner address to validate
+
+        Returns:
+            str | None: The checksummed owner address, or the owner name
+
+        Raises:
+            ValueError: If the owner is neither a name nor a valid address
+
+        """
+        return None if v is None else validate_eth_address_or_name(v)
@@ -1,5 +1,6 @@
 from web3 import Web3
 
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
 from coinbase_agentkit.wallet_providers import EvmWalletProvider
 
 ERC20_APPROVE_ABI = [
@@ -46,3 +47,29 @@ def approve(wallet: EvmWalletProvider, token_address: str, spender_address: str,
         return receipt
     except Exception as e:
         return f"Error approving tokens: {e!s}"
+
+
+def get_allowance(
+    wallet: EvmWalletProvider, token_address: str, owner_address: str, spender_address: str
+) -> int:
+    """Get the amount of tokens a spender may spend on behalf of an owner.
+
+    Args:
+        wallet (EvmWalletProvider): The wallet provider to use for the read
+        token_address (str): The address of the token contract
+        owner_address (str): The address of the token owner
+        spender_address (str): The address of the spender
+
+    Returns:
+        int: The allowance in atomic units (wei)
+
+    """
+    return wallet.read_contract(
+        contract_address=Web3.to_checksum_address(token_address),
+        abi=ERC20_ABI,
+        function_name="allowance",
+        args=[
+            Web3.to_checksum_address(owner_address),
+            Web3.to_checksum_address(spender_address),
+        ],
+    )
@@ -0,0 +1,213 @@
+"""Batched reads of Morpho Vault (ERC-4626) state."""
+
+from dataclasses import dataclass
+from typing import Any
+
+from web3 import Web3
+
+from coinbase_agentkit.action_providers.morpho.constants import METAMORPHO_ABI
+from coinbase_agentkit.cache import ChainBlockCaches, JsonFileStore, KeyValueStore
+from coinbase_agentkit.multicall import Call, multicall
+from coinbase_agentkit.tokens import TokenMetadata, TokenRegistry
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+
+DEFAULT_STORE_NAME = "morpho_vault_assets"
+
+# MetaMorpho shares always have 18 decimals, so share prices are quoted per 10**18 shares
+SHARE_UNIT = 10**18
+
+
+def _vault_calls(vault_address: str, owner: str) -> list[Call]:
+    """Get the ERC-4626 views describing a vault and an owner's position in it."""
+    return [
+        Call(vault_address, METAMORPHO_ABI, "asset"),
+        Call(vault_address, METAMORPHO_ABI, "totalAssets"),
+        Call(vault_address, METAMORPHO_ABI, "totalSupply"),
+        Call(vault_address, METAMORPHO_ABI, "balanceOf", (owner,)),
+        Call(vault_address, METAMORPHO_ABI, "convertToAssets", (SHARE_UNIT,)),
+        Call(vault_address, METAMORPHO_ABI, "maxWithdraw", (owner,)),
+    ]
+
+
+@dataclass(frozen=True)
+class VaultPosition:
+    """The state of a vault and an owner's position in it, read at one block."""
+
+    vault_address: str
+    owner: str
+    asset: str
+    total_assets: int
+    total_supply: int
+    shares: int
+    assets_per_share: int
+    max_withdraw: int
+    assets: int
+    block_number: int
+
+
+class MorphoVaultReader:
+    """Reads the ERC-4626 state of Morpho Vaults and owner positions.
+
+    Every view of every requested vault is read in one multicall pinned to the latest
+    block, and positions are cached until a new block is observed. The assets owned are
+    converted from the owner's exact share balance by a second multicall at the same
+    block, made only for vaults where the owner holds shares.
+
+    A vault's underlying asset never changes, so it is persisted per vault once read,
+    and its decimals are resolved through the token registry. Converting amounts for a
+    known vault then needs no RPC calls.
+    """
+
+    def __init__(
+        self, store: KeyValueStore | None = None, token_registry: TokenRegistry | None = None
+    ):
+        """Initialize the vault reader.
+
+        Args:
+            store (KeyValueStore | None): Persistent store for vault assets. Defaults to a
+                JSON file in the AgentKit cache directory, opened on first use.
+            token_registry (TokenRegistry | None): Registry used to resolve asset decimals.
+
+        """
+        self._store = store
+        self.token_registry = token_registry or TokenRegistry()
+        self._caches = ChainBlockCaches()
+
+    @property
+    def store(self) -> KeyValueStore:
+        """The persistent store for vault assets."""
+        if self._store is None:
+            self._store = JsonFileStore.named(DEFAULT_STORE_NAME)
+        return self._store
+
+    @staticmethod
+    def _key(chain_id: str, vault_address: str) -> str:
+        return f"{chain_id}:{vault_address.lower()}"
+
+    def get_asset(self, wallet_provider: EvmWalletProvider, vault_address: str) -> TokenMetadata:
+        """Get the metadata of a vault's underlying asset.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider used for reads.
+            vault_address (str): The vault address.
+
+        Returns:
+            TokenMetadata: The asset's metadata, including its decimals.
+
+        Raises:
+            Exception: If the vault's asset or the asset's decimals could not be read.
+
+        """
+        key = self._key(wallet_provider.get_network().chain_id, vault_address)
+        asset_address = self.store.get(key)
+        if asset_address is None:
+            asset_address = wallet_provider.read_contract(
+                contract_address=Web3.to_checksum_address(vault_address),
+                abi=METAMORPHO_ABI,
+                function_name="asset",
+                args=[],
+            )
+            self.store.set(key, asset_address)
+
+        metadata = self.token_registry.resolve(wallet_provider, [asset_address])[asset_address]
+        if metadata is None:
+            raise Exception(f"Failed to read decimals of vault asset {asset_address}")
+        return metadata
+
+    def get_positions(
+        self, wallet_provider: EvmWalletProvider, vault_addresses: list[str], owner: str
+    ) -> list[VaultPosition | Exception]:
+        """Get an owner's positions in many vaults.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider used for reads.
+            vault_addresses (list[str]): The vault addresses.
+            owner (str): The address holding the vault shares.
+
+        Returns:
+            list[VaultPosition | Exception]: One position per vault, in the same order, or
+                the error of a vault whose views could not be read.
+
+        """
+        cache = self._caches.get(wallet_provider)
+        chain_id = wallet_provider.get_network().chain_id
+        owner = Web3.to_checksum_address(owner)
+        vault_addresses = [Web3.to_checksum_address(address) for address in vault_addresses]
+
+        positions: dict[str, VaultPosition | Exception] = {}
+        for vault_address in vault_addresses:
+            position = cache.get((vault_address, owner))
+            if position is not None:
+                positions[vault_address] = position
+
+        missing = [
+            address for address in dict.fromkeys(vault_addresses) if address not in positions
+        ]
+        if missing:
+            block_number = cache.block_number()
+            calls_per_vault = [_vault_calls(vault_address, owner) for vault_address in missing]
+            results = iter(
+                multicall(
+                    wallet_provider,
+                    [call for vault_calls in calls_per_vault for call in vault_calls],
+                    block_number,
+                )
+            )
+
+            views: dict[str, list[Any]] = {}
+            for vault_address, vault_calls in zip(missing, calls_per_vault, strict=True):
+                vault_results = [next(results) for _ in vault_calls]
+                failed = next((result for result in vault_results if not result.success), None)
+                if failed is not None:
+                    positions[vault_address] = Exception(
+                        f"Failed to read vault {vault_address}: {failed.error}"
+                    )
+                    continue
+                views[vault_address] = [result.value for result in vault_results]
+
+            # Scaling the share price would round, so each share balance is converted itself
+            holding = {address: view[3] for address, view in views.items() if view[3]}
+            conversions = dict(
+                zip(
+                    holding,
+                    multicall(
+                        wallet_provider,
+                        [
+                            Call(vault_address, METAMORPHO_ABI, "convertToAssets", (shares,))
+                            for vault_address, shares in holding.items()
+                        ],
+                        block_number,
+                    ),
+                    strict=True,
+                )
+            )
+
+            for vault_address, view in views.items():
+                asset, total_assets, total_supply, shares, assets_per_share, max_withdraw = view
+                conversion = conversions.get(vault_address)
+                if conversion is not None and not conversion.success:
+                    positions[vault_address] = Exception(
+                        f"Failed to read vault {vault_address}: {conversion.error}"
+                    )
+                    continue
+
+                position = VaultPosition(
+                    vault_address=vault_address,
+                    owner=owner,
+                    asset=asset,
+                    total_assets=total_assets,
+                    total_supply=total_supply,
+                    shares=shares,
+                    assets_per_share=assets_per_share,
+                    max_withdraw=max_withdraw,
+                    assets=0 if conversion is None else conversion.value,
+                    block_number=block_number,
+                )
+                cache.set((vault_address, owner), position, block_number)
+                positions[vault_address] = position
+
+                # Positions read the asset anyway, so remember it for amount conversions
+                if self.store.get(self._key(chain_id, vault_address)) is None:
+                    self.store.set(self._key(chain_id, vault_address), asset)
+
+        return [positions[vault_address] for vault_address in vault_addresses]
@@ -0,0 +1,183 @@
+"""Local catalog of Pyth price feeds."""
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+import requests
+
+from ...cache import JsonFileStore, KeyValueStore
+
+HERMES_URL = "https://hermes.pyth.network"
+
+DEFAULT_STORE_NAME = "pyth_price_feeds"
+
+# Seconds after which the catalog is downloaded again; feeds are rarely added or changed
+DEFAULT_TTL = 24 * 60 * 60.0
+
+# Quote currency preferred when a lookup does not specify one
+DEFAULT_QUOTE = "usd"
+
+_STORE_KEY = "catalog"
+
+
+@dataclass(frozen=True)
+class PriceFeed:
+    """A Pyth price feed."""
+
+    id: str
+    base: str
+    quote: str
+    asset_type: str
+    symbol: str
+
+
+def _parse_feed(item: dict) -> PriceFeed | None:
+    attributes = item.get("attributes", {})
+    if not item.get("id") or not attributes.get("base"):
+        return None
+    return PriceFeed(
+        id=item["id"],
+        base=attributes["base"],
+        quote=attributes.get("quote_currency") or attributes.get("quote", ""),
+        asset_type=attributes.get("asset_type", "").lower(),
+        symbol=attributes.get("symbol", ""),
+    )
+
+
+class PythFeedCatalog:
+    """Finds Pyth price feeds by symbol without querying Hermes per lookup.
+
+    The full feed list is downloaded once, persisted to the AgentKit cache directory and
+    indexed by asset type, base symbol and quote currency, so a lookup is a dict hit.
+    Once the catalog is older than the TTL, lookups keep being served from it while a
+    fresh copy is downloaded on a daemon thread.
+    """
+
+    def __init__(
+        self,
+        store: KeyValueStore | None = None,
+        ttl: float = DEFAULT_TTL,
+        hermes_url: str = HERMES_URL,
+    ):
+        """Initialize the feed catalog.
+
+        Args:
+            store (KeyValueStore | None): Persistent store for the feed list. Defaults to
+                a JSON file in the AgentKit cache directory, opened on first use.
+            ttl (float): Seconds after which the feed list is refreshed.
+            hermes_url (str): Base URL of the Hermes API.
+
+        """
+        self._store = store
+        self._ttl = ttl
+        self._hermes_url = hermes_url.rstrip("/")
+        self._fetched_at: float | None = None
+        self._feeds: dict[tuple[str, str], list[PriceFeed]] = {}
+        self._refreshing = False
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    @property
+    def store(self) -> KeyValueStore:
+        """The persistent store for the feed list."""
+        if self._store is None:
+            self._store = JsonFileStore.named(DEFAULT_STORE_NAME)
+        return self._store
+
+    def _index(self, feeds: list[PriceFeed], fetched_at: float) -> None:
+        index: dict[tuple[str, str], list[PriceFeed]] = {}
+        for feed in feeds:
+            index.setdefault((feed.asset_type, feed.base.lower()), []).append(feed)
+        with self._lock:
+            self._feeds = index
+            self._fetched_at = fetched_at
+
+    def _load(self) -> bool:
+        """Index the persisted feed list, returning whether there was one."""
+        entry = self.store.get(_STORE_KEY)
+        if entry is None:
+            return False
+        self._index([PriceFeed(**feed) for feed in entry["feeds"]], entry["fetched_at"])
+        return True
+
+    def refresh(self) -> int:
+        """Download, persist and index the full feed list.
+
+        Returns:
+            int: The number of feeds in the catalog.
+
+        Raises:
+            requests.exceptions.RequestException: If the feed list could not be downloaded.
+
+        """
+        with self._refresh_lock:
+            response = requests.get(f"{self._hermes_url}/v2/price_feeds")
+            response.raise_for_status()
+            feeds = [feed for feed in map(_parse_feed, response.json()) if feed is not None]
+
+            fetched_at = time.time()
+            self.store.set(
+                _STORE_KEY, {"fetched_at": fetched_at, "feeds": [asdict(feed) for feed in feeds]}
+            )
+            self._index(feeds, fetched_at)
+            return len(feeds)
+
+    def refresh_in_background(self) -> bool:
+        """Start a refresh on a daemon thread unless one is running.
+
+        Returns:
+            bool: Whether a refresh was started.
+
+        """
+        with self._lock:
+            if self._refreshing:
+                return False
+            self._refreshing = True
+
+        def run() -> None:
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Error refreshing Pyth price feed catalog: {e!s}")
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(target=run, name="pyth-feed-catalog", daemon=True).start()
+        return True
+
+    def _ensure_fresh(self) -> None:
+        if self._fetched_at is None and not self._load():
+            self.refresh()
+        elif time.time() - self._fetched_at > self._ttl:
+            self.refresh_in_background()
+
+    def find(
+        self, base: str, quote: str | None = None, asset_type: str = "crypto"
+    ) -> list[PriceFeed]:
+        """Find the price feeds of a base symbol.
+
+        The feed list is downloaded on the first lookup only if it was never persisted.
+
+        Args:
+            base (str): The base symbol, e.g. ``BTC``, in any case.
+            quote (str | None): The quote currency to match. If None, feeds quoted in USD
+                come first.
+            asset_type (str): The Pyth asset type, e.g. ``crypto`` or ``equity``.
+
+        Returns:
+            list[PriceFeed]: The matching feeds.
+
+        Raises:
+            requests.exceptions.RequestException: If the catalog had to be downloaded
+                and the download failed.
+
+        """
+        self._ensure_fresh()
+        with self._lock:
+            feeds = self._feeds.get((asset_type.lower(), base.strip().lower()), [])
+
+        if quote is not None:
+            return [feed for feed in feeds if feed.quote.lower() == quote.lower()]
+        return sorted(feeds, key=lambda feed: feed.quote.lower() != DEFAULT_QUOTE)
@@ -9,6 +9,7 @@ from ...network import Network
 from ...wallet_providers import WalletProvider
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
+from .feed_catalog import PythFeedCatalog
 
 
 class FetchPriceFeedIdSchema(BaseModel):
@@ -26,8 +27,9 @@ class FetchPriceSchema(BaseModel):
 class PythActionProvider(ActionProvider[WalletProvider]):
     """Provides actions for interacting with Pyth price feeds."""
 
-    def __init__(self):
+    def __init__(self, feed_catalog: PythFeedCatalog | None = None):
         super().__init__("pyth", [])
+        self.feed_catalog = feed_catalog or PythFeedCatalog()
 
     @create_action(
         name="fetch_price_feed_id",
@@ -45,21 +47,11 @@ class PythActionProvider(ActionProvider[WalletProvider]):
 
         """
         token_symbol = args["token_symbol"]
-        url = f"https://hermes.pyth.network/v2/price_feeds?query={token_symbol}&asset_type=crypto"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-
-        if not data:
-            raise ValueError(f"No price feed found for {token_symbol}")
-
-        filtered_data = [
-            item for item in data if item["attributes"]["base"].lower() == token_symbol.lower()
-        ]
-        if not filtered_data:
+        feeds = self.feed_catalog.find(token_symbol)
+        if not feeds:
             raise ValueError(f"No price feed found for {token_symbol}")
 
-        return filtered_data[0]["id"]
+        return feeds[0].id
 
     @create_action(
         name="get_price",
@@ -116,11 +108,14 @@ Important notes:
         return True
 
 
-def pyth_action_provider() -> PythActionProvider:
+def pyth_action_provider(feed_catalog: PythFeedCatalog | None = None) -> PythActionProvider:
     """Create a new Pyth action provider.
 
+    Args:
+        feed_catalog (PythFeedCatalog | None): Catalog used to look up price feed IDs.
+
     Returns:
         PythActionProvider: A new Pyth action provider instance.
 
     """
-    return PythActionProvider()
+    return PythActionProvider(feed_catalog)
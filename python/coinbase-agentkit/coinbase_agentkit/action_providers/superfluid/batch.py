@@ -0,0 +1,85 @@
+"""Encoding of Superfluid flow operations into one host batch call."""
+
+from dataclasses import dataclass
+from typing import Literal
+
+from eth_abi import encode
+from web3 import Web3
+
+from ...multicall import get_function_codec
+from .constants import CFA_V1_ABI, OPERATION_TYPE_SUPERFLUID_CALL_AGREEMENT, SUPERFLUID_HOST_ABI
+
+FlowAction = Literal["create", "update", "delete"]
+
+
+@dataclass(frozen=True)
+class FlowOperation:
+    """A change to one flow of the sender."""
+
+    action: FlowAction
+    token_address: str
+    recipient: str
+    flow_rate: int | None = None
+
+
+# CFA functions called by each flow action
+_CFA_FUNCTIONS: dict[FlowAction, str] = {
+    "create": "createFlow",
+    "update": "updateFlow",
+    "delete": "deleteFlow",
+}
+
+
+def encode_flow_operation(
+    cfa_address: str, sender: str, operation: FlowOperation
+) -> tuple[int, str, bytes]:
+    """Encode a flow change as a host batch operation calling the CFA.
+
+    The host fills in the transaction context, so the CFA calls carry an empty ``ctx``.
+
+    Args:
+        cfa_address (str): The Constant Flow Agreement address.
+        sender (str): The address sending the flows, which must send the batch.
+        operation (FlowOperation): The flow change.
+
+    Returns:
+        tuple[int, str, bytes]: The operation type, target and data of the operation.
+
+    Raises:
+        ValueError: If a create or update has no flow rate.
+
+    """
+    token_address = Web3.to_checksum_address(operation.token_address)
+    recipient = Web3.to_checksum_address(operation.recipient)
+    if operation.action == "delete":
+        args = [token_address, Web3.to_checksum_address(sender), recipient, b""]
+    elif operation.flow_rate is None:
+        raise ValueError(f"A flow rate is required to {operation.action} a flow")
+    else:
+        args = [token_address, recipient, operation.flow_rate, b""]
+
+    call_data = get_function_codec(CFA_V1_ABI, _CFA_FUNCTIONS[operation.action]).encode(args)
+    return (
+        OPERATION_TYPE_SUPERFLUID_CALL_AGREEMENT,
+        Web3.to_checksum_address(cfa_address),
+        encode(["bytes", "bytes"], [call_data, b""]),
+    )
+
+
+def encode_batch_call(cfa_address: str, sender: str, operations: list[FlowOperation]) -> str:
+    """Encode flow changes as the calldata of one host ``batchCall``.
+
+    Args:
+        cfa_address (str): The Constant Flow Agreement address.
+        sender (str): The address sending the flows, which must send the batch.
+        operations (list[FlowOperation]): The flow changes, applied in order.
+
+    Returns:
+        str: The hex-encoded calldata for the Superfluid host.
+
+    """
+    batch_call = get_function_codec(SUPERFLUID_HOST_ABI, "batchCall")
+    operation_tuples = [
+        encode_flow_operation(cfa_address, sender, operation) for operation in operations
+    ]
+    return "0x" + batch_call.encode([operation_tuples]).hex()
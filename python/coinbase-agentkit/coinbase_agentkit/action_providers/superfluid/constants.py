@@ -2,6 +2,12 @@
 
 SUPERFLUID_HOST_ADDRESS = "0xcfA132E353cB4E398080B9700609bb008eceB125"
 
+# Superfluid host of each supported chain ID, which batch calls are sent to
+SUPERFLUID_HOST_ADDRESSES = {
+    "8453": "0x4C073B3baB6d8826b8C5b229f3cfdC1eC6E47E74",
+    "84532": "0x109412E3C84f0539b43d39dB691B08c90f58dC7c",
+}
+
 CREATE_ABI = [
     {
         "inputs": [
@@ -60,3 +66,123 @@ DELETE_ABI = [
         "type": "function",
     }
 ]
+
+# Agreement type of the Constant Flow Agreement, as registered with the Superfluid host
+CFA_V1_AGREEMENT_TYPE = "org.superfluid-finance.agreements.ConstantFlowAgreement.v1"
+
+# Host batch operation type that calls an agreement with abi.encode(callData, userData)
+OPERATION_TYPE_SUPERFLUID_CALL_AGREEMENT = 201
+
+SUPER_TOKEN_ABI = [
+    {
+        "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
+        "name": "realtimeBalanceOfNow",
+        "outputs": [
+            {"internalType": "int256", "name": "availableBalance", "type": "int256"},
+            {"internalType": "uint256", "name": "deposit", "type": "uint256"},
+            {"internalType": "uint256", "name": "owedDeposit", "type": "uint256"},
+            {"internalType": "uint256", "name": "timestamp", "type": "uint256"},
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+SUPERFLUID_HOST_ABI = [
+    {
+        "inputs": [{"internalType": "bytes32", "name": "agreementType", "type": "bytes32"}],
+        "name": "getAgreementClass",
+        "outputs": [
+            {
+                "internalType": "contract ISuperAgreement",
+                "name": "agreementClass",
+                "type": "address",
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "uint32", "name": "operationType", "type": "uint32"},
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bytes", "name": "data", "type": "bytes"},
+                ],
+                "internalType": "struct ISuperfluid.Operation[]",
+                "name": "operations",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "batchCall",
+        "outputs": [],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
+CFA_V1_ABI = [
+    {
+        "inputs": [
+            {"internalType": "contract ISuperfluidToken", "name": "token", "type": "address"},
+            {"internalType": "address", "name": "receiver", "type": "address"},
+            {"internalType": "int96", "name": "flowRate", "type": "int96"},
+            {"internalType": "bytes", "name": "ctx", "type": "bytes"},
+        ],
+        "name": "createFlow",
+        "outputs": [{"internalType": "bytes", "name": "newCtx", "type": "bytes"}],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "contract ISuperfluidToken", "name": "token", "type": "address"},
+            {"internalType": "address", "name": "receiver", "type": "address"},
+            {"internalType": "int96", "name": "flowRate", "type": "int96"},
+            {"internalType": "bytes", "name": "ctx", "type": "bytes"},
+        ],
+        "name": "updateFlow",
+        "outputs": [{"internalType": "bytes", "name": "newCtx", "type": "bytes"}],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "contract ISuperfluidToken", "name": "token", "type": "address"},
+            {"internalType": "address", "name": "sender", "type": "address"},
+            {"internalType": "address", "name": "receiver", "type": "address"},
+            {"internalType": "bytes", "name": "ctx", "type": "bytes"},
+        ],
+        "name": "deleteFlow",
+        "outputs": [{"internalType": "bytes", "name": "newCtx", "type": "bytes"}],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "contract ISuperfluidToken", "name": "token", "type": "address"},
+            {"internalType": "address", "name": "sender", "type": "address"},
+            {"internalType": "address", "name": "receiver", "type": "address"},
+        ],
+        "name": "getFlow",
+        "outputs": [
+            {"internalType": "uint256", "name": "timestamp", "type": "uint256"},
+            {"internalType": "int96", "name": "flowRate", "type": "int96"},
+            {"internalType": "uint256", "name": "deposit", "type": "uint256"},
+            {"internalType": "uint256", "name": "owedDeposit", "type": "uint256"},
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "contract ISuperfluidToken", "name": "token", "type": "address"},
+            {"internalType": "address", "name": "account", "type": "address"},
+        ],
+        "name": "getNetFlow",
+        "outputs": [{"internalType": "int96", "name": "flowRate", "type": "int96"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
@@ -0,0 +1,168 @@
+"""Batched reads of Superfluid flows and net flow balances."""
+
+from dataclasses import dataclass
+
+from web3 import Web3
+
+from ...cache import ChainBlockCaches
+from ...multicall import Call, multicall
+from ...wallet_providers import EvmWalletProvider
+from .constants import CFA_V1_ABI, SUPER_TOKEN_ABI
+from .framework import SuperfluidFrameworkResolver
+
+
+@dataclass(frozen=True)
+class FlowState:
+    """A flow from a sender to a receiver, read at one block."""
+
+    token_address: str
+    sender: str
+    receiver: str
+    flow_rate: int
+    updated_at: int
+    deposit: int
+
+    @property
+    def exists(self) -> bool:
+        """Whether tokens are currently streamed from the sender to the receiver."""
+        return self.flow_rate != 0
+
+
+@dataclass(frozen=True)
+class AccountTokenState:
+    """An account's net flow and realtime balance of a Super Token, read at one block."""
+
+    token_address: str
+    account: str
+    net_flow_rate: int
+    available_balance: int
+    deposit: int
+    timestamp: int
+
+    def balance_at(self, timestamp: int) -> int:
+        """Project the available balance at a time, assuming the net flow stays unchanged.
+
+        Args:
+            timestamp (int): The unix timestamp to project the balance at.
+
+        Returns:
+            int: The projected available balance in wei. Negative once the account is
+                critical.
+
+        """
+        return self.available_balance + self.net_flow_rate * (timestamp - self.timestamp)
+
+    def depleted_at(self) -> int | None:
+        """Get when the available balance runs out at the current net flow.
+
+        Returns:
+            int | None: The unix timestamp the balance reaches zero, or None if the net
+                flow is not negative.
+
+        """
+        if self.net_flow_rate >= 0:
+            return None
+        return self.timestamp + max(self.available_balance, 0) // -self.net_flow_rate
+
+
+@dataclass(frozen=True)
+class FlowSnapshot:
+    """Flows of a sender and its state per token, read at one block."""
+
+    block_number: int
+    flows: list[FlowState | Exception]
+    accounts: dict[str, AccountTokenState | Exception]
+
+
+class SuperfluidFlowReader:
+    """Reads Superfluid flows and net flow balances with batched CFA queries.
+
+    Every flow, net flow and realtime balance of a query is read in one multicall
+    pinned to the latest block, and snapshots are cached until a new block is observed.
+    Balances at later times are projected locally from the net flow rate, since
+    Superfluid balances change every second without any transaction.
+    """
+
+    def __init__(self, framework_resolver: SuperfluidFrameworkResolver | None = None):
+        """Initialize the flow reader.
+
+        Args:
+            framework_resolver (SuperfluidFrameworkResolver | None): Resolver of the CFA
+                address of each chain.
+
+        """
+        self.framework_resolver = framework_resolver or SuperfluidFrameworkResolver()
+        self._caches = ChainBlockCaches()
+
+    def get_flows(
+        self,
+        wallet_provider: EvmWalletProvider,
+        sender: str,
+        pairs: list[tuple[str, str]],
+    ) -> FlowSnapshot:
+        """Get the flows from a sender to many receivers and the sender's net flows.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider used for reads.
+            sender (str): The address sending the flows.
+            pairs (list[tuple[str, str]]): The (Super Token, receiver) pairs to read.
+
+        Returns:
+            FlowSnapshot: The flows in the order of the pairs, and the sender's net flow
+                and realtime balance of every token in them.
+
+        """
+        sender = Web3.to_checksum_address(sender)
+        pairs = [
+            (Web3.to_checksum_address(token), Web3.to_checksum_address(receiver))
+            for token, receiver in pairs
+        ]
+        tokens = list(dict.fromkeys(token for token, _ in pairs))
+        cfa_address = self.framework_resolver.resolve(wallet_provider).cfa_address
+
+        def fetch(block_number: int) -> FlowSnapshot:
+            results = multicall(
+                wallet_provider,
+                [
+                    *(
+                        Call(cfa_address, CFA_V1_ABI, "getFlow", (token, sender, receiver))
+                        for token, receiver in pairs
+                    ),
+                    *(
+                        call
+                        for token in tokens
+                        for call in (
+                            Call(cfa_address, CFA_V1_ABI, "getNetFlow", (token, sender)),
+                            Call(token, SUPER_TOKEN_ABI, "realtimeBalanceOfNow", (sender,)),
+                        )
+                    ),
+                ],
+                block_number,
+            )
+            flow_results, account_results = results[: len(pairs)], results[len(pairs) :]
+
+            flows: list[FlowState | Exception] = []
+            for (token, receiver), result in zip(pairs, flow_results, strict=True):
+                if not result.success:
+                    flows.append(Exception(f"Failed to read flow: {result.error}"))
+                    continue
+                updated_at, flow_rate, deposit, _ = result.value
+                flows.append(FlowState(token, sender, receiver, flow_rate, updated_at, deposit))
+
+            accounts: dict[str, AccountTokenState | Exception] = {}
+            for i, token in enumerate(tokens):
+                net_flow, balance = account_results[2 * i : 2 * i + 2]
+                failed = next((r for r in (net_flow, balance) if not r.success), None)
+                if failed is not None:
+                    accounts[token] = Exception(f"Failed to read net flow: {failed.error}")
+                    continue
+                available_balance, deposit, _, timestamp = balance.value
+                accounts[token] = AccountTokenState(
+                    token, sender, net_flow.value, available_balance, deposit, timestamp
+                )
+
+            return FlowSnapshot(block_number, flows, accounts)
+
+        return self._caches.get(wallet_provider).get_or_fetch(
+            ("flows", sender, tuple(pairs)), fetch
+        )
@@ -0,0 +1,66 @@
+"""Resolution of the Superfluid framework contracts of a chain."""
+
+import threading
+from dataclasses import dataclass
+
+from web3 import Web3
+
+from ...wallet_providers import EvmWalletProvider
+from .constants import CFA_V1_AGREEMENT_TYPE, SUPERFLUID_HOST_ABI, SUPERFLUID_HOST_ADDRESSES
+
+
+@dataclass(frozen=True)
+class SuperfluidFramework:
+    """The Superfluid host and Constant Flow Agreement of a chain."""
+
+    host_address: str
+    cfa_address: str
+
+
+class SuperfluidFrameworkResolver:
+    """Finds the Superfluid host and CFA of a chain.
+
+    The host of every supported chain is pinned, since transactions are sent to it and
+    it must not be taken from a contract the caller supplied. The CFA registered with
+    the host never changes, so it is read once per chain and kept in memory.
+    """
+
+    def __init__(self):
+        """Initialize the resolver."""
+        self._frameworks: dict[str, SuperfluidFramework] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, wallet_provider: EvmWalletProvider) -> SuperfluidFramework:
+        """Get the Superfluid framework of the wallet's chain.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider used for reads.
+
+        Returns:
+            SuperfluidFramework: The host and CFA addresses.
+
+        Raises:
+            ValueError: If Superfluid has no known host on the wallet's chain.
+
+        """
+        chain_id = wallet_provider.get_network().chain_id
+        with self._lock:
+            framework = self._frameworks.get(chain_id)
+        if framework is not None:
+            return framework
+
+        host_address = SUPERFLUID_HOST_ADDRESSES.get(chain_id)
+        if host_address is None:
+            raise ValueError(f"Superfluid batch calls are not supported on chain {chain_id}")
+
+        cfa_address = wallet_provider.read_contract(
+            contract_address=host_address,
+            abi=SUPERFLUID_HOST_ABI,
+            function_name="getAgreementClass",
+            args=[Web3.keccak(text=CFA_V1_AGREEMENT_TYPE)],
+        )
+
+        framework = SuperfluidFramework(host_address, Web3.to_checksum_address(cfa_address))
+        with self._lock:
+            self._frameworks[chain_id] = framework
+        return framework
@@ -1,6 +1,10 @@
 """Schemas for Superfluid action provider."""
 
-from pydantic import BaseModel, Field
+from typing import Literal
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from ...validators.eth import validate_eth_address, validate_eth_address_or_name
 
 
 class CreateFlowSchema(BaseModel):
@@ -24,3 +28,105 @@ class UpdateFlowSchema(BaseModel):
     recipient: str = Field(..., description="The wallet address of the recipient")
     token_address: str = Field(..., description="The address of the token that is being streamed")
     new_flow_rate: str = Field(..., description="The new flow rate of tokens in wei per second")
+
+
+class FlowOperationItem(BaseModel):
+    """A single flow change in a batch of flow changes."""
+
+    action: Literal["create", "update", "delete"] = Field(
+        ..., description="Whether to create, update or delete the flow"
+    )
+    recipient: str = Field(..., description="The wallet address of the recipient")
+    token_address: str = Field(..., description="The address of the token being streamed")
+    flow_rate: str | None = Field(
+        None,
+        description="The flow rate of tokens in wei per second, required to create or update",
+    )
+
+    @model_validator(mode="after")
+    def validate_flow_rate(self) -> "FlowOperationItem":
+        """Validate that creates and updates have an integer flow rate."""
+        if self.action != "delete":
+            if self.flow_rate is None:
+                raise ValueError(f"flow_rate is required to {self.action} a flow")
+            if not self.flow_rate.isdigit():
+                raise ValueError("flow_rate must be a whole number of wei per second")
+        return self
+
+
+class BatchFlowsSchema(BaseModel):
+    """Input argument schema for changing many flows in one transaction."""
+
+    operations: list[FlowOperationItem] = Field(
+        ..., min_length=1, description="The flows to create, update or delete, applied in order"
+    )
+
+
+class FlowQueryItem(BaseModel):
+    """A single flow to read."""
+
+    recipient: str = Field(..., description="The wallet address or name of the recipient")
+    token_address: str = Field(..., description="The address of the token being streamed")
+
+    @field_validator("recipient")
+    @classmethod
+    def validate_recipient(cls, v: str) -> str:
+        """Validate that the recipient is a valid Ethereum address or name.
+
+        Args:
+            v (str): The recipient address to validate
+
+        Returns:
+            str: The checksummed recipient address, or the recipient name
+
+        Raises:
+            ValueError: If the recipient is neither a name nor a valid address
+
+        """
+        return validate_eth_address_or_name(v)
+
+    @field_validator("token_address")
+    @classmethod
+    def validate_token_address(cls, v: str) -> str:
+        """Validate that the token address is a valid Ethereum address.
+
+        Args:
+            v (str): The token address to validate
+
+        Returns:
+            str: The checksummed token address
+
+        Raises:
+            ValueError: If the token address is invalid
+
+        """
+        return validate_eth_address(v)
+
+
+class GetFlowsSchema(BaseModel):
+    """Input argument schema for reading flows."""
+
+    flows: list[FlowQueryItem] = Field(
+        ..., min_length=1, description="The recipients and tokens of the flows to read"
+    )
+    sender: str | None = Field(
+        None,
+        description="The address or name sending the flows, defaults to the wallet address",
+    )
+
+    @field_validator("sender")
+    @classmethod
+    def validate_sender(cls, v: str | None) -> str | None:
+        """Validate that the sender is a valid Ethereum address or name.
+
+        Args:
+            v (str | None): The sender address to validate
+
+        Returns:
+            str | None: The checksummed sender address, or the sender name
+
+        Raises:
+            ValueError: If the sender is neither a name nor a valid address
+
+        """
+        return None if v is None else validate_eth_address_or_name(v)
@@ -1,22 +1,50 @@
 """Superfluid action provider."""
 
+import time
 from typing import Any
 
 from web3 import Web3
 
+from ...names import resolve_address, resolve_addresses
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
+from .batch import FlowOperation, encode_batch_call
 from .constants import CREATE_ABI, DELETE_ABI, SUPERFLUID_HOST_ADDRESS, UPDATE_ABI
-from .schemas import CreateFlowSchema, DeleteFlowSchema, UpdateFlowSchema
+from .flows import SuperfluidFlowReader
+from .framework import SuperfluidFrameworkResolver
+from .schemas import (
+    BatchFlowsSchema,
+    CreateFlowSchema,
+    DeleteFlowSchema,
+    GetFlowsSchema,
+    UpdateFlowSchema,
+)
+
+# How far ahead get_flows projects balances
+PROJECTION_SECONDS = 24 * 60 * 60
 
 
 class SuperfluidActionProvider(ActionProvider[EvmWalletProvider]):
     """Provides actions for interacting with Superfluid protocol."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        framework_resolver: SuperfluidFrameworkResolver | None = None,
+        flow_reader: SuperfluidFlowReader | None = None,
+    ):
+        """Initialize the Superfluid action provider.
+
+        Args:
+            framework_resolver (SuperfluidFrameworkResolver | None): Resolver of the host
+                and CFA addresses used for batch calls.
+            flow_reader (SuperfluidFlowReader | None): Reader used to get flows.
+
+        """
         super().__init__("superfluid", [])
+        self.framework_resolver = framework_resolver or SuperfluidFrameworkResolver()
+        self.flow_reader = flow_reader or SuperfluidFlowReader(self.framework_resolver)
 
     @create_action(
         name="create_flow",
@@ -169,6 +197,143 @@ Inputs:
         except Exception as e:
             return f"Error deleting flow: {e!s}"
 
+    @create_action(
+        name="batch_flows",
+        description="""
+This tool will create, update and delete many money flows in a single transaction using Superfluid. Do not use this tool for any other purpose, or trading other assets.
+Inputs:
+- operations: A list of flow changes, each with:
+  - action: create, update or delete
+  - recipient: The wallet address the tokens are streamed to
+  - token_address: The Super token contract address
+  - flow_rate: The flowrate in wei per second, required for create and update
+Important notes:
+- Prefer this tool over create_flow, update_flow and delete_flow when changing more than one flow.
+- All operations succeed or fail together, in the given order.
+- The tokens must be Superfluid Super tokens on the same network.
+- Only Base and Base Sepolia are supported.
+- The flowrate cannot have any decimal points, since the unit of measurement is wei per second.""",
+        schema=BatchFlowsSchema,
+    )
+    def batch_flows(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Change many money flows in one Superfluid host batch call.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        try:
+            validated_args = BatchFlowsSchema(**args)
+            operations = [
+                FlowOperation(
+                    item.action,
+                    item.token_address,
+                    item.recipient,
+                    None if item.flow_rate is None else int(item.flow_rate),
+                )
+                for item in validated_args.operations
+            ]
+
+            framework = self.framework_resolver.resolve(wallet_provider)
+            encoded_data = encode_batch_call(
+                framework.cfa_address, wallet_provider.get_address(), operations
+            )
+
+            params = {"to": framework.host_address, "data": encoded_data}
+
+            tx_hash = wallet_provider.send_transaction(params)
+
+            wallet_provider.wait_for_transaction_receipt(tx_hash)
+
+            return (
+                f"{len(operations)} flow operations applied successfully in one transaction. "
+                f"Transaction hash: {tx_hash}"
+            )
+
+        except Exception as e:
+            return f"Error batching flows: {e!s}"
+
+    @create_action(
+        name="get_flows",
+        description="""
+This tool will read existing money flows to token recipients and the sender's net flow using Superfluid. Do not use this tool for any other purpose, or trading other assets.
+Inputs:
+- flows: A list of flows to read, each with:
+  - recipient: The wallet address the tokens are streamed to
+  - token_address: The Super token contract address
+- sender: The address sending the flows (optional, defaults to the wallet address)
+It returns each flow's rate in wei per second, and per token the sender's net flow rate, its balance now and in 24 hours, and when it runs out at the current rate.
+Important notes:
+- Use this before update_flow or delete_flow to check that the flow exists, and before create_flow to check that it does not.
+- Only Base and Base Sepolia are supported.""",
+        schema=GetFlowsSchema,
+    )
+    def get_flows(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Read money flows and net flow balances using Superfluid.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider instance.
+            args (dict[str, Any]): Input arguments for the action.
+
+        Returns:
+            str: A message containing the action response or error details.
+
+        """
+        try:
+            validated_args = GetFlowsSchema(**args)
+            sender = (
+                resolve_address(wallet_provider, validated_args.sender)
+                if validated_args.sender
+                else wallet_provider.get_address()
+            )
+            recipients = resolve_addresses(
+                wallet_provider, [item.recipient for item in validated_args.flows]
+            )
+            snapshot = self.flow_reader.get_flows(
+                wallet_provider,
+                sender,
+                [
+                    (item.token_address, recipient)
+                    for item, recipient in zip(validated_args.flows, recipients, strict=True)
+                ],
+            )
+
+            lines = [f"Superfluid flows of {sender} at block {snapshot.block_number}:"]
+            for flow in snapshot.flows:
+                if isinstance(flow, Exception):
+                    lines.append(f"- error: {flow!s}")
+                elif not flow.exists:
+                    lines.append(f"- {flow.token_address} to {flow.receiver}: no flow")
+                else:
+                    lines.append(
+                        f"- {flow.token_address} to {flow.receiver}: {flow.flow_rate} wei per "
+                        f"second since unix time {flow.updated_at}"
+                    )
+
+            now = int(time.time())
+            lines.append("Net flows:")
+            for token_address, account in snapshot.accounts.items():
+                if isinstance(account, Exception):
+                    lines.append(f"- {token_address}: error: {account!s}")
+                    continue
+                line = (
+                    f"- {token_address}: {account.net_flow_rate} wei per second, "
+                    f"balance now {account.balance_at(now)} wei, "
+                    f"in 24 hours {account.balance_at(now + PROJECTION_SECONDS)} wei"
+                )
+                depleted_at = account.depleted_at()
+                if depleted_at is not None:
+                    line += f", runs out at unix time {depleted_at}"
+                lines.append(line)
+            return "\n".join(lines)
+
+        except Exception as e:
+            return f"Error getting flows: {e!s}"
+
     def supports_network(self, network: Network) -> bool:
         """Check if network is supported by Superfluid actions.
 
@@ -182,11 +347,19 @@ Inputs:
         return network.protocol_family == "evm"
 
 
-def superfluid_action_provider() -> SuperfluidActionProvider:
+def superfluid_action_provider(
+    framework_resolver: SuperfluidFrameworkResolver | None = None,
+    flow_reader: SuperfluidFlowReader | None = None,
+) -> SuperfluidActionProvider:
     """Create a new Superfluid action provider.
 
+    Args:
+        framework_resolver (SuperfluidFrameworkResolver | None): Resolver of the host and
+            CFA addresses used for batch calls.
+        flow_reader (SuperfluidFlowReader | None): Reader used to get flows.
+
     Returns:
         SuperfluidActionProvider: A new Superfluid action provider instance.
 
     """
-    return SuperfluidActionProvider()
+    return SuperfluidActionProvider(framework_resolver, flow_reader)
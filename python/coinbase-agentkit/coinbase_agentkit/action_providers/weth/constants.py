@@ -2,6 +2,19 @@
 
 WETH_ADDRESS = "0x4200000000000000000000000000000000000006"
 
+# WETH contracts of the chains in chain_definitions whose native currency is ETH,
+# keyed by chain ID. A "weth" entry in a chain's contracts takes precedence.
+WETH_ADDRESSES: dict[str, str] = {
+    "1": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+    "11155111": "0xfFf9976782d46CC05630D1f6eBAb18b2324d6B14",
+    "8453": WETH_ADDRESS,
+    "84532": WETH_ADDRESS,
+    "10": WETH_ADDRESS,
+    "11155420": WETH_ADDRESS,
+    "42161": "0x82aF49447D8a07e3bd95BD0d56f35241523fBab1",
+    "421614": "0x980B62Da83eFf3D4576C647993b0c1D7faf17c73",
+}
+
 MIN_WRAP_AMOUNT = 100_000_000_000_000
 
 WETH_ABI = [
@@ -12,4 +25,18 @@ WETH_ABI = [
         "stateMutability": "payable",
         "type": "function",
     },
+    {
+        "inputs": [{"internalType": "uint256", "name": "wad", "type": "uint256"}],
+        "name": "withdraw",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
 ]
@@ -2,7 +2,7 @@
 
 import re
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 
 from .constants import MIN_WRAP_AMOUNT
 
@@ -12,7 +12,7 @@ class WrapEthSchema(BaseModel):
 
     amount_to_wrap: str = Field(..., description="Amount of ETH to wrap in wei")
 
-    @validator("amount_to_wrap")
+    @field_validator("amount_to_wrap")
     @classmethod
     def validate_amount(cls, v: str) -> str:
         """Validate that amount is a valid wei value (whole number as string)."""
@@ -23,3 +23,35 @@ class WrapEthSchema(BaseModel):
             raise ValueError(f"Amount must be at least {MIN_WRAP_AMOUNT} wei (0.0001 WETH)")
 
         return v
+
+
+class UnwrapEthSchema(BaseModel):
+    """Input schema for unwrapping WETH to ETH."""
+
+    amount_to_unwrap: str = Field(..., description="Amount of WETH to unwrap in wei")
+
+    @field_validator("amount_to_unwrap")
+    @classmethod
+    def validate_amount(cls, v: str) -> str:
+        """Validate that amount is a positive wei value (whole number as string)."""
+        if not re.match(r"^[0-9]+$", v) or int(v) == 0:
+            raise ValueError("Amount must be a positive whole number as a string")
+
+        return v
+
+
+class WrapEthIfNeededSchema(BaseModel):
+    """Input schema for topping up the WETH balance by wrapping ETH."""
+
+    required_weth_amount: str = Field(
+        ..., description="The WETH balance the wallet needs to have, in wei"
+    )
+
+    @field_validator("required_weth_amount")
+    @classmethod
+    def validate_amount(cls, v: str) -> str:
+        """Validate that amount is a valid wei value (whole number as string)."""
+        if not re.match(r"^[0-9]+$", v):
+            raise ValueError("Amount must be a whole number as a string")
+
+        return v
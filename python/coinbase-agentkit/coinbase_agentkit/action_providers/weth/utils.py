@@ -0,0 +1,20 @@
+"""Utilities for WETH action provider."""
+
+from ...network import CHAIN_ID_TO_NETWORK_ID, NETWORK_ID_TO_CHAIN
+from .constants import WETH_ADDRESSES
+
+
+def get_weth_address(chain_id: str | None) -> str | None:
+    """Get the WETH contract of a chain.
+
+    Args:
+        chain_id (str | None): The chain ID.
+
+    Returns:
+        str | None: The WETH address, or None if the chain has no known WETH contract.
+
+    """
+    chain = NETWORK_ID_TO_CHAIN.get(CHAIN_ID_TO_NETWORK_ID.get(chain_id, ""))
+    if chain is not None and "weth" in chain.contracts:
+        return chain.contracts["weth"].address
+    return WETH_ADDRESSES.get(chain_id)
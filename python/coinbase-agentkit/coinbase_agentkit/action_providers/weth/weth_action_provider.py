@@ -2,21 +2,71 @@ from typing import Any
 
 from web3 import Web3
 
+from ...cache import ChainBlockCaches
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
-from .constants import WETH_ABI, WETH_ADDRESS
-from .schemas import WrapEthSchema
-
-SUPPORTED_CHAINS = ["8453", "84532"]
+from .constants import MIN_WRAP_AMOUNT, WETH_ABI
+from .schemas import UnwrapEthSchema, WrapEthIfNeededSchema, WrapEthSchema
+from .utils import get_weth_address
 
 
 class WethActionProvider(ActionProvider[EvmWalletProvider]):
-    """Provides actions for interacting with WETH."""
+    """Provides actions for interacting with WETH.
+
+    The WETH contract is resolved per chain. WETH balances are cached per block, so
+    checking the balance before a wrap or unwrap costs no extra request within a block.
+    """
 
     def __init__(self):
+        """Initialize the WETH action provider."""
         super().__init__("weth", [])
+        self._balance_caches = ChainBlockCaches()
+
+    @staticmethod
+    def _weth_address(wallet_provider: EvmWalletProvider) -> str:
+        chain_id = wallet_provider.get_network().chain_id
+        weth_address = get_weth_address(chain_id)
+        if weth_address is None:
+            raise ValueError(f"WETH is not available on chain {chain_id}")
+        return weth_address
+
+    def get_weth_balance(self, wallet_provider: EvmWalletProvider) -> int:
+        """Get the wallet's WETH balance, cached for the latest block.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider to read the balance of.
+
+        Returns:
+            int: The WETH balance in wei.
+
+        """
+        weth_address = self._weth_address(wallet_provider)
+        owner = wallet_provider.get_address()
+        return self._balance_caches.get(wallet_provider).get_or_fetch(
+            (weth_address, owner.lower()),
+            lambda block_number: wallet_provider.read_contract(
+                contract_address=weth_address,
+                abi=WETH_ABI,
+                function_name="balanceOf",
+                args=[owner],
+                block_identifier=block_number,
+            ),
+        )
+
+    def _send_wrap(
+        self, wallet_provider: EvmWalletProvider, weth_address: str, amount: int | str
+    ) -> str:
+        contract = Web3().eth.contract(address=weth_address, abi=WETH_ABI)
+        data = contract.encode_abi("deposit", args=[])
+
+        tx_hash = wallet_provider.send_transaction(
+            {"to": weth_address, "data": data, "value": amount}
+        )
+        wallet_provider.wait_for_transaction_receipt(tx_hash)
+        self._balance_caches.get(wallet_provider).invalidate()
+        return tx_hash
 
     @create_action(
         name="wrap_eth",
@@ -49,16 +99,110 @@ Important notes:
         try:
             validated_args = WrapEthSchema(**args)
 
-            contract = Web3().eth.contract(address=WETH_ADDRESS, abi=WETH_ABI)
-            data = contract.encode_abi("deposit", args=[])
-
-            tx_hash = wallet_provider.send_transaction(
-                {"to": WETH_ADDRESS, "data": data, "value": validated_args.amount_to_wrap}
+            tx_hash = self._send_wrap(
+                wallet_provider,
+                self._weth_address(wallet_provider),
+                validated_args.amount_to_wrap,
             )
 
+            return f"Wrapped ETH with transaction hash: {tx_hash}"
+        except Exception as e:
+            return f"Error wrapping ETH: {e}"
+
+    @create_action(
+        name="unwrap_eth",
+        description="""
+    This tool can only be used to unwrap WETH to ETH.
+Do not use this tool for any other purpose, or trading other assets.
+
+Inputs:
+- Amount of WETH to unwrap.
+
+Important notes:
+- The amount is a string and cannot have any decimal points, since the unit of measurement is wei.
+- Make sure to use the exact amount provided, and if there's any doubt, check by getting more information before continuing with the action.
+- 1 wei = 0.000000000000000001 WETH
+- The WETH balance is checked first, so nothing is sent if it does not cover the amount.
+""",
+        schema=UnwrapEthSchema,
+    )
+    def unwrap_eth(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Unwrap WETH to ETH by calling the withdraw function on the WETH contract.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider to unwrap WETH from.
+            args (dict[str, Any]): Arguments containing amount_to_unwrap in wei.
+
+        Returns:
+            str: A message containing the unwrap details or error message.
+
+        """
+        try:
+            validated_args = UnwrapEthSchema(**args)
+            amount = int(validated_args.amount_to_unwrap)
+            weth_address = self._weth_address(wallet_provider)
+
+            balance = self.get_weth_balance(wallet_provider)
+            if balance < amount:
+                return (
+                    f"Error unwrapping ETH: insufficient WETH balance, "
+                    f"have {balance} wei but need {amount} wei"
+                )
+
+            contract = Web3().eth.contract(address=weth_address, abi=WETH_ABI)
+            data = contract.encode_abi("withdraw", args=[amount])
+
+            tx_hash = wallet_provider.send_transaction({"to": weth_address, "data": data})
+
             wallet_provider.wait_for_transaction_receipt(tx_hash)
+            self._balance_caches.get(wallet_provider).invalidate()
 
-            return f"Wrapped ETH with transaction hash: {tx_hash}"
+            return f"Unwrapped WETH with transaction hash: {tx_hash}"
+        except Exception as e:
+            return f"Error unwrapping ETH: {e}"
+
+    @create_action(
+        name="wrap_eth_if_needed",
+        description="""
+    This tool can only be used to make sure the wallet holds a WETH balance, wrapping ETH only if needed.
+Do not use this tool for any other purpose, or trading other assets.
+
+Inputs:
+- The WETH balance the wallet needs to have.
+
+Important notes:
+- The amount is a string and cannot have any decimal points, since the unit of measurement is wei.
+- Use this instead of wrap_eth before an action that spends WETH, so ETH is only wrapped when the WETH balance is short.
+- Only the missing amount is wrapped, with a minimum of 100000000000000 wei (0.0001 WETH).
+""",
+        schema=WrapEthIfNeededSchema,
+    )
+    def wrap_eth_if_needed(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Wrap ETH to WETH only when the WETH balance is below a required amount.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider to wrap ETH from.
+            args (dict[str, Any]): Arguments containing required_weth_amount in wei.
+
+        Returns:
+            str: A message containing the wrap details or error message.
+
+        """
+        try:
+            validated_args = WrapEthIfNeededSchema(**args)
+            required = int(validated_args.required_weth_amount)
+            weth_address = self._weth_address(wallet_provider)
+
+            balance = self.get_weth_balance(wallet_provider)
+            if balance >= required:
+                return (
+                    f"WETH balance of {balance} wei already covers {required} wei, nothing wrapped"
+                )
+
+            amount = max(required - balance, MIN_WRAP_AMOUNT)
+            tx_hash = self._send_wrap(wallet_provider, weth_address, amount)
+
+            return f"Wrapped {amount} wei of ETH with transaction hash: {tx_hash}"
         except Exception as e:
             return f"Error wrapping ETH: {e}"
 
@@ -72,7 +216,7 @@ Important notes:
             bool: True if the network is supported, False otherwise.
 
         """
-        return network.chain_id in SUPPORTED_CHAINS
+        return network.protocol_family == "evm" and get_weth_address(network.chain_id) is not None
 
 
 def weth_action_provider() -> WethActionProvider:
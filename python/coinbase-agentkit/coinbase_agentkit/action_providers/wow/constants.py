@@ -816,11 +816,22 @@ WOW_ABI = [
     {"stateMutability": "payable", "type": "receive"},
 ]
 
+CHAIN_ID_TO_WOW_NETWORK = {
+    "8453": "base-mainnet",
+    "84532": "base-sepolia",
+}
+
 WOW_FACTORY_CONTRACT_ADDRESSES = {
     "base-sepolia": "0x04870e22fa217Cb16aa00501D7D5253B8838C1eA",
     "base-mainnet": "0x997020E5F59cCB79C74D527Be492Cc610CB9fA2B",
 }
 
+# keccak256 of the WOW token events used to index tokens
+WOW_TOKEN_CREATED_EVENT_TOPIC = "0xc14d4a89f40f2ad9a3bacaae76b1d8567b797e367ed13e62996afbb52625457f"
+WOW_MARKET_GRADUATED_EVENT_TOPIC = (
+    "0x9b932ef08aec7b34ee4d1c09579d92521b437379b5cab356f34588f1cdbbf968"
+)
+
 addresses = {
     "base-sepolia": {
         "wow_factory": "0xB09c0b1b18369Ef62e896D5a49Af8d65EFa0A404",
@@ -0,0 +1,411 @@
+"""Quotes for WOW token trades computed from batched reads."""
+
+import threading
+from dataclasses import dataclass
+from typing import Literal
+
+from web3 import Web3
+
+from ...cache import ChainBlockCaches
+from ...multicall import Call, CallResult, multicall
+from ...wallet_providers import EvmWalletProvider
+from .constants import CHAIN_ID_TO_WOW_NETWORK, WOW_ABI, addresses
+from .uniswap.constants import UNISWAP_QUOTER_ABI, UNISWAP_V3_ABI
+from .uniswap.pool_state import PoolState
+from .uniswap.utils import get_pool_state
+
+QuoteSide = Literal["buy", "sell"]
+
+# Market type of tokens whose liquidity moved from the bonding curve to Uniswap V3
+GRADUATED_MARKET_TYPE = 1
+
+_CURVE_QUOTE_FUNCTIONS = {"buy": "getEthBuyQuote", "sell": "getTokenSellQuote"}
+
+
+@dataclass(frozen=True)
+class WowQuote:
+    """A quote for buying or selling a WOW token."""
+
+    amount_in: int
+    amount_out: int
+    has_graduated: bool
+
+
+@dataclass(frozen=True)
+class QuoteCurvePoint:
+    """One sampled amount of a quote curve."""
+
+    amount_in: int
+    amount_out: int | None
+    price_impact: float | None
+
+
+@dataclass(frozen=True)
+class WowQuoteCurve:
+    """Quotes of a WOW token trade sampled at several amounts on one block."""
+
+    token_address: str
+    side: QuoteSide
+    has_graduated: bool
+    block_number: int
+    points: list[QuoteCurvePoint]
+
+    def table(self) -> str:
+        """Format the curve as a price-impact table for an action response.
+
+        Returns:
+            str: One row per sampled amount with the amount in and out in wei, the
+                amount received per unit sold and the price impact.
+
+        """
+        rows = ["amount in (wei) | amount out (wei) | out per in | price impact"]
+        for point in self.points:
+            if point.amount_out is None:
+                rows.append(f"{point.amount_in} | reverted | - | -")
+                continue
+            impact = "-" if point.price_impact is None else f"{point.price_impact:.2%}"
+            rows.append(
+                f"{point.amount_in} | {point.amount_out} | "
+                f"{point.amount_out / point.amount_in:.6g} | {impact}"
+            )
+        return "\n".join(rows)
+
+
+def sample_amounts(max_amount: int, points: int) -> list[int]:
+    """Get amounts spaced geometrically up to a maximum, each twice the previous.
+
+    Args:
+        max_amount (int): The largest amount to sample.
+        points (int): The number of amounts to sample.
+
+    Returns:
+        list[int]: The distinct nonzero amounts, in ascending order.
+
+    """
+    return sorted({max_amount >> shift for shift in range(points)} - {0})
+
+
+def _price_impacts(amounts_in: list[int], amounts_out: list[int | None]) -> list[float | None]:
+    """Get each sample's price impact relative to the rate of the smallest quoted sample."""
+    rates = [
+        None if amount_out is None else amount_out / amount_in
+        for amount_in, amount_out in zip(amounts_in, amounts_out, strict=True)
+    ]
+    reference = next((rate for rate in rates if rate), None)
+    return [None if rate is None or not reference else 1 - rate / reference for rate in rates]
+
+
+@dataclass(frozen=True)
+class _GraduatedPool:
+    """Uniswap V3 pool parameters of a graduated token, which never change."""
+
+    pool_address: str
+    fee: int
+
+
+class WowQuoteEngine:
+    """Computes WOW buy and sell quotes with as few RPC requests as possible.
+
+    The market type, pool address and bonding curve quote are read in one multicall,
+    so a token still on its bonding curve is quoted with a single request. Graduation
+    is permanent and a graduated token's pool address and fee never change, so they
+    are cached after the first quote; from then on a graduated token is quoted with one
+    multicall holding the Uniswap quoter call and the bonding curve fallback.
+
+    With local Uniswap quotes enabled, a graduated token's swap is instead simulated
+    in process over a snapshot of its pool state, which is cached per block. Repeated
+    quotes on the same block then make no RPC requests. The quoter is still used when
+    the snapshot cannot be read or the swap moves past the ticks it covers.
+
+    Quote curves sample many amounts in one multicall and are cached per block too.
+    """
+
+    def __init__(self, local_uniswap_quotes: bool = True):
+        """Initialize the quote engine.
+
+        Args:
+            local_uniswap_quotes (bool): Whether to simulate Uniswap swaps over cached
+                pool state instead of calling the quoter for every quote.
+
+        """
+        self._pools: dict[str, _GraduatedPool] = {}
+        self._block_caches = ChainBlockCaches()
+        self._local_uniswap_quotes = local_uniswap_quotes
+        self._lock = threading.Lock()
+
+    def quote(
+        self,
+        wallet_provider: EvmWalletProvider,
+        token_address: str,
+        amount: int,
+        side: QuoteSide,
+    ) -> WowQuote:
+        """Quote a trade of a WOW token.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider used for reads.
+            token_address (str): The WOW token address.
+            amount (int): For a buy, the ETH to spend in wei. For a sell, the tokens to
+                sell in wei.
+            side (QuoteSide): Whether to quote a buy or a sell.
+
+        Returns:
+            WowQuote: The amount of tokens (buy) or ETH (sell) received, in wei.
+
+        Raises:
+            ValueError: If WOW is not deployed on the wallet's network.
+            Exception: If neither the bonding curve nor Uniswap could quote the trade.
+
+        """
+        chain_id, network = self._network(wallet_provider)
+        token_address = Web3.to_checksum_address(token_address)
+        curve_call = Call(token_address, WOW_ABI, _CURVE_QUOTE_FUNCTIONS[side], (amount,))
+
+        key = f"{chain_id}:{token_address.lower()}"
+        with self._lock:
+            pool = self._pools.get(key)
+
+        if pool is None:
+            market_type, pool_address, curve_quote = multicall(
+                wallet_provider,
+                [
+                    Call(token_address, WOW_ABI, "marketType"),
+                    Call(token_address, WOW_ABI, "poolAddress"),
+                    curve_call,
+                ],
+            )
+            pool = self._graduated_pool(wallet_provider, key, market_type, pool_address)
+            if pool is None:
+                return WowQuote(amount, self._amount_out(curve_quote), has_graduated=False)
+
+        weth = addresses[network]["weth"]
+        token_in, token_out = (weth, token_address) if side == "buy" else (token_address, weth)
+
+        if self._local_uniswap_quotes:
+            amount_out = self._local_quote(wallet_provider, pool, token_in, amount)
+            if amount_out:
+                return WowQuote(amount, amount_out, has_graduated=True)
+            if amount_out == 0:
+                (curve_quote,) = multicall(wallet_provider, [curve_call])
+                return WowQuote(amount, self._amount_out(curve_quote), has_graduated=True)
+
+        uniswap_quote, curve_quote = multicall(
+            wallet_provider,
+            [
+                Call(
+                    addresses[network]["uniswap_quoter"],
+                    UNISWAP_QUOTER_ABI,
+                    "quoteExactInputSingle",
+                    ((token_in, token_out, amount, pool.fee, 0),),
+                ),
+                curve_call,
+            ],
+        )
+
+        if uniswap_quote.success and uniswap_quote.value[0]:
+            return WowQuote(amount, uniswap_quote.value[0], has_graduated=True)
+        return WowQuote(amount, self._amount_out(curve_quote), has_graduated=True)
+
+    def quote_curve(
+        self,
+        wallet_provider: EvmWalletProvider,
+        token_address: str,
+        amounts: list[int],
+        side: QuoteSide,
+    ) -> WowQuoteCurve:
+        """Quote a trade of a WOW token at many amounts at once.
+
+        Every quote is read at the same block. The market type is read first, unless the
+        token is already known to have graduated. A token on its bonding curve is then
+        sampled with one multicall holding every curve quote. A graduated token is
+        simulated over its pool state at that block, which is pure CPU once the state is
+        cached, and the amounts the snapshot cannot cover are batched into one quoter
+        multicall. The curve is cached per (token, side, amounts) for the block.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider used for reads.
+            token_address (str): The WOW token address.
+            amounts (list[int]): The amounts to quote, in ascending order, in wei.
+            side (QuoteSide): Whether to quote buys or sells.
+
+        Returns:
+            WowQuoteCurve: The sampled quotes and their price impact relative to the
+                smallest amount.
+
+        Raises:
+            ValueError: If WOW is not deployed on the wallet's network.
+            Exception: If the market type could not be read or no amount could be quoted.
+
+        """
+        chain_id, network = self._network(wallet_provider)
+        token_address = Web3.to_checksum_address(token_address)
+        key = f"{chain_id}:{token_address.lower()}"
+
+        def fetch(block_number: int) -> WowQuoteCurve:
+            with self._lock:
+                pool = self._pools.get(key)
+
+            if pool is None:
+                market_type, pool_address = multicall(
+                    wallet_provider,
+                    [
+                        Call(token_address, WOW_ABI, "marketType"),
+                        Call(token_address, WOW_ABI, "poolAddress"),
+                    ],
+                    block_number,
+                )
+                pool = self._graduated_pool(wallet_provider, key, market_type, pool_address)
+
+            if pool is None:
+                amounts_out = [
+                    int(result.value) if result.success else None
+                    for result in multicall(
+                        wallet_provider,
+                        [
+                            Call(token_address, WOW_ABI, _CURVE_QUOTE_FUNCTIONS[side], (amount,))
+                            for amount in amounts
+                        ],
+                        block_number,
+                    )
+                ]
+            else:
+                weth = addresses[network]["weth"]
+                token_in, token_out = (
+                    (weth, token_address) if side == "buy" else (token_address, weth)
+                )
+                amounts_out = self._pool_quotes(
+                    wallet_provider, network, pool, token_in, token_out, amounts, block_number
+                )
+            if all(amount_out is None for amount_out in amounts_out):
+                raise Exception("Failed fetching quote for every amount")
+
+            return WowQuoteCurve(
+                token_address,
+                side,
+                pool is not None,
+                block_number,
+                [
+                    QuoteCurvePoint(amount_in, amount_out, price_impact)
+                    for amount_in, amount_out, price_impact in zip(
+                        amounts, amounts_out, _price_impacts(amounts, amounts_out), strict=True
+                    )
+                ],
+            )
+
+        return self._block_caches.get(wallet_provider).get_or_fetch(
+            ("quote_curve", token_address.lower(), side, tuple(amounts)), fetch
+        )
+
+    def _graduated_pool(
+        self,
+        wallet_provider: EvmWalletProvider,
+        key: str,
+        market_type: CallResult,
+        pool_address: CallResult,
+    ) -> _GraduatedPool | None:
+        """Get the pool of a token that has graduated, caching it, or None if it has not."""
+        if not market_type.success:
+            raise Exception(f"Failed to read market type: {market_type.error}")
+        if market_type.value != GRADUATED_MARKET_TYPE or not pool_address.success:
+            return None
+
+        (fee,) = multicall(wallet_provider, [Call(pool_address.value, UNISWAP_V3_ABI, "fee")])
+        if not fee.success:
+            raise Exception(f"Failed to fetch pool information: {fee.error}")
+
+        pool = _GraduatedPool(pool_address.value, fee.value)
+        with self._lock:
+            self._pools[key] = pool
+        return pool
+
+    def _pool_quotes(
+        self,
+        wallet_provider: EvmWalletProvider,
+        network: str,
+        pool: _GraduatedPool,
+        token_in: str,
+        token_out: str,
+        amounts: list[int],
+        block_number: int,
+    ) -> list[int | None]:
+        """Quote swaps through a graduated token's pool at a block."""
+        amounts_out: list[int | None] = [None] * len(amounts)
+        if self._local_uniswap_quotes:
+            try:
+                pool_state = self._pool_state(wallet_provider, pool, block_number)
+            except Exception:
+                pool_state = None
+            for i, amount in enumerate(amounts):
+                if pool_state is None:
+                    break
+                try:
+                    amounts_out[i] = (
+                        pool_state.quote_exact_input(token_in, amount).amount_out or None
+                    )
+                except Exception:
+                    continue
+
+        missing = [i for i, amount_out in enumerate(amounts_out) if amount_out is None]
+        if missing:
+            quotes = multicall(
+                wallet_provider,
+                [
+                    Call(
+                        addresses[network]["uniswap_quoter"],
+                        UNISWAP_QUOTER_ABI,
+                        "quoteExactInputSingle",
+                        ((token_in, token_out, amounts[i], pool.fee, 0),),
+                    )
+                    for i in missing
+                ],
+                block_number,
+            )
+            for i, quote in zip(missing, quotes, strict=True):
+                if quote.success and quote.value[0]:
+                    amounts_out[i] = quote.value[0]
+        return amounts_out
+
+    @staticmethod
+    def _network(wallet_provider: EvmWalletProvider) -> tuple[str, str]:
+        chain_id = wallet_provider.get_network().chain_id
+        network = CHAIN_ID_TO_WOW_NETWORK.get(chain_id)
+        if network is None:
+            raise ValueError(f"Unsupported network: {chain_id}")
+        return chain_id, network
+
+    def _pool_state(
+        self, wallet_provider: EvmWalletProvider, pool: _GraduatedPool, block_number: int
+    ) -> PoolState:
+        """Get the snapshot of a pool's state at a block, reusing the cached one."""
+        block_cache = self._block_caches.get(wallet_provider)
+        # Snapshots of past blocks are read without touching the cache
+        if block_number != block_cache.block_number():
+            return get_pool_state(wallet_provider, pool.pool_address, block_number)
+
+        key = ("pool_state", pool.pool_address.lower())
+        pool_state: PoolState | None = block_cache.get(key)
+        if pool_state is None:
+            pool_state = get_pool_state(wallet_provider, pool.pool_address, block_number)
+            block_cache.set(key, pool_state, block_number)
+        return pool_state
+
+    def _local_quote(
+        self,
+        wallet_provider: EvmWalletProvider,
+        pool: _GraduatedPool,
+        token_in: str,
+        amount: int,
+    ) -> int | None:
+        """Simulate a swap over the pool's cached state, or return None if it is unknown."""
+        try:
+            block_number = self._block_caches.get(wallet_provider).block_number()
+            pool_state = self._pool_state(wallet_provider, pool, block_number)
+            return pool_state.quote_exact_input(token_in, amount).amount_out
+        except Exception:
+            return None
+
+    @staticmethod
+    def _amount_out(result: CallResult) -> int:
+        if not result.success:
+            raise Exception(f"Failed fetching quote: {result.error}")
+        return int(result.value)
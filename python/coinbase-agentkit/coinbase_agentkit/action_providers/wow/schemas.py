@@ -1,5 +1,7 @@
 """Schemas for WOW action provider."""
 
+from typing import Literal
+
 from pydantic import BaseModel, Field, field_validator
 
 from ...validators.eth import validate_eth_address
@@ -65,3 +67,48 @@ class WowSellTokenSchema(BaseModel):
 
         """
         return validate_eth_address(v)
+
+
+class WowQuoteCurveSchema(BaseModel):
+    """Input schema for sampling WOW token quotes at many amounts."""
+
+    contract_address: str = Field(..., description="The WOW token contract address")
+    side: Literal["buy", "sell"] = Field(
+        ..., description="Whether to quote buying tokens with ETH or selling tokens for ETH"
+    )
+    max_amount_in_wei: str = Field(
+        ...,
+        description="The largest amount to quote (in wei), ETH for buys and tokens for sells",
+        pattern=r"^\d+$",
+    )
+    points: int = Field(
+        10, description="Number of amounts to sample, each twice the previous", ge=2, le=50
+    )
+
+    @field_validator("contract_address")
+    @classmethod
+    def validate_address(cls, v: str) -> str:
+        """Validate that the contract address is a valid Ethereum address.
+
+        Args:
+            v (str): The contract address to validate
+
+        Returns:
+            str: The validated contract address
+
+        Raises:
+            ValueError: If the address is not a valid Ethereum address
+
+        """
+        return validate_eth_address(v)
+
+
+class WowSearchTokensSchema(BaseModel):
+    """Input schema for searching indexed WOW tokens."""
+
+    query: str = Field(
+        ...,
+        description="A token symbol, part of a name or symbol, or an address prefix",
+        min_length=1,
+    )
+    limit: int = Field(10, description="Maximum number of tokens to return", ge=1, le=50)
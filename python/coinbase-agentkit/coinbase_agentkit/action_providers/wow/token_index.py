@@ -0,0 +1,480 @@
+"""Local index of WOW tokens built from their creation and graduation events."""
+
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+
+from eth_abi import decode
+from web3 import Web3
+from web3.types import FilterParams, LogReceipt
+
+from ...cache import default_cache_dir
+from ...indexing import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_CONFIRMATIONS,
+    LogScanner,
+    find_deployment_block,
+    is_historical_state_error,
+)
+from ...multicall import Call, get_function_codec, multicall
+from ...wallet_providers import EvmWalletProvider
+from .constants import (
+    CHAIN_ID_TO_WOW_NETWORK,
+    WOW_ABI,
+    WOW_FACTORY_ABI,
+    WOW_FACTORY_CONTRACT_ADDRESSES,
+    WOW_MARKET_GRADUATED_EVENT_TOPIC,
+    WOW_TOKEN_CREATED_EVENT_TOPIC,
+)
+
+DEFAULT_INDEX_FILENAME = "wow_tokens.sqlite"
+
+# Minimum number of seconds between two syncs of the same chain
+DEFAULT_SYNC_INTERVAL = 60.0
+
+# Types of the non-indexed WowTokenCreated fields, in event order
+_TOKEN_CREATED_DATA_TYPES = [
+    "address",  # platformReferrer
+    "address",  # protocolFeeRecipient
+    "address",  # bondingCurve
+    "string",  # tokenURI
+    "string",  # name
+    "string",  # symbol
+    "address",  # tokenAddress
+    "address",  # poolAddress
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tokens (
+    chain_id TEXT NOT NULL,
+    address TEXT NOT NULL,
+    name TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    creator TEXT NOT NULL,
+    pool_address TEXT NOT NULL,
+    created_block INTEGER NOT NULL,
+    graduated INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (chain_id, address)
+);
+CREATE INDEX IF NOT EXISTS tokens_symbol ON tokens (chain_id, symbol COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS cursors (
+    chain_id TEXT PRIMARY KEY,
+    last_block INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bonding_curves (
+    chain_id TEXT NOT NULL,
+    address TEXT NOT NULL,
+    PRIMARY KEY (chain_id, address)
+);
+"""
+
+
+@dataclass(frozen=True)
+class WowToken:
+    """A WOW token in the index."""
+
+    address: str
+    name: str
+    symbol: str
+    creator: str
+    pool_address: str
+    created_block: int
+    graduated: bool
+
+
+def _topic_to_address(topic: bytes | str) -> str:
+    topic = topic.hex() if isinstance(topic, bytes) else topic
+    return Web3.to_checksum_address("0x" + topic.removeprefix("0x")[-40:])
+
+
+def _data_to_bytes(data: bytes | str) -> bytes:
+    return data if isinstance(data, bytes) else bytes.fromhex(data.removeprefix("0x"))
+
+
+def _event_topic(log: LogReceipt) -> str:
+    topic = log["topics"][0]
+    topic = topic.hex() if isinstance(topic, bytes) else topic
+    return "0x" + topic.removeprefix("0x")
+
+
+@dataclass(frozen=True)
+class _CreatedToken:
+    """A token announced by a WowTokenCreated log, before it is verified."""
+
+    address: str
+    name: str
+    symbol: str
+    creator: str
+    bonding_curve: str
+    pool_address: str
+    created_block: int
+
+
+class WowTokenIndex:
+    """Indexes WOW tokens per chain in a local sqlite database.
+
+    Tokens are discovered from the WowTokenCreated events a token emits with the chain's
+    WOW factory as indexed ``factoryAddress``. Since any contract can emit such an
+    event, a token is only indexed if it emitted the event itself and, read onchain, it
+    uses the bonding curve and the pool announced in the event. That bonding curve must
+    be one the factory has used: every curve the factory reports is remembered per
+    chain, so tokens created before the factory's curve was replaced stay indexed. Tokens
+    are marked graduated on the WowMarketGraduated events they emit themselves.
+
+    Scanning starts at the factory's deployment, found onchain on the first sync, and
+    stays ``confirmations`` blocks behind the head, so a reorganized block is never
+    indexed. The last scanned block is stored with the tokens, and every sync only reads
+    blocks produced since the previous one. Searches only query the database.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+        start_blocks: dict[str, int] | None = None,
+        confirmations: int = DEFAULT_CONFIRMATIONS,
+    ):
+        """Initialize the token index.
+
+        Args:
+            path (str | Path | None): The sqlite database file. Defaults to a file in the
+                AgentKit cache directory.
+            chunk_size (int): Maximum number of blocks requested per eth_getLogs call.
+            sync_interval (float): Minimum seconds between two background syncs of a chain.
+            start_blocks (dict[str, int] | None): Block to start the first scan at per
+                chain ID. Defaults to the factory's deployment block, or to block 0 on
+                endpoints without archive state.
+            confirmations (int): Number of blocks behind the head the index stays at.
+
+        """
+        self._path = Path(path) if path is not None else None
+        self._scanner = LogScanner(chunk_size)
+        self._sync_interval = sync_interval
+        self._start_blocks = dict(start_blocks or {})
+        self._confirmations = confirmations
+        self._synced_at: dict[str, float] = {}
+        self._syncing: set[str] = set()
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """The sqlite database file."""
+        if self._path is None:
+            self._path = default_cache_dir() / DEFAULT_INDEX_FILENAME
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.executescript(_SCHEMA)
+        return connection
+
+    @staticmethod
+    def _filters(chain_id: str) -> list[FilterParams]:
+        factory_address = WOW_FACTORY_CONTRACT_ADDRESSES[CHAIN_ID_TO_WOW_NETWORK[chain_id]]
+        factory_topic = "0x" + bytes.fromhex(factory_address[2:].lower()).rjust(32, b"\0").hex()
+        return [
+            {"topics": [WOW_TOKEN_CREATED_EVENT_TOPIC, factory_topic]},
+            {"topics": [WOW_MARKET_GRADUATED_EVENT_TOPIC]},
+        ]
+
+    @staticmethod
+    def _created_tokens(logs: list[LogReceipt]) -> list[_CreatedToken]:
+        tokens = []
+        for log in logs:
+            topics = log["topics"]
+            if _event_topic(log) != WOW_TOKEN_CREATED_EVENT_TOPIC or len(topics) != 3:
+                continue
+
+            (_, _, bonding_curve, _, name, symbol, token_address, pool_address) = decode(
+                _TOKEN_CREATED_DATA_TYPES, _data_to_bytes(log["data"])
+            )
+            # Tokens announce their own creation, so logs emitted by other contracts are forged
+            if token_address.lower() != log["address"].lower():
+                continue
+
+            tokens.append(
+                _CreatedToken(
+                    Web3.to_checksum_address(token_address),
+                    name,
+                    symbol,
+                    _topic_to_address(topics[2]),
+                    Web3.to_checksum_address(bonding_curve),
+                    Web3.to_checksum_address(pool_address),
+                    log["blockNumber"],
+                )
+            )
+        return tokens
+
+    def _start_block(self, wallet_provider: EvmWalletProvider, chain_id: str, latest: int) -> int:
+        """Find the block the chain's WOW factory was deployed at.
+
+        The lookup calls the factory at old blocks, which needs an archive node. On an
+        endpoint without it, the scan starts at block 0 instead; eth_getLogs does not
+        need archive state.
+        """
+        if chain_id in self._start_blocks:
+            return self._start_blocks[chain_id]
+
+        factory_address = WOW_FACTORY_CONTRACT_ADDRESSES[CHAIN_ID_TO_WOW_NETWORK[chain_id]]
+        probe = {
+            "to": Web3.to_checksum_address(factory_address),
+            "data": Web3.to_hex(get_function_codec(WOW_FACTORY_ABI, "bondingCurve").encode()),
+        }
+        try:
+            block = find_deployment_block(wallet_provider, probe, latest)
+        except Exception as e:
+            if not is_historical_state_error(e):
+                raise
+            return 0
+        if block is None:
+            raise ValueError(f"No WOW factory is deployed at {factory_address}")
+
+        self._start_blocks[chain_id] = block
+        return block
+
+    @staticmethod
+    def _known_curves(connection: sqlite3.Connection, chain_id: str) -> set[str]:
+        rows = connection.execute(
+            "SELECT address FROM bonding_curves WHERE chain_id = ?", (chain_id,)
+        ).fetchall()
+        return {address for (address,) in rows}
+
+    @staticmethod
+    def _remember_curve(connection: sqlite3.Connection, chain_id: str, curve: str) -> None:
+        with connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO bonding_curves (chain_id, address) VALUES (?, ?)",
+                (chain_id, curve),
+            )
+
+    def _verify(
+        self,
+        wallet_provider: EvmWalletProvider,
+        connection: sqlite3.Connection,
+        chain_id: str,
+        tokens: list[_CreatedToken],
+    ) -> list[_CreatedToken]:
+        """Keep the tokens whose bonding curve and pool match their event and the factory.
+
+        A token's bonding curve and pool are fixed at deployment, so they are read at the
+        latest block, which needs no archive state. The factory's current bonding curve
+        is read with them and remembered. A curve that is not yet known is accepted if it
+        was the factory's curve at the block the token was created in. That read needs
+        archive state; without it, or if it fails, the token is skipped.
+        """
+        if not tokens:
+            return []
+
+        factory_address = WOW_FACTORY_CONTRACT_ADDRESSES[CHAIN_ID_TO_WOW_NETWORK[chain_id]]
+        factory_curve, *results = multicall(
+            wallet_provider,
+            [
+                Call(factory_address, WOW_FACTORY_ABI, "bondingCurve"),
+                *(
+                    Call(token.address, WOW_ABI, function_name)
+                    for token in tokens
+                    for function_name in ("bondingCurve", "poolAddress")
+                ),
+            ],
+        )
+        if not factory_curve.success:
+            raise Exception(f"Failed to read the WOW factory bonding curve: {factory_curve.error}")
+
+        self._remember_curve(connection, chain_id, factory_curve.value.lower())
+        known_curves = self._known_curves(connection, chain_id)
+
+        matching = [
+            token
+            for token, bonding_curve, pool_address in zip(
+                tokens, results[::2], results[1::2], strict=True
+            )
+            if bonding_curve.success
+            and pool_address.success
+            and bonding_curve.value.lower() == token.bonding_curve.lower()
+            and pool_address.value.lower() == token.pool_address.lower()
+        ]
+
+        # Check each unknown curve once, at the creation block of its first token
+        first_blocks: dict[str, int] = {}
+        for token in matching:
+            curve = token.bonding_curve.lower()
+            if curve not in known_curves:
+                first_blocks[curve] = min(
+                    first_blocks.get(curve, token.created_block), token.created_block
+                )
+        for curve, block in first_blocks.items():
+            (past_curve,) = multicall(
+                wallet_provider, [Call(factory_address, WOW_FACTORY_ABI, "bondingCurve")], block
+            )
+            if past_curve.success and past_curve.value.lower() == curve:
+                self._remember_curve(connection, chain_id, curve)
+                known_curves.add(curve)
+
+        return [token for token in matching if token.bonding_curve.lower() in known_curves]
+
+    @staticmethod
+    def _apply(
+        connection: sqlite3.Connection,
+        chain_id: str,
+        tokens: list[_CreatedToken],
+        logs: list[LogReceipt],
+    ) -> None:
+        connection.executemany(
+            "INSERT OR IGNORE INTO tokens "
+            "(chain_id, address, name, symbol, creator, pool_address, created_block) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    chain_id,
+                    token.address,
+                    token.name,
+                    token.symbol,
+                    token.creator,
+                    token.pool_address,
+                    token.created_block,
+                )
+                for token in tokens
+            ],
+        )
+
+        for log in logs:
+            topics = log["topics"]
+            if _event_topic(log) != WOW_MARKET_GRADUATED_EVENT_TOPIC or len(topics) != 3:
+                continue
+
+            # Only a token can graduate itself; graduations of tokens that are not indexed
+            # leave the table unchanged
+            token_address = _topic_to_address(topics[1])
+            if token_address.lower() == log["address"].lower():
+                connection.execute(
+                    "UPDATE tokens SET graduated = 1 WHERE chain_id = ? AND address = ?",
+                    (chain_id, token_address),
+                )
+
+    def last_block(self, chain_id: str) -> int | None:
+        """Get the last block indexed on a chain.
+
+        Args:
+            chain_id (str): The chain ID.
+
+        Returns:
+            int | None: The last scanned block, or None if the chain was never synced.
+
+        """
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT last_block FROM cursors WHERE chain_id = ?", (chain_id,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def sync(self, wallet_provider: EvmWalletProvider) -> int:
+        """Index the tokens created and graduated since the last sync.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider used to read logs.
+
+        Returns:
+            int: The last indexed block.
+
+        Raises:
+            ValueError: If WOW is not deployed on the wallet's network.
+            Exception: If the factory could not be read to verify new tokens.
+
+        """
+        chain_id = wallet_provider.get_network().chain_id
+        if chain_id not in CHAIN_ID_TO_WOW_NETWORK:
+            raise ValueError(f"Unsupported network: {chain_id}")
+
+        with self._sync_lock, closing(self._connect()) as connection:
+            last_block = self.last_block(chain_id)
+            latest = wallet_provider.get_block_number() - self._confirmations
+            start = (
+                self._start_block(wallet_provider, chain_id, latest)
+                if last_block is None
+                else last_block + 1
+            )
+
+            for chunk in self._scanner.scan(
+                wallet_provider, self._filters(chain_id), start, latest
+            ):
+                tokens = self._verify(
+                    wallet_provider, connection, chain_id, self._created_tokens(chunk.logs)
+                )
+                # Tokens and the cursor are committed together so an interrupted sync resumes
+                with connection:
+                    self._apply(connection, chain_id, tokens, chunk.logs)
+                    connection.execute(
+                        "INSERT OR REPLACE INTO cursors (chain_id, last_block) VALUES (?, ?)",
+                        (chain_id, chunk.to_block),
+                    )
+
+        with self._lock:
+            self._synced_at[chain_id] = time.monotonic()
+        return max(latest, start - 1)
+
+    def sync_in_background(self, wallet_provider: EvmWalletProvider) -> bool:
+        """Start a sync on a daemon thread unless one is running or the chain is fresh.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider used to read logs.
+
+        Returns:
+            bool: Whether a sync was started.
+
+        """
+        chain_id = wallet_provider.get_network().chain_id
+        with self._lock:
+            synced_at = self._synced_at.get(chain_id)
+            if chain_id in self._syncing or (
+                synced_at is not None and time.monotonic() - synced_at < self._sync_interval
+            ):
+                return False
+            self._syncing.add(chain_id)
+
+        def run() -> None:
+            try:
+                self.sync(wallet_provider)
+            except Exception as e:
+                print(f"Error syncing WOW token index: {e!s}")
+            finally:
+                with self._lock:
+                    self._syncing.discard(chain_id)
+
+        threading.Thread(target=run, name=f"wow-token-index-{chain_id}", daemon=True).start()
+        return True
+
+    def search(self, chain_id: str, query: str, limit: int = 10) -> list[WowToken]:
+        """Find indexed tokens by symbol, name or address without making RPC calls.
+
+        Exact symbol matches come first, then the most recently created tokens.
+
+        Args:
+            chain_id (str): The chain ID.
+            query (str): A symbol, part of a name or symbol, or an address prefix.
+            limit (int): The maximum number of tokens to return.
+
+        Returns:
+            list[WowToken]: The matching tokens.
+
+        """
+        query = query.strip().removeprefix("$")
+        escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT address, name, symbol, creator, pool_address, created_block, graduated "
+                "FROM tokens WHERE chain_id = ? AND ("
+                "symbol LIKE ? ESCAPE '\\' OR name LIKE ? ESCAPE '\\' "
+                "OR lower(address) LIKE ? ESCAPE '\\') "
+                "ORDER BY lower(symbol) = lower(?) DESC, created_block DESC LIMIT ?",
+                (chain_id, f"%{escaped}%", f"%{escaped}%", f"{escaped.lower()}%", query, limit),
+            ).fetchall()
+        return [
+            WowToken(address, name, symbol, creator, pool_address, created_block, bool(graduated))
+            for address, name, symbol, creator, pool_address, created_block, graduated in rows
+        ]
@@ -0,0 +1,201 @@
+"""In-process Uniswap V3 swap simulation over a snapshot of pool state."""
+
+from dataclasses import dataclass, field
+
+from .v3_math import (
+    MAX_SQRT_RATIO,
+    MAX_TICK,
+    MIN_SQRT_RATIO,
+    MIN_TICK,
+    compute_swap_step,
+    get_sqrt_ratio_at_tick,
+    get_tick_at_sqrt_ratio,
+)
+
+
+class TickRangeError(Exception):
+    """Raised when a swap moves the price beyond the tick bitmap words in a snapshot."""
+
+
+@dataclass(frozen=True)
+class SwapResult:
+    """The outcome of a simulated swap, matching the fields returned by QuoterV2."""
+
+    amount_in: int
+    amount_out: int
+    sqrt_price_x96_after: int
+    tick_after: int
+    initialized_ticks_crossed: int
+
+
+def bitmap_word_position(tick: int, tick_spacing: int) -> int:
+    """Get the tick bitmap word holding a tick.
+
+    Args:
+        tick (int): The tick.
+        tick_spacing (int): The pool's tick spacing.
+
+    Returns:
+        int: The word position, as passed to the pool's ``tickBitmap`` getter.
+
+    """
+    return (tick // tick_spacing) >> 8
+
+
+def _most_significant_bit(x: int) -> int:
+    return x.bit_length() - 1
+
+
+def _least_significant_bit(x: int) -> int:
+    return (x & -x).bit_length() - 1
+
+
+@dataclass(frozen=True)
+class PoolState:
+    """A snapshot of the pool state a swap reads, taken at a single block.
+
+    Only the tick bitmap words in ``tick_bitmap`` are known. Words that are not in the
+    snapshot were not read, so a swap that reaches one raises TickRangeError instead of
+    assuming the word is empty.
+    """
+
+    token0: str
+    token1: str
+    fee: int
+    tick_spacing: int
+    sqrt_price_x96: int
+    tick: int
+    liquidity: int
+    tick_bitmap: dict[int, int] = field(default_factory=dict)
+    liquidity_net: dict[int, int] = field(default_factory=dict)
+    block_number: int | None = None
+
+    def _next_initialized_tick_within_one_word(self, tick: int, lte: bool) -> tuple[int, bool]:
+        """Port of TickBitmap.nextInitializedTickWithinOneWord."""
+        compressed = tick // self.tick_spacing
+
+        if lte:
+            word_position, bit_position = compressed >> 8, compressed & 0xFF
+            word = self._word(word_position)
+            masked = word & ((1 << bit_position) - 1 + (1 << bit_position))
+            if masked:
+                return (
+                    compressed - (bit_position - _most_significant_bit(masked))
+                ) * self.tick_spacing, True
+            return (compressed - bit_position) * self.tick_spacing, False
+
+        compressed += 1
+        word_position, bit_position = compressed >> 8, compressed & 0xFF
+        word = self._word(word_position)
+        masked = word & ~((1 << bit_position) - 1)
+        if masked:
+            return (
+                compressed + (_least_significant_bit(masked) - bit_position)
+            ) * self.tick_spacing, True
+        return (compressed + (255 - bit_position)) * self.tick_spacing, False
+
+    def _word(self, word_position: int) -> int:
+        word = self.tick_bitmap.get(word_position)
+        if word is None:
+            raise TickRangeError(f"Tick bitmap word {word_position} is not in the snapshot")
+        return word
+
+    def swap(
+        self, zero_for_one: bool, amount_specified: int, sqrt_price_limit_x96: int | None = None
+    ) -> SwapResult:
+        """Simulate a swap the way UniswapV3Pool.swap executes it, without changing the snapshot.
+
+        Args:
+            zero_for_one (bool): Whether token0 is swapped for token1.
+            amount_specified (int): The exact input amount if positive, or the exact
+                output amount if negative.
+            sqrt_price_limit_x96 (int | None): The price the swap cannot go past. Defaults
+                to the limit QuoterV2 uses when it is given a limit of zero.
+
+        Returns:
+            SwapResult: The amounts swapped and the pool price afterwards.
+
+        Raises:
+            TickRangeError: If the swap reaches a tick bitmap word missing from the snapshot.
+            ValueError: If the amount is zero or the price limit is invalid.
+
+        """
+        if amount_specified == 0:
+            raise ValueError("Swap amount must not be zero")
+        if sqrt_price_limit_x96 is None:
+            sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        if zero_for_one and not MIN_SQRT_RATIO < sqrt_price_limit_x96 < self.sqrt_price_x96:
+            raise ValueError("Invalid sqrt price limit")
+        if not zero_for_one and not self.sqrt_price_x96 < sqrt_price_limit_x96 < MAX_SQRT_RATIO:
+            raise ValueError("Invalid sqrt price limit")
+
+        exact_input = amount_specified > 0
+        amount_remaining = amount_specified
+        amount_calculated = 0
+        sqrt_price_x96 = self.sqrt_price_x96
+        tick = self.tick
+        liquidity = self.liquidity
+        ticks_crossed = 0
+
+        while amount_remaining != 0 and sqrt_price_x96 != sqrt_price_limit_x96:
+            sqrt_price_start = sqrt_price_x96
+            tick_next, initialized = self._next_initialized_tick_within_one_word(tick, zero_for_one)
+            tick_next = min(max(tick_next, MIN_TICK), MAX_TICK)
+            sqrt_price_next = get_sqrt_ratio_at_tick(tick_next)
+
+            past_limit = (
+                sqrt_price_next < sqrt_price_limit_x96
+                if zero_for_one
+                else sqrt_price_next > sqrt_price_limit_x96
+            )
+            sqrt_price_x96, amount_in, amount_out, fee_amount = compute_swap_step(
+                sqrt_price_x96,
+                sqrt_price_limit_x96 if past_limit else sqrt_price_next,
+                liquidity,
+                amount_remaining,
+                self.fee,
+            )
+
+            if exact_input:
+                amount_remaining -= amount_in + fee_amount
+                amount_calculated -= amount_out
+            else:
+                amount_remaining += amount_out
+                amount_calculated += amount_in + fee_amount
+
+            if sqrt_price_x96 == sqrt_price_next:
+                if initialized:
+                    liquidity_net = self.liquidity_net.get(tick_next, 0)
+                    liquidity += -liquidity_net if zero_for_one else liquidity_net
+                    ticks_crossed += 1
+                tick = tick_next - 1 if zero_for_one else tick_next
+            elif sqrt_price_x96 != sqrt_price_start:
+                tick = get_tick_at_sqrt_ratio(sqrt_price_x96)
+
+        if exact_input:
+            amount_in, amount_out = amount_specified - amount_remaining, -amount_calculated
+        else:
+            amount_in, amount_out = amount_calculated, -(amount_specified - amount_remaining)
+
+        return SwapResult(amount_in, amount_out, sqrt_price_x96, tick, ticks_crossed)
+
+    def quote_exact_input(self, token_in: str, amount_in: int) -> SwapResult:
+        """Simulate QuoterV2.quoteExactInputSingle with no price limit.
+
+        Args:
+            token_in (str): The address of the token sold to the pool.
+            amount_in (int): The amount of ``token_in`` to sell, in wei.
+
+        Returns:
+            SwapResult: The simulated swap.
+
+        Raises:
+            ValueError: If ``token_in`` is not one of the pool's tokens.
+            TickRangeError: If the swap reaches a tick bitmap word missing from the snapshot.
+
+        """
+        if token_in.lower() == self.token0.lower():
+            return self.swap(True, amount_in)
+        if token_in.lower() == self.token1.lower():
+            return self.swap(False, amount_in)
+        raise ValueError(f"Token {token_in} is not in the pool")
@@ -2,14 +2,21 @@
 
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Literal
+from typing import Any
 
 from web3 import Web3
-from web3.types import Wei
+from web3.types import BlockIdentifier, Wei
 
+from ....multicall import Call, CallResult, multicall
 from ....wallet_providers import EvmWalletProvider
-from ..constants import WOW_ABI, addresses
-from .constants import UNISWAP_QUOTER_ABI, UNISWAP_V3_ABI
+from ..constants import WOW_ABI
+from .constants import UNISWAP_V3_ABI
+from .pool_state import PoolState, bitmap_word_position
+from .v3_math import MAX_TICK, MIN_TICK
+
+# Number of tick bitmap words read on each side of the current tick for a pool state
+# snapshot. One word covers 256 tick spacings, e.g. a 167x price move at a 1% fee tier.
+DEFAULT_BITMAP_WORD_RADIUS = 2
 
 
 @dataclass
@@ -20,14 +27,6 @@ class PriceInfo:
     usd: Decimal
 
 
-@dataclass
-class Balance:
-    """Balance for a given token."""
-
-    erc20z: Wei
-    weth: Wei
-
-
 @dataclass
 class Price:
     """Price info for a given token."""
@@ -36,17 +35,6 @@ class Price:
     total: PriceInfo
 
 
-@dataclass
-class Quote:
-    """Quote for a given uniswap v3 swap."""
-
-    amount_in: int
-    amount_out: int
-    balance: Balance | None
-    fee: float | None
-    error: str | None
-
-
 @dataclass
 class PoolInfo:
     """Pool info for a given uniswap v3 pool."""
@@ -76,28 +64,16 @@ def create_price_info(wei_amount: Wei, eth_price_in_usd: float) -> PriceInfo:
     return PriceInfo(eth=wei_amount, usd=Decimal(str(usd)))
 
 
-def get_has_graduated(wallet_provider: EvmWalletProvider, token_address: str) -> bool:
-    """Check if a token has graduated from the Zora Wow protocol.
-
-    Args:
-        wallet_provider: The wallet provider to use for contract calls
-        token_address: Token address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
-
-    Returns:
-        bool: True if the token has graduated, False otherwise
-
-    """
-    market_type = wallet_provider.read_contract(
-        contract_address=token_address,
-        abi=WOW_ABI,
-        function_name="marketType",
-        args=[],
-    )
-    return market_type == 1
+def _values(results: list[CallResult]) -> list[Any]:
+    """Get the values of batched calls, raising on the first failed call."""
+    for result in results:
+        if not result.success:
+            raise Exception(result.error)
+    return [result.value for result in results]
 
 
 def get_pool_info(wallet_provider: EvmWalletProvider, pool_address: str) -> PoolInfo:
-    """Get pool info for a given uniswap v3 pool address.
+    """Get pool info for a given uniswap v3 pool address with two batched reads.
 
     Args:
         wallet_provider: The wallet provider to use for contract calls
@@ -108,49 +84,23 @@ def get_pool_info(wallet_provider: EvmWalletProvider, pool_address: str) -> Pool
 
     """
     try:
-        token0 = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="token0",
-            args=[],
-        )
-        token1 = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="token1",
-            args=[],
-        )
-        fee = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="fee",
-            args=[],
-        )
-        liquidity = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="liquidity",
-            args=[],
+        token0, token1, fee, liquidity, slot0 = _values(
+            multicall(
+                wallet_provider,
+                [
+                    Call(pool_address, UNISWAP_V3_ABI, function_name)
+                    for function_name in ("token0", "token1", "fee", "liquidity", "slot0")
+                ],
+            )
         )
-        slot0 = wallet_provider.read_contract(
-            contract_address=pool_address,
-            abi=UNISWAP_V3_ABI,
-            function_name="slot0",
-            args=[],
-        )
-
-        balance0 = wallet_provider.read_contract(
-            contract_address=token0,
-            abi=WOW_ABI,
-            function_name="balanceOf",
-            args=[pool_address],
-        )
-
-        balance1 = wallet_provider.read_contract(
-            contract_address=token1,
-            abi=WOW_ABI,
-            function_name="balanceOf",
-            args=[pool_address],
+        balance0, balance1 = _values(
+            multicall(
+                wallet_provider,
+                [
+                    Call(token0, WOW_ABI, "balanceOf", (pool_address,)),
+                    Call(token1, WOW_ABI, "balanceOf", (pool_address,)),
+                ],
+            )
         )
 
         return PoolInfo(
@@ -166,154 +116,106 @@ def get_pool_info(wallet_provider: EvmWalletProvider, pool_address: str) -> Pool
         raise Exception(f"Failed to fetch pool information: {error!s}") from error
 
 
-def exact_input_single(
-    wallet_provider: EvmWalletProvider, token_in: str, token_out: str, amount_in: int, fee: str
-) -> int:
-    """Get exact input quote from Uniswap.
-
-    Args:
-        wallet_provider: The wallet provider to use for contract calls
-        token_in: Token address to swap from, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
-        token_out: Token address to swap to, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
-        amount_in: Amount of tokens to swap (in Wei)
-        fee: Fee for the swap
-
-    Returns:
-        int: Amount of tokens to receive (in Wei)
-
-    """
-    try:
-        chain_id = wallet_provider.get_network().chain_id
-        network = "base-mainnet" if chain_id == 8453 else "base-sepolia"
-        if network not in addresses:
-            raise ValueError(f"Unsupported network: {network}")
-
-        amount = wallet_provider.read_contract(
-            contract_address=addresses[network]["uniswap_quoter"],
-            abi=UNISWAP_QUOTER_ABI,
-            function_name="quoteExactInputSingle",
-            args=[
-                {
-                    "tokenIn": str(Web3.to_checksum_address(token_in)),
-                    "tokenOut": str(Web3.to_checksum_address(token_out)),
-                    "fee": fee,
-                    "amountIn": amount_in,
-                    "sqrtPriceLimitX96": 0,
-                }
-            ],
-        )
-        return amount
-    except Exception as e:
-        print(f"Quoter error: {e!s}")
-        return 0
-
-
-def get_uniswap_quote(
+def get_pool_state(
     wallet_provider: EvmWalletProvider,
-    token_address: str,
-    amount: int,
-    quote_type: Literal["buy", "sell"],
-) -> Quote:
-    """Get Uniswap quote for buying or selling tokens.
+    pool_address: str,
+    block_identifier: BlockIdentifier = "latest",
+    word_radius: int = DEFAULT_BITMAP_WORD_RADIUS,
+) -> PoolState:
+    """Snapshot the state a swap reads from a uniswap v3 pool with batched reads.
+
+    The pool info read by ``get_pool_info`` is extended with the tick spacing, the tick
+    bitmap words around the current tick and the liquidity net of every initialized
+    tick in them. All reads are made at the same block so the snapshot is consistent.
 
     Args:
         wallet_provider: The wallet provider to use for contract calls
-        token_address: Token address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
-        amount: Amount of tokens (in Wei)
-        quote_type: 'buy' or 'sell'
+        pool_address: Uniswap v3 pool address
+        block_identifier: The block to read the pool state at, defaults to 'latest'
+        word_radius: Number of tick bitmap words to read on each side of the current tick
 
     Returns:
-        Quote: A Quote object containing the amount in, amount out, balance, fee, and any error messages.
+        PoolState: A snapshot that quotes swaps staying within the words read.
 
     """
-    pool = None
-    tokens = None
-    balances = None
-    eth_price_in_usd = None
-    quote_result = None
-    utilization = Wei(0)
-    insufficient_liquidity = False
-
-    chain_id = wallet_provider.get_network().chain_id
-    network = "base-mainnet" if chain_id == 8453 else "base-sepolia"
-    if network not in addresses:
-        raise ValueError(f"Unsupported network: {network}")
-
-    pool_address = wallet_provider.read_contract(
-        contract_address=token_address,
-        abi=WOW_ABI,
-        function_name="poolAddress",
-        args=[],
-    )
-    invalid_pool_error = "Invalid pool address" if not pool_address else None
-
     try:
-        pool_info = get_pool_info(wallet_provider, pool_address)
-        token0, token1 = pool_info.token0, pool_info.token1
-        balance0, balance1 = pool_info.balance0, pool_info.balance1
-        fee = pool_info.fee
-
-        pool = pool_info
-        tokens = (token0, token1)
-        balances = (balance0, balance1)
-
-        is_token0_weth = token0.lower() == addresses[network]["weth"].lower()
-        token_in = (
-            token0
-            if (quote_type == "buy" and is_token0_weth)
-            or (quote_type == "sell" and not is_token0_weth)
-            else token1
+        if block_identifier == "latest":
+            block_identifier = wallet_provider.get_block_number()
+
+        token0, token1, fee, tick_spacing, liquidity, slot0 = _values(
+            multicall(
+                wallet_provider,
+                [
+                    Call(pool_address, UNISWAP_V3_ABI, function_name)
+                    for function_name in (
+                        "token0",
+                        "token1",
+                        "fee",
+                        "tickSpacing",
+                        "liquidity",
+                        "slot0",
+                    )
+                ],
+                block_identifier,
+            )
         )
+        sqrt_price_x96, tick = slot0[0], slot0[1]
 
-        token_out, balance_out = (token1, balance1) if token_in == token0 else (token0, balance0)
-
-        if isinstance(balance_out, list | tuple):
-            balance_out = balance_out[0] if balance_out else 0
-        balance_out = int(balance_out)
-
-        insufficient_liquidity = quote_type == "buy" and amount > balance_out
-        utilization = (
-            Wei(int(amount / balance_out)) if quote_type == "buy" and balance_out > 0 else Wei(0)
+        current_word = bitmap_word_position(tick, tick_spacing)
+        word_positions = range(
+            max(current_word - word_radius, bitmap_word_position(MIN_TICK, tick_spacing)),
+            min(current_word + word_radius, bitmap_word_position(MAX_TICK, tick_spacing)) + 1,
         )
-
-        quote_result = exact_input_single(wallet_provider, token_in, token_out, amount, fee)
-
-    except Exception as e:
-        print(f"Error fetching quote: {e!s}")
-
-    insufficient_liquidity = (
-        quote_type == "sell" and pool and not quote_result
-    ) or insufficient_liquidity
-
-    error_msg = None
-    if not pool or not eth_price_in_usd:
-        error_msg = "Failed fetching pool"
-    elif insufficient_liquidity:
-        error_msg = "Insufficient liquidity"
-    elif not quote_result and utilization >= Wei(int(0.9 * 1e18)):
-        error_msg = "Price impact too high"
-    elif not quote_result:
-        error_msg = "Failed fetching quote"
-
-    balance_result = None
-    if tokens and balances:
-        is_weth_token0 = tokens[0].lower() == addresses[network]["weth"].lower()
-        balance_result = Balance(
-            erc20z=Wei(balances[1][0] if isinstance(balances[1], list | tuple) else balances[1])
-            if is_weth_token0
-            else Wei(balances[0][0] if isinstance(balances[0], list | tuple) else balances[0]),
-            weth=Wei(balances[0][0] if isinstance(balances[0], list | tuple) else balances[0])
-            if is_weth_token0
-            else Wei(balances[1][0] if isinstance(balances[1], list | tuple) else balances[1]),
+        words = _values(
+            multicall(
+                wallet_provider,
+                [
+                    Call(pool_address, UNISWAP_V3_ABI, "tickBitmap", (word_position,))
+                    for word_position in word_positions
+                ],
+                block_identifier,
+            )
+        )
+        tick_bitmap = dict(zip(word_positions, words, strict=True))
+
+        initialized_ticks = [
+            ((word_position << 8) + bit) * tick_spacing
+            for word_position, word in tick_bitmap.items()
+            for bit in range(256)
+            if word >> bit & 1
+        ]
+        tick_infos = (
+            _values(
+                multicall(
+                    wallet_provider,
+                    [
+                        Call(pool_address, UNISWAP_V3_ABI, "ticks", (initialized_tick,))
+                        for initialized_tick in initialized_ticks
+                    ],
+                    block_identifier,
+                )
+            )
+            if initialized_ticks
+            else []
         )
 
-    return Quote(
-        amount_in=amount,
-        amount_out=quote_result if quote_result else Wei(0),
-        balance=balance_result,
-        fee=pool.fee / 1000000 if pool else None,
-        error=invalid_pool_error or error_msg,
-    )
+        return PoolState(
+            token0=token0,
+            token1=token1,
+            fee=fee,
+            tick_spacing=tick_spacing,
+            sqrt_price_x96=sqrt_price_x96,
+            tick=tick,
+            liquidity=liquidity,
+            tick_bitmap=tick_bitmap,
+            liquidity_net={
+                initialized_tick: tick_info[1]
+                for initialized_tick, tick_info in zip(initialized_ticks, tick_infos, strict=True)
+            },
+            block_number=block_identifier if isinstance(block_identifier, int) else None,
+        )
+    except Exception as error:
+        raise Exception(f"Failed to fetch pool state: {error!s}") from error
 
 
 def get_pool_address(wallet_provider: EvmWalletProvider, token_address: str) -> str:
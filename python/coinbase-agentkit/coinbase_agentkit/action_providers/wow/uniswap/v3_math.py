@@ -0,0 +1,270 @@
+"""Uniswap V3 swap math, ported from the v3-core TickMath, SqrtPriceMath and SwapMath libraries.
+
+All functions work on integers and round exactly like the Solidity implementation, so
+amounts computed here match the amounts a pool would swap.
+"""
+
+Q96 = 1 << 96
+UINT256_MAX = (1 << 256) - 1
+FEE_DENOMINATOR = 1_000_000
+
+MIN_TICK = -887272
+MAX_TICK = 887272
+MIN_SQRT_RATIO = 4295128739
+MAX_SQRT_RATIO = 1461446703485210103287273052203988822378723970342
+
+# Multipliers of TickMath.getSqrtRatioAtTick for each bit of the absolute tick,
+# starting from bit 1. Bit 0 selects the initial ratio.
+_TICK_RATIO_MULTIPLIERS = (
+    0xFFF97272373D413259A46990580E213A,
+    0xFFF2E50F5F656932EF12357CF3C7FDCC,
+    0xFFE5CACA7E10E4E61C3624EAA0941CD0,
+    0xFFCB9843D60F6159C9DB58835C926644,
+    0xFF973B41FA98C081472E6896DFB254C0,
+    0xFF2EA16466C96A3843EC78B326B52861,
+    0xFE5DEE046A99A2A811C461F1969C3053,
+    0xFCBE86C7900A88AEDCFFC83B479AA3A4,
+    0xF987A7253AC413176F2B074CF7815E54,
+    0xF3392B0822B70005940C7A398E4B70F3,
+    0xE7159475A2C29B7443B29C7FA6E889D9,
+    0xD097F3BDFD2022B8845AD8F792AA5825,
+    0xA9F746462D870FDF8A65DC1F90E061E5,
+    0x70D869A156D2A1B890BB3DF62BAF32F7,
+    0x31BE135F97D08FD981231505542FCFA6,
+    0x9AA508B5B7A84E1C677DE54F3E99BC9,
+    0x5D6AF8DEDB81196699C329225EE604,
+    0x2216E584F5FA1EA926041BEDFE98,
+    0x48A170391F7DC42444E8FA2,
+)
+
+
+def _mul_div(a: int, b: int, denominator: int) -> int:
+    return a * b // denominator
+
+
+def _mul_div_rounding_up(a: int, b: int, denominator: int) -> int:
+    return -(-a * b // denominator)
+
+
+def _div_rounding_up(a: int, denominator: int) -> int:
+    return -(-a // denominator)
+
+
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    """Get the sqrt price of a tick as a Q64.96 number.
+
+    Args:
+        tick (int): The tick, between MIN_TICK and MAX_TICK.
+
+    Returns:
+        int: sqrt(1.0001^tick) * 2^96, rounded up.
+
+    Raises:
+        ValueError: If the tick is out of range.
+
+    """
+    abs_tick = abs(tick)
+    if abs_tick > MAX_TICK:
+        raise ValueError(f"Tick {tick} is out of range")
+
+    ratio = (
+        0xFFFCB933BD6FAD37AA2D162D1A594001
+        if abs_tick & 0x1
+        else 0x100000000000000000000000000000000
+    )
+    for bit, multiplier in enumerate(_TICK_RATIO_MULTIPLIERS, start=1):
+        if abs_tick & (1 << bit):
+            ratio = (ratio * multiplier) >> 128
+
+    if tick > 0:
+        ratio = UINT256_MAX // ratio
+
+    return (ratio >> 32) + (0 if ratio % (1 << 32) == 0 else 1)
+
+
+def get_tick_at_sqrt_ratio(sqrt_price_x96: int) -> int:
+    """Get the greatest tick whose sqrt price is at most the given sqrt price.
+
+    Args:
+        sqrt_price_x96 (int): A Q64.96 sqrt price between MIN_SQRT_RATIO and MAX_SQRT_RATIO.
+
+    Returns:
+        int: The tick.
+
+    Raises:
+        ValueError: If the sqrt price is out of range.
+
+    """
+    if not MIN_SQRT_RATIO <= sqrt_price_x96 < MAX_SQRT_RATIO:
+        raise ValueError(f"Sqrt price {sqrt_price_x96} is out of range")
+
+    low, high = MIN_TICK, MAX_TICK
+    while low < high:
+        middle = (low + high + 1) // 2
+        if get_sqrt_ratio_at_tick(middle) <= sqrt_price_x96:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def get_next_sqrt_price_from_amount0_rounding_up(
+    sqrt_price_x96: int, liquidity: int, amount: int, add: bool
+) -> int:
+    """Get the sqrt price after adding or removing an amount of token0."""
+    if amount == 0:
+        return sqrt_price_x96
+
+    numerator1 = liquidity << 96
+    product = amount * sqrt_price_x96
+
+    if add:
+        # The contract falls back to a formula that rounds differently on overflow
+        if product <= UINT256_MAX and numerator1 + product <= UINT256_MAX:
+            return _mul_div_rounding_up(numerator1, sqrt_price_x96, numerator1 + product)
+        return _div_rounding_up(numerator1, numerator1 // sqrt_price_x96 + amount)
+
+    if product > UINT256_MAX or numerator1 <= product:
+        raise ValueError("Insufficient liquidity for output amount")
+    return _mul_div_rounding_up(numerator1, sqrt_price_x96, numerator1 - product)
+
+
+def get_next_sqrt_price_from_amount1_rounding_down(
+    sqrt_price_x96: int, liquidity: int, amount: int, add: bool
+) -> int:
+    """Get the sqrt price after adding or removing an amount of token1."""
+    if add:
+        return sqrt_price_x96 + _mul_div(amount, Q96, liquidity)
+
+    quotient = _mul_div_rounding_up(amount, Q96, liquidity)
+    if sqrt_price_x96 <= quotient:
+        raise ValueError("Insufficient liquidity for output amount")
+    return sqrt_price_x96 - quotient
+
+
+def get_next_sqrt_price_from_input(
+    sqrt_price_x96: int, liquidity: int, amount_in: int, zero_for_one: bool
+) -> int:
+    """Get the sqrt price after swapping an input amount into the pool."""
+    if zero_for_one:
+        return get_next_sqrt_price_from_amount0_rounding_up(
+            sqrt_price_x96, liquidity, amount_in, True
+        )
+    return get_next_sqrt_price_from_amount1_rounding_down(
+        sqrt_price_x96, liquidity, amount_in, True
+    )
+
+
+def get_next_sqrt_price_from_output(
+    sqrt_price_x96: int, liquidity: int, amount_out: int, zero_for_one: bool
+) -> int:
+    """Get the sqrt price after swapping an output amount out of the pool."""
+    if zero_for_one:
+        return get_next_sqrt_price_from_amount1_rounding_down(
+            sqrt_price_x96, liquidity, amount_out, False
+        )
+    return get_next_sqrt_price_from_amount0_rounding_up(
+        sqrt_price_x96, liquidity, amount_out, False
+    )
+
+
+def get_amount0_delta(sqrt_ratio_a: int, sqrt_ratio_b: int, liquidity: int, round_up: bool) -> int:
+    """Get the amount of token0 between two sqrt prices for a liquidity."""
+    if sqrt_ratio_a > sqrt_ratio_b:
+        sqrt_ratio_a, sqrt_ratio_b = sqrt_ratio_b, sqrt_ratio_a
+
+    numerator1 = liquidity << 96
+    numerator2 = sqrt_ratio_b - sqrt_ratio_a
+
+    if round_up:
+        return _div_rounding_up(
+            _mul_div_rounding_up(numerator1, numerator2, sqrt_ratio_b), sqrt_ratio_a
+        )
+    return _mul_div(numerator1, numerator2, sqrt_ratio_b) // sqrt_ratio_a
+
+
+def get_amount1_delta(sqrt_ratio_a: int, sqrt_ratio_b: int, liquidity: int, round_up: bool) -> int:
+    """Get the amount of token1 between two sqrt prices for a liquidity."""
+    if sqrt_ratio_a > sqrt_ratio_b:
+        sqrt_ratio_a, sqrt_ratio_b = sqrt_ratio_b, sqrt_ratio_a
+
+    if round_up:
+        return _mul_div_rounding_up(liquidity, sqrt_ratio_b - sqrt_ratio_a, Q96)
+    return _mul_div(liquidity, sqrt_ratio_b - sqrt_ratio_a, Q96)
+
+
+def compute_swap_step(
+    sqrt_ratio_current: int,
+    sqrt_ratio_target: int,
+    liquidity: int,
+    amount_remaining: int,
+    fee_pips: int,
+) -> tuple[int, int, int, int]:
+    """Compute one step of a swap, within a single tick range.
+
+    Args:
+        sqrt_ratio_current (int): The current Q64.96 sqrt price.
+        sqrt_ratio_target (int): The sqrt price the step cannot go past.
+        liquidity (int): The usable liquidity.
+        amount_remaining (int): The amount left to swap. Positive for exact input,
+            negative for exact output.
+        fee_pips (int): The fee in hundredths of a bip.
+
+    Returns:
+        tuple[int, int, int, int]: The sqrt price after the step, the amount in, the
+            amount out and the fee amount.
+
+    """
+    zero_for_one = sqrt_ratio_current >= sqrt_ratio_target
+    exact_in = amount_remaining >= 0
+
+    if exact_in:
+        amount_remaining_less_fee = _mul_div(
+            amount_remaining, FEE_DENOMINATOR - fee_pips, FEE_DENOMINATOR
+        )
+        amount_in = (
+            get_amount0_delta(sqrt_ratio_target, sqrt_ratio_current, liquidity, True)
+            if zero_for_one
+            else get_amount1_delta(sqrt_ratio_current, sqrt_ratio_target, liquidity, True)
+        )
+        if amount_remaining_less_fee >= amount_in:
+            sqrt_ratio_next = sqrt_ratio_target
+        else:
+            sqrt_ratio_next = get_next_sqrt_price_from_input(
+                sqrt_ratio_current, liquidity, amount_remaining_less_fee, zero_for_one
+            )
+    else:
+        amount_out = (
+            get_amount1_delta(sqrt_ratio_target, sqrt_ratio_current, liquidity, False)
+            if zero_for_one
+            else get_amount0_delta(sqrt_ratio_current, sqrt_ratio_target, liquidity, False)
+        )
+        if -amount_remaining >= amount_out:
+            sqrt_ratio_next = sqrt_ratio_target
+        else:
+            sqrt_ratio_next = get_next_sqrt_price_from_output(
+                sqrt_ratio_current, liquidity, -amount_remaining, zero_for_one
+            )
+
+    reached_target = sqrt_ratio_next == sqrt_ratio_target
+
+    if zero_for_one:
+        if not (reached_target and exact_in):
+            amount_in = get_amount0_delta(sqrt_ratio_next, sqrt_ratio_current, liquidity, True)
+        if not (reached_target and not exact_in):
+            amount_out = get_amount1_delta(sqrt_ratio_next, sqrt_ratio_current, liquidity, False)
+    else:
+        if not (reached_target and exact_in):
+            amount_in = get_amount1_delta(sqrt_ratio_current, sqrt_ratio_next, liquidity, True)
+        if not (reached_target and not exact_in):
+            amount_out = get_amount0_delta(sqrt_ratio_current, sqrt_ratio_next, liquidity, False)
+
+    if not exact_in and amount_out > -amount_remaining:
+        amount_out = -amount_remaining
+
+    if exact_in and sqrt_ratio_next != sqrt_ratio_target:
+        fee_amount = amount_remaining - amount_in
+    else:
+        fee_amount = _mul_div_rounding_up(amount_in, fee_pips, FEE_DENOMINATOR - fee_pips)
+
+    return sqrt_ratio_next, amount_in, amount_out, fee_amount
@@ -14,13 +14,16 @@ from .constants import (
     WOW_ABI,
     WOW_FACTORY_ABI,
 )
-from .schemas import WowBuyTokenSchema, WowCreateTokenSchema, WowSellTokenSchema
-from .utils import (
-    get_buy_quote,
-    get_factory_address,
-    get_has_graduated,
-    get_sell_quote,
+from .quote_engine import WowQuoteEngine, sample_amounts
+from .schemas import (
+    WowBuyTokenSchema,
+    WowCreateTokenSchema,
+    WowQuoteCurveSchema,
+    WowSearchTokensSchema,
+    WowSellTokenSchema,
 )
+from .token_index import WowTokenIndex
+from .utils import get_factory_address
 
 SUPPORTED_CHAINS = ["8453", "84532"]
 
@@ -28,9 +31,21 @@ SUPPORTED_CHAINS = ["8453", "84532"]
 class WowActionProvider(ActionProvider[EvmWalletProvider]):
     """Provides actions for interacting with WOW protocol."""
 
-    def __init__(self):
-        """Initialize WOW action provider."""
+    def __init__(
+        self,
+        quote_engine: WowQuoteEngine | None = None,
+        token_index: WowTokenIndex | None = None,
+    ):
+        """Initialize WOW action provider.
+
+        Args:
+            quote_engine (WowQuoteEngine | None): Engine used to quote buys and sells.
+            token_index (WowTokenIndex | None): Local index of WOW tokens used for searches.
+
+        """
         super().__init__("wow", [])
+        self.quote_engine = quote_engine or WowQuoteEngine()
+        self.token_index = token_index or WowTokenIndex()
 
     @create_action(
         name="buy_token",
@@ -61,21 +76,18 @@ Important notes:
 
         """
         try:
-            token_quote = get_buy_quote(
-                wallet_provider, args["contract_address"], args["amount_eth_in_wei"]
+            validated_args = WowBuyTokenSchema(**args)
+            quote = self.quote_engine.quote(
+                wallet_provider,
+                validated_args.contract_address,
+                int(validated_args.amount_eth_in_wei),
+                "buy",
             )
+            has_graduated = quote.has_graduated
 
-            if isinstance(token_quote, list | tuple):
-                token_quote = token_quote[0] if token_quote else 0
-            token_quote = int(token_quote)
-
-            has_graduated = get_has_graduated(wallet_provider, args["contract_address"])
+            min_tokens = math.floor(float(quote.amount_out) * 0.99)
 
-            min_tokens = math.floor(float(token_quote) * 0.99)
-
-            contract = Web3().eth.contract(
-                address=Web3.to_checksum_address(args["contract_address"]), abi=WOW_ABI
-            )
+            contract = Web3().eth.contract(address=validated_args.contract_address, abi=WOW_ABI)
 
             encoded_data = contract.encode_abi(
                 "buy",
@@ -92,9 +104,9 @@ Important notes:
 
             tx_hash = wallet_provider.send_transaction(
                 {
-                    "to": Web3.to_checksum_address(args["contract_address"]),
+                    "to": validated_args.contract_address,
                     "data": encoded_data,
-                    "value": int(args["amount_eth_in_wei"]),
+                    "value": int(validated_args.amount_eth_in_wei),
                 }
             )
             receipt = wallet_provider.wait_for_transaction_receipt(tx_hash)
@@ -179,6 +191,110 @@ Important notes:
         except Exception as e:
             return f"Error creating Zora Wow ERC20 memecoin: {e!s}"
 
+    @create_action(
+        name="quote_curve",
+        description="""
+This tool quotes buying or selling a Zora Wow ERC20 memecoin at many amounts at once, to choose a trade size before buying or selling.
+
+Inputs:
+- WOW token contract address
+- Side: 'buy' to quote spending ETH, 'sell' to quote selling tokens
+- Largest amount to quote (in wei)
+- Number of amounts to sample (optional, default 10). Each amount is twice the previous one, up to the largest amount.
+
+Important notes:
+- The amount is a string and cannot have any decimal points, since the unit of measurement is wei.
+- Price impact is relative to the smallest sampled amount.
+- Use this instead of quoting amounts one at a time.""",
+        schema=WowQuoteCurveSchema,
+    )
+    def quote_curve(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Quote a WOW token trade at many amounts and report the price impact of each.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider used for reads.
+            args (dict[str, Any]): Input arguments containing contract_address, side,
+                max_amount_in_wei and points.
+
+        Returns:
+            str: A price-impact table or error message.
+
+        """
+        try:
+            validated_args = WowQuoteCurveSchema(**args)
+            side = validated_args.side
+            curve = self.quote_engine.quote_curve(
+                wallet_provider,
+                validated_args.contract_address,
+                sample_amounts(int(validated_args.max_amount_in_wei), validated_args.points),
+                side,
+            )
+            market = "Uniswap" if curve.has_graduated else "bonding curve"
+            action = "buying" if side == "buy" else "selling"
+
+            return (
+                f"Quotes for {action} {curve.token_address} on the {market} "
+                f"at block {curve.block_number}:\n{curve.table()}"
+            )
+        except Exception as e:
+            return f"Error quoting Zora Wow ERC20 memecoin: {e!s}"
+
+    @create_action(
+        name="search_tokens",
+        description="""
+This tool searches Zora Wow ERC20 memecoins by symbol, name or address, returning their contract address, creator, pool and whether they have graduated to Uniswap.
+
+Inputs:
+- Query: a token symbol (e.g. WOW), part of a name or symbol, or an address prefix
+- Maximum number of results (optional, default 10)
+
+Important notes:
+- Use this to find a token's contract address before buying or selling it, instead of guessing addresses.
+- Results come from a local index that is kept up to date in the background, so very recently created tokens may not appear yet.""",
+        schema=WowSearchTokensSchema,
+    )
+    def search_tokens(self, wallet_provider: EvmWalletProvider, args: dict[str, Any]) -> str:
+        """Search the local index of WOW tokens.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider whose network to search.
+            args (dict[str, Any]): Input arguments containing query and limit.
+
+        Returns:
+            str: The matching tokens or error message.
+
+        """
+        try:
+            validated_args = WowSearchTokensSchema(**args)
+            chain_id = wallet_provider.get_network().chain_id
+            self.token_index.sync_in_background(wallet_provider)
+
+            last_block = self.token_index.last_block(chain_id)
+            if last_block is None:
+                return (
+                    "The WOW token index is being built for this network for the first time. "
+                    "Try searching again shortly."
+                )
+
+            tokens = self.token_index.search(chain_id, validated_args.query, validated_args.limit)
+            if not tokens:
+                return (
+                    f"No WOW tokens found matching '{validated_args.query}' "
+                    f"(indexed through block {last_block})."
+                )
+
+            lines = [
+                f"{token.symbol} | {token.name} | {token.address} | creator {token.creator} | "
+                f"pool {token.pool_address} | {'graduated' if token.graduated else 'bonding curve'}"
+                for token in tokens
+            ]
+            return (
+                f"Found {len(tokens)} WOW tokens matching '{validated_args.query}' "
+                f"(indexed through block {last_block}):\n" + "\n".join(lines)
+            )
+        except Exception as e:
+            return f"Error searching Zora Wow ERC20 memecoins: {e!s}"
+
     @create_action(
         name="sell_token",
         description="""
@@ -208,26 +324,23 @@ Important notes:
 
         """
         try:
-            eth_quote = get_sell_quote(
-                wallet_provider, args["contract_address"], args["amount_tokens_in_wei"]
+            validated_args = WowSellTokenSchema(**args)
+            quote = self.quote_engine.quote(
+                wallet_provider,
+                validated_args.contract_address,
+                int(validated_args.amount_tokens_in_wei),
+                "sell",
             )
+            has_graduated = quote.has_graduated
 
-            if isinstance(eth_quote, list | tuple):
-                eth_quote = eth_quote[0] if eth_quote else 0
-            eth_quote = int(eth_quote)
-
-            has_graduated = get_has_graduated(wallet_provider, args["contract_address"])
+            min_eth = math.floor(float(quote.amount_out) * 0.98)
 
-            min_eth = math.floor(float(eth_quote) * 0.98)
-
-            contract = Web3().eth.contract(
-                address=Web3.to_checksum_address(args["contract_address"]), abi=WOW_ABI
-            )
+            contract = Web3().eth.contract(address=validated_args.contract_address, abi=WOW_ABI)
 
             encoded_data = contract.encode_abi(
                 "sell",
                 [
-                    int(args["amount_tokens_in_wei"]),
+                    int(validated_args.amount_tokens_in_wei),
                     wallet_provider.get_address(),
                     "0x0000000000000000000000000000000000000000",
                     "",
@@ -239,7 +352,7 @@ Important notes:
 
             tx_hash = wallet_provider.send_transaction(
                 {
-                    "to": Web3.to_checksum_address(args["contract_address"]),
+                    "to": validated_args.contract_address,
                     "data": encoded_data,
                 }
             )
@@ -267,6 +380,8 @@ Important notes:
         return network.protocol_family == "evm" and network.chain_id in SUPPORTED_CHAINS
 
 
-def wow_action_provider() -> WowActionProvider:
+def wow_action_provider(
+    quote_engine: WowQuoteEngine | None = None, token_index: WowTokenIndex | None = None
+) -> WowActionProvider:
     """Create a new WowActionProvider instance."""
-    return WowActionProvider()
+    return WowActionProvider(quote_engine, token_index)
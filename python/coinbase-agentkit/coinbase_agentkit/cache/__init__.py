@@ -0,0 +1,13 @@
+"""Caching utilities for AgentKit."""
+
+from .block_cache import BlockCache, ChainBlockCaches
+from .store import InMemoryStore, JsonFileStore, KeyValueStore, default_cache_dir
+
+__all__ = [
+    "BlockCache",
+    "ChainBlockCaches",
+    "InMemoryStore",
+    "JsonFileStore",
+    "KeyValueStore",
+    "default_cache_dir",
+]
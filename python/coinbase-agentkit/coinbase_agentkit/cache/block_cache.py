@@ -0,0 +1,163 @@
+"""Cache whose entries are scoped to the block they were read at."""
+
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..wallet_providers import EvmWalletProvider
+
+# Minimum number of seconds between two block number lookups
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+class BlockCache:
+    """A cache of onchain reads that is invalidated whenever a new block is observed.
+
+    The current block number is looked up at most once per ``poll_interval`` seconds,
+    so repeated reads within the same block do not hit the RPC endpoint again. The
+    cache may be shared between threads.
+    """
+
+    def __init__(
+        self,
+        get_block_number: Callable[[], int],
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        """Initialize the block cache.
+
+        Args:
+            get_block_number (Callable[[], int]): Function returning the latest block number.
+            poll_interval (float): Minimum seconds between two block number lookups.
+
+        """
+        self._get_block_number = get_block_number
+        self._poll_interval = poll_interval
+        self._block_number: int | None = None
+        self._block_number_fetched_at = 0.0
+        self._entries: dict[Hashable, tuple[int, Any]] = {}
+        self._lock = threading.Lock()
+
+    def block_number(self) -> int:
+        """Get the latest block number, polling the chain at most once per poll interval.
+
+        Returns:
+            int: The latest known block number.
+
+        """
+        now = time.monotonic()
+        if self._block_number is None or now - self._block_number_fetched_at >= self._poll_interval:
+            self._block_number = int(self._get_block_number())
+            self._block_number_fetched_at = now
+        return self._block_number
+
+    def get(self, key: Hashable) -> Any | None:
+        """Get a cached value if it was read at the latest block.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Any | None: The cached value, or None if missing or stale.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        block_number, value = entry
+        if block_number != self.block_number():
+            with self._lock:
+                # Another thread may have replaced or dropped the stale entry meanwhile
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            return None
+
+        return value
+
+    def set(self, key: Hashable, value: Any, block_number: int | None = None) -> None:
+        """Store a value read at the given block.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to cache.
+            block_number (int | None): The block the value was read at. Defaults to the latest block.
+
+        """
+        if block_number is None:
+            block_number = self.block_number()
+        with self._lock:
+            self._entries[key] = (block_number, value)
+
+    def get_or_fetch(
+        self, key: Hashable, fetch: Callable[[int], Any], refresh: bool = False
+    ) -> Any:
+        """Get a cached value, reading it through ``fetch`` on a miss.
+
+        Args:
+            key (Hashable): The cache key.
+            fetch (Callable[[int], Any]): Function reading the value at the given block number.
+            refresh (bool): Whether to bypass the cached value.
+
+        Returns:
+            Any: The cached or freshly read value.
+
+        """
+        if not refresh:
+            value = self.get(key)
+            if value is not None:
+                return value
+
+        block_number = self.block_number()
+        value = fetch(block_number)
+        self.set(key, value, block_number)
+        return value
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drop a cached entry, or every entry if no key is given.
+
+        Args:
+            key (Hashable | None): The cache key to drop. Drops all entries when None.
+
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+class ChainBlockCaches:
+    """Block caches keyed by chain ID, each created on first use."""
+
+    def __init__(self, poll_interval: float = DEFAULT_POLL_INTERVAL):
+        """Initialize the block caches.
+
+        Args:
+            poll_interval (float): Minimum seconds between two block number lookups per chain.
+
+        """
+        self._poll_interval = poll_interval
+        self._caches: dict[str, BlockCache] = {}
+        self._lock = threading.Lock()
+
+    def get(self, wallet_provider: "EvmWalletProvider") -> BlockCache:
+        """Get the block cache of a wallet provider's chain.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider whose chain to cache.
+                Its block number lookups back the cache when it is created.
+
+        Returns:
+            BlockCache: The chain's block cache.
+
+        """
+        chain_id = wallet_provider.get_network().chain_id
+        with self._lock:
+            cache = self._caches.get(chain_id)
+            if cache is None:
+                cache = BlockCache(wallet_provider.get_block_number, self._poll_interval)
+                self._caches[chain_id] = cache
+            return cache
@@ -0,0 +1,170 @@
+"""Key-value stores used to persist cached data across restarts."""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+
+def default_cache_dir() -> Path:
+    """Get the directory AgentKit persists caches to.
+
+    Returns:
+        Path: The value of the AGENTKIT_CACHE_DIR environment variable, or
+            ``~/.cache/coinbase_agentkit`` if it is not set.
+
+    """
+    return Path(
+        os.getenv("AGENTKIT_CACHE_DIR") or Path.home() / ".cache" / "coinbase_agentkit"
+    ).expanduser()
+
+
+class KeyValueStore(ABC):
+    """Base class for stores of JSON-serializable values."""
+
+    @abstractmethod
+    def get(self, key: str, max_age: float | None = None) -> Any | None:
+        """Get a stored value.
+
+        Args:
+            key (str): The key to look up.
+            max_age (float | None): Maximum age of the value in seconds. Older values are ignored.
+
+        Returns:
+            Any | None: The stored value, or None if missing or older than max_age.
+
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Store a value.
+
+        Args:
+            key (str): The key to store the value under.
+            value (Any): The JSON-serializable value.
+
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete a stored value.
+
+        Args:
+            key (str): The key to delete.
+
+        """
+        pass
+
+
+class InMemoryStore(KeyValueStore):
+    """A store that keeps values in process memory only."""
+
+    def __init__(self):
+        self._entries: dict[str, tuple[float, Any]] = {}
+
+    def get(self, key: str, max_age: float | None = None) -> Any | None:
+        """Get a stored value."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if max_age is not None and time.time() - stored_at > max_age:
+            return None
+
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value."""
+        self._entries[key] = (time.time(), value)
+
+    def delete(self, key: str) -> None:
+        """Delete a stored value."""
+        self._entries.pop(key, None)
+
+
+class JsonFileStore(KeyValueStore):
+    """A store persisted to a single JSON file.
+
+    The file is read lazily on first access and rewritten atomically on every change.
+    """
+
+    def __init__(self, path: str | Path):
+        """Initialize the store.
+
+        Args:
+            path (str | Path): Path to the JSON file. Parent directories are created on write.
+
+        """
+        self._path = Path(path).expanduser()
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def named(cls, name: str) -> "JsonFileStore":
+        """Create a store in the default cache directory.
+
+        Args:
+            name (str): The store name, used as the file name.
+
+        Returns:
+            JsonFileStore: A store backed by ``<cache dir>/<name>.json``.
+
+        """
+        return cls(default_cache_dir() / f"{name}.json")
+
+    @property
+    def path(self) -> Path:
+        """The path of the backing JSON file."""
+        return self._path
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self._path) as f:
+                    self._entries = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._entries = {}
+        return self._entries
+
+    def _flush(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self._path.parent, prefix=f".{self._path.name}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def get(self, key: str, max_age: float | None = None) -> Any | None:
+        """Get a stored value."""
+        with self._lock:
+            entry = self._load().get(key)
+
+        if entry is None:
+            return None
+
+        if max_age is not None and time.time() - entry["stored_at"] > max_age:
+            return None
+
+        return entry["value"]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value and persist the file."""
+        with self._lock:
+            self._load()[key] = {"stored_at": time.time(), "value": value}
+            self._flush()
+
+    def delete(self, key: str) -> None:
+        """Delete a stored value and persist the file."""
+        with self._lock:
+            if self._load().pop(key, None) is not None:
+                self._flush()
@@ -0,0 +1,14 @@
+"""Shared CDP API clients."""
+
+from .client import CdpClientStats, PooledCdpApiClient
+from .manager import CdpClientManager, cdp_client_manager, configure_cdp
+from .rate_limiter import TokenBucket
+
+__all__ = [
+    "CdpClientManager",
+    "CdpClientStats",
+    "PooledCdpApiClient",
+    "TokenBucket",
+    "cdp_client_manager",
+    "configure_cdp",
+]
@@ -0,0 +1,271 @@
+"""CDP API client with rate limiting, retries and a cached signing key."""
+
+import importlib.metadata
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+from functools import cache
+from urllib.parse import urlparse
+
+import jwt
+from cdp import __version__
+from cdp.cdp_api_client import CdpApiClient
+from cdp.client import rest
+from cdp.constants import SDK_DEFAULT_SOURCE
+from cdp.errors import InvalidAPIKeyFormatError
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from urllib3.util import Retry
+
+from .rate_limiter import TokenBucket
+
+# Methods that are safe to resend after the server may have processed them
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+RATE_LIMITED_STATUS = 429
+RETRYABLE_SERVER_STATUSES = frozenset({500, 502, 503, 504})
+
+# The cdp-sdk release whose private JWT and retry hooks the client overrides.
+# pyproject.toml pins this exact version; with any other version the SDK's own hooks are used.
+POOLED_CLIENT_CDP_SDK_VERSION = "0.17.0"
+
+
+@cache
+def _sdk_overrides_supported() -> bool:
+    """Check whether the installed cdp-sdk is the release the client's overrides were built for."""
+    try:
+        return importlib.metadata.version("cdp-sdk") == POOLED_CLIENT_CDP_SDK_VERSION
+    except importlib.metadata.PackageNotFoundError:
+        return False
+
+
+@dataclass
+class CdpClientStats:
+    """Counters for requests made through a CDP API client."""
+
+    requests: int = 0
+    retries: int = 0
+    rate_limited_responses: int = 0
+    server_error_responses: int = 0
+    throttled_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, int | float]:
+        """Convert the counters to a dictionary.
+
+        Returns:
+            dict[str, int | float]: The counters by name.
+
+        """
+        return asdict(self)
+
+
+class PooledCdpApiClient(CdpApiClient):
+    """A CDP API client meant to be shared by every provider using the same API key.
+
+    Compared to the SDK client, it keeps a larger keep-alive connection pool, waits on a
+    token bucket before each request and retries rate limited and server error responses
+    with jittered exponential backoff. With the pinned cdp-sdk release, it also parses
+    the API private key once instead of on every request and leaves status retries to
+    ``call_api``; those override private SDK methods and are skipped on other releases.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        private_key: str,
+        host: str = "https://api.cdp.coinbase.com/platform",
+        debugging: bool = False,
+        max_network_retries: int = 3,
+        source: str = SDK_DEFAULT_SOURCE,
+        source_version: str = __version__,
+        rate_limiter: TokenBucket | None = None,
+        pool_maxsize: int | None = None,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+    ):
+        """Initialize the client.
+
+        Args:
+            api_key (str): The API key name.
+            private_key (str): The PEM encoded API private key.
+            host (str): The base URL for the API.
+            debugging (bool): Whether to print requests and responses.
+            max_network_retries (int): Maximum number of retries per request.
+            source (str): The SDK source reported to CDP.
+            source_version (str): The SDK source version reported to CDP.
+            rate_limiter (TokenBucket | None): Token bucket shared by all requests, if any.
+            pool_maxsize (int | None): Maximum number of keep-alive connections per host.
+            backoff_base (float): Base delay in seconds of the exponential backoff.
+            backoff_max (float): Maximum delay in seconds between retries.
+
+        Raises:
+            InvalidAPIKeyFormatError: If the private key cannot be parsed.
+
+        """
+        super().__init__(
+            api_key, private_key, host, debugging, max_network_retries, source, source_version
+        )
+        self._max_network_retries = max_network_retries
+        self._signing_key = (
+            self._load_signing_key(private_key) if _sdk_overrides_supported() else None
+        )
+        self._rate_limiter = rate_limiter
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._stats = CdpClientStats()
+        self._stats_lock = threading.Lock()
+
+        if pool_maxsize is not None:
+            self.configuration.connection_pool_maxsize = pool_maxsize
+            self.rest_client = rest.RESTClientObject(self.configuration)
+
+    @staticmethod
+    def _load_signing_key(private_key: str) -> ec.EllipticCurvePrivateKey:
+        try:
+            signing_key = serialization.load_pem_private_key(private_key.encode(), password=None)
+        except Exception as e:
+            raise InvalidAPIKeyFormatError("Could not parse the private key") from e
+
+        if not isinstance(signing_key, ec.EllipticCurvePrivateKey):
+            raise InvalidAPIKeyFormatError("Could not parse the private key")
+
+        return signing_key
+
+    @property
+    def rate_limiter(self) -> TokenBucket | None:
+        """The token bucket requests wait on."""
+        return self._rate_limiter
+
+    @property
+    def stats(self) -> CdpClientStats:
+        """A snapshot of the request counters."""
+        with self._stats_lock:
+            return CdpClientStats(**asdict(self._stats))
+
+    def _record(self, **increments: int | float) -> None:
+        with self._stats_lock:
+            for name, increment in increments.items():
+                setattr(self._stats, name, getattr(self._stats, name) + increment)
+
+    def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> rest.RESTResponse:
+        """Make the HTTP request, waiting for rate limit capacity and retrying on failure.
+
+        Rate limited responses are retried for every method, since the request was not
+        processed. Server errors are only retried for idempotent methods.
+
+        Args:
+            method: Method to call.
+            url: Path to method endpoint.
+            header_params: Header parameters to be placed in the request header.
+            body: Request body.
+            post_params (dict): Request post form parameters.
+            _request_timeout: Timeout setting for this request.
+
+        Returns:
+            RESTResponse
+
+        """
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                throttled = self._rate_limiter.acquire()
+                if throttled:
+                    self._record(throttled_seconds=throttled)
+
+            # A fresh header dict per attempt so every retry is signed with a new JWT
+            response = super().call_api(
+                method, url, dict(header_params or {}), body, post_params, _request_timeout
+            )
+            self._record(requests=1)
+
+            if response.status == RATE_LIMITED_STATUS:
+                self._record(rate_limited_responses=1)
+            elif response.status in RETRYABLE_SERVER_STATUSES:
+                self._record(server_error_responses=1)
+
+            if attempt >= self._max_network_retries or not self._should_retry(
+                method, response.status
+            ):
+                return response
+
+            time.sleep(self._retry_delay(attempt, response))
+            attempt += 1
+            self._record(retries=1)
+
+    @staticmethod
+    def _should_retry(method: str, status: int) -> bool:
+        if status == RATE_LIMITED_STATUS:
+            return True
+        return status in RETRYABLE_SERVER_STATUSES and method.upper() in IDEMPOTENT_METHODS
+
+    def _retry_delay(self, attempt: int, response: rest.RESTResponse) -> float:
+        """Get the delay before the next attempt.
+
+        Honors a numeric Retry-After header, otherwise uses full jitter exponential
+        backoff so that concurrent clients do not retry in lockstep.
+        """
+        retry_after = response.getheader("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self._backoff_max)
+            except ValueError:
+                pass
+
+        return random.uniform(0, min(self._backoff_max, self._backoff_base * 2**attempt))
+
+    def _build_jwt(self, url: str, method: str = "GET") -> str:
+        """Build the JWT for the given API endpoint URL with the cached signing key.
+
+        Args:
+            url (str): The URL to authenticate.
+            method (str): The HTTP method to use.
+
+        Returns:
+            str: The JWT for the given API endpoint URL.
+
+        """
+        if self._signing_key is None:
+            return super()._build_jwt(url, method)
+
+        header = {
+            "alg": "ES256",
+            "kid": self.api_key,
+            "typ": "JWT",
+            "nonce": self._nonce(),
+        }
+
+        parsed_url = urlparse(url)
+        now = int(time.time())
+        claims = {
+            "sub": self.api_key,
+            "iss": "cdp",
+            "aud": ["cdp_service"],
+            "nbf": now,
+            "exp": now + 60,
+            "uris": [f"{method} {parsed_url.netloc}{parsed_url.path}"],
+        }
+
+        try:
+            return jwt.encode(claims, self._signing_key, algorithm="ES256", headers=header)
+        except Exception as e:
+            raise InvalidAPIKeyFormatError("Could not sign the JWT") from e
+
+    def _get_retry_strategy(self, max_network_retries: int) -> Retry:
+        """Retry connection and read errors only; response statuses are retried in call_api."""
+        if not _sdk_overrides_supported():
+            return super()._get_retry_strategy(max_network_retries)
+
+        return Retry(
+            total=max_network_retries,
+            allowed_methods=IDEMPOTENT_METHODS,
+            backoff_factor=0.5,
+        )
@@ -0,0 +1,238 @@
+"""Process-wide manager of CDP API clients."""
+
+import hashlib
+import json
+import os
+import threading
+
+from cdp import Cdp, __version__
+from cdp.api_clients import ApiClients
+from cdp.constants import SDK_DEFAULT_SOURCE
+from cdp.errors import InvalidConfigurationError
+
+from .client import CdpClientStats, PooledCdpApiClient
+from .rate_limiter import TokenBucket
+
+DEFAULT_BASE_PATH = "https://api.cdp.coinbase.com/platform"
+DEFAULT_KEY_FILE = "~/Downloads/cdp_api_key.json"
+
+DEFAULT_BURST = 20
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_POOL_MAXSIZE = 32
+
+
+class CdpClientManager:
+    """Keeps one CDP API client per API key and installs it as the CDP SDK client.
+
+    Every provider configured with the same key shares the client's connection pool,
+    parsed private key, counters and, when enabled, rate limit budget, no matter how
+    many agents are created in the process.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float | None = None,
+        burst: int = DEFAULT_BURST,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    ):
+        """Initialize the manager.
+
+        Args:
+            requests_per_second (float | None): Sustained request rate allowed per API key.
+                Requests are not throttled if None.
+            burst (int): Number of requests per API key that may be sent back to back when
+                requests are throttled.
+            max_retries (int): Maximum number of retries per request.
+            pool_maxsize (int): Maximum number of keep-alive connections per API key.
+
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.max_retries = max_retries
+        self.pool_maxsize = pool_maxsize
+        self._clients: dict[str, tuple[PooledCdpApiClient, ApiClients]] = {}
+        self._lock = threading.Lock()
+
+    def _get(
+        self,
+        api_key_name: str,
+        private_key: str,
+        base_path: str,
+        debugging: bool = False,
+        source: str = SDK_DEFAULT_SOURCE,
+        source_version: str = __version__,
+    ) -> tuple[PooledCdpApiClient, ApiClients]:
+        key = hashlib.sha256(
+            json.dumps(
+                [api_key_name, private_key, base_path, debugging, source, source_version]
+            ).encode()
+        ).hexdigest()
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is None:
+                client = PooledCdpApiClient(
+                    api_key_name,
+                    private_key,
+                    host=base_path,
+                    debugging=debugging,
+                    max_network_retries=self.max_retries,
+                    source=source,
+                    source_version=source_version,
+                    rate_limiter=(
+                        TokenBucket(self.requests_per_second, self.burst)
+                        if self.requests_per_second is not None
+                        else None
+                    ),
+                    pool_maxsize=self.pool_maxsize,
+                )
+                entry = (client, ApiClients(client))
+                self._clients[key] = entry
+            return entry
+
+    def get_client(
+        self, api_key_name: str, private_key: str, base_path: str = DEFAULT_BASE_PATH
+    ) -> PooledCdpApiClient:
+        """Get the shared client for an API key, creating it on first use.
+
+        Args:
+            api_key_name (str): The CDP API key name.
+            private_key (str): The CDP API key private key.
+            base_path (str): The base URL for the CDP API.
+
+        Returns:
+            PooledCdpApiClient: The shared client.
+
+        Raises:
+            InvalidAPIKeyFormatError: If the private key cannot be parsed.
+
+        """
+        return self._get(api_key_name, private_key, base_path)[0]
+
+    def configure(
+        self,
+        api_key_name: str,
+        private_key: str,
+        use_server_signer: bool = False,
+        debugging: bool = False,
+        base_path: str = DEFAULT_BASE_PATH,
+        source: str = SDK_DEFAULT_SOURCE,
+        source_version: str = __version__,
+    ) -> PooledCdpApiClient:
+        """Configure the CDP SDK to use the shared client for an API key.
+
+        Like ``Cdp.configure``, every SDK setting is reset, including the server signer
+        and debugging flags.
+
+        Args:
+            api_key_name (str): The CDP API key name.
+            private_key (str): The CDP API key private key.
+            use_server_signer (bool): Whether to use the server signer.
+            debugging (bool): Whether to print requests and responses.
+            base_path (str): The base URL for the CDP API.
+            source (str): The SDK source reported to CDP.
+            source_version (str): The SDK source version reported to CDP.
+
+        Returns:
+            PooledCdpApiClient: The client the CDP SDK now uses.
+
+        Raises:
+            InvalidAPIKeyFormatError: If the private key cannot be parsed.
+
+        """
+        client, api_clients = self._get(
+            api_key_name, private_key, base_path, debugging, source, source_version
+        )
+
+        Cdp.api_key_name = api_key_name
+        Cdp.private_key = private_key
+        Cdp.use_server_signer = use_server_signer
+        Cdp.debugging = debugging
+        Cdp.base_path = base_path
+        Cdp.max_network_retries = self.max_retries
+        Cdp.api_clients = api_clients
+
+        return client
+
+    def configure_from_json(
+        self,
+        file_path: str = DEFAULT_KEY_FILE,
+        use_server_signer: bool = False,
+        debugging: bool = False,
+        base_path: str = DEFAULT_BASE_PATH,
+        source: str = SDK_DEFAULT_SOURCE,
+        source_version: str = __version__,
+    ) -> PooledCdpApiClient:
+        """Configure the CDP SDK from a downloaded CDP API key file.
+
+        Args:
+            file_path (str): Path to the JSON key file.
+            use_server_signer (bool): Whether to use the server signer.
+            debugging (bool): Whether to print requests and responses.
+            base_path (str): The base URL for the CDP API.
+            source (str): The SDK source reported to CDP.
+            source_version (str): The SDK source version reported to CDP.
+
+        Returns:
+            PooledCdpApiClient: The client the CDP SDK now uses.
+
+        Raises:
+            InvalidConfigurationError: If the file is missing the key name or private key.
+
+        """
+        with open(os.path.expanduser(file_path)) as f:
+            data = json.load(f)
+
+        api_key_name = data.get("name")
+        private_key = data.get("privateKey")
+        if not api_key_name:
+            raise InvalidConfigurationError("Invalid JSON format: Missing 'api_key_name'")
+        if not private_key:
+            raise InvalidConfigurationError("Invalid JSON format: Missing 'private_key'")
+
+        return self.configure(
+            api_key_name,
+            private_key,
+            use_server_signer,
+            debugging,
+            base_path,
+            source,
+            source_version,
+        )
+
+    def stats(self) -> dict[str, CdpClientStats]:
+        """Get the request counters of every client.
+
+        Returns:
+            dict[str, CdpClientStats]: Counters keyed by API key name, summed across
+                clients that share a key name.
+
+        """
+        with self._lock:
+            clients = [client for client, _ in self._clients.values()]
+
+        totals: dict[str, CdpClientStats] = {}
+        for client in clients:
+            total = totals.setdefault(client.api_key, CdpClientStats())
+            for name, value in client.stats.to_dict().items():
+                setattr(total, name, getattr(total, name) + value)
+        return totals
+
+
+cdp_client_manager = CdpClientManager()
+
+
+def configure_cdp(api_key_name: str | None = None, private_key: str | None = None) -> None:
+    """Configure the CDP SDK through the shared client manager.
+
+    Args:
+        api_key_name (str | None): The CDP API key name.
+        private_key (str | None): The CDP API key private key. Escaped newlines are
+            unescaped. If either value is missing, the key is read from the default
+            CDP API key file instead.
+
+    """
+    if api_key_name and private_key:
+        cdp_client_manager.configure(api_key_name, private_key.replace("\\n", "\n"))
+    else:
+        cdp_client_manager.configure_from_json()
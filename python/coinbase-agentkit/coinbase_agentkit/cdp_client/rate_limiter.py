@@ -0,0 +1,65 @@
+"""Token bucket rate limiter for CDP API requests."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """A thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``. Each request
+    takes one token, blocking until the bucket has refilled enough to cover it.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """Initialize the bucket full.
+
+        Args:
+            rate (float): Tokens added per second.
+            capacity (float): Maximum number of tokens, i.e. the allowed burst size.
+
+        Raises:
+            ValueError: If rate or capacity is not positive.
+
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("Token bucket rate and capacity must be positive")
+
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second."""
+        return self._rate
+
+    @property
+    def capacity(self) -> float:
+        """Maximum number of tokens."""
+        return self._capacity
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    def acquire(self) -> float:
+        """Take one token, waiting for it if the bucket is empty.
+
+        The token is reserved before waiting, so concurrent callers are served in the
+        order they arrive instead of racing for each refill.
+
+        Returns:
+            float: The number of seconds spent waiting.
+
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            delay = -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+        if delay:
+            time.sleep(delay)
+        return delay
@@ -0,0 +1,20 @@
+"""Utilities for indexing onchain event logs."""
+
+from .deployment import find_deployment_block, is_historical_state_error
+from .log_scanner import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_CONFIRMATIONS,
+    LogChunk,
+    LogScanner,
+    is_range_error,
+)
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "DEFAULT_CONFIRMATIONS",
+    "LogChunk",
+    "LogScanner",
+    "find_deployment_block",
+    "is_historical_state_error",
+    "is_range_error",
+]
@@ -0,0 +1,68 @@
+"""Find the block a contract was deployed at."""
+
+from web3.types import TxParams
+
+from ..wallet_providers import EvmWalletProvider
+
+# Fragments of the errors RPC endpoints without archive state return for calls at old blocks
+HISTORICAL_STATE_ERROR_MESSAGES = (
+    "missing trie node",
+    "header not found",
+    "state not available",
+    "state is not available",
+    "historical state",
+    "state histories",
+    "pruned",
+    "archive",
+)
+
+
+def is_historical_state_error(error: Exception) -> bool:
+    """Check whether a call error means the endpoint does not keep the block's state.
+
+    Args:
+        error (Exception): The error raised by the RPC request.
+
+    Returns:
+        bool: True if the call may succeed on an archive node.
+
+    """
+    message = str(error).lower()
+    return any(fragment in message for fragment in HISTORICAL_STATE_ERROR_MESSAGES)
+
+
+def find_deployment_block(
+    wallet_provider: EvmWalletProvider, probe: TxParams, latest: int
+) -> int | None:
+    """Find the first block a contract answers a call at by bisecting calls to it.
+
+    Calls to an address without code succeed and return no data, so the contract is
+    deployed at the first block the probe returns data at. Calls at old blocks need an
+    archive node; on other endpoints they raise errors recognized by
+    ``is_historical_state_error``.
+
+    Args:
+        wallet_provider (EvmWalletProvider): The wallet provider used for calls.
+        probe (TxParams): A call to a view function of the contract.
+        latest (int): The block to search up to.
+
+    Returns:
+        int | None: The deployment block, or None if the contract does not answer the
+            probe at ``latest``.
+
+    """
+
+    def deployed_at(block: int) -> bool:
+        return len(wallet_provider.call(probe, block)) > 0
+
+    if not deployed_at(latest):
+        return None
+
+    low, high = 0, latest
+    while low < high:
+        middle = (low + high) // 2
+        if deployed_at(middle):
+            high = middle
+        else:
+            low = middle + 1
+    return low
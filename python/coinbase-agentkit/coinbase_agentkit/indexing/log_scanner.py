@@ -0,0 +1,143 @@
+"""Read event logs over large block ranges with chunked eth_getLogs requests."""
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+from web3.types import FilterParams, LogReceipt
+
+from ..wallet_providers import EvmWalletProvider
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Number of blocks behind the chain head after which indexed logs are treated as final.
+# Blocks within this window are rescanned on every sync in case they are reorganized.
+DEFAULT_CONFIRMATIONS = 12
+
+# Number of consecutive successful requests after which a reduced chunk size is doubled
+GROW_AFTER_SUCCESSES = 8
+
+# Fragments of the errors RPC providers return when a getLogs request covers too many
+# blocks or matches too many logs
+RANGE_ERROR_MESSAGES = (
+    "too many results",
+    "query returned more than",
+    "block range",
+    "range is too large",
+    "range too large",
+    "exceed maximum block range",
+    "response size",
+    "too many logs",
+)
+
+
+def is_range_error(error: Exception) -> bool:
+    """Check whether a getLogs error means the block range should be narrowed.
+
+    Args:
+        error (Exception): The error raised by the RPC request.
+
+    Returns:
+        bool: True if retrying over a smaller range may succeed.
+
+    """
+    message = str(error).lower()
+    return any(fragment in message for fragment in RANGE_ERROR_MESSAGES)
+
+
+@dataclass
+class LogChunk:
+    """The logs matching a set of filters within a block range."""
+
+    from_block: int
+    to_block: int
+    logs: list[LogReceipt] = field(default_factory=list)
+
+
+class LogScanner:
+    """Scans block ranges with as few eth_getLogs requests as the RPC endpoint allows.
+
+    Ranges are requested ``chunk_size`` blocks at a time. When the endpoint rejects a
+    range for returning too many results, the range is split in half and retried, and
+    the smaller size is kept for the following chunks. After a run of successful chunks
+    the size grows back towards the configured maximum.
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE, min_chunk_size: int = 1):
+        """Initialize the scanner.
+
+        Args:
+            chunk_size (int): Maximum number of blocks requested at once.
+            min_chunk_size (int): Smallest range tried before giving up on a request.
+
+        """
+        self.max_chunk_size = chunk_size
+        self.min_chunk_size = min_chunk_size
+        self.chunk_size = chunk_size
+        self._successes = 0
+
+    def _get_logs(
+        self,
+        wallet_provider: EvmWalletProvider,
+        filters: list[FilterParams],
+        from_block: int,
+        to_block: int,
+    ) -> list[LogReceipt]:
+        # Logs matching several filters are keyed by position so they are only kept once
+        logs: dict[tuple[int, int], LogReceipt] = {}
+        for filter_params in filters:
+            for log in wallet_provider.get_logs(
+                {**filter_params, "fromBlock": from_block, "toBlock": to_block}
+            ):
+                logs[(log["blockNumber"], log["logIndex"])] = log
+        return [logs[position] for position in sorted(logs)]
+
+    def scan(
+        self,
+        wallet_provider: EvmWalletProvider,
+        filters: FilterParams | list[FilterParams],
+        from_block: int,
+        to_block: int,
+    ) -> Iterator[LogChunk]:
+        """Read the logs matching one or more filters between two blocks.
+
+        Chunks are yielded in block order, so callers can persist their progress after
+        each one and resume from the last completed block.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider used to read logs.
+            filters (FilterParams | list[FilterParams]): The filters to match, without
+                block bounds. Every filter is queried over the same ranges and their logs
+                are merged.
+            from_block (int): The first block to scan.
+            to_block (int): The last block to scan, inclusive.
+
+        Yields:
+            LogChunk: The logs of each scanned range, sorted by block and log index.
+
+        Raises:
+            Exception: If a request fails for a reason other than the range size, or
+                still fails at the minimum chunk size.
+
+        """
+        if not isinstance(filters, list):
+            filters = [filters]
+
+        start = from_block
+        while start <= to_block:
+            end = min(start + self.chunk_size - 1, to_block)
+            try:
+                logs = self._get_logs(wallet_provider, filters, start, end)
+            except Exception as e:
+                if not is_range_error(e) or end - start + 1 <= self.min_chunk_size:
+                    raise
+                self.chunk_size = max(self.min_chunk_size, (end - start + 1) // 2)
+                self._successes = 0
+                continue
+
+            self._successes += 1
+            if self.chunk_size < self.max_chunk_size and self._successes >= GROW_AFTER_SUCCESSES:
+                self.chunk_size = min(self.max_chunk_size, self.chunk_size * 2)
+                self._successes = 0
+
+            yield LogChunk(start, end, logs)
+            start = end + 1
@@ -0,0 +1,15 @@
+"""Batched contract reads through Multicall3."""
+
+from .codec import FunctionCodec, get_function_codec
+from .constants import MULTICALL3_ABI, MULTICALL3_ADDRESS
+from .multicall import Call, CallResult, multicall
+
+__all__ = [
+    "MULTICALL3_ABI",
+    "MULTICALL3_ADDRESS",
+    "Call",
+    "CallResult",
+    "FunctionCodec",
+    "get_function_codec",
+    "multicall",
+]
@@ -0,0 +1,121 @@
+"""Precompiled encoders and decoders for contract function calls."""
+
+from typing import Any
+
+from eth_abi import decode, encode
+from eth_abi.grammar import ABIType, TupleType, parse
+from eth_utils import function_abi_to_4byte_selector, to_checksum_address
+from eth_utils.abi import collapse_if_tuple
+
+
+def _checksum_addresses(abi_type: ABIType, value: Any) -> Any:
+    """Checksum decoded addresses, matching the values returned by web3 contract calls."""
+    if abi_type.is_array:
+        return [_checksum_addresses(abi_type.item_type, item) for item in value]
+    if isinstance(abi_type, TupleType):
+        return tuple(
+            _checksum_addresses(component, item)
+            for component, item in zip(abi_type.components, value, strict=True)
+        )
+    if abi_type.base == "address":
+        return to_checksum_address(value)
+    return value
+
+
+class FunctionCodec:
+    """Encodes calls to and decodes results from a single contract function.
+
+    The selector and argument types are computed once when the codec is built, so
+    encoding a call does not rebuild a web3 contract object.
+    """
+
+    def __init__(self, function_abi: dict[str, Any]):
+        """Initialize the codec.
+
+        Args:
+            function_abi (dict[str, Any]): The ABI entry of the function.
+
+        """
+        self.name: str = function_abi["name"]
+        self.selector: bytes = function_abi_to_4byte_selector(function_abi)
+        self.input_types: list[str] = [
+            collapse_if_tuple(arg) for arg in function_abi.get("inputs", [])
+        ]
+        self.output_types: list[str] = [
+            collapse_if_tuple(arg) for arg in function_abi.get("outputs", [])
+        ]
+        self._parsed_output_types = [parse(output_type) for output_type in self.output_types]
+        self._has_address_output = any("address" in t for t in self.output_types)
+
+    def encode(self, args: list[Any] | tuple[Any, ...] = ()) -> bytes:
+        """Encode the calldata of a call.
+
+        Args:
+            args (list[Any] | tuple[Any, ...]): The function arguments.
+
+        Returns:
+            bytes: The selector followed by the ABI-encoded arguments.
+
+        """
+        return self.selector + encode(self.input_types, list(args))
+
+    def decode(self, data: bytes) -> Any:
+        """Decode the return data of a call.
+
+        Args:
+            data (bytes): The raw return data.
+
+        Returns:
+            Any: The single return value, or a tuple of values if the function has several
+                outputs.
+
+        """
+        values = decode(self.output_types, data)
+        if self._has_address_output:
+            values = tuple(
+                _checksum_addresses(abi_type, value)
+                for abi_type, value in zip(self._parsed_output_types, values, strict=True)
+            )
+        return values[0] if len(values) == 1 else values
+
+
+# Codecs keyed by the id of the ABI list they were built from. The ABI is kept alongside
+# the codec so its id cannot be reused while the entry exists.
+_codecs: dict[tuple[int, str], tuple[list[dict[str, Any]], FunctionCodec]] = {}
+
+
+def get_function_codec(abi: list[dict[str, Any]], function_name: str) -> FunctionCodec:
+    """Get the codec of a function, building it on first use.
+
+    ABIs are expected to be module-level constants, so codecs are cached for the
+    lifetime of the process.
+
+    Args:
+        abi (list[dict[str, Any]]): The contract ABI.
+        function_name (str): The name of the function.
+
+    Returns:
+        FunctionCodec: The codec for the function.
+
+    Raises:
+        ValueError: If the ABI has no function with that name.
+
+    """
+    key = (id(abi), function_name)
+    entry = _codecs.get(key)
+    if entry is None:
+        function_abi = next(
+            (
+                item
+                for item in abi
+                if item.get("type") == "function" and item.get("name") == function_name
+            ),
+            None,
+        )
+        if function_abi is None:
+            raise ValueError(f"Function {function_name} not found in ABI")
+
+        entry = (abi, FunctionCodec(function_abi))
+        _codecs[key] = entry
+
+    return entry[1]
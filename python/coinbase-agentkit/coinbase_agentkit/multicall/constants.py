@@ -0,0 +1,47 @@
+"""Constants for Multicall3."""
+
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "type": "function",
+        "name": "aggregate3",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            },
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+            },
+        ],
+    },
+    {
+        "type": "function",
+        "name": "getBlockNumber",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"name": "blockNumber", "type": "uint256"}],
+    },
+    {
+        "type": "function",
+        "name": "getEthBalance",
+        "stateMutability": "view",
+        "inputs": [{"name": "addr", "type": "address"}],
+        "outputs": [{"name": "balance", "type": "uint256"}],
+    },
+]
@@ -0,0 +1,111 @@
+"""Batch contract reads into a single Multicall3 request."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from web3 import Web3
+from web3.types import BlockIdentifier
+
+from ..wallet_providers import EvmWalletProvider
+from .codec import get_function_codec
+from .constants import MULTICALL3_ABI, MULTICALL3_ADDRESS
+
+# Maximum number of calls sent in one aggregate3 request, to stay under RPC gas and size limits
+MAX_CALLS_PER_REQUEST = 500
+
+
+@dataclass(frozen=True)
+class Call:
+    """A read-only contract call."""
+
+    target: str
+    abi: list[dict[str, Any]] = field(repr=False)
+    function_name: str
+    args: tuple[Any, ...] = ()
+
+
+@dataclass(frozen=True)
+class CallResult:
+    """The outcome of a call in a batch."""
+
+    success: bool
+    value: Any = None
+    error: str | None = None
+
+
+def _read_individually(
+    wallet_provider: EvmWalletProvider, calls: list[Call], block_identifier: BlockIdentifier
+) -> list[CallResult]:
+    results = []
+    for call in calls:
+        try:
+            value = wallet_provider.read_contract(
+                contract_address=Web3.to_checksum_address(call.target),
+                abi=call.abi,
+                function_name=call.function_name,
+                args=list(call.args),
+                block_identifier=block_identifier,
+            )
+            results.append(CallResult(True, value))
+        except Exception as e:
+            results.append(CallResult(False, error=str(e)))
+    return results
+
+
+def _aggregate(
+    wallet_provider: EvmWalletProvider, calls: list[Call], block_identifier: BlockIdentifier
+) -> list[CallResult]:
+    codecs = [get_function_codec(call.abi, call.function_name) for call in calls]
+    requests = [
+        (Web3.to_checksum_address(call.target), True, codec.encode(call.args))
+        for call, codec in zip(calls, codecs, strict=True)
+    ]
+
+    responses = wallet_provider.read_contract(
+        contract_address=MULTICALL3_ADDRESS,
+        abi=MULTICALL3_ABI,
+        function_name="aggregate3",
+        args=[requests],
+        block_identifier=block_identifier,
+    )
+
+    results = []
+    for codec, (success, return_data) in zip(codecs, responses, strict=True):
+        if not success:
+            results.append(CallResult(False, error="Call reverted"))
+            continue
+        try:
+            results.append(CallResult(True, codec.decode(return_data)))
+        except Exception as e:
+            results.append(CallResult(False, error=f"Could not decode result: {e!s}"))
+    return results
+
+
+def multicall(
+    wallet_provider: EvmWalletProvider,
+    calls: list[Call],
+    block_identifier: BlockIdentifier = "latest",
+) -> list[CallResult]:
+    """Execute read-only calls in as few RPC requests as possible.
+
+    Calls are batched through Multicall3's aggregate3 with failures allowed, so a
+    reverting call does not fail the batch. If the Multicall3 request itself fails,
+    e.g. on a chain without Multicall3, the calls are made one by one instead.
+
+    Args:
+        wallet_provider (EvmWalletProvider): The wallet provider used to read contracts.
+        calls (list[Call]): The calls to execute.
+        block_identifier (BlockIdentifier): The block to read at, defaults to 'latest'.
+
+    Returns:
+        list[CallResult]: One result per call, in the same order as the calls.
+
+    """
+    results: list[CallResult] = []
+    for start in range(0, len(calls), MAX_CALLS_PER_REQUEST):
+        batch = calls[start : start + MAX_CALLS_PER_REQUEST]
+        try:
+            results.extend(_aggregate(wallet_provider, batch, block_identifier))
+        except Exception:
+            results.extend(_read_individually(wallet_provider, batch, block_identifier))
+    return results
@@ -0,0 +1,21 @@
+"""Basename and ENS name resolution."""
+
+from .namehash import namehash, normalize_name, reverse_node
+from .resolver import (
+    NameResolver,
+    get_default_resolver,
+    is_name,
+    resolve_address,
+    resolve_addresses,
+)
+
+__all__ = [
+    "NameResolver",
+    "get_default_resolver",
+    "is_name",
+    "namehash",
+    "normalize_name",
+    "resolve_address",
+    "resolve_addresses",
+    "reverse_node",
+]
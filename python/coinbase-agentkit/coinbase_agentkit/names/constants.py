@@ -0,0 +1,58 @@
+"""Constants for Basename and ENS resolution."""
+
+from dataclasses import dataclass
+
+# How long resolved names and addresses are reused before being read again, in seconds
+DEFAULT_TTL = 300.0
+
+
+@dataclass(frozen=True)
+class NameService:
+    """The name registry of a chain and the names it resolves."""
+
+    registry_address: str
+    suffixes: tuple[str, ...]
+    reverse_suffix: str
+
+
+# Name services keyed by the chain ID they are read on. Basenames use the ENSIP-19
+# reverse namespace of their chain's coin type, 0x80000000 | chain ID.
+NAME_SERVICES: dict[str, NameService] = {
+    "1": NameService("0x00000000000C2E074eC69A0dFb2997BA6C7d2e1e", (".eth",), "addr.reverse"),
+    "11155111": NameService(
+        "0x00000000000C2E074eC69A0dFb2997BA6C7d2e1e", (".eth",), "addr.reverse"
+    ),
+    "8453": NameService(
+        "0xB94704422c2a1E396835A571837Aa5AE53285a95", (".base.eth",), "80002105.reverse"
+    ),
+    "84532": NameService(
+        "0x1493b2567056c2181630115660963E13A8E32735", (".basetest.eth",), "80014a34.reverse"
+    ),
+}
+
+REGISTRY_ABI = [
+    {
+        "inputs": [{"internalType": "bytes32", "name": "node", "type": "bytes32"}],
+        "name": "resolver",
+        "outputs": [{"internalType": "address", "name": "", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+RESOLVER_ABI = [
+    {
+        "inputs": [{"internalType": "bytes32", "name": "node", "type": "bytes32"}],
+        "name": "addr",
+        "outputs": [{"internalType": "address payable", "name": "", "type": "address"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "bytes32", "name": "node", "type": "bytes32"}],
+        "name": "name",
+        "outputs": [{"internalType": "string", "name": "", "type": "string"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
@@ -0,0 +1,77 @@
+"""Local computation of ENS namehashes."""
+
+from functools import lru_cache
+
+from eth_utils import keccak
+
+from .constants import NAME_SERVICES
+
+# Maximum number of nodes kept, including every parent of the names hashed so far
+NODE_CACHE_SIZE = 4096
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a name before hashing.
+
+    ASCII names are lowercased, which is their ENSIP-15 normalization. Other names go
+    through web3's full ENSIP-15 normalization.
+
+    Args:
+        name (str): The name to normalize.
+
+    Returns:
+        str: The normalized name.
+
+    """
+    name = name.strip()
+    if name.isascii():
+        return name.lower()
+
+    from ens.utils import normalize_name as normalize_name_ensip15
+
+    return normalize_name_ensip15(name)
+
+
+@lru_cache(maxsize=NODE_CACHE_SIZE)
+def _node(normalized_name: str) -> bytes:
+    if not normalized_name:
+        return b"\0" * 32
+    label, _, parent = normalized_name.partition(".")
+    return keccak(_node(parent) + keccak(text=label))
+
+
+def namehash(name: str) -> bytes:
+    """Compute the ENS node of a name.
+
+    Nodes are cached along with every parent node, so hashing a name under a known
+    parent such as ``base.eth`` costs a single keccak of the new label.
+
+    Args:
+        name (str): The name, e.g. ``alice.base.eth``.
+
+    Returns:
+        bytes: The 32-byte node.
+
+    """
+    return _node(normalize_name(name))
+
+
+def reverse_node(address: str, reverse_suffix: str) -> bytes:
+    """Compute the reverse resolution node of an address.
+
+    Args:
+        address (str): The address.
+        reverse_suffix (str): The reverse namespace, e.g. ``addr.reverse``.
+
+    Returns:
+        bytes: The 32-byte node.
+
+    """
+    return _node(f"{address.lower().removeprefix('0x')}.{reverse_suffix}")
+
+
+# Precompute the parent nodes every lookup goes through
+for _service in NAME_SERVICES.values():
+    for _suffix in _service.suffixes:
+        _node(_suffix.lstrip("."))
+    _node(_service.reverse_suffix)
@@ -0,0 +1,258 @@
+"""Forward and reverse resolution of Basenames and ENS names."""
+
+from web3 import Web3
+
+from ..cache import InMemoryStore, KeyValueStore
+from ..multicall import Call, multicall
+from ..wallet_providers import EvmWalletProvider
+from .constants import DEFAULT_TTL, NAME_SERVICES, REGISTRY_ABI, RESOLVER_ABI, NameService
+from .namehash import namehash, normalize_name, reverse_node
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def is_name(value: str) -> bool:
+    """Check whether a value looks like a name rather than an address.
+
+    Args:
+        value (str): An address or a name.
+
+    Returns:
+        bool: Whether the value is a dotted name such as ``alice.base.eth``.
+
+    """
+    value = value.strip()
+    return "." in value and not value.lower().startswith("0x")
+
+
+class NameResolver:
+    """Resolves names to addresses and addresses to names.
+
+    Lookups of many names or addresses go through two multicalls: one reading the
+    resolver of every node from the chain's registry, and one reading every address or
+    name from those resolvers. Nodes are hashed locally. Results, including names that
+    do not resolve, are cached for the TTL, so repeated lookups make no RPC requests.
+    """
+
+    def __init__(self, store: KeyValueStore | None = None, ttl: float = DEFAULT_TTL):
+        """Initialize the name resolver.
+
+        Args:
+            store (KeyValueStore | None): Store for resolved names and addresses.
+                Defaults to process memory.
+            ttl (float): Seconds a resolution is reused before being read again.
+
+        """
+        self.store = store or InMemoryStore()
+        self.ttl = ttl
+
+    @staticmethod
+    def _service(chain_id: str) -> NameService:
+        service = NAME_SERVICES.get(chain_id)
+        if service is None:
+            raise ValueError(f"Name resolution is not supported on chain {chain_id}")
+        return service
+
+    def resolve(
+        self, wallet_provider: EvmWalletProvider, names: list[str]
+    ) -> dict[str, str | None]:
+        """Resolve names to addresses.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider used for reads.
+            names (list[str]): The names, e.g. ``alice.base.eth``.
+
+        Returns:
+            dict[str, str | None]: The checksummed address of every name, or None for
+                names that do not resolve.
+
+        Raises:
+            ValueError: If names cannot be resolved on the wallet's chain.
+
+        """
+        chain_id = wallet_provider.get_network().chain_id
+        service = self._service(chain_id)
+        for name in names:
+            if not normalize_name(name).endswith(service.suffixes):
+                raise ValueError(
+                    f"Cannot resolve {name} on chain {chain_id}, "
+                    f"which resolves {', '.join(service.suffixes)} names"
+                )
+
+        keys = {name: f"{chain_id}:addr:{normalize_name(name)}" for name in names}
+        return self._lookup(
+            wallet_provider,
+            service,
+            keys,
+            {name: namehash(name) for name in names},
+            "addr",
+        )
+
+    def lookup(
+        self, wallet_provider: EvmWalletProvider, addresses: list[str]
+    ) -> dict[str, str | None]:
+        """Look up the primary names of addresses.
+
+        The name record of an address is set by its owner, so a name is only returned
+        when it resolves forward to the same address.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider used for reads.
+            addresses (list[str]): The addresses.
+
+        Returns:
+            dict[str, str | None]: The primary name of every address, or None for
+                addresses without a verified one.
+
+        Raises:
+            ValueError: If names cannot be resolved on the wallet's chain.
+
+        """
+        chain_id = wallet_provider.get_network().chain_id
+        service = self._service(chain_id)
+
+        keys = {address: f"{chain_id}:name:{address.lower()}" for address in addresses}
+        claimed = self._lookup(
+            wallet_provider,
+            service,
+            keys,
+            {address: reverse_node(address, service.reverse_suffix) for address in addresses},
+            "name",
+        )
+        candidates = {
+            address: name
+            for address, name in claimed.items()
+            if name is not None and normalize_name(name).endswith(service.suffixes)
+        }
+        forward = (
+            self.resolve(wallet_provider, list(dict.fromkeys(candidates.values())))
+            if candidates
+            else {}
+        )
+
+        names: dict[str, str | None] = {}
+        for address in addresses:
+            name = candidates.get(address)
+            resolved = forward.get(name) if name is not None else None
+            verified = resolved is not None and resolved.lower() == address.lower()
+            names[address] = name if verified else None
+        return names
+
+    def _lookup(
+        self,
+        wallet_provider: EvmWalletProvider,
+        service: NameService,
+        keys: dict[str, str],
+        nodes: dict[str, bytes],
+        function_name: str,
+    ) -> dict[str, str | None]:
+        results: dict[str, str | None] = {}
+        for query, key in keys.items():
+            entry = self.store.get(key, max_age=self.ttl)
+            if entry is not None:
+                results[query] = entry["value"]
+
+        missing = [query for query in keys if query not in results]
+        if not missing:
+            return results
+
+        resolvers = multicall(
+            wallet_provider,
+            [
+                Call(service.registry_address, REGISTRY_ABI, "resolver", (nodes[query],))
+                for query in missing
+            ],
+        )
+        resolved = [
+            (query, resolver.value)
+            for query, resolver in zip(missing, resolvers, strict=True)
+            if resolver.success and resolver.value != ZERO_ADDRESS
+        ]
+        records = multicall(
+            wallet_provider,
+            [
+                Call(resolver_address, RESOLVER_ABI, function_name, (nodes[query],))
+                for query, resolver_address in resolved
+            ],
+        )
+        values = {
+            query: record.value
+            for (query, _), record in zip(resolved, records, strict=True)
+            if record.success and record.value and record.value != ZERO_ADDRESS
+        }
+
+        for query in missing:
+            value = values.get(query)
+            if value is not None and function_name == "addr":
+                value = Web3.to_checksum_address(value)
+            results[query] = value
+            self.store.set(keys[query], {"value": value})
+
+        return results
+
+
+_default_resolver = NameResolver()
+
+
+def get_default_resolver() -> NameResolver:
+    """Get the resolver shared by actions.
+
+    Returns:
+        NameResolver: The shared resolver.
+
+    """
+    return _default_resolver
+
+
+def resolve_addresses(wallet_provider: EvmWalletProvider, values: list[str]) -> list[str]:
+    """Resolve addresses and names with the wallet provider an action runs with.
+
+    Names are resolved on the wallet's chain with the shared resolver, all in one
+    lookup, so names resolved within the TTL are returned without making RPC calls.
+
+    Args:
+        wallet_provider (EvmWalletProvider): The wallet provider of the action.
+        values (list[str]): Addresses or names, e.g. ``alice.base.eth``.
+
+    Returns:
+        list[str]: The checksummed address of every value, in order.
+
+    Raises:
+        ValueError: If an address is invalid, or a name does not resolve or cannot be
+            resolved on the wallet's chain.
+
+    """
+    names = list(dict.fromkeys(value for value in values if is_name(value)))
+    resolved = _default_resolver.resolve(wallet_provider, names) if names else {}
+
+    addresses = []
+    for value in values:
+        if value in resolved:
+            address = resolved[value]
+            if address is None:
+                raise ValueError(f"Name {value} does not resolve to an address")
+            addresses.append(address)
+            continue
+        try:
+            addresses.append(Web3.to_checksum_address(value))
+        except ValueError as e:
+            raise ValueError("Invalid Ethereum address") from e
+    return addresses
+
+
+def resolve_address(wallet_provider: EvmWalletProvider, value: str) -> str:
+    """Resolve an address or name with the wallet provider an action runs with.
+
+    Args:
+        wallet_provider (EvmWalletProvider): The wallet provider of the action.
+        value (str): An address or a name, e.g. ``alice.base.eth``.
+
+    Returns:
+        str: The checksummed address.
+
+    Raises:
+        ValueError: If the address is invalid, or the name does not resolve or cannot be
+            resolved on the wallet's chain.
+
+    """
+    return resolve_addresses(wallet_provider, [value])[0]
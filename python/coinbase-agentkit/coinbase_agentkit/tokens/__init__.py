@@ -0,0 +1,5 @@
+"""ERC20 token metadata."""
+
+from .registry import TokenMetadata, TokenRegistry, format_units, parse_units
+
+__all__ = ["TokenMetadata", "TokenRegistry", "format_units", "parse_units"]
@@ -0,0 +1,92 @@
+"""Constants for the token metadata registry."""
+
+ERC20_METADATA_ABI = [
+    {
+        "type": "function",
+        "name": "name",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"type": "string"}],
+    },
+    {
+        "type": "function",
+        "name": "symbol",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"type": "string"}],
+    },
+    {
+        "type": "function",
+        "name": "decimals",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"type": "uint8"}],
+    },
+]
+
+# Major tokens on the chains in chain_definitions, keyed by chain ID.
+# Each entry is (address, name, symbol, decimals).
+KNOWN_TOKENS: dict[str, list[tuple[str, str, str, int]]] = {
+    # Ethereum
+    "1": [
+        ("0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48", "USD Coin", "USDC", 6),
+        ("0xdAC17F958D2ee523a2206206994597C13D831ec7", "Tether USD", "USDT", 6),
+        ("0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2", "Wrapped Ether", "WETH", 18),
+        ("0x6B175474E89094C44Da98b954EedeAC495271d0F", "Dai Stablecoin", "DAI", 18),
+        ("0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599", "Wrapped BTC", "WBTC", 8),
+        ("0xBe9895146f7AF43049ca1c1AE358B0541Ea49704", "Coinbase Wrapped Staked ETH", "cbETH", 18),
+        ("0xcbB7C0000aB88B473b1f5aFd9ef808440eed33Bf", "Coinbase Wrapped BTC", "cbBTC", 8),
+    ],
+    # Sepolia
+    "11155111": [
+        ("0x1c7D4B196Cb0C7B01d743Fbc6116a902379C7238", "USDC", "USDC", 6),
+        ("0xfFf9976782d46CC05630D1f6eBAb18b2324d6B14", "Wrapped Ether", "WETH", 18),
+    ],
+    # Base
+    "8453": [
+        ("0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913", "USD Coin", "USDC", 6),
+        ("0x4200000000000000000000000000000000000006", "Wrapped Ether", "WETH", 18),
+        ("0x50c5725949A6F0c72E6C4a641F24049A917DB0Cb", "Dai Stablecoin", "DAI", 18),
+        ("0xd9aAEc86B65D86f6A7B5B1b0c42FFA531710b6CA", "USD Base Coin", "USDbC", 6),
+        ("0x2Ae3F1Ec7F1F5012CFEab0185bfc7aa3cf0DEc22", "Coinbase Wrapped Staked ETH", "cbETH", 18),
+        ("0xcbB7C0000aB88B473b1f5aFd9ef808440eed33Bf", "Coinbase Wrapped BTC", "cbBTC", 8),
+    ],
+    # Base Sepolia
+    "84532": [
+        ("0x036CbD53842c5426634e7929541eC2318f3dCF7e", "USDC", "USDC", 6),
+        ("0x4200000000000000000000000000000000000006", "Wrapped Ether", "WETH", 18),
+    ],
+    # Optimism
+    "10": [
+        ("0x0b2C639c533813f4Aa9D7837CAf62653d097Ff85", "USD Coin", "USDC", 6),
+        ("0x94b008aA00579c1307B0EF2c499aD98a8ce58e58", "Tether USD", "USDT", 6),
+        ("0x4200000000000000000000000000000000000006", "Wrapped Ether", "WETH", 18),
+        ("0xDA10009cBd5D07dd0CeCc66161FC93D7c9000da1", "Dai Stablecoin", "DAI", 18),
+        ("0x68f180fcCe6836688e9084f035309E29Bf0A2095", "Wrapped BTC", "WBTC", 8),
+    ],
+    # Optimism Sepolia
+    "11155420": [
+        ("0x5fd84259d66Cd46123540766Be93DFE6D43130D7", "USDC", "USDC", 6),
+        ("0x4200000000000000000000000000000000000006", "Wrapped Ether", "WETH", 18),
+    ],
+    # Arbitrum
+    "42161": [
+        ("0xaf88d065e77c8cC2239327C5EDb3A432268e5831", "USD Coin", "USDC", 6),
+        ("0xFd086bC7CD5C481DCC9C85ebE478A1C0b69FCbb9", "Tether USD", "USDT", 6),
+        ("0x82aF49447D8a07e3bd95BD0d56f35241523fBab1", "Wrapped Ether", "WETH", 18),
+        ("0xDA10009cBd5D07dd0CeCc66161FC93D7c9000da1", "Dai Stablecoin", "DAI", 18),
+        ("0x2f2a2543B76A4166549F7aaB2e75Bef0aefC5B0f", "Wrapped BTC", "WBTC", 8),
+    ],
+    # Arbitrum Sepolia
+    "421614": [
+        ("0x75faf114eafb1BDbe2F0316DF893fd58CE46AA4d", "USDC", "USDC", 6),
+    ],
+    # Polygon
+    "137": [
+        ("0x3c499c542cEF5E3811e1192ce70d8cC03d5c3359", "USD Coin", "USDC", 6),
+        ("0xc2132D05D31c914a87C6611C10748AEb04B58e8F", "Tether USD", "USDT", 6),
+        ("0x7ceB23fD6bC0adD59E62ac25578270cFf1b9f619", "Wrapped Ether", "WETH", 18),
+        ("0x8f3Cf7ad23Cd3CaDbD9735AFf958023239c6A063", "Dai Stablecoin", "DAI", 18),
+        ("0x1BFD67037B42Cf73acF2047067bd4F2C47D9BfD6", "Wrapped BTC", "WBTC", 8),
+    ],
+}
@@ -0,0 +1,236 @@
+"""Registry of ERC20 token metadata."""
+
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+
+from web3 import Web3
+
+from ..cache import JsonFileStore, KeyValueStore
+from ..multicall import Call, CallResult, multicall
+from ..wallet_providers import EvmWalletProvider
+from .constants import ERC20_METADATA_ABI, KNOWN_TOKENS
+
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_STORE_NAME = "erc20_tokens"
+
+
+@dataclass(frozen=True)
+class TokenMetadata:
+    """Metadata of an ERC20 token."""
+
+    chain_id: str
+    address: str
+    name: str
+    symbol: str
+    decimals: int
+
+    def format_amount(self, amount: int) -> str:
+        """Format a raw token amount in whole units.
+
+        Args:
+            amount (int): The amount in the token's smallest unit.
+
+        Returns:
+            str: The amount in whole units, without trailing zeros.
+
+        """
+        return format_units(amount, self.decimals)
+
+
+def format_units(amount: int, decimals: int) -> str:
+    """Format a raw token amount in whole units.
+
+    Args:
+        amount (int): The amount in the token's smallest unit.
+        decimals (int): The token's decimals.
+
+    Returns:
+        str: The amount in whole units, without trailing zeros.
+
+    """
+    formatted = f"{Decimal(amount).scaleb(-decimals):f}"
+    return formatted.rstrip("0").rstrip(".") if "." in formatted else formatted
+
+
+def parse_units(amount: str | Decimal, decimals: int) -> int:
+    """Convert an amount in whole units to the token's smallest unit.
+
+    Args:
+        amount (str | Decimal): The amount in whole units.
+        decimals (int): The token's decimals.
+
+    Returns:
+        int: The amount in the token's smallest unit.
+
+    Raises:
+        ValueError: If the amount has more decimal places than the token supports.
+
+    """
+    amount = Decimal(amount)
+    scaled = amount.scaleb(decimals)
+    if scaled != scaled.to_integral_value():
+        raise ValueError(f"Amount {amount:f} has more than {decimals} decimal places")
+    return int(scaled)
+
+
+_KNOWN_TOKENS_BY_KEY = {
+    f"{chain_id}:{address.lower()}": TokenMetadata(chain_id, address, name, symbol, decimals)
+    for chain_id, tokens in KNOWN_TOKENS.items()
+    for address, name, symbol, decimals in tokens
+}
+
+
+class TokenRegistry:
+    """Resolves ERC20 token metadata once per (chain, address).
+
+    Lookups go through an in-memory LRU, then the bundled list of major tokens, then a
+    persistent store. Unknown tokens are read onchain with one multicall and
+    written to both caches, so formatting an amount needs no RPC after first use.
+    """
+
+    def __init__(self, store: KeyValueStore | None = None, max_size: int = DEFAULT_MAX_SIZE):
+        """Initialize the registry.
+
+        Args:
+            store (KeyValueStore | None): Persistent store for resolved metadata. Defaults
+                to a JSON file in the AgentKit cache directory, opened on first use.
+            max_size (int): Maximum number of tokens kept in memory.
+
+        """
+        self._store = store
+        self._max_size = max_size
+        self._entries: OrderedDict[str, TokenMetadata] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def store(self) -> KeyValueStore:
+        """The persistent store for resolved metadata."""
+        if self._store is None:
+            self._store = JsonFileStore.named(DEFAULT_STORE_NAME)
+        return self._store
+
+    @staticmethod
+    def _key(chain_id: str, address: str) -> str:
+        return f"{chain_id}:{address.lower()}"
+
+    def _remember(self, key: str, metadata: TokenMetadata) -> None:
+        with self._lock:
+            self._entries[key] = metadata
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def get(self, chain_id: str, address: str) -> TokenMetadata | None:
+        """Get the metadata of a token without making RPC calls.
+
+        Args:
+            chain_id (str): The chain ID.
+            address (str): The token contract address.
+
+        Returns:
+            TokenMetadata | None: The metadata, or None if the token has not been resolved.
+
+        """
+        key = self._key(chain_id, address)
+        with self._lock:
+            metadata = self._entries.get(key)
+            if metadata is not None:
+                self._entries.move_to_end(key)
+                return metadata
+
+        metadata = _KNOWN_TOKENS_BY_KEY.get(key)
+        if metadata is None:
+            stored = self.store.get(key)
+            if stored is None:
+                return None
+            metadata = TokenMetadata(**stored)
+
+        self._remember(key, metadata)
+        return metadata
+
+    def add(self, metadata: TokenMetadata) -> None:
+        """Add token metadata to the registry and persist it.
+
+        Args:
+            metadata (TokenMetadata): The metadata to add.
+
+        """
+        key = self._key(metadata.chain_id, metadata.address)
+        self._remember(key, metadata)
+        self.store.set(key, asdict(metadata))
+
+    @staticmethod
+    def metadata_calls(address: str) -> list[Call]:
+        """Get the multicall calls that read a token's metadata.
+
+        Use with ``from_results`` to resolve metadata in the same multicall as other reads.
+
+        Args:
+            address (str): The token contract address.
+
+        Returns:
+            list[Call]: The name, symbol and decimals calls.
+
+        """
+        return [
+            Call(address, ERC20_METADATA_ABI, "name"),
+            Call(address, ERC20_METADATA_ABI, "symbol"),
+            Call(address, ERC20_METADATA_ABI, "decimals"),
+        ]
+
+    def from_results(
+        self, chain_id: str, address: str, results: list[CallResult]
+    ) -> TokenMetadata | None:
+        """Build and register metadata from the results of ``metadata_calls``.
+
+        Args:
+            chain_id (str): The chain ID.
+            address (str): The token contract address.
+            results (list[CallResult]): The name, symbol and decimals results.
+
+        Returns:
+            TokenMetadata | None: The metadata, or None if symbol or decimals could not be
+                read. A missing name falls back to the symbol.
+
+        """
+        name, symbol, decimals = results
+        if not symbol.success or not decimals.success:
+            return None
+
+        metadata = TokenMetadata(
+            chain_id=chain_id,
+            address=Web3.to_checksum_address(address),
+            name=name.value if name.success else symbol.value,
+            symbol=symbol.value,
+            decimals=decimals.value,
+        )
+        self.add(metadata)
+        return metadata
+
+    def resolve(
+        self, wallet_provider: EvmWalletProvider, addresses: list[str]
+    ) -> dict[str, TokenMetadata | None]:
+        """Get the metadata of several tokens, reading unknown ones in one multicall.
+
+        Args:
+            wallet_provider (EvmWalletProvider): The wallet provider used for onchain reads.
+            addresses (list[str]): The token contract addresses.
+
+        Returns:
+            dict[str, TokenMetadata | None]: Metadata keyed by the given addresses, or None
+                for tokens that do not implement the ERC20 metadata functions.
+
+        """
+        chain_id = wallet_provider.get_network().chain_id
+        resolved = {address: self.get(chain_id, address) for address in addresses}
+
+        missing = [address for address, metadata in resolved.items() if metadata is None]
+        if missing:
+            calls = [call for address in missing for call in self.metadata_calls(address)]
+            results = multicall(wallet_provider, calls)
+            for i, address in enumerate(missing):
+                resolved[address] = self.from_results(chain_id, address, results[i * 3 : i * 3 + 3])
+
+        return resolved
@@ -2,6 +2,8 @@
 
 from web3 import Web3
 
+from ..names import is_name
+
 
 def validate_eth_address(value: str) -> str:
     """Validate Ethereum address format.
@@ -20,3 +22,24 @@ def validate_eth_address(value: str) -> str:
         return Web3.to_checksum_address(value)
     except ValueError as e:
         raise ValueError("Invalid Ethereum address") from e
+
+
+def validate_eth_address_or_name(value: str) -> str:
+    """Validate an Ethereum address or a Basename or ENS name.
+
+    Names such as ``alice.base.eth`` are returned unresolved. Actions resolve them with
+    their own wallet provider, on the chain they run on.
+
+    Args:
+        value: The address or name to validate
+
+    Returns:
+        The checksummed address, or the name
+
+    Raises:
+        ValueError: If the value is neither a name nor a valid address
+
+    """
+    if is_name(value):
+        return value.strip()
+    return validate_eth_address(value)
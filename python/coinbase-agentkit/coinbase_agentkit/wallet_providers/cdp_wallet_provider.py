@@ -1,7 +1,11 @@
 """CDP Wallet provider."""
 
+import hashlib
+import importlib.metadata
 import json
 import os
+import unicodedata
+from collections.abc import Callable
 from decimal import Decimal
 from typing import Any
 
@@ -14,13 +18,67 @@ from cdp import (
     hash_message,
     hash_typed_data_message,
 )
-from eth_account.typed_transactions import DynamicFeeTransaction
-from pydantic import BaseModel, Field
+from cdp.client.models.address import Address as AddressModel
+from cdp.client.models.wallet import Wallet as WalletModel
+from pydantic import BaseModel, ConfigDict, Field
 from web3 import Web3
-from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+from web3.types import (
+    BlockIdentifier,
+    ChecksumAddress,
+    FilterParams,
+    HexStr,
+    LogReceipt,
+    TxParams,
+)
 
+from ..cache import BlockCache, KeyValueStore
+from ..cdp_client import configure_cdp
 from ..network import NETWORK_ID_TO_CHAIN, Network
 from .evm_wallet_provider import EvmGasConfig, EvmWalletProvider
+from .fee_estimation import get_base_fee_per_gas
+from .gas_estimation import estimate_gas_batch
+from .nonce_manager import NonceManager
+from .typed_transaction import encode_dynamic_fee_transaction
+
+# The cdp-sdk release whose wallet internals the wallet cache snapshots. pyproject.toml
+# pins this exact version; with any other version the cache is bypassed.
+WALLET_CACHE_CDP_SDK_VERSION = "0.17.0"
+
+
+def _mnemonic_seed(mnemonic_phrase: str) -> str:
+    """Derive the BIP-39 seed of a mnemonic phrase without a passphrase, as a hex string."""
+    return hashlib.pbkdf2_hmac(
+        "sha512", unicodedata.normalize("NFKD", mnemonic_phrase).encode(), b"mnemonic", 2048
+    ).hex()
+
+
+def _wallet_cache_supported() -> bool:
+    """Check whether the installed cdp-sdk is the release the wallet cache was built for."""
+    try:
+        return importlib.metadata.version("cdp-sdk") == WALLET_CACHE_CDP_SDK_VERSION
+    except importlib.metadata.PackageNotFoundError:
+        return False
+
+
+def _snapshot_wallet(wallet: Wallet) -> dict[str, Any]:
+    """Get the public wallet and address models of a wallet, which hold no key material."""
+    return {
+        "wallet": wallet._model.to_json(),
+        "addresses": [address._model.to_json() for address in wallet.addresses],
+    }
+
+
+def _restore_wallet(snapshot: dict[str, Any], seed: str) -> Wallet:
+    """Rebuild a wallet from a snapshot and its seed without calling the CDP API.
+
+    Addresses are rebuilt through the SDK, which checks that each derives from the seed.
+    """
+    wallet = Wallet(WalletModel.from_json(snapshot["wallet"]), seed)
+    wallet._addresses = [
+        wallet._build_wallet_address(AddressModel.from_json(address), index)
+        for index, address in enumerate(snapshot["addresses"])
+    ]
+    return wallet
 
 
 class CdpProviderConfig(BaseModel):
@@ -37,6 +95,20 @@ class CdpWalletProviderConfig(CdpProviderConfig):
     mnemonic_phrase: str | None = Field(None, description="The mnemonic phrase of the wallet")
     wallet_data: str | None = Field(None, description="The data of the CDP Wallet as a JSON string")
     gas: EvmGasConfig | None = Field(None, description="Gas configuration settings")
+    local_signing: bool = Field(
+        False,
+        description="Sign in-process with the wallet's derived key instead of through the CDP API, when the seed is available",
+    )
+    wallet_cache: KeyValueStore | None = Field(
+        None,
+        description="Store used to cache the imported wallet across restarts, skipping the CDP API calls on a hit",
+    )
+    wallet_cache_ttl: float = Field(
+        24 * 60 * 60,
+        description="Maximum age in seconds of a cached wallet before it is re-imported",
+    )
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
 class CdpWalletProvider(EvmWalletProvider):
@@ -60,13 +132,7 @@ class CdpWalletProvider(EvmWalletProvider):
             api_key_name = config.api_key_name or os.getenv("CDP_API_KEY_NAME")
             api_key_private_key = config.api_key_private_key or os.getenv("CDP_API_KEY_PRIVATE_KEY")
 
-            if api_key_name and api_key_private_key:
-                Cdp.configure(
-                    api_key_name=api_key_name,
-                    private_key=api_key_private_key.replace("\\n", "\n"),
-                )
-            else:
-                Cdp.configure_from_json()
+            configure_cdp(api_key_name, api_key_private_key)
 
             network_id = config.network_id or os.getenv("NETWORK_ID", "base-sepolia")
             chain = NETWORK_ID_TO_CHAIN[network_id]
@@ -77,20 +143,41 @@ class CdpWalletProvider(EvmWalletProvider):
 
             if config.wallet_data:
                 wallet_data = WalletData.from_dict(json.loads(config.wallet_data))
-                self._wallet = Wallet.import_data(wallet_data)
+                self._wallet = self._import_wallet(
+                    config,
+                    network_id,
+                    config.wallet_data,
+                    lambda: wallet_data.seed,
+                    lambda: Wallet.import_data(wallet_data),
+                )
             elif config.mnemonic_phrase:
                 phrase = MnemonicSeedPhrase(config.mnemonic_phrase)
-                self._wallet = Wallet.import_wallet(phrase, network_id)
+                self._wallet = self._import_wallet(
+                    config,
+                    network_id,
+                    config.mnemonic_phrase,
+                    lambda: _mnemonic_seed(config.mnemonic_phrase),
+                    lambda: Wallet.import_wallet(phrase, network_id),
+                )
             else:
                 self._wallet = Wallet.create(network_id=network_id)
 
             self._address = self._wallet.default_address.address_id
+            self._local_account = (
+                self._wallet.default_address.key
+                if config.local_signing and self._wallet.can_sign
+                else None
+            )
             self._network = Network(
                 protocol_family="evm",
                 network_id=network_id,
                 chain_id=chain.id,
             )
             self._web3 = Web3(Web3.HTTPProvider(rpc_url))
+            self._balance_cache = BlockCache(lambda: self._web3.eth.block_number)
+            self._nonce_manager = NonceManager(
+                lambda: self._web3.eth.get_transaction_count(self._address, "pending")
+            )
 
             self._gas_limit_multiplier = (
                 max(config.gas.gas_limit_multiplier, 1)
@@ -112,6 +199,56 @@ class CdpWalletProvider(EvmWalletProvider):
         except Exception as e:
             raise ValueError(f"Failed to initialize CDP wallet: {e!s}") from e
 
+    @staticmethod
+    def _import_wallet(
+        config: CdpWalletProviderConfig,
+        network_id: str,
+        secret: str,
+        get_seed: Callable[[], str],
+        import_wallet: Callable[[], Wallet],
+    ) -> Wallet:
+        """Import a wallet, going through the wallet cache when one is configured.
+
+        Cache entries are keyed by a hash of the API key name, network and wallet secret, and
+        only hold the public wallet and address models. The seed is always taken from the
+        configuration, so no key material is written to the cache. Snapshots rely on
+        internals of the pinned cdp-sdk release, so the cache is bypassed with any other
+        release, and a snapshot that fails to restore falls back to a regular import.
+
+        Args:
+            config (CdpWalletProviderConfig): The provider configuration.
+            network_id (str): The network the wallet is used on.
+            secret (str): The wallet data or mnemonic phrase the wallet is imported from.
+            get_seed (Callable[[], str]): Function returning the wallet seed as a hex string.
+            import_wallet (Callable[[], Wallet]): Function importing the wallet through the CDP API.
+
+        Returns:
+            Wallet: The imported wallet.
+
+        """
+        store = config.wallet_cache
+        if store is None or not _wallet_cache_supported():
+            return import_wallet()
+
+        cache_key = hashlib.sha256(
+            json.dumps([Cdp.api_key_name, network_id, secret]).encode()
+        ).hexdigest()
+
+        cached = store.get(cache_key, max_age=config.wallet_cache_ttl)
+        if cached is not None:
+            try:
+                return _restore_wallet(cached, get_seed())
+            except Exception:
+                store.delete(cache_key)
+
+        wallet = import_wallet()
+        try:
+            snapshot = _snapshot_wallet(wallet)
+        except Exception:
+            return wallet
+        store.set(cache_key, snapshot)
+        return wallet
+
     def get_address(self) -> str:
         """Get the wallet address.
 
@@ -121,9 +258,15 @@ class CdpWalletProvider(EvmWalletProvider):
         """
         return self._address
 
-    def get_balance(self) -> Decimal:
+    def get_balance(self, refresh: bool = False) -> Decimal:
         """Get the wallet balance in native currency.
 
+        Balances are cached per block and dropped after any transaction sent from this provider,
+        so repeated reads within a block do not go through the CDP API.
+
+        Args:
+            refresh (bool): Whether to bypass the cached balance, defaults to False
+
         Returns:
             Decimal: The wallet's balance in wei as a Decimal
 
@@ -134,8 +277,11 @@ class CdpWalletProvider(EvmWalletProvider):
         if not self._wallet:
             raise Exception("Wallet not initialized")
 
-        balance = self._wallet.balance("eth")
-        return Decimal(str(Web3.to_wei(balance, "ether")))
+        return self._balance_cache.get_or_fetch(
+            (self._address, "eth"),
+            lambda _: Decimal(str(Web3.to_wei(self._wallet.balance("eth"), "ether"))),
+            refresh=refresh,
+        )
 
     def get_name(self) -> str:
         """Get the name of the wallet provider.
@@ -180,6 +326,9 @@ class CdpWalletProvider(EvmWalletProvider):
                 gasless=False,
             )
 
+            self._balance_cache.invalidate()
+            # Transfers through the CDP API consume a nonce outside the local nonce manager
+            self._nonce_manager.reset()
             transfer_result.wait()
             tx_hash = transfer_result.transaction_hash
 
@@ -220,6 +369,44 @@ class CdpWalletProvider(EvmWalletProvider):
             args = []
         return func(*args).call(block_identifier=block_identifier)
 
+    def call(self, transaction: TxParams, block_identifier: BlockIdentifier = "latest") -> bytes:
+        """Execute a message call without creating a transaction.
+
+        Unlike read_contract, no contract object is built and the output is not decoded,
+        so callers with precompiled calldata and decoders pay for the eth_call only.
+
+        Args:
+            transaction (TxParams): The call parameters, e.g. to and data
+            block_identifier (BlockIdentifier): The block to execute the call at, defaults to 'latest'
+
+        Returns:
+            bytes: The raw return data of the call
+
+        """
+        return bytes(self._web3.eth.call(transaction, block_identifier))
+
+    def get_block_number(self) -> int:
+        """Get the number of the latest block.
+
+        Returns:
+            int: The latest block number
+
+        """
+        return self._web3.eth.block_number
+
+    def get_logs(self, filter_params: FilterParams) -> list[LogReceipt]:
+        """Get the event logs matching a filter.
+
+        Args:
+            filter_params (FilterParams): The eth_getLogs filter, e.g. address, topics,
+                fromBlock and toBlock
+
+        Returns:
+            list[LogReceipt]: The matching logs
+
+        """
+        return list(self._web3.eth.get_logs(filter_params))
+
     def sign_message(self, message: str | bytes) -> HexStr:
         """Sign a message using the wallet's private key.
 
@@ -237,9 +424,7 @@ class CdpWalletProvider(EvmWalletProvider):
             raise Exception("Wallet not initialized")
 
         message_hash = hash_message(message)
-        payload_signature = self._wallet.sign_payload(message_hash)
-
-        return payload_signature.signature
+        return self._sign_hash(message_hash)
 
     def sign_typed_data(self, typed_data: dict[str, Any]) -> HexStr:
         """Sign typed data according to EIP-712 standard.
@@ -258,10 +443,7 @@ class CdpWalletProvider(EvmWalletProvider):
             raise Exception("Wallet not initialized")
 
         typed_data_message_hash = hash_typed_data_message(typed_data)
-
-        payload_signature = self._wallet.sign_payload(typed_data_message_hash)
-
-        return payload_signature.signature
+        return self._sign_hash(typed_data_message_hash)
 
     def sign_transaction(self, transaction: TxParams) -> HexStr:
         """Sign an EVM transaction.
@@ -279,17 +461,15 @@ class CdpWalletProvider(EvmWalletProvider):
         if not self._wallet:
             raise Exception("Wallet not initialized")
 
-        dynamic_fee_tx = DynamicFeeTransaction.from_dict(transaction)
-
-        tx_hash_bytes = dynamic_fee_tx.hash()
-        tx_hash_hex = tx_hash_bytes.hex()
-
-        payload_signature = self._wallet.sign_payload(tx_hash_hex)
-        return payload_signature.signature
+        encoded_transaction = encode_dynamic_fee_transaction(transaction)
+        return self._sign_hash(encoded_transaction.signing_hash().hex())
 
     def send_transaction(self, transaction: TxParams) -> HexStr:
         """Send a signed transaction to the network.
 
+        The transaction is RLP-encoded once; the same encoding is hashed for signing and
+        extended with the signature for broadcast.
+
         Args:
             transaction (TxParams): Transaction parameters including to, value, and data
 
@@ -302,24 +482,46 @@ class CdpWalletProvider(EvmWalletProvider):
         """
         self._prepare_transaction(transaction)
 
-        signature = self.sign_transaction(transaction)
+        try:
+            encoded_transaction = encode_dynamic_fee_transaction(transaction)
+            signature = self._sign_hash(encoded_transaction.signing_hash().hex())
+            signed_bytes = encoded_transaction.signed(Web3.to_bytes(hexstr=signature))
 
-        transaction["r"] = int(signature[2:66], 16)
-        transaction["s"] = int(signature[66:130], 16)
-        transaction["v"] = int(signature[130:132], 16) - 27
+            external_address = ExternalAddress(
+                self._wallet.network_id, self._wallet.default_address.address_id
+            )
+            broadcasted_transaction = external_address.broadcast_external_transaction(
+                signed_bytes.hex()
+            )
+        except Exception:
+            self._nonce_manager.reset()
+            raise
 
-        signed_dynamic_fee_tx = DynamicFeeTransaction.from_dict(transaction)
+        self._balance_cache.invalidate()
 
-        signed_bytes = signed_dynamic_fee_tx.payload()
+        return broadcasted_transaction.transaction_hash
 
-        external_address = ExternalAddress(
-            self._wallet.network_id, self._wallet.default_address.address_id
-        )
-        broadcasted_transaction = external_address.broadcast_external_transaction(
-            "02" + signed_bytes.hex()
-        )
+    def estimate_gas(self, transactions: list[TxParams]) -> list[int]:
+        """Estimate gas limits for transactions sent from the wallet.
 
-        return broadcasted_transaction.transaction_hash
+        All transactions are estimated in one JSON-RPC batch request when the endpoint
+        supports it. The configured gas limit multiplier is applied to each estimate.
+
+        Args:
+            transactions (list[TxParams]): Transaction parameters including to, value, and data
+
+        Returns:
+            list[int]: The gas limit of each transaction
+
+        Raises:
+            Exception: If the gas of any transaction cannot be estimated
+
+        """
+        estimates = estimate_gas_batch(
+            self._web3,
+            [{**transaction, "from": self._address} for transaction in transactions],
+        )
+        return [int(gas * self._gas_limit_multiplier) for gas in estimates]
 
     def wait_for_transaction_receipt(
         self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
@@ -355,36 +557,47 @@ class CdpWalletProvider(EvmWalletProvider):
             Exception: If transaction preparation fails
 
         """
-        if transaction["to"]:
-            transaction["to"] = Web3.to_bytes(hexstr=transaction["to"])
-        else:
-            transaction["to"] = b""
+        if not transaction.get("to"):
+            transaction.pop("to", None)
 
         transaction["from"] = self._address
         transaction["value"] = int(transaction.get("value", 0))
         transaction["type"] = 2
         transaction["chainId"] = int(self._network.chain_id)
 
-        nonce = self._web3.eth.get_transaction_count(self._address)
-        transaction["nonce"] = nonce
-
-        data_field = transaction.get("data", b"")
-        if isinstance(data_field, str) and data_field.startswith("0x"):
-            data_bytes = bytes.fromhex(data_field[2:])
-
-        transaction["data"] = data_bytes
-
         max_priority_fee_per_gas, max_fee_per_gas = self._estimate_fees()
         transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
         transaction["maxFeePerGas"] = max_fee_per_gas
 
-        gas = int(self._web3.eth.estimate_gas(transaction) * self._gas_limit_multiplier)
-        transaction["gas"] = gas
+        if "gas" not in transaction:
+            transaction["gas"] = self.estimate_gas([transaction])[0]
 
         del transaction["from"]
 
+        transaction["nonce"] = self._nonce_manager.next_nonce()
+
         return transaction
 
+    def _sign_hash(self, message_hash: str) -> HexStr:
+        """Sign a 32-byte hash with the wallet's default address.
+
+        Signs in-process when local signing is enabled and the wallet's key is available,
+        otherwise signs through the CDP API.
+
+        Args:
+            message_hash (str): The hash to sign as a hex string
+
+        Returns:
+            HexStr: The 65-byte signature as a hex string
+
+        """
+        if self._local_account is not None:
+            signed = self._local_account.unsafe_sign_hash(Web3.to_bytes(hexstr=message_hash))
+            return HexStr(Web3.to_hex(signed.signature))
+
+        payload_signature = self._wallet.sign_payload(message_hash)
+        return payload_signature.signature
+
     def _estimate_fees(self):
         """Estimate gas fees for a transaction, applying the configured fee multipliers.
 
@@ -394,8 +607,7 @@ class CdpWalletProvider(EvmWalletProvider):
         """
 
         def get_base_fee():
-            latest_block = self._web3.eth.get_block("latest")
-            base_fee = latest_block["baseFeePerGas"]
+            base_fee = get_base_fee_per_gas(self._web3)
             # Multiply the configured fee multiplier to give some buffer
             return int(base_fee * self._fee_per_gas_multiplier)
 
@@ -451,12 +663,15 @@ class CdpWalletProvider(EvmWalletProvider):
             raise Exception("Wallet not initialized")
 
         try:
-            return self._wallet.deploy_contract(
+            deployment = self._wallet.deploy_contract(
                 solidity_version=solidity_version,
                 solidity_input_json=solidity_input_json,
                 contract_name=contract_name,
                 constructor_args=constructor_args,
             )
+            self._balance_cache.invalidate()
+            self._nonce_manager.reset()
+            return deployment
         except Exception as e:
             raise Exception(f"Failed to deploy contract: {e!s}") from e
 
@@ -479,11 +694,14 @@ class CdpWalletProvider(EvmWalletProvider):
             raise Exception("Wallet not initialized")
 
         try:
-            return self._wallet.deploy_nft(
+            deployment = self._wallet.deploy_nft(
                 name=name,
                 symbol=symbol,
                 base_uri=base_uri,
             )
+            self._balance_cache.invalidate()
+            self._nonce_manager.reset()
+            return deployment
         except Exception as e:
             raise Exception(f"Failed to deploy NFT: {e!s}") from e
 
@@ -506,11 +724,14 @@ class CdpWalletProvider(EvmWalletProvider):
             raise Exception("Wallet not initialized")
 
         try:
-            return self._wallet.deploy_token(
+            deployment = self._wallet.deploy_token(
                 name=name,
                 symbol=symbol,
                 total_supply=total_supply,
             )
+            self._balance_cache.invalidate()
+            self._nonce_manager.reset()
+            return deployment
         except Exception as e:
             raise Exception(f"Failed to deploy token: {e!s}") from e
 
@@ -538,6 +759,8 @@ class CdpWalletProvider(EvmWalletProvider):
                 from_asset_id=from_asset_id,
                 to_asset_id=to_asset_id,
             ).wait()
+            self._balance_cache.invalidate()
+            self._nonce_manager.reset()
 
             return "\n".join(
                 [
@@ -9,10 +9,21 @@ from eth_account.messages import encode_defunct
 from pydantic import BaseModel, Field
 from web3 import Web3
 from web3.middleware import SignAndSendRawMiddlewareBuilder
-from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
-
+from web3.types import (
+    BlockIdentifier,
+    ChecksumAddress,
+    FilterParams,
+    HexStr,
+    LogReceipt,
+    TxParams,
+)
+
+from ..cache import BlockCache
 from ..network import CHAIN_ID_TO_NETWORK_ID, NETWORK_ID_TO_CHAIN, Network
 from .evm_wallet_provider import EvmGasConfig, EvmWalletProvider
+from .fee_estimation import get_base_fee_per_gas
+from .gas_estimation import estimate_gas_batch
+from .nonce_manager import NonceManager
 
 
 class EthAccountWalletProviderConfig(BaseModel):
@@ -55,6 +66,11 @@ class EthAccountWalletProvider(EvmWalletProvider):
             network_id=CHAIN_ID_TO_NETWORK_ID[self.config.chain_id],
         )
 
+        self._balance_cache = BlockCache(lambda: self.web3.eth.block_number)
+        self._nonce_manager = NonceManager(
+            lambda: self.web3.eth.get_transaction_count(self.account.address, "pending")
+        )
+
         self._gas_limit_multiplier = (
             max(config.gas.gas_limit_multiplier, 1)
             if config and config.gas and config.gas.gas_limit_multiplier is not None
@@ -85,15 +101,25 @@ class EthAccountWalletProvider(EvmWalletProvider):
         """
         return self._network
 
-    def get_balance(self) -> Decimal:
+    def get_balance(self, refresh: bool = False) -> Decimal:
         """Get the wallet balance in native currency.
 
+        Balances are cached per block and dropped after any transaction sent from this provider.
+
+        Args:
+            refresh (bool): Whether to bypass the cached balance, defaults to False
+
         Returns:
             Decimal: The wallet's balance in wei as a Decimal
 
         """
-        balance_wei = self.web3.eth.get_balance(self.account.address)
-        return Decimal(str(balance_wei))
+        return self._balance_cache.get_or_fetch(
+            (self.account.address, "eth"),
+            lambda block_number: Decimal(
+                str(self.web3.eth.get_balance(self.account.address, block_identifier=block_number))
+            ),
+            refresh=refresh,
+        )
 
     def get_name(self) -> str:
         """Get the name of the wallet provider.
@@ -159,14 +185,13 @@ class EthAccountWalletProvider(EvmWalletProvider):
         """
 
         def get_base_fee():
-            """Get the base fee from the latest block and apply the multiplier.
+            """Get the current base fee and apply the multiplier.
 
             Returns:
                 int: The adjusted base fee in wei
 
             """
-            latest_block = self.web3.eth.get_block("latest")
-            base_fee = latest_block["baseFeePerGas"]
+            base_fee = get_base_fee_per_gas(self.web3)
             # Multiply the configured fee multiplier to give some buffer
             return int(base_fee * self._fee_per_gas_multiplier)
 
@@ -197,20 +222,45 @@ class EthAccountWalletProvider(EvmWalletProvider):
         transaction["from"] = self.account.address
         transaction["chainId"] = int(self._network.chain_id)
 
-        nonce = self.web3.eth.get_transaction_count(self.account.address)
-        transaction["nonce"] = nonce
-
         max_priority_fee_per_gas, max_fee_per_gas = self.estimate_fees()
         transaction["maxPriorityFeePerGas"] = max_priority_fee_per_gas
         transaction["maxFeePerGas"] = max_fee_per_gas
 
+        if "gas" not in transaction:
+            transaction["gas"] = self.estimate_gas([transaction])[0]
 
-        gas = int(self.web3.eth.estimate_gas(transaction) * self._gas_limit_multiplier)
-        transaction["gas"] = gas
+        transaction["nonce"] = self._nonce_manager.next_nonce()
+        try:
+            hash = self.web3.eth.send_transaction(transaction)
+        except Exception:
+            self._nonce_manager.reset()
+            raise
 
-        hash = self.web3.eth.send_transaction(transaction)
+        self._balance_cache.invalidate()
         return Web3.to_hex(hash)
 
+    def estimate_gas(self, transactions: list[TxParams]) -> list[int]:
+        """Estimate gas limits for transactions sent from the wallet.
+
+        All transactions are estimated in one JSON-RPC batch request when the endpoint
+        supports it. The configured gas limit multiplier is applied to each estimate.
+
+        Args:
+            transactions (list[TxParams]): Transaction parameters including to, value, and data
+
+        Returns:
+            list[int]: The gas limit of each transaction
+
+        Raises:
+            Exception: If the gas of any transaction cannot be estimated
+
+        """
+        estimates = estimate_gas_batch(
+            self.web3,
+            [{**transaction, "from": self.account.address} for transaction in transactions],
+        )
+        return [int(gas * self._gas_limit_multiplier) for gas in estimates]
+
     def wait_for_transaction_receipt(
         self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
     ) -> dict[str, Any]:
@@ -259,6 +309,44 @@ class EthAccountWalletProvider(EvmWalletProvider):
             args = []
         return func(*args).call(block_identifier=block_identifier)
 
+    def call(self, transaction: TxParams, block_identifier: BlockIdentifier = "latest") -> bytes:
+        """Execute a message call without creating a transaction.
+
+        Unlike read_contract, no contract object is built and the output is not decoded,
+        so callers with precompiled calldata and decoders pay for the eth_call only.
+
+        Args:
+            transaction (TxParams): The call parameters, e.g. to and data
+            block_identifier (BlockIdentifier): The block to execute the call at, defaults to 'latest'
+
+        Returns:
+            bytes: The raw return data of the call
+
+        """
+        return bytes(self.web3.eth.call(transaction, block_identifier))
+
+    def get_block_number(self) -> int:
+        """Get the number of the latest block.
+
+        Returns:
+            int: The latest block number
+
+        """
+        return self.web3.eth.block_number
+
+    def get_logs(self, filter_params: FilterParams) -> list[LogReceipt]:
+        """Get the event logs matching a filter.
+
+        Args:
+            filter_params (FilterParams): The eth_getLogs filter, e.g. address, topics,
+                fromBlock and toBlock
+
+        Returns:
+            list[LogReceipt]: The matching logs
+
+        """
+        return list(self.web3.eth.get_logs(filter_params))
+
     def native_transfer(self, to: str, value: Decimal) -> str:
         """Transfer the native asset of the network.
 
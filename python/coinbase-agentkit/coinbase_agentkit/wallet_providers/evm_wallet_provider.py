@@ -5,20 +5,58 @@ from typing import Any
 
 from eth_account.datastructures import SignedTransaction
 from pydantic import BaseModel, Field
-from web3.types import BlockIdentifier, ChecksumAddress, HexStr, TxParams
+from web3 import Web3
+from web3.types import (
+    BlockIdentifier,
+    ChecksumAddress,
+    FilterParams,
+    HexStr,
+    LogReceipt,
+    TxParams,
+)
 
+from ..network import CHAIN_ID_TO_NETWORK_ID, NETWORK_ID_TO_CHAIN
+from .gas_estimation import estimate_gas_batch
 from .wallet_provider import WalletProvider
 
 
 class EvmGasConfig(BaseModel):
     """Configuration for gas multipliers."""
 
-    gas_limit_multiplier: float | None = Field(None, description="An internal multiplier on gas limit estimation")
-    fee_per_gas_multiplier: float | None = Field(None, description="An internal multiplier on fee per gas estimation")
+    gas_limit_multiplier: float | None = Field(
+        None, description="An internal multiplier on gas limit estimation"
+    )
+    fee_per_gas_multiplier: float | None = Field(
+        None, description="An internal multiplier on fee per gas estimation"
+    )
+
 
 class EvmWalletProvider(WalletProvider, ABC):
     """Abstract base class for all EVM wallet providers."""
 
+    def _default_web3(self) -> Web3:
+        """Get a Web3 instance connected to the default RPC endpoint of the wallet's network.
+
+        Backs the default implementations of the read helpers, so subclasses written
+        before those helpers existed keep working without overriding them.
+
+        Raises:
+            ValueError: If the wallet's network has no known RPC endpoint.
+
+        """
+        web3 = getattr(self, "_default_web3_instance", None)
+        if web3 is None:
+            network = self.get_network()
+            network_id = network.network_id or CHAIN_ID_TO_NETWORK_ID.get(network.chain_id or "")
+            chain = NETWORK_ID_TO_CHAIN.get(network_id or "")
+            if chain is None:
+                raise ValueError(
+                    f"No default RPC endpoint for network {network_id or network.chain_id}"
+                )
+            web3 = Web3(Web3.HTTPProvider(chain.rpc_urls["default"].http[0]))
+            self._default_web3_instance = web3
+        return web3
+
     @abstractmethod
     def sign_message(self, message: str | bytes) -> HexStr:
         """Sign a message using the wallet's private key."""
@@ -39,6 +77,28 @@ class EvmWalletProvider(WalletProvider, ABC):
         """Send a signed transaction to the network."""
         pass
 
+    def estimate_gas(self, transactions: list[TxParams]) -> list[int]:
+        """Estimate gas limits for transactions sent from the wallet, batched where supported.
+
+        The default implementation estimates through the default RPC endpoint of the
+        wallet's network. Providers with their own endpoint should override it.
+
+        Args:
+            transactions (list[TxParams]): Transaction parameters including to, value, and data
+
+        Returns:
+            list[int]: The gas limit of each transaction
+
+        Raises:
+            Exception: If the gas of any transaction cannot be estimated
+
+        """
+        address = self.get_address()
+        return estimate_gas_batch(
+            self._default_web3(),
+            [{**transaction, "from": address} for transaction in transactions],
+        )
+
     @abstractmethod
     def wait_for_transaction_receipt(
         self, tx_hash: HexStr, timeout: float = 120, poll_latency: float = 0.1
@@ -57,3 +117,46 @@ class EvmWalletProvider(WalletProvider, ABC):
     ) -> Any:
         """Read data from a smart contract."""
         pass
+
+    def call(self, transaction: TxParams, block_identifier: BlockIdentifier = "latest") -> bytes:
+        """Execute a message call without creating a transaction and return its raw output.
+
+        The default implementation calls through the default RPC endpoint of the wallet's
+        network. Providers with their own endpoint should override it.
+
+        Args:
+            transaction (TxParams): The call parameters including to and data
+            block_identifier (BlockIdentifier): The block to execute the call at
+
+        Returns:
+            bytes: The raw return data of the call
+
+        """
+        return bytes(self._default_web3().eth.call(transaction, block_identifier))
+
+    def get_block_number(self) -> int:
+        """Get the number of the latest block.
+
+        The default implementation reads it from the default RPC endpoint of the wallet's
+        network. Providers with their own endpoint should override it.
+
+        Returns:
+            int: The latest block number
+
+        """
+        return self._default_web3().eth.block_number
+
+    def get_logs(self, filter_params: FilterParams) -> list[LogReceipt]:
+        """Get the event logs matching a filter.
+
+        The default implementation reads them from the default RPC endpoint of the
+        wallet's network. Providers with their own endpoint should override it.
+
+        Args:
+            filter_params (FilterParams): The filter including address, topics and block range
+
+        Returns:
+            list[LogReceipt]: The matching logs
+
+        """
+        return list(self._default_web3().eth.get_logs(filter_params))
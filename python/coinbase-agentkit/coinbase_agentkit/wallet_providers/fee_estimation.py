@@ -0,0 +1,94 @@
+"""Base fee estimation shared by EVM wallet providers."""
+
+from collections.abc import Callable
+
+from web3 import Web3
+
+
+def _base_fee_from_fee_history(web3: Web3) -> int:
+    """Read the next block's base fee with a single-block eth_feeHistory call."""
+    fee_history = web3.eth.fee_history(1, "latest")
+    return int(fee_history["baseFeePerGas"][-1])
+
+
+def _base_fee_from_gas_price(web3: Web3) -> int:
+    """Read the suggested legacy gas price, which upper-bounds the base fee."""
+    return int(web3.eth.gas_price)
+
+
+def _base_fee_from_latest_block(web3: Web3) -> int:
+    """Read the base fee from the full latest block."""
+    return int(web3.eth.get_block("latest")["baseFeePerGas"])
+
+
+# Base fee sources, ordered from the smallest response payload to the largest
+BASE_FEE_METHODS: dict[str, Callable[[Web3], int]] = {
+    "eth_feeHistory": _base_fee_from_fee_history,
+    "eth_gasPrice": _base_fee_from_gas_price,
+    "eth_getBlockByNumber": _base_fee_from_latest_block,
+}
+
+# JSON-RPC error code of calls to methods the endpoint does not implement
+METHOD_NOT_FOUND_CODE = -32601
+
+# Maps RPC endpoint URIs to the base fee method detected for them
+_endpoint_base_fee_methods: dict[str, str] = {}
+
+
+def _is_method_not_supported(error: Exception) -> bool:
+    """Check whether an RPC error means the endpoint does not implement the method."""
+    rpc_error = (getattr(error, "rpc_response", None) or {}).get("error")
+    if rpc_error is None and error.args and isinstance(error.args[0], dict):
+        rpc_error = error.args[0]
+    if isinstance(rpc_error, dict) and rpc_error.get("code") == METHOD_NOT_FOUND_CODE:
+        return True
+    return "method not found" in str(error).lower()
+
+
+def _endpoint_key(web3: Web3) -> str:
+    return str(getattr(web3.provider, "endpoint_uri", None) or id(web3.provider))
+
+
+def get_base_fee_per_gas(web3: Web3) -> int:
+    """Get the current base fee per gas using the cheapest RPC method the endpoint supports.
+
+    The method is detected on the first call for an endpoint and reused afterwards. Only
+    methods the endpoint reports as not implemented are skipped, and detection runs again
+    if the detected method becomes unimplemented. Any other error, e.g. a timeout, is
+    raised and leaves the detected method unchanged.
+
+    Args:
+        web3 (Web3): The web3 instance connected to the endpoint.
+
+    Returns:
+        int: The base fee per gas in wei.
+
+    Raises:
+        Exception: If no base fee method is supported by the endpoint, or the RPC request
+            failed for another reason.
+
+    """
+    endpoint = _endpoint_key(web3)
+    detected = _endpoint_base_fee_methods.get(endpoint)
+    if detected is not None:
+        try:
+            return BASE_FEE_METHODS[detected](web3)
+        except Exception as e:
+            if not _is_method_not_supported(e):
+                raise
+            _endpoint_base_fee_methods.pop(endpoint, None)
+
+    errors = []
+    for name, method in BASE_FEE_METHODS.items():
+        try:
+            base_fee = method(web3)
+        except Exception as e:
+            if not _is_method_not_supported(e):
+                raise
+            errors.append(f"{name}: {e!s}")
+            continue
+
+        _endpoint_base_fee_methods[endpoint] = name
+        return base_fee
+
+    raise Exception(f"Failed to estimate base fee: {'; '.join(errors)}")
@@ -0,0 +1,32 @@
+"""Gas limit estimation shared by EVM wallet providers."""
+
+from web3 import Web3
+from web3.types import TxParams
+
+
+def estimate_gas_batch(web3: Web3, transactions: list[TxParams]) -> list[int]:
+    """Estimate the gas used by several transactions in one JSON-RPC batch request.
+
+    Falls back to one request per transaction if the endpoint rejects batch requests.
+
+    Args:
+        web3 (Web3): The web3 instance connected to the endpoint.
+        transactions (list[TxParams]): The transactions to estimate, including from.
+
+    Returns:
+        list[int]: The estimated gas of each transaction, in order.
+
+    Raises:
+        Exception: If the gas of any transaction cannot be estimated.
+
+    """
+    if len(transactions) > 1:
+        try:
+            with web3.batch_requests() as batch:
+                for transaction in transactions:
+                    batch.add(web3.eth.estimate_gas(transaction))
+                return [int(gas) for gas in batch.execute()]
+        except Exception:
+            pass
+
+    return [int(web3.eth.estimate_gas(transaction)) for transaction in transactions]
@@ -0,0 +1,61 @@
+"""Local nonce tracking for EVM wallet providers."""
+
+import threading
+import time
+from collections.abc import Callable
+
+# Seconds without a new nonce after which the local counter is no longer trusted
+DEFAULT_IDLE_RESYNC_INTERVAL = 3.0
+
+
+class NonceManager:
+    """Hands out consecutive nonces for one account.
+
+    Nonces allocated back to back are counted locally, so several transactions can be
+    sent without waiting for each to reach the node's pending pool. Once no nonce was
+    allocated for ``idle_resync_interval`` seconds, the next one is read from the pending
+    transaction count again. Dropped or replaced transactions and transactions sent by
+    other processes with the same key are therefore picked up as soon as the account
+    is idle. Call ``reset`` when a send fails so the next nonce is read right away.
+    """
+
+    def __init__(
+        self,
+        get_pending_transaction_count: Callable[[], int],
+        idle_resync_interval: float = DEFAULT_IDLE_RESYNC_INTERVAL,
+    ):
+        """Initialize the nonce manager.
+
+        Args:
+            get_pending_transaction_count (Callable[[], int]): Reads the account's
+                transaction count including pending transactions.
+            idle_resync_interval (float): Seconds without a new nonce after which the
+                next one is read from the network.
+
+        """
+        self._get_pending_transaction_count = get_pending_transaction_count
+        self._idle_resync_interval = idle_resync_interval
+        self._next_nonce: int | None = None
+        self._allocated_at = 0.0
+        self._lock = threading.Lock()
+
+    def next_nonce(self) -> int:
+        """Allocate the next nonce.
+
+        Returns:
+            int: The nonce to use for the next transaction.
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._next_nonce is None or now - self._allocated_at >= self._idle_resync_interval:
+                self._next_nonce = self._get_pending_transaction_count()
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            self._allocated_at = now
+            return nonce
+
+    def reset(self) -> None:
+        """Forget the locally tracked nonce so the next one is read from the network."""
+        with self._lock:
+            self._next_nonce = None
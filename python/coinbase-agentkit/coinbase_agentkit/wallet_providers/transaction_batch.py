@@ -0,0 +1,131 @@
+"""Send many transactions from one wallet without waiting between them."""
+
+import time
+from dataclasses import dataclass, field
+
+from web3.types import HexStr, TxParams
+
+from .evm_wallet_provider import EvmWalletProvider
+
+
+@dataclass(frozen=True)
+class TransactionOutcome:
+    """The outcome of one transaction in a batch."""
+
+    tx_hash: HexStr | None = None
+    status: str = "error"
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the transaction was mined successfully."""
+        return self.status == "success"
+
+    def describe(self) -> str:
+        """Describe the outcome for an action response.
+
+        Returns:
+            str: The status, or the error for transactions whose receipt could not be
+                read, followed by the transaction hash if it was sent.
+
+        """
+        if self.tx_hash is None:
+            return f"error: {self.error}"
+        status = f"error: {self.error}" if self.status == "error" else self.status
+        return f"{status} | {self.tx_hash}"
+
+
+@dataclass
+class TransactionBatchResult:
+    """The outcomes of a batch of transactions and how long the batch took."""
+
+    outcomes: list[TransactionOutcome] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        """The number of transactions mined successfully."""
+        return sum(outcome.succeeded for outcome in self.outcomes)
+
+    @property
+    def throughput(self) -> float:
+        """The number of transactions sent per second, including reverted ones."""
+        sent = sum(outcome.tx_hash is not None for outcome in self.outcomes)
+        return sent / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        """Summarize the batch for an action response.
+
+        Returns:
+            str: The number of successful transactions, elapsed time and throughput.
+
+        """
+        return (
+            f"{self.succeeded}/{len(self.outcomes)} transactions succeeded in "
+            f"{self.elapsed:.2f}s ({self.throughput:.2f} tx/s)"
+        )
+
+
+def _estimate_gas(
+    wallet_provider: EvmWalletProvider, transactions: list[TxParams]
+) -> list[int | Exception]:
+    """Estimate gas in one batch, falling back to one estimate per transaction on failure."""
+    try:
+        return list(wallet_provider.estimate_gas(transactions))
+    except Exception:
+        pass
+
+    estimates: list[int | Exception] = []
+    for transaction in transactions:
+        try:
+            estimates.append(wallet_provider.estimate_gas([transaction])[0])
+        except Exception as e:
+            estimates.append(e)
+    return estimates
+
+
+def send_transactions(
+    wallet_provider: EvmWalletProvider, transactions: list[TxParams]
+) -> TransactionBatchResult:
+    """Send transactions back to back and then wait for all their receipts.
+
+    Gas is estimated for the whole batch up front and the wallet provider assigns
+    nonces locally, so every transaction is broadcast before the first receipt is
+    awaited. A transaction that cannot be estimated or sent is reported as an error
+    without stopping the rest of the batch.
+
+    Args:
+        wallet_provider (EvmWalletProvider): The wallet provider sending the transactions.
+        transactions (list[TxParams]): The transactions to send.
+
+    Returns:
+        TransactionBatchResult: One outcome per transaction, in the same order.
+
+    """
+    started_at = time.monotonic()
+
+    sent: list[HexStr | Exception] = []
+    for transaction, gas in zip(
+        transactions, _estimate_gas(wallet_provider, transactions), strict=True
+    ):
+        if isinstance(gas, Exception):
+            sent.append(gas)
+            continue
+        try:
+            sent.append(wallet_provider.send_transaction({**transaction, "gas": gas}))
+        except Exception as e:
+            sent.append(e)
+
+    outcomes = []
+    for tx_hash in sent:
+        if isinstance(tx_hash, Exception):
+            outcomes.append(TransactionOutcome(error=str(tx_hash)))
+            continue
+        try:
+            receipt = wallet_provider.wait_for_transaction_receipt(tx_hash)
+            status = "failed" if receipt.get("status") == 0 else "success"
+            outcomes.append(TransactionOutcome(tx_hash, status))
+        except Exception as e:
+            outcomes.append(TransactionOutcome(tx_hash, error=str(e)))
+
+    return TransactionBatchResult(outcomes, time.monotonic() - started_at)
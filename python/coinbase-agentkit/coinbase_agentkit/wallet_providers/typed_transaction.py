@@ -0,0 +1,120 @@
+"""Byte-level encoding of EIP-1559 (type 2) transactions."""
+
+from dataclasses import dataclass
+from typing import Any
+
+import rlp
+from eth_utils import keccak, to_bytes
+from web3.types import TxParams
+
+DYNAMIC_FEE_TRANSACTION_TYPE = b"\x02"
+
+# RLP list prefix offset
+_LIST_OFFSET = 0xC0
+
+
+def _to_bytes(value: Any) -> bytes:
+    """Convert a hex string or bytes-like value to bytes."""
+    if value is None:
+        return b""
+    if isinstance(value, bytes | bytearray):
+        return bytes(value)
+    return to_bytes(hexstr=value)
+
+
+def _list_prefix(length: int) -> bytes:
+    """Get the RLP prefix of a list whose encoded items are ``length`` bytes long."""
+    if length < 56:
+        return bytes([_LIST_OFFSET + length])
+    encoded_length = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes([_LIST_OFFSET + 55 + len(encoded_length)]) + encoded_length
+
+
+def _to_int(value: Any) -> int:
+    """Convert an int or hex string value to int."""
+    if isinstance(value, str):
+        return int(value, 16) if value.startswith("0x") else int(value)
+    return int(value or 0)
+
+
+@dataclass(frozen=True)
+class EncodedDynamicFeeTransaction:
+    """An EIP-1559 transaction whose unsigned fields are RLP-encoded once.
+
+    The encoded fields are shared by the signing hash and the signed payload, so signing
+    and broadcasting a transaction never re-encodes it.
+    """
+
+    fields: bytes
+
+    def unsigned(self) -> bytes:
+        """Get the typed unsigned transaction bytes.
+
+        Returns:
+            bytes: The transaction type byte followed by the RLP list of unsigned fields.
+
+        """
+        return DYNAMIC_FEE_TRANSACTION_TYPE + _list_prefix(len(self.fields)) + self.fields
+
+    def signing_hash(self) -> bytes:
+        """Get the hash to sign.
+
+        Returns:
+            bytes: The keccak256 hash of the typed unsigned transaction.
+
+        """
+        return keccak(self.unsigned())
+
+    def signed(self, signature: bytes) -> bytes:
+        """Get the typed signed transaction bytes, ready to broadcast.
+
+        Args:
+            signature (bytes): The 65-byte signature as r || s || v, where v is 0/1 or 27/28.
+
+        Returns:
+            bytes: The transaction type byte followed by the RLP list of signed fields.
+
+        Raises:
+            ValueError: If the signature is not 65 bytes long.
+
+        """
+        if len(signature) != 65:
+            raise ValueError(f"Invalid signature length: {len(signature)}")
+
+        r = int.from_bytes(signature[0:32], "big")
+        s = int.from_bytes(signature[32:64], "big")
+        y_parity = signature[64] - 27 if signature[64] >= 27 else signature[64]
+
+        payload = self.fields + rlp.encode(y_parity) + rlp.encode(r) + rlp.encode(s)
+        return DYNAMIC_FEE_TRANSACTION_TYPE + _list_prefix(len(payload)) + payload
+
+
+def encode_dynamic_fee_transaction(transaction: TxParams) -> EncodedDynamicFeeTransaction:
+    """RLP-encode the unsigned fields of an EIP-1559 transaction.
+
+    Args:
+        transaction (TxParams): Transaction parameters including chainId, nonce, fees, gas,
+            to, value and data. Addresses and data may be hex strings or bytes.
+
+    Returns:
+        EncodedDynamicFeeTransaction: The encoded transaction.
+
+    """
+    access_list = [
+        [_to_bytes(entry["address"]), [_to_bytes(key) for key in entry["storageKeys"]]]
+        for entry in transaction.get("accessList", [])
+    ]
+
+    fields = [
+        _to_int(transaction["chainId"]),
+        _to_int(transaction["nonce"]),
+        _to_int(transaction["maxPriorityFeePerGas"]),
+        _to_int(transaction["maxFeePerGas"]),
+        _to_int(transaction["gas"]),
+        _to_bytes(transaction.get("to")),
+        _to_int(transaction.get("value", 0)),
+        _to_bytes(transaction.get("data")),
+        access_list,
+    ]
+
+    return EncodedDynamicFeeTransaction(b"".join(rlp.encode(field) for field in fields))
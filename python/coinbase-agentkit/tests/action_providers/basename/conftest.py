@@ -3,6 +3,7 @@
 from unittest.mock import Mock
 
 import pytest
+from eth_abi import encode
 from web3 import Web3
 
 from coinbase_agentkit.action_providers.basename.basename_action_provider import (
@@ -18,6 +19,18 @@ MOCK_AMOUNT = "0.01"
 MOCK_RECEIPT = {"status": 1}
 
 
+def quote_results(*quotes):
+    """Build the encoded multicall results of registrar availability and price reads."""
+    return [
+        result
+        for available, price in quotes
+        for result in (
+            (True, encode(["bool"], [available])),
+            (True, encode(["uint256"], [price])) if price is not None else (False, b""),
+        )
+    ]
+
+
 @pytest.fixture
 def mock_wallet_provider():
     """Create a mock wallet provider for testing."""
@@ -25,6 +38,7 @@ def mock_wallet_provider():
     mock.get_address.return_value = MOCK_ADDRESS
     mock.send_transaction.return_value = MOCK_TX_HASH
     mock.wait_for_transaction_receipt.return_value = MOCK_RECEIPT
+    mock.read_contract.return_value = quote_results((True, Web3.to_wei(MOCK_AMOUNT, "ether")))
 
     mock.get_network.return_value = Network(
         protocol_family="evm", chain_id="8453", network_id="base-mainnet"
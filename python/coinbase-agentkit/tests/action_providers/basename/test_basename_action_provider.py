@@ -10,7 +10,7 @@ from coinbase_agentkit.action_providers.basename.constants import (
 )
 from coinbase_agentkit.network import Network
 
-from .conftest import MOCK_ADDRESS, MOCK_AMOUNT, MOCK_BASENAME, MOCK_TX_HASH
+from .conftest import MOCK_ADDRESS, MOCK_AMOUNT, MOCK_BASENAME, MOCK_TX_HASH, quote_results
 
 
 def test_register_basename_mainnet_success(provider, mock_wallet_provider):
@@ -92,6 +92,62 @@ def test_register_basename_error(provider, mock_wallet_provider):
     assert response == "Error registering basename: Registration failed"
 
 
+def test_register_basename_already_registered(provider, mock_wallet_provider):
+    """Test that a taken basename is reported without sending a transaction."""
+    mock_wallet_provider.read_contract.return_value = quote_results((False, 10**15))
+
+    response = provider.register_basename(
+        mock_wallet_provider, {"basename": MOCK_BASENAME, "amount": MOCK_AMOUNT}
+    )
+
+    assert response == f"Error registering basename: {MOCK_BASENAME}.base.eth is already registered"
+    mock_wallet_provider.send_transaction.assert_not_called()
+
+
+def test_register_basename_amount_below_price(provider, mock_wallet_provider):
+    """Test that an amount below the registration price is rejected before sending."""
+    mock_wallet_provider.read_contract.return_value = quote_results((True, 2 * 10**16))
+
+    response = provider.register_basename(
+        mock_wallet_provider, {"basename": MOCK_BASENAME, "amount": MOCK_AMOUNT}
+    )
+
+    assert response == (
+        f"Error registering basename: {MOCK_BASENAME}.base.eth costs 0.02 ETH, more than "
+        f"{MOCK_AMOUNT} ETH"
+    )
+    mock_wallet_provider.send_transaction.assert_not_called()
+
+
+def test_check_basename_availability(provider, mock_wallet_provider):
+    """Test that every candidate is checked in one multicall."""
+    mock_wallet_provider.read_contract.return_value = quote_results(
+        (False, 10**15), (True, 10**15), (True, None)
+    )
+
+    response = provider.check_basename_availability(
+        mock_wallet_provider, {"basenames": ["taken.base.eth", "free", "x"]}
+    )
+
+    assert response.splitlines() == [
+        "taken.base.eth: already registered",
+        "free.base.eth: available for 0.001 ETH per year",
+        "x.base.eth: available, price unavailable",
+    ]
+    mock_wallet_provider.read_contract.assert_called_once()
+
+
+def test_check_basename_availability_error(provider, mock_wallet_provider):
+    """Test error handling when availability cannot be read."""
+    mock_wallet_provider.read_contract.side_effect = Exception("RPC error")
+
+    response = provider.check_basename_availability(
+        mock_wallet_provider, {"basenames": ["free.base.eth"]}
+    )
+
+    assert response.startswith("Error checking basenames: Failed to check availability of free")
+
+
 def test_supports_network(provider):
     """Test network support check."""
     test_cases = [
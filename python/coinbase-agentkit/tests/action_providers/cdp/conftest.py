@@ -120,9 +120,11 @@ def mock_wallet_testnet_provider():
 def mock_cdp_imports():
     """Mock CDP SDK imports."""
     with (
-        patch("coinbase_agentkit.action_providers.cdp.cdp_api_action_provider.Cdp") as mock_cdp,
+        patch(
+            "coinbase_agentkit.action_providers.cdp.cdp_api_action_provider.configure_cdp"
+        ) as mock_configure_cdp,
         patch(
             "coinbase_agentkit.action_providers.cdp.cdp_api_action_provider.ExternalAddress"
         ) as mock_external_address,
     ):
-        yield mock_cdp, mock_external_address
+        yield mock_configure_cdp, mock_external_address
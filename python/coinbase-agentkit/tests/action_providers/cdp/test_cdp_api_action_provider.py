@@ -18,44 +18,35 @@ from .conftest import (
 @pytest.mark.usefixtures("mock_env")
 def test_provider_init_with_env_vars(mock_cdp_imports):
     """Test provider initialization with environment variables."""
-    mock_cdp, _ = mock_cdp_imports
+    mock_configure_cdp, _ = mock_cdp_imports
     _ = cdp_api_action_provider()
-    mock_cdp.configure.assert_called_once_with(
-        api_key_name=MOCK_API_KEY_NAME,
-        private_key=MOCK_API_KEY_PRIVATE_KEY,
-    )
+    mock_configure_cdp.assert_called_once_with(MOCK_API_KEY_NAME, MOCK_API_KEY_PRIVATE_KEY)
 
 
 def test_provider_init_with_config(mock_cdp_imports):
     """Test provider initialization with config."""
-    mock_cdp, _ = mock_cdp_imports
+    mock_configure_cdp, _ = mock_cdp_imports
     config = CdpProviderConfig(
         api_key_name=MOCK_API_KEY_NAME, api_key_private_key=MOCK_API_KEY_PRIVATE_KEY
     )
     _ = cdp_api_action_provider(config)
-    mock_cdp.configure.assert_called_once_with(
-        api_key_name=MOCK_API_KEY_NAME,
-        private_key=MOCK_API_KEY_PRIVATE_KEY,
-    )
+    mock_configure_cdp.assert_called_once_with(MOCK_API_KEY_NAME, MOCK_API_KEY_PRIVATE_KEY)
 
 
 @pytest.mark.usefixtures("mock_env")
 def test_provider_init_without_config(mock_cdp_imports):
     """Test provider initialization without config."""
-    mock_cdp, _ = mock_cdp_imports
+    mock_configure_cdp, _ = mock_cdp_imports
     _ = cdp_api_action_provider()
-    mock_cdp.configure.assert_called_once_with(
-        api_key_name=MOCK_API_KEY_NAME,
-        private_key=MOCK_API_KEY_PRIVATE_KEY,
-    )
+    mock_configure_cdp.assert_called_once_with(MOCK_API_KEY_NAME, MOCK_API_KEY_PRIVATE_KEY)
 
 
 def test_provider_init_missing_credentials(mock_cdp_imports):
-    """Test provider initialization with missing credentials falls back to configure_from_json."""
-    mock_cdp, _ = mock_cdp_imports
+    """Test provider initialization with missing credentials falls back to the key file."""
+    mock_configure_cdp, _ = mock_cdp_imports
     with patch.dict(os.environ, {}, clear=True):
         _ = cdp_api_action_provider()
-        mock_cdp.configure_from_json.assert_called_once()
+        mock_configure_cdp.assert_called_once_with(None, None)
 
 
 @pytest.mark.usefixtures("mock_env")
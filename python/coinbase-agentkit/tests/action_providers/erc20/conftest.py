@@ -4,12 +4,17 @@ from unittest.mock import Mock
 
 import pytest
 
+from coinbase_agentkit.cache import InMemoryStore
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.tokens import TokenMetadata, TokenRegistry
 from coinbase_agentkit.wallet_providers.evm_wallet_provider import EvmWalletProvider
 
 MOCK_AMOUNT = "1000000000000000000"
 MOCK_CONTRACT_ADDRESS = "0x1234567890123456789012345678901234567890"
 MOCK_DESTINATION = "0x9876543210987654321098765432109876543210"
 MOCK_ADDRESS = "0x1234567890123456789012345678901234567890"
+MOCK_CHAIN_ID = "8453"
+MOCK_TOKEN_METADATA = TokenMetadata(MOCK_CHAIN_ID, MOCK_CONTRACT_ADDRESS, "Mock Token", "MOCK", 18)
 
 
 @pytest.fixture
@@ -17,5 +22,16 @@ def mock_wallet():
     """Create a mock wallet provider."""
     mock = Mock(spec=EvmWalletProvider)
     mock.get_address.return_value = MOCK_ADDRESS
+    mock.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id=MOCK_CHAIN_ID
+    )
     mock.read_contract.return_value = MOCK_AMOUNT
     return mock
+
+
+@pytest.fixture
+def token_registry():
+    """Create an in-memory token registry that knows the mock token."""
+    registry = TokenRegistry(store=InMemoryStore())
+    registry.add(MOCK_TOKEN_METADATA)
+    return registry
@@ -1,14 +1,26 @@
 """Tests for the ERC20 action provider."""
 
 import pytest
+from eth_abi import encode
 from web3 import Web3
 
-from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.action_providers.erc20.constants import (
+    DISPERSE_ABI,
+    DISPERSE_ADDRESSES,
+    ERC20_ABI,
+)
 from coinbase_agentkit.action_providers.erc20.erc20_action_provider import (
     erc20_action_provider,
 )
-from coinbase_agentkit.action_providers.erc20.schemas import GetBalanceSchema, TransferSchema
+from coinbase_agentkit.action_providers.erc20.schemas import (
+    BatchTransferSchema,
+    GetBalanceSchema,
+    GetBalancesSchema,
+    TransferSchema,
+)
+from coinbase_agentkit.cache import InMemoryStore
 from coinbase_agentkit.network import Network
+from coinbase_agentkit.tokens import TokenRegistry
 
 from .conftest import (
     MOCK_AMOUNT,
@@ -30,10 +42,11 @@ def test_get_balance_schema_invalid():
         GetBalanceSchema()
 
 
-def test_get_balance_success(mock_wallet):
+def test_get_balance_success(mock_wallet, token_registry):
     """Test successful get_balance call."""
     args = {"contract_address": MOCK_CONTRACT_ADDRESS}
-    provider = erc20_action_provider()
+    mock_wallet.read_contract.return_value = int(MOCK_AMOUNT)
+    provider = erc20_action_provider(token_registry)
 
     response = provider.get_balance(mock_wallet, args)
 
@@ -43,7 +56,26 @@ def test_get_balance_success(mock_wallet):
         function_name="balanceOf",
         args=[mock_wallet.get_address()],
     )
-    assert f"Balance of {MOCK_CONTRACT_ADDRESS} is {MOCK_AMOUNT}" in response
+    assert f"Balance of {MOCK_CONTRACT_ADDRESS} is {MOCK_AMOUNT} (1 MOCK)" in response
+
+
+def test_get_balance_resolves_unknown_token_metadata(mock_wallet):
+    """Test that get_balance reads unknown token metadata once and caches it."""
+    args = {"contract_address": MOCK_CONTRACT_ADDRESS}
+    metadata_results = [
+        (True, encode(["string"], ["USD Coin"])),
+        (True, encode(["string"], ["USDC"])),
+        (True, encode(["uint8"], [6])),
+    ]
+    mock_wallet.read_contract.side_effect = [1_500_000, metadata_results, 2_000_000]
+    provider = erc20_action_provider(TokenRegistry(store=InMemoryStore()))
+
+    first = provider.get_balance(mock_wallet, args)
+    second = provider.get_balance(mock_wallet, args)
+
+    assert mock_wallet.read_contract.call_count == 3
+    assert "is 1500000 (1.5 USDC)" in first
+    assert "is 2000000 (2 USDC)" in second
 
 
 def test_get_balance_error(mock_wallet):
@@ -64,6 +96,75 @@ def test_get_balance_error(mock_wallet):
     assert f"Error getting balance: {error!s}" in response
 
 
+def test_get_balances_schema_requires_tokens():
+    """Test that the GetBalancesSchema requires at least one token."""
+    with pytest.raises(ValueError):
+        GetBalancesSchema(contract_addresses=[])
+
+
+def test_get_balances_success(mock_wallet, token_registry):
+    """Test that get_balances reads balances and unknown metadata in one multicall."""
+    unknown_token = MOCK_DESTINATION
+    mock_wallet.read_contract.return_value = [
+        (False, b""),
+        (False, b""),
+        (False, b""),
+        (True, encode(["uint256"], [1_500_000_000_000_000_000])),
+        (True, encode(["uint256"], [0])),
+        (True, encode(["uint256"], [10**18])),
+        (False, b""),
+    ]
+    provider = erc20_action_provider(token_registry)
+
+    response = provider.get_balances(
+        mock_wallet,
+        {
+            "contract_addresses": [MOCK_CONTRACT_ADDRESS, unknown_token],
+            "holders": [MOCK_CONTRACT_ADDRESS, MOCK_DESTINATION],
+        },
+    )
+
+    mock_wallet.read_contract.assert_called_once()
+    kwargs = mock_wallet.read_contract.call_args.kwargs
+    assert kwargs["function_name"] == "aggregate3"
+    assert len(kwargs["args"][0]) == 7
+    assert f"MOCK ({MOCK_CONTRACT_ADDRESS}) | {MOCK_CONTRACT_ADDRESS} | 1.5" in response
+    assert f"MOCK ({MOCK_CONTRACT_ADDRESS}) | {MOCK_DESTINATION} | 0" in response
+    assert (
+        f"{unknown_token} | {MOCK_CONTRACT_ADDRESS} | 1000000000000000000 (raw, decimals unknown)"
+        in response
+    )
+    assert f"{unknown_token} | {MOCK_DESTINATION} | error: Call reverted" in response
+
+
+def test_get_balances_defaults_to_wallet_address(mock_wallet):
+    """Test that get_balances resolves unknown tokens and reads the wallet's balance."""
+    mock_wallet.read_contract.return_value = [
+        (True, encode(["string"], ["Token"])),
+        (True, encode(["string"], ["TOKEN"])),
+        (True, encode(["uint8"], [18])),
+        (True, encode(["uint256"], [int(MOCK_AMOUNT)])),
+    ]
+    registry = TokenRegistry(store=InMemoryStore())
+    provider = erc20_action_provider(registry)
+
+    response = provider.get_balances(mock_wallet, {"contract_addresses": [MOCK_CONTRACT_ADDRESS]})
+
+    requests = mock_wallet.read_contract.call_args.kwargs["args"][0]
+    assert len(requests) == 4
+    assert f"TOKEN ({MOCK_CONTRACT_ADDRESS}) | {mock_wallet.get_address()} | 1" in response
+    assert registry.get(mock_wallet.get_network().chain_id, MOCK_CONTRACT_ADDRESS).decimals == 18
+
+
+def test_get_balances_error(mock_wallet):
+    """Test get_balances with an invalid address."""
+    provider = erc20_action_provider()
+
+    response = provider.get_balances(mock_wallet, {"contract_addresses": ["0xinvalid"]})
+
+    assert "Error getting balances:" in response
+
+
 def test_transfer_schema_valid():
     """Test that the TransferSchema validates correctly."""
     valid_input = {
@@ -83,6 +184,14 @@ def test_transfer_schema_invalid():
         TransferSchema()
 
 
+def test_transfer_schema_invalid_destination():
+    """Test that the TransferSchema rejects invalid destination addresses."""
+    with pytest.raises(ValueError, match="Invalid Ethereum address"):
+        TransferSchema(
+            amount=MOCK_AMOUNT, contract_address=MOCK_CONTRACT_ADDRESS, destination="0xinvalid"
+        )
+
+
 def test_transfer_success(mock_wallet):
     """Test successful transfer call."""
     args = {
@@ -147,3 +256,177 @@ def test_supports_network():
     for protocol_family, expected in test_cases:
         network = Network(chain_id="1", protocol_family=protocol_family)
         assert provider.supports_network(network) is expected
+
+
+BATCH_DESTINATIONS = [
+    "0x1111111111111111111111111111111111111111",
+    "0x2222222222222222222222222222222222222222",
+    "0x3333333333333333333333333333333333333333",
+]
+
+
+def batch_transfer_args(amount: int = 10) -> dict:
+    """Build batch transfer arguments paying each batch destination the same amount."""
+    return {
+        "contract_address": MOCK_CONTRACT_ADDRESS,
+        "transfers": [
+            {"destination": destination, "amount": str(amount)}
+            for destination in BATCH_DESTINATIONS
+        ],
+    }
+
+
+def test_batch_transfer_schema_invalid():
+    """Test that the BatchTransferSchema rejects empty batches and invalid amounts."""
+    with pytest.raises(ValueError):
+        BatchTransferSchema(contract_address=MOCK_CONTRACT_ADDRESS, transfers=[])
+    with pytest.raises(ValueError):
+        BatchTransferSchema(
+            contract_address=MOCK_CONTRACT_ADDRESS,
+            transfers=[{"destination": MOCK_DESTINATION, "amount": "0"}],
+        )
+
+
+def test_batch_transfer_pipelines_transfers(mock_wallet):
+    """Test that transfers are estimated together and sent without waiting in between."""
+    mock_wallet.read_contract.return_value = [(True, encode(["uint256"], [100]))]
+    mock_wallet.estimate_gas.return_value = [60000, 60000, 60000]
+    mock_wallet.send_transaction.side_effect = ["0xa", Exception("nonce too low"), "0xc"]
+    mock_wallet.wait_for_transaction_receipt.side_effect = [{"status": 1}, {"status": 0}]
+    provider = erc20_action_provider()
+
+    response = provider.batch_transfer(mock_wallet, batch_transfer_args())
+
+    mock_wallet.estimate_gas.assert_called_once()
+    assert len(mock_wallet.estimate_gas.call_args.args[0]) == 3
+
+    contract = Web3().eth.contract(address=MOCK_CONTRACT_ADDRESS, abi=ERC20_ABI)
+    sent = [call.args[0] for call in mock_wallet.send_transaction.call_args_list]
+    assert sent[0] == {
+        "to": MOCK_CONTRACT_ADDRESS,
+        "data": contract.encode_abi("transfer", [BATCH_DESTINATIONS[0], 10]),
+        "gas": 60000,
+    }
+
+    assert f"Batch transfer of 30 of {MOCK_CONTRACT_ADDRESS} to 3 destinations:" in response
+    assert f"{BATCH_DESTINATIONS[0]} | 10 | success | 0xa" in response
+    assert f"{BATCH_DESTINATIONS[1]} | 10 | error: nonce too low" in response
+    assert f"{BATCH_DESTINATIONS[2]} | 10 | failed | 0xc" in response
+
+
+def test_batch_transfer_uses_disperse_with_single_approval(mock_wallet):
+    """Test that chains with a Disperse contract approve once and send one transaction."""
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="ethereum-mainnet", chain_id="1"
+    )
+    mock_wallet.read_contract.return_value = [
+        (True, encode(["uint256"], [100])),
+        (True, encode(["uint256"], [0])),
+    ]
+    mock_wallet.send_transaction.side_effect = ["0xapprove", "0xdisperse"]
+    mock_wallet.wait_for_transaction_receipt.return_value = {"status": 1}
+    provider = erc20_action_provider()
+
+    response = provider.batch_transfer(mock_wallet, batch_transfer_args())
+
+    disperse_address = DISPERSE_ADDRESSES["1"]
+    token = Web3().eth.contract(address=MOCK_CONTRACT_ADDRESS, abi=ERC20_ABI)
+    disperse = Web3().eth.contract(address=disperse_address, abi=DISPERSE_ABI)
+    sent = [call.args[0] for call in mock_wallet.send_transaction.call_args_list]
+    assert sent == [
+        {"to": MOCK_CONTRACT_ADDRESS, "data": token.encode_abi("approve", [disperse_address, 30])},
+        {
+            "to": disperse_address,
+            "data": disperse.encode_abi(
+                "disperseToken", [MOCK_CONTRACT_ADDRESS, BATCH_DESTINATIONS, [10, 10, 10]]
+            ),
+        },
+    ]
+    mock_wallet.estimate_gas.assert_not_called()
+    assert f"Approved 30 for {disperse_address}: 0xapprove" in response
+    assert "Dispersed to 3 destinations (success): 0xdisperse" in response
+
+
+def test_batch_transfer_skips_approval_when_allowance_suffices(mock_wallet):
+    """Test that an existing allowance is reused."""
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="ethereum-mainnet", chain_id="1"
+    )
+    mock_wallet.read_contract.return_value = [
+        (True, encode(["uint256"], [100])),
+        (True, encode(["uint256"], [30])),
+    ]
+    mock_wallet.send_transaction.return_value = "0xdisperse"
+    mock_wallet.wait_for_transaction_receipt.return_value = {"status": 1}
+    provider = erc20_action_provider()
+
+    response = provider.batch_transfer(mock_wallet, batch_transfer_args())
+
+    mock_wallet.send_transaction.assert_called_once()
+    assert "Approved" not in response
+
+
+def test_batch_transfer_resets_partial_allowance_before_approving(mock_wallet):
+    """Test that a partial allowance is reset to zero before approving the total."""
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="ethereum-mainnet", chain_id="1"
+    )
+    mock_wallet.read_contract.return_value = [
+        (True, encode(["uint256"], [100])),
+        (True, encode(["uint256"], [5])),
+    ]
+    mock_wallet.send_transaction.side_effect = ["0xreset", "0xapprove", "0xdisperse"]
+    mock_wallet.wait_for_transaction_receipt.return_value = {"status": 1}
+    provider = erc20_action_provider()
+
+    response = provider.batch_transfer(mock_wallet, batch_transfer_args())
+
+    disperse_address = DISPERSE_ADDRESSES["1"]
+    token = Web3().eth.contract(address=MOCK_CONTRACT_ADDRESS, abi=ERC20_ABI)
+    sent = [call.args[0] for call in mock_wallet.send_transaction.call_args_list]
+    assert sent[:2] == [
+        {"to": MOCK_CONTRACT_ADDRESS, "data": token.encode_abi("approve", [disperse_address, 0])},
+        {"to": MOCK_CONTRACT_ADDRESS, "data": token.encode_abi("approve", [disperse_address, 30])},
+    ]
+    assert sent[2]["to"] == disperse_address
+    assert f"Approved 0 for {disperse_address}: 0xreset" in response
+    assert f"Approved 30 for {disperse_address}: 0xapprove" in response
+    assert "Dispersed to 3 destinations (success): 0xdisperse" in response
+
+
+def test_batch_transfer_reports_chunks_sent_before_a_failure(mock_wallet, monkeypatch):
+    """Test that chunks already dispersed are reported when sending a later chunk fails."""
+    monkeypatch.setattr(
+        "coinbase_agentkit.action_providers.erc20.erc20_action_provider."
+        "MAX_RECIPIENTS_PER_DISPERSE",
+        1,
+    )
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="ethereum-mainnet", chain_id="1"
+    )
+    mock_wallet.read_contract.return_value = [
+        (True, encode(["uint256"], [100])),
+        (True, encode(["uint256"], [30])),
+    ]
+    mock_wallet.send_transaction.side_effect = ["0xfirst", Exception("nonce too low")]
+    mock_wallet.wait_for_transaction_receipt.return_value = {"status": 1}
+    provider = erc20_action_provider()
+
+    response = provider.batch_transfer(mock_wallet, batch_transfer_args())
+
+    assert mock_wallet.send_transaction.call_count == 2
+    mock_wallet.wait_for_transaction_receipt.assert_called_once_with("0xfirst")
+    assert "Dispersed to 1 destinations (success): 0xfirst" in response
+    assert "Error dispersing to 1 destinations: nonce too low" in response
+    assert "Not sent to the remaining 1 destinations" in response
+
+
+def test_batch_transfer_insufficient_balance(mock_wallet):
+    """Test that nothing is sent when the balance does not cover the batch."""
+    mock_wallet.read_contract.return_value = [(True, encode(["uint256"], [29]))]
+    provider = erc20_action_provider()
+
+    response = provider.batch_transfer(mock_wallet, batch_transfer_args())
+
+    mock_wallet.send_transaction.assert_not_called()
+    assert "insufficient balance" in response
@@ -3,8 +3,12 @@
 from unittest.mock import Mock
 
 import pytest
+from hexbytes import HexBytes
 
+from coinbase_agentkit.action_providers.erc721.constants import TRANSFER_EVENT_TOPIC
 from coinbase_agentkit.action_providers.erc721.erc721_action_provider import erc721_action_provider
+from coinbase_agentkit.action_providers.erc721.indexer import Erc721Indexer
+from coinbase_agentkit.cache import InMemoryStore
 from coinbase_agentkit.network import Network
 from coinbase_agentkit.wallet_providers import EvmWalletProvider
 
@@ -15,6 +19,22 @@ MOCK_TOKEN_ID = "123"
 MOCK_TX_HASH = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
 MOCK_NETWORK = Network(protocol_family="evm", chain_id="1", network_id="ethereum-mainnet")
 MOCK_RECEIPT = {"status": 1}
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def make_transfer_log(from_address, to_address, token_id, block_number, log_index=0):
+    """Build a Transfer log as returned by eth_getLogs."""
+    return {
+        "address": MOCK_CONTRACT,
+        "blockNumber": block_number,
+        "logIndex": log_index,
+        "topics": [
+            HexBytes(TRANSFER_EVENT_TOPIC),
+            HexBytes(bytes.fromhex(from_address[2:]).rjust(32, b"\0")),
+            HexBytes(bytes.fromhex(to_address[2:]).rjust(32, b"\0")),
+            HexBytes(token_id.to_bytes(32, "big")),
+        ],
+    }
 
 
 @pytest.fixture
@@ -37,6 +57,12 @@ def mock_wallet_provider():
 
 
 @pytest.fixture
-def provider():
+def indexer():
+    """Create an ERC721 indexer backed by an in-memory store."""
+    return Erc721Indexer(store=InMemoryStore())
+
+
+@pytest.fixture
+def provider(indexer):
     """Create an ERC721ActionProvider instance."""
-    return erc721_action_provider()
+    return erc721_action_provider(indexer)
@@ -1,12 +1,24 @@
 """Tests for ERC721 action provider."""
 
-from unittest.mock import ANY, patch
+from unittest.mock import patch
 
-from eth_typing import HexStr
+from eth_abi import encode
+from web3 import Web3
 
+from coinbase_agentkit.action_providers.erc721.constants import ERC721_ABI
+from coinbase_agentkit.multicall import get_function_codec
 from coinbase_agentkit.network import Network
 
-from .conftest import MOCK_ADDRESS, MOCK_CONTRACT, MOCK_DESTINATION, MOCK_TOKEN_ID, MOCK_TX_HASH
+from .conftest import (
+    MOCK_ADDRESS,
+    MOCK_CONTRACT,
+    MOCK_DESTINATION,
+    MOCK_RECEIPT,
+    MOCK_TOKEN_ID,
+    MOCK_TX_HASH,
+    ZERO_ADDRESS,
+    make_transfer_log,
+)
 
 
 def test_mint_success(provider, mock_wallet_provider):
@@ -99,7 +111,7 @@ def test_transfer_error(provider, mock_wallet_provider):
 
 def test_get_balance_success(provider, mock_wallet_provider):
     """Test successful NFT balance retrieval."""
-    mock_wallet_provider.read_contract.return_value = 1
+    mock_wallet_provider.call.return_value = encode(["uint256"], [1])
 
     args = {
         "contract_address": MOCK_CONTRACT,
@@ -111,19 +123,16 @@ def test_get_balance_success(provider, mock_wallet_provider):
         response == f"Balance of NFTs for contract {MOCK_CONTRACT} at address {MOCK_ADDRESS} is 1"
     )
 
-    mock_wallet_provider.read_contract.assert_called_once_with(
-        {
-            "address": HexStr(MOCK_CONTRACT),
-            "abi": ANY,
-            "function_name": "balanceOf",
-            "args": [MOCK_ADDRESS],
-        }
+    balance_of_data = get_function_codec(ERC721_ABI, "balanceOf").encode([MOCK_ADDRESS])
+    mock_wallet_provider.call.assert_called_once_with(
+        {"to": MOCK_CONTRACT, "data": Web3.to_hex(balance_of_data)}, "latest"
     )
+    mock_wallet_provider.read_contract.assert_not_called()
 
 
 def test_get_balance_error(provider, mock_wallet_provider):
     """Test error handling in NFT balance retrieval."""
-    mock_wallet_provider.read_contract.side_effect = Exception("Balance check failed")
+    mock_wallet_provider.call.side_effect = Exception("Balance check failed")
 
     args = {
         "contract_address": MOCK_CONTRACT,
@@ -139,3 +148,109 @@ def test_supports_network(provider):
     """Test network support check."""
     assert provider.supports_network(Network(protocol_family="evm", chain_id="1"))
     assert not provider.supports_network(Network(protocol_family="solana"))
+
+
+def test_list_tokens_success(provider, mock_wallet_provider):
+    """Test listing the NFTs held by the wallet."""
+    mock_wallet_provider.get_block_number.return_value = 100
+    mock_wallet_provider.call.return_value = b"\0" * 32
+    mock_wallet_provider.get_logs.side_effect = [
+        [make_transfer_log(ZERO_ADDRESS, MOCK_ADDRESS, 5, 10)],
+        [],
+    ]
+
+    response = provider.list_tokens(mock_wallet_provider, {"contract_address": MOCK_CONTRACT})
+
+    assert response == (
+        f"Address {MOCK_ADDRESS} holds 1 NFTs for contract {MOCK_CONTRACT} with token IDs: 5"
+    )
+
+
+def test_list_tokens_error(provider, mock_wallet_provider):
+    """Test error handling when listing NFTs."""
+    mock_wallet_provider.get_block_number.side_effect = Exception("RPC unavailable")
+
+    response = provider.list_tokens(mock_wallet_provider, {"contract_address": MOCK_CONTRACT})
+
+    assert response == f"Error listing NFTs for contract {MOCK_CONTRACT}: RPC unavailable"
+
+
+def test_batch_mint_pipelines_transactions(provider, mock_wallet_provider):
+    """Test that every mint is sent before the first receipt is awaited."""
+    events = []
+
+    def send_transaction(transaction):
+        events.append("send")
+        return f"0xhash{events.count('send')}"
+
+    def wait_for_transaction_receipt(tx_hash):
+        events.append("wait")
+        return MOCK_RECEIPT
+
+    mock_wallet_provider.estimate_gas.return_value = [90000, 90000]
+    mock_wallet_provider.send_transaction.side_effect = send_transaction
+    mock_wallet_provider.wait_for_transaction_receipt.side_effect = wait_for_transaction_receipt
+
+    response = provider.batch_mint(
+        mock_wallet_provider,
+        {"contract_address": MOCK_CONTRACT, "destinations": [MOCK_DESTINATION, MOCK_ADDRESS]},
+    )
+
+    assert events == ["send", "send", "wait", "wait"]
+    mock_wallet_provider.estimate_gas.assert_called_once()
+
+    mint_data = get_function_codec(ERC721_ABI, "mint").encode([MOCK_DESTINATION, 1])
+    first_tx = mock_wallet_provider.send_transaction.call_args_list[0].args[0]
+    assert first_tx["data"] == Web3.to_hex(mint_data)
+    assert first_tx["gas"] == 90000
+
+    assert f"{MOCK_DESTINATION} | success | 0xhash1" in response
+    assert f"{MOCK_ADDRESS} | success | 0xhash2" in response
+    assert "2/2 transactions succeeded" in response
+
+
+def test_batch_transfer_reports_per_item_results(provider, mock_wallet_provider):
+    """Test that a transfer that cannot be estimated does not stop the batch."""
+
+    def estimate_gas(transactions):
+        if len(transactions) > 1:
+            raise Exception("execution reverted")
+        data = transactions[0]["data"]
+        if data.endswith(f"{2:064x}"):
+            raise Exception("execution reverted: not owner")
+        return [80000]
+
+    mock_wallet_provider.estimate_gas.side_effect = estimate_gas
+    mock_wallet_provider.wait_for_transaction_receipt.return_value = MOCK_RECEIPT
+
+    response = provider.batch_transfer(
+        mock_wallet_provider,
+        {
+            "contract_address": MOCK_CONTRACT,
+            "transfers": [
+                {"token_id": "1", "destination": MOCK_DESTINATION},
+                {"token_id": "2", "destination": MOCK_DESTINATION},
+            ],
+        },
+    )
+
+    transfer_data = get_function_codec(ERC721_ABI, "transferFrom").encode(
+        [MOCK_ADDRESS, MOCK_DESTINATION, 1]
+    )
+    mock_wallet_provider.send_transaction.assert_called_once()
+    assert mock_wallet_provider.send_transaction.call_args.args[0]["data"] == Web3.to_hex(
+        transfer_data
+    )
+    assert f"1 | {MOCK_DESTINATION} | success | {MOCK_TX_HASH}" in response
+    assert f"2 | {MOCK_DESTINATION} | error: execution reverted: not owner" in response
+    assert "1/2 transactions succeeded" in response
+
+
+def test_batch_transfer_error(provider, mock_wallet_provider):
+    """Test error handling in batch NFT transfer."""
+    response = provider.batch_transfer(
+        mock_wallet_provider,
+        {"contract_address": MOCK_CONTRACT, "transfers": []},
+    )
+
+    assert response.startswith(f"Error batch transferring NFTs of contract {MOCK_CONTRACT}:")
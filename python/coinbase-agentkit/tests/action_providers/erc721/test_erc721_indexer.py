@@ -0,0 +1,249 @@
+"""Tests for the ERC721 holdings indexer."""
+
+import threading
+
+import pytest
+
+from coinbase_agentkit.action_providers.erc721.indexer import Erc721Indexer
+from coinbase_agentkit.cache import InMemoryStore
+
+from .conftest import (
+    MOCK_ADDRESS,
+    MOCK_CONTRACT,
+    MOCK_DESTINATION,
+    ZERO_ADDRESS,
+    make_transfer_log,
+)
+
+
+def _logs_by_topics(logs):
+    """Serve eth_getLogs requests from a list of logs, honoring topics and block bounds."""
+
+    def get_logs(params):
+        topics = params["topics"]
+        return [
+            log
+            for log in logs
+            if params["fromBlock"] <= log["blockNumber"] <= params["toBlock"]
+            and all(
+                topic is None or log["topics"][i].hex() == topic[2:]
+                for i, topic in enumerate(topics)
+            )
+        ]
+
+    return get_logs
+
+
+def test_list_tokens_applies_transfers_in_order(mock_wallet_provider):
+    """Test that holdings follow mints and transfers in and out of the owner."""
+    logs = [
+        make_transfer_log(ZERO_ADDRESS, MOCK_ADDRESS, 1, 10),
+        make_transfer_log(ZERO_ADDRESS, MOCK_ADDRESS, 2, 10, 1),
+        make_transfer_log(MOCK_ADDRESS, MOCK_DESTINATION, 1, 20),
+        make_transfer_log(MOCK_DESTINATION, MOCK_ADDRESS, 7, 30),
+    ]
+    mock_wallet_provider.get_logs.side_effect = _logs_by_topics(logs)
+    mock_wallet_provider.get_block_number.return_value = 40
+
+    indexer = Erc721Indexer(store=InMemoryStore())
+
+    assert indexer.list_tokens(mock_wallet_provider, MOCK_CONTRACT, MOCK_ADDRESS, from_block=0) == [
+        2,
+        7,
+    ]
+
+
+def test_list_tokens_scans_only_new_blocks(mock_wallet_provider):
+    """Test that a later sync resumes after the last confirmed block."""
+    logs = [make_transfer_log(ZERO_ADDRESS, MOCK_ADDRESS, 1, 10)]
+    mock_wallet_provider.get_logs.side_effect = _logs_by_topics(logs)
+    mock_wallet_provider.get_block_number.return_value = 40
+
+    store = InMemoryStore()
+    Erc721Indexer(store=store, confirmations=5).list_tokens(
+        mock_wallet_provider, MOCK_CONTRACT, MOCK_ADDRESS, from_block=0
+    )
+
+    logs.append(make_transfer_log(ZERO_ADDRESS, MOCK_ADDRESS, 2, 45))
+    mock_wallet_provider.get_logs.reset_mock()
+    mock_wallet_provider.get_block_number.return_value = 50
+
+    # A new indexer on the same store picks up from the persisted cursor, which stays
+    # behind the head by the confirmation depth
+    token_ids = Erc721Indexer(store=store, confirmations=5).list_tokens(
+        mock_wallet_provider, MOCK_CONTRACT, MOCK_ADDRESS
+    )
+
+    assert token_ids == [1, 2]
+    assert {call.args[0]["fromBlock"] for call in mock_wallet_provider.get_logs.call_args_list} == {
+        36
+    }
+    mock_wallet_provider.call.assert_not_called()
+
+
+def test_list_tokens_rescans_unconfirmed_blocks(mock_wallet_provider):
+    """Test that transfers within the confirmation depth are not persisted."""
+    logs = [
+        make_transfer_log(ZERO_ADDRESS, MOCK_ADDRESS, 1, 10),
+        make_transfer_log(ZERO_ADDRESS, MOCK_ADDRESS, 2, 38),
+    ]
+    mock_wallet_provider.get_logs.side_effect = _logs_by_topics(logs)
+    mock_wallet_provider.get_block_number.return_value = 40
+
+    store = InMemoryStore()
+    indexer = Erc721Indexer(store=store, confirmations=5)
+
+    assert indexer.list_tokens(mock_wallet_provider, MOCK_CONTRACT, MOCK_ADDRESS, from_block=0) == [
+        1,
+        2,
+    ]
+    assert store.get(f"1:{MOCK_CONTRACT.lower()}:{MOCK_ADDRESS.lower()}") == {
+        "last_block": 35,
+        "token_ids": [1],
+    }
+
+    # The block with the second mint is reorganized away
+    logs.pop()
+    mock_wallet_provider.get_block_number.return_value = 41
+
+    assert indexer.list_tokens(mock_wallet_provider, MOCK_CONTRACT, MOCK_ADDRESS, refresh=True) == [
+        1
+    ]
+
+
+def test_list_tokens_starts_at_deployment_block(mock_wallet_provider):
+    """Test that the first scan starts at the contract's deployment block."""
+    mock_wallet_provider.get_logs.return_value = []
+    mock_wallet_provider.get_block_number.return_value = 1000
+    mock_wallet_provider.call.side_effect = lambda tx, block: b"\0" * 32 if block >= 700 else b""
+
+    store = InMemoryStore()
+    Erc721Indexer(store=store).list_tokens(mock_wallet_provider, MOCK_CONTRACT, MOCK_ADDRESS)
+
+    assert {call.args[0]["fromBlock"] for call in mock_wallet_provider.get_logs.call_args_list} == {
+        700
+    }
+
+    # The deployment block is looked up once per contract
+    mock_wallet_provider.call.reset_mock()
+    Erc721Indexer(store=store).list_tokens(mock_wallet_provider, MOCK_CONTRACT, MOCK_DESTINATION)
+    mock_wallet_provider.call.assert_not_called()
+
+
+def test_list_tokens_without_archive_state_scans_from_genesis(mock_wallet_provider):
+    """Test that the first scan starts at block 0 when old state cannot be read."""
+    mock_wallet_provider.get_logs.return_value = []
+    mock_wallet_provider.get_block_number.return_value = 1000
+
+    def call(tx, block):
+        if block < 1000:
+            raise ValueError({"code": -32000, "message": "missing trie node abc (path )"})
+        return b"\0" * 32
+
+    mock_wallet_provider.call.side_effect = call
+
+    Erc721Indexer(store=InMemoryStore(), chunk_size=10_000).list_tokens(
+        mock_wallet_provider, MOCK_CONTRACT, MOCK_ADDRESS
+    )
+
+    assert {call.args[0]["fromBlock"] for call in mock_wallet_provider.get_logs.call_args_list} == {
+        0
+    }
+
+
+def test_list_tokens_remembers_genesis_fallback(mock_wallet_provider):
+    """Test that the deployment lookup is not repeated once it fell back to block 0."""
+    mock_wallet_provider.get_logs.return_value = []
+    mock_wallet_provider.get_block_number.return_value = 1000
+    mock_wallet_provider.call.side_effect = ValueError(
+        {"code": -32000, "message": "missing trie node abc (path )"}
+    )
+    indexer = Erc721Indexer(store=InMemoryStore())
+
+    indexer.list_tokens(mock_wallet_provider, MOCK_CONTRACT, MOCK_ADDRESS)
+    mock_wallet_provider.call.reset_mock()
+    indexer.list_tokens(mock_wallet_provider, MOCK_CONTRACT, MOCK_DESTINATION)
+
+    mock_wallet_provider.call.assert_not_called()
+
+
+def test_list_tokens_from_block_skips_deployment_lookup(mock_wallet_provider):
+    """Test that a given start block is scanned from without calling the contract."""
+    mock_wallet_provider.get_logs.return_value = []
+    mock_wallet_provider.get_block_number.return_value = 1000
+
+    Erc721Indexer(store=InMemoryStore()).list_tokens(
+        mock_wallet_provider, MOCK_CONTRACT, MOCK_ADDRESS, from_block=500
+    )
+
+    mock_wallet_provider.call.assert_not_called()
+    assert {call.args[0]["fromBlock"] for call in mock_wallet_provider.get_logs.call_args_list} == {
+        500
+    }
+
+
+def test_list_tokens_requires_deployed_contract(mock_wallet_provider):
+    """Test that listing tokens of an address without code fails."""
+    mock_wallet_provider.get_block_number.return_value = 1000
+    mock_wallet_provider.call.return_value = b""
+
+    with pytest.raises(ValueError, match="No ERC721 contract is deployed"):
+        Erc721Indexer(store=InMemoryStore()).list_tokens(
+            mock_wallet_provider, MOCK_CONTRACT, MOCK_ADDRESS
+        )
+
+    mock_wallet_provider.get_logs.assert_not_called()
+
+
+def test_list_tokens_answers_from_cache_between_syncs(mock_wallet_provider):
+    """Test that lookups within the sync interval make no RPC calls."""
+    mock_wallet_provider.get_logs.side_effect = _logs_by_topics(
+        [make_transfer_log(ZERO_ADDRESS, MOCK_ADDRESS, 3, 5)]
+    )
+    mock_wallet_provider.get_block_number.return_value = 10
+
+    indexer = Erc721Indexer(store=InMemoryStore(), sync_interval=60)
+    indexer.list_tokens(mock_wallet_provider, MOCK_CONTRACT, MOCK_ADDRESS, from_block=0)
+    mock_wallet_provider.get_logs.reset_mock()
+    mock_wallet_provider.get_block_number.reset_mock()
+
+    assert indexer.list_tokens(mock_wallet_provider, MOCK_CONTRACT, MOCK_ADDRESS) == [3]
+    mock_wallet_provider.get_logs.assert_not_called()
+    mock_wallet_provider.get_block_number.assert_not_called()
+    assert indexer.get_cached_tokens("1", MOCK_CONTRACT, MOCK_ADDRESS) == [3]
+
+
+def test_list_tokens_scan_does_not_block_other_holdings(mock_wallet_provider):
+    """Test that cached reads and other owners are served while one owner is scanned."""
+    owner_topic = "0x" + MOCK_ADDRESS[2:].lower().rjust(64, "0")
+    scanning = threading.Event()
+    release = threading.Event()
+
+    def get_logs(params):
+        if owner_topic in params["topics"]:
+            scanning.set()
+            release.wait(5)
+        return []
+
+    mock_wallet_provider.get_logs.side_effect = get_logs
+    mock_wallet_provider.get_block_number.return_value = 10
+    indexer = Erc721Indexer(store=InMemoryStore())
+
+    scan = threading.Thread(
+        target=indexer.list_tokens,
+        args=(mock_wallet_provider, MOCK_CONTRACT, MOCK_ADDRESS),
+        kwargs={"from_block": 0},
+    )
+    scan.start()
+    try:
+        assert scanning.wait(5)
+        assert indexer.get_cached_tokens("1", MOCK_CONTRACT, MOCK_ADDRESS) is None
+        assert (
+            indexer.list_tokens(mock_wallet_provider, MOCK_CONTRACT, MOCK_DESTINATION, from_block=0)
+            == []
+        )
+    finally:
+        release.set()
+        scan.join(5)
+
+    assert indexer.get_cached_tokens("1", MOCK_CONTRACT, MOCK_ADDRESS) == []
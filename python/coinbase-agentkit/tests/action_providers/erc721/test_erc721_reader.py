@@ -0,0 +1,117 @@
+"""Tests for ERC721 reads against a local chain stand-in."""
+
+from unittest.mock import patch
+
+import pytest
+from eth_abi import encode
+from eth_account import Account
+from web3 import Web3
+from web3.providers import BaseProvider
+
+from coinbase_agentkit.action_providers.erc721 import Erc721Reader, erc721_action_provider
+from coinbase_agentkit.action_providers.erc721.reader import BALANCE_OF, OWNER_OF, TOKEN_URI
+from coinbase_agentkit.wallet_providers import (
+    EthAccountWalletProvider,
+    EthAccountWalletProviderConfig,
+)
+
+from .conftest import MOCK_ADDRESS, MOCK_CONTRACT, MOCK_DESTINATION
+
+REVERT_ERROR = {"code": 3, "message": "execution reverted: ERC721: invalid token ID", "data": "0x"}
+
+
+class LocalErc721Chain(BaseProvider):
+    """A JSON-RPC provider serving eth_call for one ERC721 contract from memory."""
+
+    def __init__(self, contract_address, owners, token_uris):
+        super().__init__()
+        self.contract_address = contract_address.lower()
+        self.owners = {token_id: owner.lower() for token_id, owner in owners.items()}
+        self.token_uris = token_uris
+        self.calls = []
+
+    def _execute(self, call):
+        if call["to"].lower() != self.contract_address:
+            return "0x"
+
+        data = bytes.fromhex(call["data"][2:])
+        selector, arg = data[:4], data[4:]
+
+        if selector == BALANCE_OF.selector:
+            owner = "0x" + arg[12:32].hex()
+            balance = sum(holder == owner for holder in self.owners.values())
+            return Web3.to_hex(encode(["uint256"], [balance]))
+
+        token_id = int.from_bytes(arg[:32], "big")
+        if token_id not in self.owners:
+            return None
+        if selector == OWNER_OF.selector:
+            return Web3.to_hex(encode(["address"], [self.owners[token_id]]))
+        if selector == TOKEN_URI.selector:
+            return Web3.to_hex(encode(["string"], [self.token_uris[token_id]]))
+        return None
+
+    def make_request(self, method, params):
+        """Serve a JSON-RPC request."""
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 0, "result": hex(84532)}
+        if method == "eth_call":
+            self.calls.append(params[0])
+            result = self._execute(params[0])
+            if result is None:
+                return {"jsonrpc": "2.0", "id": 0, "error": REVERT_ERROR}
+            return {"jsonrpc": "2.0", "id": 0, "result": result}
+        raise NotImplementedError(method)
+
+
+@pytest.fixture
+def local_chain():
+    """Create a local chain holding two tokens of the mock contract."""
+    return LocalErc721Chain(
+        MOCK_CONTRACT,
+        owners={1: MOCK_ADDRESS, 2: MOCK_ADDRESS, 3: MOCK_DESTINATION},
+        token_uris={1: "ipfs://token/1", 2: "ipfs://token/2", 3: "ipfs://token/3"},
+    )
+
+
+@pytest.fixture
+def wallet_provider(local_chain):
+    """Create an EthAccountWalletProvider connected to the local chain."""
+    with (
+        patch.object(Web3, "HTTPProvider", return_value=local_chain),
+        patch("coinbase_agentkit.wallet_providers.wallet_provider.send_analytics_event"),
+    ):
+        yield EthAccountWalletProvider(
+            EthAccountWalletProviderConfig(account=Account.create(), chain_id="84532")
+        )
+
+
+def test_reader_reads_with_one_call_each(wallet_provider, local_chain):
+    """Test that each read is decoded from a single eth_call."""
+    reader = Erc721Reader(wallet_provider, MOCK_CONTRACT)
+
+    assert reader.balance_of(MOCK_ADDRESS) == 2
+    assert reader.owner_of(3) == Web3.to_checksum_address(MOCK_DESTINATION)
+    assert reader.token_uri(1) == "ipfs://token/1"
+    assert len(local_chain.calls) == 3
+
+
+def test_reader_raises_on_revert(wallet_provider):
+    """Test that a reverted read raises."""
+    with pytest.raises(Exception, match="invalid token ID"):
+        Erc721Reader(wallet_provider, MOCK_CONTRACT).owner_of(99)
+
+
+def test_get_balance_against_local_chain(wallet_provider, local_chain):
+    """Test the get_balance action end to end against the local chain."""
+    with patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"):
+        response = erc721_action_provider().get_balance(
+            wallet_provider, {"contract_address": MOCK_CONTRACT, "address": MOCK_ADDRESS}
+        )
+
+    assert response == (
+        f"Balance of NFTs for contract {MOCK_CONTRACT} at address {MOCK_ADDRESS} is 2"
+    )
+    assert local_chain.calls == [
+        {"to": MOCK_CONTRACT, "data": Web3.to_hex(BALANCE_OF.encode([MOCK_ADDRESS]))}
+    ]
@@ -2,28 +2,60 @@ import decimal
 from unittest.mock import MagicMock, patch
 
 import pytest
+from eth_abi import encode
+from pydantic import ValidationError
 
 from coinbase_agentkit.action_providers.morpho.morpho_action_provider import morpho_action_provider
+from coinbase_agentkit.action_providers.morpho.schemas import MorphoGetVaultPositionSchema
+from coinbase_agentkit.action_providers.morpho.vaults import MorphoVaultReader
+from coinbase_agentkit.cache import InMemoryStore, JsonFileStore
 from coinbase_agentkit.network import Network
+from coinbase_agentkit.tokens import TokenMetadata, TokenRegistry
 
 MOCK_VAULT_ADDRESS = "0x1234567890123456789012345678901234567890"
 MOCK_TOKEN_ADDRESS = "0x0987654321098765432109876543210987654321"
 MOCK_RECEIVER = "0x5555555555555555555555555555555555555555"
 MOCK_TX_HASH = "0xabcdef1234567890"
+MOCK_SECOND_VAULT_ADDRESS = "0x2222222222222222222222222222222222222222"
+MOCK_NETWORK = Network(protocol_family="evm", network_id="base-mainnet", chain_id="8453")
+BASE_USDC_ADDRESS = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+
+
+def provider_with_asset(decimals=18):
+    """Create a Morpho provider that already knows the mock vault's asset and decimals."""
+    reader = MorphoVaultReader(InMemoryStore(), TokenRegistry(InMemoryStore()))
+    reader.store.set(f"8453:{MOCK_VAULT_ADDRESS.lower()}", MOCK_TOKEN_ADDRESS)
+    reader.token_registry.add(
+        TokenMetadata("8453", MOCK_TOKEN_ADDRESS, "Mock Token", "MOCK", decimals)
+    )
+    return morpho_action_provider(reader)
+
+
+def vault_results(total_assets, total_supply, shares, assets_per_share, max_withdraw):
+    """Build the encoded multicall results of one vault's ERC-4626 views."""
+    return [
+        (True, encode(["address"], [MOCK_TOKEN_ADDRESS])),
+        *(
+            (True, encode(["uint256"], [value]))
+            for value in (total_assets, total_supply, shares, assets_per_share, max_withdraw)
+        ),
+    ]
 
 
 # Deposit Tests
 def test_morpho_deposit_success():
     """Test successful morpho deposit with valid parameters."""
     mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = MOCK_NETWORK
     mock_wallet.send_transaction.return_value = MOCK_TX_HASH
+    mock_wallet.read_contract.return_value = 0
 
     with patch(
         "coinbase_agentkit.action_providers.morpho.morpho_action_provider.approve"
     ) as mock_approve:
         mock_approve.return_value = True
 
-        result = morpho_action_provider().deposit(
+        result = provider_with_asset().deposit(
             mock_wallet,
             {
                 "vault_address": MOCK_VAULT_ADDRESS,
@@ -43,6 +75,38 @@ def test_morpho_deposit_success():
         mock_wallet.wait_for_transaction_receipt.assert_called_once_with(MOCK_TX_HASH)
 
 
+def test_morpho_deposit_skips_approve_with_sufficient_allowance():
+    """Test that morpho deposit sends only the deposit when the allowance covers it."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = MOCK_NETWORK
+    mock_wallet.get_address.return_value = MOCK_RECEIVER
+    mock_wallet.send_transaction.return_value = MOCK_TX_HASH
+    mock_wallet.read_contract.return_value = 2 * 10**18
+
+    with patch(
+        "coinbase_agentkit.action_providers.morpho.morpho_action_provider.approve"
+    ) as mock_approve:
+        result = provider_with_asset().deposit(
+            mock_wallet,
+            {
+                "vault_address": MOCK_VAULT_ADDRESS,
+                "token_address": MOCK_TOKEN_ADDRESS,
+                "assets": "1.0",
+                "receiver": MOCK_RECEIVER,
+            },
+        )
+
+    assert "Deposited 1.0" in result
+    mock_approve.assert_not_called()
+    mock_wallet.read_contract.assert_called_once()
+    assert mock_wallet.read_contract.call_args.kwargs["function_name"] == "allowance"
+    assert mock_wallet.read_contract.call_args.kwargs["args"] == [
+        MOCK_RECEIVER,
+        MOCK_VAULT_ADDRESS,
+    ]
+    mock_wallet.send_transaction.assert_called_once()
+
+
 def test_morpho_deposit_zero_amount():
     """Test morpho deposit with zero amount."""
     mock_wallet = MagicMock()
@@ -97,13 +161,15 @@ def test_morpho_deposit_invalid_amount():
 def test_morpho_deposit_approval_error():
     """Test morpho deposit with approval error."""
     mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = MOCK_NETWORK
+    mock_wallet.read_contract.side_effect = Exception("Allowance unavailable")
 
     with patch(
         "coinbase_agentkit.action_providers.morpho.morpho_action_provider.approve"
     ) as mock_approve:
         mock_approve.side_effect = Exception("Approval failed")
 
-        result = morpho_action_provider().deposit(
+        result = provider_with_asset().deposit(
             mock_wallet,
             {
                 "vault_address": MOCK_VAULT_ADDRESS,
@@ -117,16 +183,86 @@ def test_morpho_deposit_approval_error():
         mock_wallet.send_transaction.assert_not_called()
 
 
+def test_morpho_deposit_uses_asset_decimals():
+    """Test that deposits are converted with the decimals of the vault's asset."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = MOCK_NETWORK
+    mock_wallet.send_transaction.return_value = MOCK_TX_HASH
+    mock_wallet.read_contract.return_value = 0
+
+    with patch(
+        "coinbase_agentkit.action_providers.morpho.morpho_action_provider.approve"
+    ) as mock_approve:
+        result = provider_with_asset(decimals=6).deposit(
+            mock_wallet,
+            {
+                "vault_address": MOCK_VAULT_ADDRESS,
+                "token_address": MOCK_TOKEN_ADDRESS,
+                "assets": "1.5",
+                "receiver": MOCK_RECEIVER,
+            },
+        )
+
+    assert "Deposited 1.5" in result
+    mock_approve.assert_called_once_with(
+        mock_wallet, MOCK_TOKEN_ADDRESS, MOCK_VAULT_ADDRESS, 1_500_000
+    )
+
+
+def test_morpho_deposit_rejects_token_other_than_vault_asset():
+    """Test that a token other than the vault's asset is neither approved nor deposited."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = MOCK_NETWORK
+
+    with patch(
+        "coinbase_agentkit.action_providers.morpho.morpho_action_provider.approve"
+    ) as mock_approve:
+        result = provider_with_asset().deposit(
+            mock_wallet,
+            {
+                "vault_address": MOCK_VAULT_ADDRESS,
+                "token_address": BASE_USDC_ADDRESS,
+                "assets": "1.0",
+                "receiver": MOCK_RECEIVER,
+            },
+        )
+
+    assert f"Error: Token {BASE_USDC_ADDRESS} is not the asset of Morpho Vault" in result
+    assert MOCK_TOKEN_ADDRESS in result
+    mock_approve.assert_not_called()
+    mock_wallet.send_transaction.assert_not_called()
+
+
+def test_morpho_deposit_too_many_decimals():
+    """Test that an amount finer than the asset's decimals is rejected before any transaction."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = MOCK_NETWORK
+
+    result = provider_with_asset(decimals=6).deposit(
+        mock_wallet,
+        {
+            "vault_address": MOCK_VAULT_ADDRESS,
+            "token_address": MOCK_TOKEN_ADDRESS,
+            "assets": "0.0000001",
+            "receiver": MOCK_RECEIVER,
+        },
+    )
+
+    assert "Error depositing to Morpho Vault: Amount 0.0000001 has more than 6" in result
+    mock_wallet.send_transaction.assert_not_called()
+
+
 # Withdraw Tests
 def test_morpho_withdraw_success():
     """Test successful morpho withdraw with valid parameters."""
     mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = MOCK_NETWORK
     mock_wallet.send_transaction.return_value = MOCK_TX_HASH
 
     with patch("web3.eth.Contract") as mock_contract:
         mock_contract.return_value.encode_abi.return_value = b"encoded_data"
 
-        result = morpho_action_provider().withdraw(
+        result = provider_with_asset().withdraw(
             mock_wallet,
             {"vault_address": MOCK_VAULT_ADDRESS, "assets": "1.0", "receiver": MOCK_RECEIVER},
         )
@@ -137,6 +273,40 @@ def test_morpho_withdraw_success():
         mock_wallet.wait_for_transaction_receipt.assert_called_once_with(MOCK_TX_HASH)
 
 
+def test_morpho_withdraw_uses_asset_decimals():
+    """Test that withdrawals are converted with the decimals of the vault's asset."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = MOCK_NETWORK
+    mock_wallet.send_transaction.return_value = MOCK_TX_HASH
+
+    result = provider_with_asset(decimals=6).withdraw(
+        mock_wallet,
+        {"vault_address": MOCK_VAULT_ADDRESS, "assets": "2.25", "receiver": MOCK_RECEIVER},
+    )
+
+    assert "Withdrawn 2.25" in result
+    data = mock_wallet.send_transaction.call_args[0][0]["data"]
+    assert int(data[10:74], 16) == 2_250_000
+
+
+def test_morpho_vault_asset_is_read_once_and_persisted(tmp_path):
+    """Test that a vault's asset is read onchain once and then served from the store."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = MOCK_NETWORK
+    mock_wallet.read_contract.return_value = BASE_USDC_ADDRESS
+    store_path = tmp_path / "morpho_vault_assets.json"
+
+    asset = MorphoVaultReader(JsonFileStore(store_path)).get_asset(mock_wallet, MOCK_VAULT_ADDRESS)
+    reloaded = MorphoVaultReader(JsonFileStore(store_path)).get_asset(
+        mock_wallet, MOCK_VAULT_ADDRESS
+    )
+
+    assert asset.decimals == 6
+    assert reloaded == asset
+    mock_wallet.read_contract.assert_called_once()
+    assert mock_wallet.read_contract.call_args.kwargs["function_name"] == "asset"
+
+
 def test_morpho_withdraw_zero_amount():
     """Test morpho withdraw with zero amount."""
     mock_wallet = MagicMock()
@@ -180,12 +350,13 @@ def test_morpho_withdraw_invalid_amount():
 def test_morpho_withdraw_transaction_error():
     """Test morpho withdraw with transaction error."""
     mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = MOCK_NETWORK
     mock_wallet.send_transaction.side_effect = Exception("Transaction failed")
 
     with patch("web3.eth.Contract") as mock_contract:
         mock_contract.return_value.encode_abi.return_value = b"encoded_data"
 
-        result = morpho_action_provider().withdraw(
+        result = provider_with_asset().withdraw(
             mock_wallet,
             {"vault_address": MOCK_VAULT_ADDRESS, "assets": "1.0", "receiver": MOCK_RECEIVER},
         )
@@ -193,6 +364,101 @@ def test_morpho_withdraw_transaction_error():
         assert "Error withdrawing from Morpho Vault" in result
 
 
+# Vault Position Tests
+def test_morpho_get_vault_position_reads_vaults_in_one_multicall():
+    """Test that every vault's views are read in one multicall pinned to the latest block."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_address.return_value = MOCK_RECEIVER
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id="8453"
+    )
+    mock_wallet.get_block_number.return_value = 100
+    mock_wallet.read_contract.side_effect = [
+        [
+            *vault_results(10**24, 9 * 10**23, 3 * 10**18, 11 * 10**17, 33 * 10**17),
+            *vault_results(5 * 10**6, 5 * 10**18, 0, 10**6, 0),
+        ],
+        [(True, encode(["uint256"], [3300000000000000002]))],
+    ]
+    provider = morpho_action_provider()
+
+    result = provider.get_vault_position(
+        mock_wallet, {"vault_addresses": [MOCK_VAULT_ADDRESS, MOCK_SECOND_VAULT_ADDRESS]}
+    )
+    cached = provider.get_vault_position(
+        mock_wallet, {"vault_addresses": [MOCK_SECOND_VAULT_ADDRESS]}
+    )
+
+    assert f"positions of {MOCK_RECEIVER} at block 100" in result
+    # The share balance is converted exactly, not scaled from the share price
+    assert "3000000000000000000 shares worth 3300000000000000002" in result
+    assert "max withdraw 3300000000000000000" in result
+    assert "0 shares worth 0" in result
+    assert "1000000 assets per 1e18 shares" in cached
+    assert mock_wallet.read_contract.call_count == 2
+    assert {
+        call.kwargs["block_identifier"] for call in mock_wallet.read_contract.call_args_list
+    } == {100}
+    # Only the vault holding shares has its balance converted
+    assert len(mock_wallet.read_contract.call_args.kwargs["args"][0]) == 1
+
+
+def test_morpho_get_vault_position_reports_failed_vault():
+    """Test that a vault whose views revert is reported without hiding the others."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id="8453"
+    )
+    mock_wallet.get_block_number.return_value = 100
+    mock_wallet.read_contract.side_effect = [
+        [*vault_results(10**24, 10**24, 10**18, 10**18, 10**18), *[(False, b"")] * 6],
+        [(True, encode(["uint256"], [10**18]))],
+    ]
+
+    result = morpho_action_provider().get_vault_position(
+        mock_wallet,
+        {
+            "vault_addresses": [MOCK_VAULT_ADDRESS, MOCK_SECOND_VAULT_ADDRESS],
+            "owner": MOCK_RECEIVER,
+        },
+    )
+
+    assert "1000000000000000000 shares worth 1000000000000000000" in result
+    assert f"{MOCK_SECOND_VAULT_ADDRESS}: error: Failed to read vault" in result
+    mock_wallet.get_address.assert_not_called()
+
+
+def test_morpho_get_vault_position_rpc_error():
+    """Test morpho vault position when the vault views cannot be read at all."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id="8453"
+    )
+    mock_wallet.get_block_number.return_value = 100
+    mock_wallet.read_contract.side_effect = Exception("RPC error")
+
+    result = morpho_action_provider().get_vault_position(
+        mock_wallet, {"vault_addresses": [MOCK_VAULT_ADDRESS], "owner": MOCK_RECEIVER}
+    )
+
+    assert result == (
+        f"Morpho Vault positions of {MOCK_RECEIVER}:\n"
+        f"{MOCK_VAULT_ADDRESS}: error: Failed to read vault {MOCK_VAULT_ADDRESS}: RPC error"
+    )
+
+
+def test_morpho_get_vault_position_schema_validates_owner():
+    """Test that the vault position schema checksums the owner and rejects invalid ones."""
+    schema = MorphoGetVaultPositionSchema(
+        vault_addresses=[MOCK_VAULT_ADDRESS], owner=MOCK_TOKEN_ADDRESS.lower()
+    )
+
+    assert schema.owner == MOCK_TOKEN_ADDRESS
+    assert MorphoGetVaultPositionSchema(vault_addresses=[MOCK_VAULT_ADDRESS]).owner is None
+    with pytest.raises(ValidationError, match="Invalid Ethereum address"):
+        MorphoGetVaultPositionSchema(vault_addresses=[MOCK_VAULT_ADDRESS], owner="0x1234")
+
+
 # Network Support Tests
 def test_supports_network():
     """Test network support checking."""
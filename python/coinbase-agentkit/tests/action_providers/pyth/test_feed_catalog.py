@@ -0,0 +1,95 @@
+"""Tests for the local Pyth price feed catalog."""
+
+from unittest.mock import patch
+
+from coinbase_agentkit.action_providers.pyth.feed_catalog import PythFeedCatalog
+from coinbase_agentkit.cache import InMemoryStore, JsonFileStore
+
+BTC_USD_ID = "e62df6c8b4a85fe1a67db44dc12de5db330f7ac66b72dc658afedf0f4a415b43"
+BTC_EUR_ID = "3f0ebb3d04d35a8b1f4fda7e6dd8b0c0e9b6e2e9c3bf8c9d2b6f6c8f3c0a8f2b"
+AAPL_USD_ID = "49f6b65cb1de6b10eaf75e7c03ca029c306d0357e91b5311b175084a5ad55688"
+
+FEEDS = [
+    {
+        "id": BTC_EUR_ID,
+        "attributes": {
+            "asset_type": "Crypto",
+            "base": "BTC",
+            "quote_currency": "EUR",
+            "symbol": "Crypto.BTC/EUR",
+        },
+    },
+    {
+        "id": BTC_USD_ID,
+        "attributes": {
+            "asset_type": "Crypto",
+            "base": "BTC",
+            "quote_currency": "USD",
+            "symbol": "Crypto.BTC/USD",
+        },
+    },
+    {
+        "id": AAPL_USD_ID,
+        "attributes": {
+            "asset_type": "Equity",
+            "base": "AAPL",
+            "quote_currency": "USD",
+            "symbol": "Equity.US.AAPL/USD",
+        },
+    },
+]
+
+
+def mock_hermes(mock_get) -> None:
+    """Make a patched requests.get return the feed list."""
+    mock_get.return_value.json.return_value = FEEDS
+    mock_get.return_value.raise_for_status.return_value = None
+
+
+def test_find_downloads_catalog_once():
+    """Test that the feed list is downloaded once and lookups are then local."""
+    catalog = PythFeedCatalog(store=InMemoryStore())
+
+    with patch("requests.get") as mock_get:
+        mock_hermes(mock_get)
+
+        assert [feed.id for feed in catalog.find("btc")] == [BTC_USD_ID, BTC_EUR_ID]
+        assert [feed.id for feed in catalog.find("BTC", quote="eur")] == [BTC_EUR_ID]
+        assert [feed.id for feed in catalog.find("AAPL", asset_type="equity")] == [AAPL_USD_ID]
+        assert catalog.find("AAPL") == []
+
+        mock_get.assert_called_once_with("https://hermes.pyth.network/v2/price_feeds")
+
+
+def test_catalog_is_persisted(tmp_path):
+    """Test that a persisted catalog is reused without downloading it again."""
+    path = tmp_path / "pyth_price_feeds.json"
+    with patch("requests.get") as mock_get:
+        mock_hermes(mock_get)
+        PythFeedCatalog(store=JsonFileStore(path)).refresh()
+
+    with patch("requests.get") as mock_get:
+        catalog = PythFeedCatalog(store=JsonFileStore(path))
+
+        assert catalog.find("BTC")[0].id == BTC_USD_ID
+        mock_get.assert_not_called()
+
+
+def test_stale_catalog_refreshes_in_background():
+    """Test that a catalog past its TTL keeps serving lookups while it is refreshed."""
+    catalog = PythFeedCatalog(store=InMemoryStore(), ttl=60)
+    with patch("requests.get") as mock_get:
+        mock_hermes(mock_get)
+        catalog.refresh()
+
+    with (
+        patch("coinbase_agentkit.action_providers.pyth.feed_catalog.time.time") as mock_time,
+        patch.object(catalog, "refresh_in_background") as mock_refresh,
+    ):
+        mock_time.return_value = catalog._fetched_at + 30
+        assert catalog.find("BTC")[0].id == BTC_USD_ID
+        mock_refresh.assert_not_called()
+
+        mock_time.return_value = catalog._fetched_at + 61
+        assert catalog.find("BTC")[0].id == BTC_USD_ID
+        mock_refresh.assert_called_once()
@@ -28,9 +28,7 @@ def test_pyth_fetch_price_feed_id_success():
         result = pyth_action_provider().fetch_price_feed_id({"token_symbol": MOCK_TOKEN_SYMBOL})
 
         assert result == MOCK_PRICE_FEED_ID
-        mock_get.assert_called_once_with(
-            "https://hermes.pyth.network/v2/price_feeds?query=BTC&asset_type=crypto"
-        )
+        mock_get.assert_called_once_with("https://hermes.pyth.network/v2/price_feeds")
 
 
 def test_pyth_fetch_price_feed_id_empty_response():
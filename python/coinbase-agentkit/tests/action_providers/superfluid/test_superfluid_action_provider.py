@@ -3,17 +3,25 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from eth_abi import decode, encode
 from pydantic import ValidationError
+from web3 import Web3
 
 from coinbase_agentkit.action_providers.superfluid.constants import (
+    CFA_V1_ABI,
     CREATE_ABI,
     DELETE_ABI,
+    OPERATION_TYPE_SUPERFLUID_CALL_AGREEMENT,
+    SUPERFLUID_HOST_ABI,
     SUPERFLUID_HOST_ADDRESS,
+    SUPERFLUID_HOST_ADDRESSES,
     UPDATE_ABI,
 )
 from coinbase_agentkit.action_providers.superfluid.schemas import (
+    BatchFlowsSchema,
     CreateFlowSchema,
     DeleteFlowSchema,
+    GetFlowsSchema,
     UpdateFlowSchema,
 )
 from coinbase_agentkit.action_providers.superfluid.superfluid_action_provider import (
@@ -24,6 +32,26 @@ from coinbase_agentkit.network import Network
 MOCK_TX_HASH = "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef"
 MOCK_RECEIPT = {"status": 1, "transactionHash": MOCK_TX_HASH}
 MOCK_ADDRESS = "0xmockWalletAddress"
+MOCK_SENDER = "0x1111111111111111111111111111111111111111"
+MOCK_TOKEN = "0x2222222222222222222222222222222222222222"
+MOCK_HOST = SUPERFLUID_HOST_ADDRESSES["8453"]
+MOCK_CFA = "0x4444444444444444444444444444444444444444"
+MOCK_RECIPIENTS = [Web3.to_checksum_address(f"0x{i:040x}") for i in range(0xA1, 0xA4)]
+
+
+def decode_batch_call(data):
+    """Decode host batchCall calldata into (operation type, target, CFA function, CFA args)."""
+    _, args = Web3().eth.contract(abi=SUPERFLUID_HOST_ABI).decode_function_input(data)
+    cfa = Web3().eth.contract(abi=CFA_V1_ABI)
+    decoded = []
+    for operation in args["operations"]:
+        call_data, user_data = decode(["bytes", "bytes"], operation["data"])
+        assert user_data == b""
+        function, call_args = cfa.decode_function_input(call_data)
+        decoded.append(
+            (operation["operationType"], operation["target"], function.fn_name, call_args)
+        )
+    return decoded
 
 
 def test_create_flowinput_model_valid():
@@ -346,6 +374,302 @@ def test_delete_flow_error():
         assert tx["data"] == "0xencoded"
 
 
+def test_batch_flows_input_model_requires_flow_rate():
+    """Test that BatchFlowsSchema requires a whole flow rate for creates and updates."""
+    BatchFlowsSchema(
+        operations=[{"action": "delete", "recipient": MOCK_SENDER, "token_address": MOCK_TOKEN}]
+    )
+
+    with pytest.raises(ValidationError, match="flow_rate is required"):
+        BatchFlowsSchema(
+            operations=[{"action": "create", "recipient": MOCK_SENDER, "token_address": MOCK_TOKEN}]
+        )
+    with pytest.raises(ValidationError, match="whole number"):
+        BatchFlowsSchema(
+            operations=[
+                {
+                    "action": "update",
+                    "recipient": MOCK_SENDER,
+                    "token_address": MOCK_TOKEN,
+                    "flow_rate": "1.5",
+                }
+            ]
+        )
+    with pytest.raises(ValidationError):
+        BatchFlowsSchema(operations=[])
+
+
+def test_batch_flows_success():
+    """Test that many flow changes are sent to the host as one batchCall."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_address.return_value = MOCK_SENDER
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id="8453"
+    )
+    mock_wallet.read_contract.return_value = MOCK_CFA
+    mock_wallet.send_transaction.return_value = MOCK_TX_HASH
+
+    provider = SuperfluidActionProvider()
+    response = provider.batch_flows(
+        mock_wallet,
+        {
+            "operations": [
+                {
+                    "action": "create",
+                    "recipient": MOCK_RECIPIENTS[0],
+                    "token_address": MOCK_TOKEN,
+                    "flow_rate": "1000",
+                },
+                {
+                    "action": "update",
+                    "recipient": MOCK_RECIPIENTS[1],
+                    "token_address": MOCK_TOKEN,
+                    "flow_rate": "2000",
+                },
+                {"action": "delete", "recipient": MOCK_RECIPIENTS[2], "token_address": MOCK_TOKEN},
+            ]
+        },
+    )
+
+    assert response == (
+        "3 flow operations applied successfully in one transaction. "
+        f"Transaction hash: {MOCK_TX_HASH}"
+    )
+    mock_wallet.send_transaction.assert_called_once()
+    tx = mock_wallet.send_transaction.call_args[0][0]
+    assert tx["to"] == MOCK_HOST
+    assert decode_batch_call(tx["data"]) == [
+        (
+            OPERATION_TYPE_SUPERFLUID_CALL_AGREEMENT,
+            MOCK_CFA,
+            "createFlow",
+            {"token": MOCK_TOKEN, "receiver": MOCK_RECIPIENTS[0], "flowRate": 1000, "ctx": b""},
+        ),
+        (
+            OPERATION_TYPE_SUPERFLUID_CALL_AGREEMENT,
+            MOCK_CFA,
+            "updateFlow",
+            {"token": MOCK_TOKEN, "receiver": MOCK_RECIPIENTS[1], "flowRate": 2000, "ctx": b""},
+        ),
+        (
+            OPERATION_TYPE_SUPERFLUID_CALL_AGREEMENT,
+            MOCK_CFA,
+            "deleteFlow",
+            {
+                "token": MOCK_TOKEN,
+                "sender": MOCK_SENDER,
+                "receiver": MOCK_RECIPIENTS[2],
+                "ctx": b"",
+            },
+        ),
+    ]
+    mock_wallet.wait_for_transaction_receipt.assert_called_once_with(MOCK_TX_HASH)
+
+    # The CFA is read from the pinned host once per chain
+    provider.batch_flows(
+        mock_wallet,
+        {
+            "operations": [
+                {"action": "delete", "recipient": MOCK_RECIPIENTS[0], "token_address": MOCK_TOKEN}
+            ]
+        },
+    )
+    mock_wallet.read_contract.assert_called_once()
+    assert mock_wallet.read_contract.call_args.kwargs["contract_address"] == MOCK_HOST
+
+
+def test_batch_flows_unsupported_chain():
+    """Test that batch flows are refused on chains without a pinned host."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="ethereum-mainnet", chain_id="1"
+    )
+
+    response = SuperfluidActionProvider().batch_flows(
+        mock_wallet,
+        {
+            "operations": [
+                {"action": "delete", "recipient": MOCK_RECIPIENTS[0], "token_address": MOCK_TOKEN}
+            ]
+        },
+    )
+
+    assert response == "Error batching flows: Superfluid batch calls are not supported on chain 1"
+    mock_wallet.read_contract.assert_not_called()
+    mock_wallet.send_transaction.assert_not_called()
+
+
+def test_batch_flows_error():
+    """Test batch flows when the transaction fails."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_address.return_value = MOCK_SENDER
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id="8453"
+    )
+    mock_wallet.read_contract.return_value = MOCK_CFA
+    mock_wallet.send_transaction.side_effect = Exception("Transaction failed")
+
+    response = SuperfluidActionProvider().batch_flows(
+        mock_wallet,
+        {
+            "operations": [
+                {"action": "delete", "recipient": MOCK_RECIPIENTS[0], "token_address": MOCK_TOKEN}
+            ]
+        },
+    )
+
+    assert response == "Error batching flows: Transaction failed"
+
+
+def flow_results(flows, net_flow, balance):
+    """Build the encoded multicall results of a get_flows query on one token."""
+    return [
+        *((True, encode(["uint256", "int96", "uint256", "uint256"], list(flow))) for flow in flows),
+        (True, encode(["int96"], [net_flow])),
+        (True, encode(["int256", "uint256", "uint256", "uint256"], list(balance))),
+    ]
+
+
+def test_get_flows_success():
+    """Test that flows and net flows are read in one multicall and projected locally."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_address.return_value = MOCK_SENDER
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id="8453"
+    )
+    mock_wallet.get_block_number.return_value = 100
+    mock_wallet.read_contract.side_effect = [
+        MOCK_CFA,
+        flow_results(
+            [(1_699_000_000, 1000, 3_600_000, 0), (0, 0, 0, 0)],
+            -1500,
+            (10**9, 5_400_000, 0, 1_700_000_000),
+        ),
+    ]
+    args = {
+        "flows": [
+            {"recipient": MOCK_RECIPIENTS[0], "token_address": MOCK_TOKEN},
+            {"recipient": MOCK_RECIPIENTS[1], "token_address": MOCK_TOKEN},
+        ]
+    }
+    provider = SuperfluidActionProvider()
+
+    with patch(
+        "coinbase_agentkit.action_providers.superfluid.superfluid_action_provider.time.time",
+        return_value=1_700_000_100,
+    ):
+        response = provider.get_flows(mock_wallet, args)
+        cached = provider.get_flows(mock_wallet, args)
+
+    assert response == cached
+    assert response.splitlines() == [
+        f"Superfluid flows of {MOCK_SENDER} at block 100:",
+        f"- {MOCK_TOKEN} to {MOCK_RECIPIENTS[0]}: 1000 wei per second since unix time 1699000000",
+        f"- {MOCK_TOKEN} to {MOCK_RECIPIENTS[1]}: no flow",
+        "Net flows:",
+        f"- {MOCK_TOKEN}: -1500 wei per second, balance now 999850000 wei, "
+        "in 24 hours 870250000 wei, runs out at unix time 1700666666",
+    ]
+    assert mock_wallet.read_contract.call_count == 2
+    assert mock_wallet.read_contract.call_args.kwargs["block_identifier"] == 100
+
+
+def test_get_flows_failed_read():
+    """Test that a flow that cannot be read is reported without hiding the others."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id="8453"
+    )
+    mock_wallet.get_block_number.return_value = 100
+    results = flow_results([(0, 0, 0, 0)], 0, (10**9, 0, 0, 1_700_000_000))
+    results[0] = (False, b"")
+    mock_wallet.read_contract.side_effect = [MOCK_CFA, results]
+
+    response = SuperfluidActionProvider().get_flows(
+        mock_wallet,
+        {
+            "flows": [{"recipient": MOCK_RECIPIENTS[0], "token_address": MOCK_TOKEN}],
+            "sender": MOCK_SENDER,
+        },
+    )
+
+    assert "- error: Failed to read flow" in response
+    assert f"- {MOCK_TOKEN}: 0 wei per second, balance now 1000000000 wei" in response
+    assert "runs out" not in response
+
+
+def test_get_flows_error():
+    """Test get flows when the Superfluid framework cannot be resolved."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id="8453"
+    )
+    mock_wallet.read_contract.side_effect = Exception("RPC error")
+
+    response = SuperfluidActionProvider().get_flows(
+        mock_wallet,
+        {
+            "flows": [{"recipient": MOCK_RECIPIENTS[0], "token_address": MOCK_TOKEN}],
+            "sender": MOCK_SENDER,
+        },
+    )
+
+    assert response == "Error getting flows: RPC error"
+
+
+def test_get_flows_schema_validates_addresses():
+    """Test that the get flows schema checksums addresses and rejects invalid ones."""
+    schema = GetFlowsSchema(
+        flows=[{"recipient": MOCK_RECIPIENTS[0].lower(), "token_address": MOCK_TOKEN}],
+        sender="alice.base.eth",
+    )
+
+    assert schema.flows[0].recipient == MOCK_RECIPIENTS[0]
+    assert schema.sender == "alice.base.eth"
+    with pytest.raises(ValidationError, match="Invalid Ethereum address"):
+        GetFlowsSchema(
+            flows=[{"recipient": MOCK_RECIPIENTS[0], "token_address": MOCK_TOKEN}],
+            sender="0x1234",
+        )
+    with pytest.raises(ValidationError, match="Invalid Ethereum address"):
+        GetFlowsSchema(flows=[{"recipient": MOCK_RECIPIENTS[0], "token_address": "alice.eth"}])
+
+
+def test_get_flows_resolves_names():
+    """Test that a sender and recipients given by name are read at their addresses."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id="8453"
+    )
+    mock_wallet.get_block_number.return_value = 100
+    mock_wallet.read_contract.side_effect = [
+        MOCK_CFA,
+        flow_results([(0, 0, 0, 0)], 0, (0, 0, 0, 1_700_000_000)),
+    ]
+    module = "coinbase_agentkit.action_providers.superfluid.superfluid_action_provider"
+
+    with (
+        patch(f"{module}.resolve_address", return_value=MOCK_SENDER) as mock_resolve_address,
+        patch(
+            f"{module}.resolve_addresses", return_value=[MOCK_RECIPIENTS[0]]
+        ) as mock_resolve_addresses,
+    ):
+        response = SuperfluidActionProvider().get_flows(
+            mock_wallet,
+            {
+                "flows": [{"recipient": "bob.base.eth", "token_address": MOCK_TOKEN}],
+                "sender": "alice.base.eth",
+            },
+        )
+
+    mock_resolve_address.assert_called_once_with(mock_wallet, "alice.base.eth")
+    mock_resolve_addresses.assert_called_once_with(mock_wallet, ["bob.base.eth"])
+    assert response.splitlines()[:2] == [
+        f"Superfluid flows of {MOCK_SENDER} at block 100:",
+        f"- {MOCK_TOKEN} to {MOCK_RECIPIENTS[0]}: no flow",
+    ]
+
+
 def test_supports_network():
     """Test network support validation."""
     provider = SuperfluidActionProvider()
@@ -0,0 +1,98 @@
+"""Tests for WETH unwrap and wrap-if-needed actions."""
+
+import pytest
+from eth_abi import decode
+from pydantic import ValidationError
+
+from coinbase_agentkit.action_providers.weth.constants import MIN_WRAP_AMOUNT, WETH_ADDRESS
+from coinbase_agentkit.action_providers.weth.schemas import UnwrapEthSchema
+from coinbase_agentkit.action_providers.weth.weth_action_provider import WethActionProvider
+
+from .conftest import MOCK_ADDRESS, MOCK_TX_HASH
+
+WITHDRAW_SELECTOR = "0x2e1a7d4d"
+DEPOSIT_SELECTOR = "0xd0e30db0"
+
+
+def test_unwrap_eth_input_model_rejects_invalid_amounts():
+    """Test that UnwrapEthSchema only accepts positive whole wei amounts."""
+    assert UnwrapEthSchema(amount_to_unwrap="1").amount_to_unwrap == "1"
+
+    for invalid_input in ["", "0", "-1", "1.5", "abc"]:
+        with pytest.raises(ValidationError, match="positive whole number"):
+            UnwrapEthSchema(amount_to_unwrap=invalid_input)
+
+
+def test_unwrap_eth_success(mock_wallet_provider):
+    """Test that unwrap_eth checks the balance and calls withdraw."""
+    mock_wallet_provider.get_block_number.return_value = 100
+    mock_wallet_provider.read_contract.return_value = 5 * 10**18
+
+    response = WethActionProvider().unwrap_eth(
+        mock_wallet_provider, {"amount_to_unwrap": str(10**18)}
+    )
+
+    assert response == f"Unwrapped WETH with transaction hash: {MOCK_TX_HASH}"
+    assert mock_wallet_provider.read_contract.call_args.kwargs["function_name"] == "balanceOf"
+    assert mock_wallet_provider.read_contract.call_args.kwargs["args"] == [MOCK_ADDRESS]
+    assert mock_wallet_provider.read_contract.call_args.kwargs["block_identifier"] == 100
+    tx = mock_wallet_provider.send_transaction.call_args[0][0]
+    assert tx["to"] == WETH_ADDRESS
+    assert tx["data"][:10] == WITHDRAW_SELECTOR
+    assert decode(["uint256"], bytes.fromhex(tx["data"][10:])) == (10**18,)
+    mock_wallet_provider.wait_for_transaction_receipt.assert_called_once_with(MOCK_TX_HASH)
+
+
+def test_unwrap_eth_insufficient_balance(mock_wallet_provider):
+    """Test that unwrap_eth sends nothing when the WETH balance is too low."""
+    mock_wallet_provider.get_block_number.return_value = 100
+    mock_wallet_provider.read_contract.return_value = 10
+
+    response = WethActionProvider().unwrap_eth(mock_wallet_provider, {"amount_to_unwrap": "11"})
+
+    assert response == (
+        "Error unwrapping ETH: insufficient WETH balance, have 10 wei but need 11 wei"
+    )
+    mock_wallet_provider.send_transaction.assert_not_called()
+
+
+def test_wrap_eth_if_needed_skips_covered_balance(mock_wallet_provider):
+    """Test that nothing is wrapped when the cached WETH balance already covers the amount."""
+    mock_wallet_provider.get_block_number.return_value = 100
+    mock_wallet_provider.read_contract.return_value = 10**18
+    provider = WethActionProvider()
+
+    first = provider.wrap_eth_if_needed(mock_wallet_provider, {"required_weth_amount": str(10**18)})
+    second = provider.wrap_eth_if_needed(
+        mock_wallet_provider, {"required_weth_amount": str(10**17)}
+    )
+
+    assert "already covers" in first
+    assert "already covers" in second
+    mock_wallet_provider.read_contract.assert_called_once()
+    mock_wallet_provider.send_transaction.assert_not_called()
+
+
+def test_wrap_eth_if_needed_wraps_shortfall(mock_wallet_provider):
+    """Test that only the missing WETH is wrapped, with the minimum wrap amount."""
+    mock_wallet_provider.get_block_number.return_value = 100
+    mock_wallet_provider.read_contract.side_effect = [10**18, 10**18 + 5 * 10**17, 0]
+    provider = WethActionProvider()
+
+    response = provider.wrap_eth_if_needed(
+        mock_wallet_provider, {"required_weth_amount": str(10**18 + 5 * 10**17)}
+    )
+
+    assert response == (f"Wrapped {5 * 10**17} wei of ETH with transaction hash: {MOCK_TX_HASH}")
+    tx = mock_wallet_provider.send_transaction.call_args[0][0]
+    assert tx["to"] == WETH_ADDRESS
+    assert tx["data"] == DEPOSIT_SELECTOR
+    assert tx["value"] == 5 * 10**17
+
+    # The balance is read again after the wrap, even within the same block
+    assert "already covers" in provider.wrap_eth_if_needed(
+        mock_wallet_provider, {"required_weth_amount": str(10**18 + 5 * 10**17)}
+    )
+
+    WethActionProvider().wrap_eth_if_needed(mock_wallet_provider, {"required_weth_amount": "1"})
+    assert mock_wallet_provider.send_transaction.call_args[0][0]["value"] == MIN_WRAP_AMOUNT
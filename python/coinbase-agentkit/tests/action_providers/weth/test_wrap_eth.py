@@ -5,16 +5,18 @@ from unittest.mock import MagicMock, patch
 import pytest
 from pydantic import ValidationError
 
-from coinbase_agentkit.action_providers.weth.constants import MIN_WRAP_AMOUNT
-from coinbase_agentkit.action_providers.weth.schemas import WrapEthSchema
-from coinbase_agentkit.action_providers.weth.weth_action_provider import (
+from coinbase_agentkit.action_providers.weth.constants import (
+    MIN_WRAP_AMOUNT,
     WETH_ABI,
     WETH_ADDRESS,
-    WethActionProvider,
 )
+from coinbase_agentkit.action_providers.weth.schemas import WrapEthSchema
+from coinbase_agentkit.action_providers.weth.utils import get_weth_address
+from coinbase_agentkit.action_providers.weth.weth_action_provider import WethActionProvider
 from coinbase_agentkit.network import Network
 
 from .conftest import (
+    MOCK_NETWORK,
     MOCK_RECEIPT,
     MOCK_TX_HASH,
 )
@@ -67,6 +69,7 @@ def test_wrap_eth_success():
         mock_contract = mock_web3.return_value.eth.contract.return_value
         mock_contract.encode_abi.return_value = "0xencoded"
         mock_wallet = MagicMock()
+        mock_wallet.get_network.return_value = MOCK_NETWORK
         mock_wallet.send_transaction.return_value = MOCK_TX_HASH
         mock_wallet.wait_for_transaction_receipt.return_value = MOCK_RECEIPT
 
@@ -125,6 +128,7 @@ def test_wrap_eth_transaction_error():
         mock_contract = mock_web3.return_value.eth.contract.return_value
         mock_contract.encode_abi.return_value = "0xencoded"
         mock_wallet = MagicMock()
+        mock_wallet.get_network.return_value = MOCK_NETWORK
         mock_wallet.send_transaction.side_effect = Exception("Transaction failed")
 
         provider = WethActionProvider()
@@ -147,9 +151,10 @@ def test_supports_network():
     test_cases = [
         ("base-mainnet", "8453", "evm", True),
         ("base-sepolia", "84532", "evm", True),
-        ("ethereum-mainnet", "1", "evm", False),
-        ("arbitrum-one", "42161", "evm", False),
-        ("optimism", "10", "evm", False),
+        ("ethereum-mainnet", "1", "evm", True),
+        ("arbitrum-one", "42161", "evm", True),
+        ("optimism", "10", "evm", True),
+        ("polygon-mainnet", "137", "evm", False),
         ("base-goerli", "84531", "evm", False),
         ("mainnet", None, "bitcoin", False),
         ("mainnet", None, "solana", False),
@@ -163,6 +168,43 @@ def test_supports_network():
         ), f"Network {network_id} (chain_id: {chain_id}) should{' ' if expected_result else ' not '}be supported"
 
 
+def test_get_weth_address_per_chain():
+    """Test that WETH is resolved per chain."""
+    assert get_weth_address("8453") == WETH_ADDRESS
+    assert get_weth_address("1") == "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+    assert get_weth_address("42161") == "0x82aF49447D8a07e3bd95BD0d56f35241523fBab1"
+    assert get_weth_address("137") is None
+    assert get_weth_address(None) is None
+
+
+def test_wrap_eth_uses_chain_weth():
+    """Test that wrap_eth sends to the WETH contract of the wallet's chain."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", chain_id="1", network_id="ethereum-mainnet"
+    )
+    mock_wallet.send_transaction.return_value = MOCK_TX_HASH
+
+    response = WethActionProvider().wrap_eth(mock_wallet, {"amount_to_wrap": MOCK_AMOUNT})
+
+    assert response == f"Wrapped ETH with transaction hash: {MOCK_TX_HASH}"
+    tx = mock_wallet.send_transaction.call_args[0][0]
+    assert tx["to"] == "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+
+
+def test_wrap_eth_unsupported_chain():
+    """Test that wrap_eth sends nothing on a chain without WETH."""
+    mock_wallet = MagicMock()
+    mock_wallet.get_network.return_value = Network(
+        protocol_family="evm", chain_id="137", network_id="polygon-mainnet"
+    )
+
+    response = WethActionProvider().wrap_eth(mock_wallet, {"amount_to_wrap": MOCK_AMOUNT})
+
+    assert response == "Error wrapping ETH: WETH is not available on chain 137"
+    mock_wallet.send_transaction.assert_not_called()
+
+
 def test_action_provider_setup():
     """Test action provider initialization."""
     provider = WethActionProvider()
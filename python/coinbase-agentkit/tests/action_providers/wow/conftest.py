@@ -0,0 +1,192 @@
+"""Test fixtures for WOW action provider tests."""
+
+from collections import defaultdict
+from unittest.mock import Mock
+
+from eth_abi import encode
+
+from coinbase_agentkit.action_providers.wow.constants import (
+    WOW_ABI,
+    WOW_FACTORY_CONTRACT_ADDRESSES,
+    WOW_MARKET_GRADUATED_EVENT_TOPIC,
+    WOW_TOKEN_CREATED_EVENT_TOPIC,
+)
+from coinbase_agentkit.action_providers.wow.token_index import WowTokenIndex
+from coinbase_agentkit.action_providers.wow.uniswap.pool_state import (
+    PoolState,
+    bitmap_word_position,
+)
+from coinbase_agentkit.action_providers.wow.uniswap.v3_math import (
+    MAX_TICK,
+    MIN_TICK,
+    get_sqrt_ratio_at_tick,
+)
+from coinbase_agentkit.multicall.codec import get_function_codec
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+
+TOKEN0 = "0x4200000000000000000000000000000000000006"
+TOKEN1 = "0x1234567890123456789012345678901234567890"
+MOCK_POOL = "0x9876543210987654321098765432109876543210"
+
+TICK_SPACING = 60
+FEE = 3000
+
+# (tick lower, tick upper, liquidity) of the positions in the test pool
+POSITIONS = [
+    (-600, 600, 10**21),
+    (-1200, -600, 4 * 10**20),
+    (600, 3000, 2 * 10**20),
+    (MIN_TICK // TICK_SPACING * TICK_SPACING + TICK_SPACING, -1200, 10**19),
+]
+
+
+def make_pool_state(tick: int, positions=POSITIONS, words=None) -> PoolState:
+    """Build the snapshot of a pool holding the given positions, priced at a tick."""
+    liquidity_net = defaultdict(int)
+    tick_bitmap = defaultdict(int)
+    liquidity = 0
+    for lower, upper, amount in positions:
+        liquidity_net[lower] += amount
+        liquidity_net[upper] -= amount
+        if lower <= tick < upper:
+            liquidity += amount
+        for initialized_tick in (lower, upper):
+            compressed = initialized_tick // TICK_SPACING
+            tick_bitmap[compressed >> 8] |= 1 << (compressed & 0xFF)
+
+    if words is None:
+        words = range(
+            bitmap_word_position(MIN_TICK, TICK_SPACING),
+            bitmap_word_position(MAX_TICK, TICK_SPACING) + 1,
+        )
+    return PoolState(
+        token0=TOKEN0,
+        token1=TOKEN1,
+        fee=FEE,
+        tick_spacing=TICK_SPACING,
+        sqrt_price_x96=get_sqrt_ratio_at_tick(tick),
+        tick=tick,
+        liquidity=liquidity,
+        tick_bitmap={word: tick_bitmap[word] for word in words},
+        liquidity_net=dict(liquidity_net),
+    )
+
+
+MOCK_CREATOR = "0x9876543210987654321098765432109876543210"
+MOCK_TOKEN_A = "0x1111111111111111111111111111111111111111"
+MOCK_TOKEN_B = "0x2222222222222222222222222222222222222222"
+MOCK_TOKEN_POOL = "0x3333333333333333333333333333333333333333"
+MOCK_BONDING_CURVE = "0x4444444444444444444444444444444444444444"
+MOCK_OTHER_CURVE = "0x5555555555555555555555555555555555555555"
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def address_topic(address: str) -> str:
+    """Encode an address as an indexed event topic."""
+    return "0x" + address[2:].lower().rjust(64, "0")
+
+
+def token_created_log(
+    token: str,
+    name: str,
+    symbol: str,
+    block: int,
+    emitter: str | None = None,
+    bonding_curve: str = MOCK_BONDING_CURVE,
+) -> dict:
+    """Build a WowTokenCreated log emitted through the Base Sepolia factory."""
+    return {
+        "address": emitter or token,
+        "blockNumber": block,
+        "logIndex": 0,
+        "topics": [
+            WOW_TOKEN_CREATED_EVENT_TOPIC,
+            address_topic(WOW_FACTORY_CONTRACT_ADDRESSES["base-sepolia"]),
+            address_topic(MOCK_CREATOR),
+        ],
+        "data": "0x"
+        + encode(
+            [
+                "address",
+                "address",
+                "address",
+                "string",
+                "string",
+                "string",
+                "address",
+                "address",
+            ],
+            [
+                ZERO_ADDRESS,
+                ZERO_ADDRESS,
+                bonding_curve,
+                "ipfs://",
+                name,
+                symbol,
+                token,
+                MOCK_TOKEN_POOL,
+            ],
+        ).hex(),
+    }
+
+
+def graduated_log(token: str, block: int, emitter: str | None = None) -> dict:
+    """Build a WowMarketGraduated log."""
+    return {
+        "address": emitter or token,
+        "blockNumber": block,
+        "logIndex": 1,
+        "topics": [
+            WOW_MARKET_GRADUATED_EVENT_TOPIC,
+            address_topic(token),
+            address_topic(MOCK_TOKEN_POOL),
+        ],
+        "data": "0x" + encode(["uint256", "uint256", "uint256", "uint8"], [1, 1, 1, 1]).hex(),
+    }
+
+
+def make_token_index(path, **kwargs) -> WowTokenIndex:
+    """Create a token index scanning Base Sepolia from genesis up to the head."""
+    return WowTokenIndex(path, start_blocks={"84532": 0}, confirmations=0, **kwargs)
+
+
+def make_wallet_provider(
+    logs: list[dict], block_number: int, bonding_curves: dict[str, str] | None = None
+) -> Mock:
+    """Create a mock wallet provider on Base Sepolia serving logs by topic and block range.
+
+    Multicalls read the factory's bonding curve and every token's bonding curve, which
+    can be overridden per token, and pool.
+    """
+    wallet_provider = Mock(spec=EvmWalletProvider)
+    wallet_provider.get_network.return_value = Network(
+        protocol_family="evm", chain_id="84532", network_id="base-sepolia"
+    )
+    wallet_provider.get_block_number.return_value = block_number
+
+    def get_logs(filter_params):
+        topics = filter_params["topics"]
+        return [
+            log
+            for log in logs
+            if log["topics"][: len(topics)] == topics
+            and filter_params["fromBlock"] <= log["blockNumber"] <= filter_params["toBlock"]
+        ]
+
+    wallet_provider.get_logs.side_effect = get_logs
+
+    pool_address_selector = get_function_codec(WOW_ABI, "poolAddress").encode(())
+
+    def read_contract(contract_address, abi, function_name, args=None, block_identifier="latest"):
+        results = []
+        for target, _, call_data in args[0]:
+            if call_data == pool_address_selector:
+                value = MOCK_TOKEN_POOL
+            else:
+                value = (bonding_curves or {}).get(target, MOCK_BONDING_CURVE)
+            results.append((True, encode(["address"], [value])))
+        return results
+
+    wallet_provider.read_contract.side_effect = read_contract
+    return wallet_provider
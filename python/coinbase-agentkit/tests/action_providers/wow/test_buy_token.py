@@ -6,6 +6,7 @@ import pytest
 from pydantic_core import ValidationError
 
 from coinbase_agentkit.action_providers.wow.constants import WOW_ABI
+from coinbase_agentkit.action_providers.wow.quote_engine import WowQuote, WowQuoteEngine
 from coinbase_agentkit.action_providers.wow.schemas import WowBuyTokenSchema
 from coinbase_agentkit.action_providers.wow.wow_action_provider import WowActionProvider
 
@@ -61,13 +62,10 @@ def test_buy_token_success():
         patch("web3.Web3.to_checksum_address", side_effect=lambda x: x),
         patch("coinbase_agentkit.action_providers.wow.wow_action_provider.Web3") as mock_web3,
         patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_buy_quote",
-            return_value=MOCK_TOKEN_QUOTE,
-        ),
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_has_graduated",
-            return_value=False,
+        patch.object(
+            WowQuoteEngine,
+            "quote",
+            return_value=WowQuote(0, int(MOCK_TOKEN_QUOTE), has_graduated=False),
         ),
     ):
         mock_contract.return_value.encode_abi.return_value = "0xencoded"
@@ -126,13 +124,10 @@ def test_buy_token_graduated_pool():
         patch("web3.Web3.to_checksum_address", side_effect=lambda x: x),
         patch("coinbase_agentkit.action_providers.wow.wow_action_provider.Web3") as mock_web3,
         patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_buy_quote",
-            return_value=MOCK_TOKEN_QUOTE,
-        ),
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_has_graduated",
-            return_value=True,
+        patch.object(
+            WowQuoteEngine,
+            "quote",
+            return_value=WowQuote(0, int(MOCK_TOKEN_QUOTE), has_graduated=True),
         ),
     ):
         mock_contract.return_value.encode_abi.return_value = "0xencoded"
@@ -184,13 +179,10 @@ def test_buy_token_error():
         patch("web3.Web3.to_checksum_address", side_effect=lambda x: x),
         patch("coinbase_agentkit.action_providers.wow.wow_action_provider.Web3") as mock_web3,
         patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_buy_quote",
-            return_value=MOCK_TOKEN_QUOTE,
-        ),
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_has_graduated",
-            return_value=False,
+        patch.object(
+            WowQuoteEngine,
+            "quote",
+            return_value=WowQuote(0, int(MOCK_TOKEN_QUOTE), has_graduated=False),
         ),
     ):
         mock_contract.return_value.encode_abi.return_value = "0xencoded"
@@ -214,3 +206,20 @@ def test_buy_token_error():
             address=MOCK_CONTRACT_ADDRESS,
             abi=WOW_ABI,
         )
+
+
+def test_buy_token_invalid_address():
+    """Test that buy_token rejects an invalid contract address before quoting."""
+    with (
+        patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
+        patch.object(WowQuoteEngine, "quote") as mock_quote,
+    ):
+        provider = WowActionProvider()
+        response = provider.buy_token(
+            mock_wallet, {"contract_address": "0xinvalid", "amount_eth_in_wei": MOCK_AMOUNT_ETH}
+        )
+
+        assert response.startswith("Error buying Zora Wow ERC20 memecoin:")
+        assert "Invalid Ethereum address" in response
+        mock_quote.assert_not_called()
+        mock_wallet.send_transaction.assert_not_called()
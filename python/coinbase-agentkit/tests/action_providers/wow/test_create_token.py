@@ -8,6 +8,7 @@ from pydantic_core import ValidationError
 from coinbase_agentkit.action_providers.wow.constants import (
     GENERIC_TOKEN_METADATA_URI,
     WOW_FACTORY_ABI,
+    WOW_FACTORY_CONTRACT_ADDRESSES,
 )
 from coinbase_agentkit.action_providers.wow.schemas import WowCreateTokenSchema
 from coinbase_agentkit.action_providers.wow.utils import get_factory_address
@@ -190,3 +191,11 @@ def test_create_token_error():
             address=factory_address,
             abi=WOW_FACTORY_ABI,
         )
+
+
+def test_get_factory_address_by_chain_id():
+    """Test that string chain IDs resolve to the factory of their network."""
+    assert get_factory_address("8453") == WOW_FACTORY_CONTRACT_ADDRESSES["base-mainnet"]
+    assert get_factory_address("84532") == WOW_FACTORY_CONTRACT_ADDRESSES["base-sepolia"]
+    with pytest.raises(ValueError):
+        get_factory_address("1")
@@ -0,0 +1,175 @@
+"""Tests for Uniswap V3 pool state snapshots and swap simulation."""
+
+from fractions import Fraction
+from unittest.mock import Mock
+
+import pytest
+from eth_abi import encode
+
+from coinbase_agentkit.action_providers.wow.uniswap.pool_state import TickRangeError
+from coinbase_agentkit.action_providers.wow.uniswap.utils import get_pool_state
+from coinbase_agentkit.action_providers.wow.uniswap.v3_math import Q96, get_sqrt_ratio_at_tick
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+
+from .conftest import FEE, MOCK_POOL, POSITIONS, TICK_SPACING, TOKEN0, TOKEN1, make_pool_state
+
+
+def reference_amount_out(tick: int, amount_in: int, zero_for_one: bool) -> tuple[Fraction, int]:
+    """Compute a swap's output with exact rational arithmetic and no intermediate rounding."""
+    boundaries = sorted({t for lower, upper, _ in POSITIONS for t in (lower, upper)})
+    boundaries = (
+        [t for t in reversed(boundaries) if t <= tick]
+        if zero_for_one
+        else [t for t in boundaries if t > tick]
+    )
+
+    price = Fraction(get_sqrt_ratio_at_tick(tick), Q96)
+    remaining = Fraction(amount_in) * (1_000_000 - FEE) / 1_000_000
+    amount_out = Fraction(0)
+    for crossed, boundary in enumerate(boundaries):
+        inside = boundary - 1 if not zero_for_one else boundary
+        liquidity = sum(amount for lower, upper, amount in POSITIONS if lower <= inside < upper)
+        target = Fraction(get_sqrt_ratio_at_tick(boundary), Q96)
+
+        needed = (
+            liquidity * (1 / target - 1 / price) if zero_for_one else liquidity * (target - price)
+        )
+        if remaining < needed:
+            if zero_for_one:
+                after = 1 / (1 / price + remaining / liquidity)
+                return amount_out + liquidity * (price - after), crossed
+            after = price + remaining / liquidity
+            return amount_out + liquidity * (1 / price - 1 / after), crossed
+
+        amount_out += (
+            liquidity * (price - target) if zero_for_one else liquidity * (1 / price - 1 / target)
+        )
+        remaining -= needed
+        price = target
+
+    raise AssertionError("Swap ran out of liquidity")
+
+
+@pytest.mark.parametrize(
+    "tick,amount_in,zero_for_one",
+    [
+        (0, 10**18, True),
+        (0, 10**18, False),
+        (30, 5 * 10**19, True),
+        (30, 5 * 10**19, False),
+        (-700, 10**19, False),
+        (590, 3 * 10**19, True),
+    ],
+)
+def test_swap_matches_exact_arithmetic(tick, amount_in, zero_for_one):
+    """Test simulated swaps, including tick crossings, against unrounded swap math."""
+    expected_out, expected_crossed = reference_amount_out(tick, amount_in, zero_for_one)
+
+    result = make_pool_state(tick).swap(zero_for_one, amount_in)
+
+    assert result.amount_in == amount_in
+    assert result.initialized_ticks_crossed == expected_crossed
+    # The pool rounds every step in its own favor, by a few wei at most
+    assert expected_out - 10 <= result.amount_out <= expected_out
+
+
+def test_swap_crossing_ticks_updates_liquidity():
+    """Test that a swap through a tick boundary continues with that range's liquidity."""
+    state = make_pool_state(0)
+
+    result = state.swap(False, 5 * 10**19)
+
+    assert result.initialized_ticks_crossed == 1
+    assert result.tick_after >= 600
+    assert result.sqrt_price_x96_after > get_sqrt_ratio_at_tick(600)
+
+
+def test_swap_exact_output_round_trips_exact_input():
+    """Test that buying an exact input swap's output costs at most that input."""
+    state = make_pool_state(0)
+    exact_input = state.swap(True, 10**18)
+
+    exact_output = state.swap(True, -exact_input.amount_out)
+
+    assert exact_output.amount_out == exact_input.amount_out
+    assert exact_input.amount_in - 1 <= exact_output.amount_in <= exact_input.amount_in
+
+
+def test_quote_exact_input_selects_direction():
+    """Test that quotes sell the given token into the pool."""
+    state = make_pool_state(0)
+
+    assert state.quote_exact_input(TOKEN0, 10**18) == state.swap(True, 10**18)
+    assert state.quote_exact_input(TOKEN1.lower(), 10**18) == state.swap(False, 10**18)
+    with pytest.raises(ValueError, match="not in the pool"):
+        state.quote_exact_input(MOCK_POOL, 10**18)
+
+
+def test_swap_past_snapshot_raises():
+    """Test that a swap reaching a tick bitmap word that was not read is not guessed."""
+    state = make_pool_state(0, positions=[(-600, 600, 10**21)], words=[-1, 0])
+
+    assert state.swap(True, 10**18).amount_out > 0
+    with pytest.raises(TickRangeError):
+        state.swap(True, 10**24)
+
+
+def test_get_pool_state_reads_snapshot_at_one_block():
+    """Test that a snapshot is read with three multicalls pinned to the same block."""
+    initialized = [-600, 600]
+    wallet_provider = Mock(spec=EvmWalletProvider)
+    wallet_provider.get_block_number.return_value = 1234
+    wallet_provider.read_contract.side_effect = [
+        [
+            (True, encode(["address"], [TOKEN0])),
+            (True, encode(["address"], [TOKEN1])),
+            (True, encode(["uint24"], [FEE])),
+            (True, encode(["int24"], [TICK_SPACING])),
+            (True, encode(["uint128"], [10**21])),
+            (
+                True,
+                encode(
+                    ["uint160", "int24", "uint16", "uint16", "uint16", "uint8", "bool"],
+                    [Q96, 0, 0, 1, 1, 0, True],
+                ),
+            ),
+        ],
+        [
+            (True, encode(["uint256"], [0])),
+            (True, encode(["uint256"], [1 << 246])),
+            (True, encode(["uint256"], [1 << 10])),
+            (True, encode(["uint256"], [0])),
+            (True, encode(["uint256"], [0])),
+        ],
+        [
+            (
+                True,
+                encode(
+                    [
+                        "uint128",
+                        "int128",
+                        "uint256",
+                        "uint256",
+                        "int56",
+                        "uint160",
+                        "uint32",
+                        "bool",
+                    ],
+                    [10**21, liquidity_net, 0, 0, 0, 0, 0, True],
+                ),
+            )
+            for liquidity_net in (10**21, -(10**21))
+        ],
+    ]
+
+    state = get_pool_state(wallet_provider, MOCK_POOL)
+
+    assert state.block_number == 1234
+    assert state.tick_bitmap == {-2: 0, -1: 1 << 246, 0: 1 << 10, 1: 0, 2: 0}
+    assert state.liquidity_net == {initialized[0]: 10**21, initialized[1]: -(10**21)}
+    assert wallet_provider.read_contract.call_count == 3
+    for call in wallet_provider.read_contract.call_args_list:
+        assert call.kwargs["block_identifier"] == 1234
+    assert state.swap(True, 10**18) == make_pool_state(0, positions=[(-600, 600, 10**21)]).swap(
+        True, 10**18
+    )
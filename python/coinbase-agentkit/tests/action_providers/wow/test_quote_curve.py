@@ -0,0 +1,197 @@
+"""Tests for WOW quote curve action."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from eth_abi import encode
+from pydantic_core import ValidationError
+
+from coinbase_agentkit.action_providers.wow.quote_engine import WowQuoteEngine, sample_amounts
+from coinbase_agentkit.action_providers.wow.schemas import WowQuoteCurveSchema
+from coinbase_agentkit.action_providers.wow.wow_action_provider import WowActionProvider
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+
+from .conftest import MOCK_POOL, TOKEN1, make_pool_state
+
+MOCK_CONTRACT_ADDRESS = "0x1234567890123456789012345678901234567890"
+MOCK_BLOCK_NUMBER = 1234
+
+
+@pytest.fixture
+def wallet_provider():
+    """Create a mock wallet provider on Base Sepolia."""
+    mock = Mock(spec=EvmWalletProvider)
+    mock.get_network.return_value = Network(
+        protocol_family="evm", chain_id="84532", network_id="base-sepolia"
+    )
+    mock.get_block_number.return_value = MOCK_BLOCK_NUMBER
+    return mock
+
+
+def market_response(market_type: int) -> list[tuple[bool, bytes]]:
+    """Build the multicall response of a market type and pool address read."""
+    return [(True, encode(["uint8"], [market_type])), (True, encode(["address"], [MOCK_POOL]))]
+
+
+def curve_response(amounts_out: list[int | None]) -> list[tuple[bool, bytes]]:
+    """Build the multicall response of a bonding curve quotes read."""
+    return [
+        (False, b"") if amount_out is None else (True, encode(["uint256"], [amount_out]))
+        for amount_out in amounts_out
+    ]
+
+
+def test_quote_curve_input_model_valid():
+    """Test that WowQuoteCurveSchema accepts valid parameters and defaults points."""
+    input_model = WowQuoteCurveSchema(
+        contract_address=MOCK_CONTRACT_ADDRESS, side="buy", max_amount_in_wei="1000"
+    )
+
+    assert input_model.points == 10
+
+
+def test_quote_curve_input_model_invalid():
+    """Test that WowQuoteCurveSchema rejects invalid sides and point counts."""
+    with pytest.raises(ValidationError):
+        WowQuoteCurveSchema(
+            contract_address=MOCK_CONTRACT_ADDRESS, side="swap", max_amount_in_wei="1000"
+        )
+    with pytest.raises(ValidationError):
+        WowQuoteCurveSchema(
+            contract_address=MOCK_CONTRACT_ADDRESS,
+            side="buy",
+            max_amount_in_wei="1000",
+            points=1,
+        )
+
+
+def test_sample_amounts():
+    """Test that sampled amounts double up to the maximum and skip zero."""
+    assert sample_amounts(1000, 4) == [125, 250, 500, 1000]
+    assert sample_amounts(3, 5) == [1, 3]
+
+
+def test_quote_curve_reads_all_amounts_in_one_request(wallet_provider):
+    """Test that a bonding curve is sampled in one multicall and cached for the block."""
+    wallet_provider.read_contract.side_effect = [
+        market_response(0),
+        curve_response([1000, 1900, 3400]),
+    ]
+    engine = WowQuoteEngine()
+
+    curve = engine.quote_curve(wallet_provider, MOCK_CONTRACT_ADDRESS, [10, 20, 40], "buy")
+    cached = engine.quote_curve(wallet_provider, MOCK_CONTRACT_ADDRESS, [10, 20, 40], "buy")
+
+    assert cached is curve
+    assert not curve.has_graduated
+    assert curve.block_number == MOCK_BLOCK_NUMBER
+    assert [point.amount_out for point in curve.points] == [1000, 1900, 3400]
+    assert [point.price_impact for point in curve.points] == pytest.approx([0.0, 0.05, 0.15])
+    assert wallet_provider.read_contract.call_count == 2
+    assert {
+        call.kwargs["block_identifier"] for call in wallet_provider.read_contract.call_args_list
+    } == {MOCK_BLOCK_NUMBER}
+    assert len(wallet_provider.read_contract.call_args.kwargs["args"][0]) == 3
+
+
+def test_quote_curve_graduated_token_simulates_pool(wallet_provider):
+    """Test that a graduated token's curve is simulated over its pool state at the block."""
+    pool_state = make_pool_state(0)
+    amounts = [10**15, 10**16, 10**17]
+    wallet_provider.read_contract.side_effect = [
+        market_response(1),
+        [(True, encode(["uint24"], [pool_state.fee]))],
+    ]
+    engine = WowQuoteEngine()
+
+    with patch(
+        "coinbase_agentkit.action_providers.wow.quote_engine.get_pool_state",
+        return_value=pool_state,
+    ) as mock_get_pool_state:
+        curve = engine.quote_curve(wallet_provider, TOKEN1, amounts, "sell")
+        # The pool state read for the curve is reused by quotes on the same block
+        quote = engine.quote(wallet_provider, TOKEN1, amounts[0], "sell")
+
+    assert curve.has_graduated
+    assert [point.amount_out for point in curve.points] == [
+        pool_state.quote_exact_input(TOKEN1, amount).amount_out for amount in amounts
+    ]
+    assert quote.amount_out == curve.points[0].amount_out
+    assert curve.points[-1].price_impact > curve.points[1].price_impact > 0
+    mock_get_pool_state.assert_called_once_with(wallet_provider, MOCK_POOL, MOCK_BLOCK_NUMBER)
+    # No bonding curve quotes are read for a graduated token
+    assert wallet_provider.read_contract.call_count == 2
+
+
+def test_quote_curve_known_graduated_token_skips_market_read(wallet_provider):
+    """Test that a token known to have graduated is quoted without reading its market."""
+    pool_state = make_pool_state(0, positions=[(-600, 600, 10**21)], words=[-1, 0])
+    amounts = [10**15, 10**24]
+    quoter_result = (True, encode(["uint256", "uint160", "uint32", "uint256"], [7000, 1, 1, 1]))
+    wallet_provider.read_contract.side_effect = [
+        market_response(1),
+        [(True, encode(["uint24"], [pool_state.fee]))],
+        [quoter_result],
+    ]
+    engine = WowQuoteEngine()
+
+    with patch(
+        "coinbase_agentkit.action_providers.wow.quote_engine.get_pool_state",
+        return_value=pool_state,
+    ):
+        engine.quote_curve(wallet_provider, TOKEN1, amounts[:1], "sell")
+        curve = engine.quote_curve(wallet_provider, TOKEN1, amounts, "sell")
+
+    # The amount leaving the snapshot is quoted by the quoter at the curve's block
+    assert curve.points[1].amount_out == 7000
+    assert wallet_provider.read_contract.call_count == 3
+    quoter_call = wallet_provider.read_contract.call_args
+    assert quoter_call.kwargs["block_identifier"] == MOCK_BLOCK_NUMBER
+    assert len(quoter_call.kwargs["args"][0]) == 1
+
+
+def test_quote_curve_action(wallet_provider):
+    """Test that the action reports a price-impact table with reverted amounts marked."""
+    wallet_provider.read_contract.side_effect = [
+        market_response(0),
+        curve_response([500, 900, None]),
+    ]
+
+    response = WowActionProvider().quote_curve(
+        wallet_provider,
+        {
+            "contract_address": MOCK_CONTRACT_ADDRESS,
+            "side": "sell",
+            "max_amount_in_wei": "400",
+            "points": 3,
+        },
+    )
+
+    assert response == (
+        f"Quotes for selling {MOCK_CONTRACT_ADDRESS} on the bonding curve "
+        f"at block {MOCK_BLOCK_NUMBER}:\n"
+        "amount in (wei) | amount out (wei) | out per in | price impact\n"
+        "100 | 500 | 5 | 0.00%\n"
+        "200 | 900 | 4.5 | 10.00%\n"
+        "400 | reverted | - | -"
+    )
+
+
+def test_quote_curve_action_error(wallet_provider):
+    """Test that the action reports an error when no amount can be quoted."""
+    wallet_provider.read_contract.side_effect = [market_response(0), curve_response([None, None])]
+
+    response = WowActionProvider().quote_curve(
+        wallet_provider,
+        {
+            "contract_address": MOCK_CONTRACT_ADDRESS,
+            "side": "buy",
+            "max_amount_in_wei": "2",
+            "points": 2,
+        },
+    )
+
+    assert response == (
+        "Error quoting Zora Wow ERC20 memecoin: Failed fetching quote for every amount"
+    )
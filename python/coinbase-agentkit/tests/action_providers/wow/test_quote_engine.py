@@ -0,0 +1,160 @@
+"""Tests for the WOW quote engine."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from eth_abi import encode
+
+from coinbase_agentkit.action_providers.wow.quote_engine import WowQuoteEngine
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+
+from .conftest import TOKEN1, make_pool_state
+
+MOCK_TOKEN = "0x1234567890123456789012345678901234567890"
+MOCK_POOL = "0x9876543210987654321098765432109876543210"
+MOCK_AMOUNT = 10**15
+
+
+@pytest.fixture
+def wallet_provider():
+    """Create a mock wallet provider on Base Sepolia."""
+    mock = Mock(spec=EvmWalletProvider)
+    mock.get_network.return_value = Network(
+        protocol_family="evm", chain_id="84532", network_id="base-sepolia"
+    )
+    return mock
+
+
+def test_quote_on_bonding_curve_uses_one_request(wallet_provider):
+    """Test that a token on its bonding curve is quoted with a single multicall."""
+    wallet_provider.read_contract.return_value = [
+        (True, encode(["uint8"], [0])),
+        (True, encode(["address"], [MOCK_POOL])),
+        (True, encode(["uint256"], [5000])),
+    ]
+
+    quote = WowQuoteEngine().quote(wallet_provider, MOCK_TOKEN, MOCK_AMOUNT, "buy")
+
+    assert quote.amount_out == 5000
+    assert not quote.has_graduated
+    wallet_provider.read_contract.assert_called_once()
+    calls = wallet_provider.read_contract.call_args.kwargs["args"][0]
+    assert len(calls) == 3
+
+
+def test_quote_graduated_token_caches_pool(wallet_provider):
+    """Test that a graduated token's pool is read once and later quotes take one request."""
+    quoter_result = (True, encode(["uint256", "uint160", "uint32", "uint256"], [7000, 1, 1, 1]))
+    wallet_provider.read_contract.side_effect = [
+        [
+            (True, encode(["uint8"], [1])),
+            (True, encode(["address"], [MOCK_POOL])),
+            (False, b""),
+        ],
+        [(True, encode(["uint24"], [10000]))],
+        [quoter_result, (False, b"")],
+        [quoter_result, (False, b"")],
+    ]
+    engine = WowQuoteEngine(local_uniswap_quotes=False)
+
+    first = engine.quote(wallet_provider, MOCK_TOKEN, MOCK_AMOUNT, "sell")
+    second = engine.quote(wallet_provider, MOCK_TOKEN, MOCK_AMOUNT, "sell")
+
+    assert first.amount_out == second.amount_out == 7000
+    assert first.has_graduated and second.has_graduated
+    assert wallet_provider.read_contract.call_count == 4
+
+    quoter_call = wallet_provider.read_contract.call_args.kwargs["args"][0][0]
+    assert quoter_call[0] == "0xC5290058841028F1614F3A6F0F5816cAd0df5E27"
+
+
+def test_quote_falls_back_to_bonding_curve(wallet_provider):
+    """Test that a failed Uniswap quote falls back to the bonding curve quote."""
+    engine = WowQuoteEngine(local_uniswap_quotes=False)
+    wallet_provider.read_contract.side_effect = [
+        [
+            (True, encode(["uint8"], [1])),
+            (True, encode(["address"], [MOCK_POOL])),
+            (True, encode(["uint256"], [1])),
+        ],
+        [(True, encode(["uint24"], [10000]))],
+        [(False, b""), (True, encode(["uint256"], [4200]))],
+    ]
+
+    quote = engine.quote(wallet_provider, MOCK_TOKEN, MOCK_AMOUNT, "buy")
+
+    assert quote.amount_out == 4200
+
+
+def test_quote_graduated_token_locally_on_same_block(wallet_provider):
+    """Test that graduated quotes are simulated over pool state read once per block."""
+    pool_state = make_pool_state(0)
+    wallet_provider.get_block_number.return_value = 1234
+    wallet_provider.read_contract.side_effect = [
+        [
+            (True, encode(["uint8"], [1])),
+            (True, encode(["address"], [MOCK_POOL])),
+            (False, b""),
+        ],
+        [(True, encode(["uint24"], [pool_state.fee]))],
+    ]
+    engine = WowQuoteEngine()
+
+    with patch(
+        "coinbase_agentkit.action_providers.wow.quote_engine.get_pool_state",
+        return_value=pool_state,
+    ) as mock_get_pool_state:
+        first = engine.quote(wallet_provider, TOKEN1, MOCK_AMOUNT, "sell")
+        second = engine.quote(wallet_provider, TOKEN1, 2 * MOCK_AMOUNT, "sell")
+
+    assert first.has_graduated and second.has_graduated
+    assert first.amount_out == pool_state.quote_exact_input(TOKEN1, MOCK_AMOUNT).amount_out
+    assert second.amount_out == pool_state.quote_exact_input(TOKEN1, 2 * MOCK_AMOUNT).amount_out
+    mock_get_pool_state.assert_called_once_with(wallet_provider, MOCK_POOL, 1234)
+    assert wallet_provider.read_contract.call_count == 2
+    wallet_provider.get_block_number.assert_called_once()
+
+
+def test_quote_falls_back_to_quoter_outside_snapshot(wallet_provider):
+    """Test that the quoter is used when a swap leaves the ticks in the pool state snapshot."""
+    pool_state = make_pool_state(0, positions=[(-600, 600, 10**21)], words=[-1, 0])
+    quoter_result = (True, encode(["uint256", "uint160", "uint32", "uint256"], [7000, 1, 1, 1]))
+    wallet_provider.get_block_number.return_value = 1234
+    wallet_provider.read_contract.side_effect = [
+        [
+            (True, encode(["uint8"], [1])),
+            (True, encode(["address"], [MOCK_POOL])),
+            (False, b""),
+        ],
+        [(True, encode(["uint24"], [pool_state.fee]))],
+        [quoter_result, (False, b"")],
+    ]
+
+    with patch(
+        "coinbase_agentkit.action_providers.wow.quote_engine.get_pool_state",
+        return_value=pool_state,
+    ):
+        quote = WowQuoteEngine().quote(wallet_provider, TOKEN1, 10**24, "sell")
+
+    assert quote.amount_out == 7000
+
+
+def test_quote_raises_when_no_quote_available(wallet_provider):
+    """Test that a quote fails when the bonding curve quote reverts."""
+    wallet_provider.read_contract.return_value = [
+        (True, encode(["uint8"], [0])),
+        (True, encode(["address"], [MOCK_POOL])),
+        (False, b""),
+    ]
+
+    with pytest.raises(Exception, match="Failed fetching quote"):
+        WowQuoteEngine().quote(wallet_provider, MOCK_TOKEN, MOCK_AMOUNT, "buy")
+
+
+def test_quote_unsupported_network(wallet_provider):
+    """Test that quotes on chains without WOW are rejected."""
+    wallet_provider.get_network.return_value = Network(protocol_family="evm", chain_id="1")
+
+    with pytest.raises(ValueError, match="Unsupported network"):
+        WowQuoteEngine().quote(wallet_provider, MOCK_TOKEN, MOCK_AMOUNT, "buy")
@@ -0,0 +1,66 @@
+"""Tests for WOW search tokens action."""
+
+from unittest.mock import patch
+
+from coinbase_agentkit.action_providers.wow.wow_action_provider import WowActionProvider
+
+from .conftest import MOCK_TOKEN_A, make_token_index, make_wallet_provider, token_created_log
+
+
+def test_search_tokens_answers_from_index(tmp_path):
+    """Test that searches are answered from the local index without RPC calls."""
+    token_index = make_token_index(tmp_path / "wow_tokens.sqlite")
+    token_index.sync(
+        make_wallet_provider([token_created_log(MOCK_TOKEN_A, "Alpha Coin", "ALPHA", 10)], 100)
+    )
+    wallet_provider = make_wallet_provider([], 100)
+    provider = WowActionProvider(token_index=token_index)
+
+    with patch.object(token_index, "sync_in_background") as mock_sync:
+        response = provider.search_tokens(wallet_provider, {"query": "ALPHA"})
+
+    assert response.startswith("Found 1 WOW tokens matching 'ALPHA' (indexed through block 100):")
+    assert f"ALPHA | Alpha Coin | {MOCK_TOKEN_A}" in response
+    assert response.endswith("| bonding curve")
+    mock_sync.assert_called_once_with(wallet_provider)
+    wallet_provider.get_logs.assert_not_called()
+    wallet_provider.read_contract.assert_not_called()
+
+
+def test_search_tokens_before_first_sync(tmp_path):
+    """Test that the first search starts building the index in the background."""
+    provider = WowActionProvider(token_index=make_token_index(tmp_path / "wow_tokens.sqlite"))
+
+    with patch.object(provider.token_index, "sync_in_background") as mock_sync:
+        response = provider.search_tokens(make_wallet_provider([], 100), {"query": "ALPHA"})
+
+    assert "being built" in response
+    mock_sync.assert_called_once()
+
+
+def test_search_tokens_no_match(tmp_path):
+    """Test that a search without matches reports the indexed block."""
+    token_index = make_token_index(tmp_path / "wow_tokens.sqlite")
+    token_index.sync(make_wallet_provider([], 100))
+
+    response = WowActionProvider(token_index=token_index).search_tokens(
+        make_wallet_provider([], 100), {"query": "NOPE"}
+    )
+
+    assert response == "No WOW tokens found matching 'NOPE' (indexed through block 100)."
+
+
+def test_search_tokens_validates_args(tmp_path):
+    """Test that empty queries and out of range limits are rejected before searching."""
+    provider = WowActionProvider(token_index=make_token_index(tmp_path / "wow_tokens.sqlite"))
+
+    with (
+        patch.object(provider.token_index, "sync_in_background") as mock_sync,
+        patch.object(provider.token_index, "search") as mock_search,
+    ):
+        for args in ({"query": ""}, {"query": "ALPHA", "limit": -1}, {"query": "A", "limit": 51}):
+            response = provider.search_tokens(make_wallet_provider([], 100), args)
+            assert response.startswith("Error searching Zora Wow ERC20 memecoins:")
+
+    mock_sync.assert_not_called()
+    mock_search.assert_not_called()
@@ -6,6 +6,7 @@ import pytest
 from pydantic_core import ValidationError
 
 from coinbase_agentkit.action_providers.wow.constants import WOW_ABI
+from coinbase_agentkit.action_providers.wow.quote_engine import WowQuote, WowQuoteEngine
 from coinbase_agentkit.action_providers.wow.schemas import WowSellTokenSchema
 from coinbase_agentkit.action_providers.wow.wow_action_provider import WowActionProvider
 
@@ -61,13 +62,10 @@ def test_sell_token_success():
         patch("web3.Web3.to_checksum_address", side_effect=lambda x: x),
         patch("coinbase_agentkit.action_providers.wow.wow_action_provider.Web3") as mock_web3,
         patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_sell_quote",
-            return_value=MOCK_ETH_QUOTE,
-        ),
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_has_graduated",
-            return_value=False,
+        patch.object(
+            WowQuoteEngine,
+            "quote",
+            return_value=WowQuote(0, int(MOCK_ETH_QUOTE), has_graduated=False),
         ),
     ):
         mock_contract.return_value.encode_abi.return_value = "0xencoded"
@@ -125,13 +123,10 @@ def test_sell_token_graduated_pool():
         patch("web3.Web3.to_checksum_address", side_effect=lambda x: x),
         patch("coinbase_agentkit.action_providers.wow.wow_action_provider.Web3") as mock_web3,
         patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_sell_quote",
-            return_value=MOCK_ETH_QUOTE,
-        ),
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_has_graduated",
-            return_value=True,
+        patch.object(
+            WowQuoteEngine,
+            "quote",
+            return_value=WowQuote(0, int(MOCK_ETH_QUOTE), has_graduated=True),
         ),
     ):
         mock_contract.return_value.encode_abi.return_value = "0xencoded"
@@ -182,13 +177,10 @@ def test_sell_token_error():
         patch("web3.Web3.to_checksum_address", side_effect=lambda x: x),
         patch("coinbase_agentkit.action_providers.wow.wow_action_provider.Web3") as mock_web3,
         patch("coinbase_agentkit.wallet_providers.EvmWalletProvider") as mock_wallet,
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_sell_quote",
-            return_value=MOCK_ETH_QUOTE,
-        ),
-        patch(
-            "coinbase_agentkit.action_providers.wow.wow_action_provider.get_has_graduated",
-            return_value=False,
+        patch.object(
+            WowQuoteEngine,
+            "quote",
+            return_value=WowQuote(0, int(MOCK_ETH_QUOTE), has_graduated=False),
         ),
     ):
         mock_contract.return_value.encode_abi.return_value = "0xencoded"
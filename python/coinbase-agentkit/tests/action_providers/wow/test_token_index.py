@@ -0,0 +1,250 @@
+"""Tests for the WOW token index."""
+
+import pytest
+from eth_abi import encode
+
+from coinbase_agentkit.action_providers.wow.constants import WOW_FACTORY_CONTRACT_ADDRESSES
+from coinbase_agentkit.action_providers.wow.token_index import WowTokenIndex
+from coinbase_agentkit.network import Network
+
+from .conftest import (
+    MOCK_BONDING_CURVE,
+    MOCK_CREATOR,
+    MOCK_OTHER_CURVE,
+    MOCK_TOKEN_A,
+    MOCK_TOKEN_B,
+    MOCK_TOKEN_POOL,
+    graduated_log,
+    make_token_index,
+    make_wallet_provider,
+    token_created_log,
+)
+
+
+@pytest.fixture
+def token_index(tmp_path):
+    """Create a token index in a temporary sqlite file."""
+    return make_token_index(tmp_path / "wow_tokens.sqlite", chunk_size=100)
+
+
+def test_sync_indexes_created_and_graduated_tokens(token_index):
+    """Test that creation and graduation events are indexed and searchable."""
+    wallet_provider = make_wallet_provider(
+        [
+            token_created_log(MOCK_TOKEN_A, "Alpha Coin", "ALPHA", 10),
+            token_created_log(MOCK_TOKEN_B, "Beta Coin", "BETA", 150),
+            graduated_log(MOCK_TOKEN_A, 180),
+        ],
+        block_number=250,
+    )
+
+    assert token_index.sync(wallet_provider) == 250
+
+    (alpha,) = token_index.search("84532", "alpha")
+    assert alpha.address == MOCK_TOKEN_A
+    assert alpha.creator == MOCK_CREATOR
+    assert alpha.pool_address == MOCK_TOKEN_POOL
+    assert alpha.graduated
+    assert [token.symbol for token in token_index.search("84532", "coin")] == ["BETA", "ALPHA"]
+    assert token_index.search("84532", "0x2222")[0].symbol == "BETA"
+    assert token_index.search("8453", "alpha") == []
+    assert token_index.last_block("84532") == 250
+
+
+def test_sync_resumes_from_cursor(tmp_path):
+    """Test that a new index on the same database only scans blocks after the cursor."""
+    logs = [token_created_log(MOCK_TOKEN_A, "Alpha Coin", "ALPHA", 10)]
+    make_token_index(tmp_path / "wow_tokens.sqlite").sync(make_wallet_provider(logs, 100))
+
+    wallet_provider = make_wallet_provider(
+        [*logs, token_created_log(MOCK_TOKEN_B, "Beta Coin", "BETA", 120)], 130
+    )
+    make_token_index(tmp_path / "wow_tokens.sqlite").sync(wallet_provider)
+
+    from_blocks = {call.args[0]["fromBlock"] for call in wallet_provider.get_logs.call_args_list}
+    assert from_blocks == {101}
+    assert len(make_token_index(tmp_path / "wow_tokens.sqlite").search("84532", "coin")) == 2
+
+
+def test_search_ranks_exact_symbol_first(token_index):
+    """Test that an exact symbol match outranks newer partial matches."""
+    token_index.sync(
+        make_wallet_provider(
+            [
+                token_created_log(MOCK_TOKEN_A, "Wow", "WOW", 10),
+                token_created_log(MOCK_TOKEN_B, "Wowzers", "WOWZ", 20),
+            ],
+            block_number=50,
+        )
+    )
+
+    assert [token.symbol for token in token_index.search("84532", "$wow")] == ["WOW", "WOWZ"]
+    assert token_index.search("84532", "%") == []
+
+
+def test_sync_unsupported_network(token_index):
+    """Test that syncing a chain without WOW is rejected."""
+    wallet_provider = make_wallet_provider([], 10)
+    wallet_provider.get_network.return_value = Network(protocol_family="evm", chain_id="1")
+
+    with pytest.raises(ValueError, match="Unsupported network"):
+        token_index.sync(wallet_provider)
+
+
+def test_sync_ignores_forged_tokens(token_index):
+    """Test that tokens not emitted by themselves or not using the factory are skipped."""
+    wallet_provider = make_wallet_provider(
+        [
+            token_created_log(MOCK_TOKEN_A, "Alpha Coin", "ALPHA", 10, emitter=MOCK_CREATOR),
+            token_created_log(MOCK_TOKEN_B, "Beta Coin", "BETA", 20),
+        ],
+        block_number=50,
+        bonding_curves={MOCK_TOKEN_B: MOCK_CREATOR},
+    )
+
+    token_index.sync(wallet_provider)
+
+    assert token_index.search("84532", "coin") == []
+
+
+def _with_factory_curve_history(wallet_provider, curve_before: str, replaced_at: int):
+    """Serve the factory's bonding curve as it was before being replaced at a block."""
+    read_contract = wallet_provider.read_contract.side_effect
+    factory_address = WOW_FACTORY_CONTRACT_ADDRESSES["base-sepolia"]
+
+    def read_contract_at(
+        contract_address, abi, function_name, args=None, block_identifier="latest"
+    ):
+        results = read_contract(contract_address, abi, function_name, args, block_identifier)
+        if block_identifier == "latest" or block_identifier >= replaced_at:
+            return results
+        return [
+            (True, encode(["address"], [curve_before])) if target == factory_address else result
+            for (target, _, _), result in zip(args[0], results, strict=True)
+        ]
+
+    wallet_provider.read_contract.side_effect = read_contract_at
+
+
+def test_sync_keeps_tokens_created_under_a_replaced_bonding_curve(token_index):
+    """Test that tokens using an earlier factory bonding curve stay indexed."""
+    wallet_provider = make_wallet_provider(
+        [
+            token_created_log(
+                MOCK_TOKEN_A, "Alpha Coin", "ALPHA", 10, bonding_curve=MOCK_OTHER_CURVE
+            ),
+            token_created_log(MOCK_TOKEN_B, "Beta Coin", "BETA", 30),
+        ],
+        block_number=50,
+        bonding_curves={MOCK_TOKEN_A: MOCK_OTHER_CURVE},
+    )
+    _with_factory_curve_history(wallet_provider, MOCK_OTHER_CURVE, replaced_at=20)
+
+    token_index.sync(wallet_provider)
+
+    assert {token.symbol for token in token_index.search("84532", "coin")} == {"ALPHA", "BETA"}
+
+
+def test_sync_remembers_bonding_curves_the_factory_used(tmp_path):
+    """Test that a curve seen on the factory is accepted after the factory replaces it."""
+    path = tmp_path / "wow_tokens.sqlite"
+    make_token_index(path).sync(
+        make_wallet_provider(
+            [token_created_log(MOCK_TOKEN_A, "Alpha Coin", "ALPHA", 10)], block_number=15
+        )
+    )
+
+    # The factory now reports a new curve and old state cannot be read
+    wallet_provider = make_wallet_provider(
+        [token_created_log(MOCK_TOKEN_B, "Beta Coin", "BETA", 20)],
+        block_number=50,
+        bonding_curves={WOW_FACTORY_CONTRACT_ADDRESSES["base-sepolia"]: MOCK_OTHER_CURVE},
+    )
+
+    make_token_index(path).sync(wallet_provider)
+
+    assert {token.symbol for token in make_token_index(path).search("84532", "coin")} == {
+        "ALPHA",
+        "BETA",
+    }
+
+
+def test_sync_skips_unknown_curves_that_the_factory_never_used(token_index):
+    """Test that a token with a curve the factory did not have at its creation is skipped."""
+    wallet_provider = make_wallet_provider(
+        [
+            token_created_log(
+                MOCK_TOKEN_A, "Alpha Coin", "ALPHA", 10, bonding_curve=MOCK_OTHER_CURVE
+            )
+        ],
+        block_number=50,
+        bonding_curves={MOCK_TOKEN_A: MOCK_OTHER_CURVE},
+    )
+
+    token_index.sync(wallet_provider)
+
+    assert token_index.search("84532", "coin") == []
+
+
+def test_sync_ignores_graduations_not_emitted_by_token(token_index):
+    """Test that only a token's own WowMarketGraduated log marks it graduated."""
+    token_index.sync(
+        make_wallet_provider(
+            [
+                token_created_log(MOCK_TOKEN_A, "Alpha Coin", "ALPHA", 10),
+                graduated_log(MOCK_TOKEN_A, 20, emitter=MOCK_TOKEN_B),
+            ],
+            block_number=50,
+        )
+    )
+
+    (alpha,) = token_index.search("84532", "alpha")
+    assert not alpha.graduated
+
+
+def test_sync_starts_at_factory_deployment_and_stays_behind_head(tmp_path):
+    """Test that scans start at the factory deployment and stop before unconfirmed blocks."""
+    wallet_provider = make_wallet_provider([], 3_000_100)
+    wallet_provider.call.side_effect = lambda tx, block: (
+        encode(["address"], [MOCK_BONDING_CURVE]) if block >= 2_999_950 else b""
+    )
+    token_index = WowTokenIndex(tmp_path / "wow_tokens.sqlite", confirmations=12)
+
+    assert token_index.sync(wallet_provider) == 3_000_088
+
+    (filter_params, *_) = (call.args[0] for call in wallet_provider.get_logs.call_args_list)
+    assert filter_params["fromBlock"] == 2_999_950
+    assert filter_params["toBlock"] == 3_000_088
+    assert token_index.last_block("84532") == 3_000_088
+
+
+def test_sync_without_archive_state_scans_from_genesis(tmp_path):
+    """Test that the first scan starts at block 0 when old factory state cannot be read."""
+    wallet_provider = make_wallet_provider([], 1_000)
+
+    def call(tx, block):
+        if block < 988:
+            raise ValueError({"code": -32000, "message": "header not found"})
+        return encode(["address"], [MOCK_BONDING_CURVE])
+
+    wallet_provider.call.side_effect = call
+    token_index = WowTokenIndex(tmp_path / "wow_tokens.sqlite", chunk_size=10_000, confirmations=12)
+
+    assert token_index.sync(wallet_provider) == 988
+
+    (filter_params, *_) = (call.args[0] for call in wallet_provider.get_logs.call_args_list)
+    assert filter_params["fromBlock"] == 0
+
+
+def test_sync_verifies_tokens_at_latest_block(token_index):
+    """Test that tokens are verified against the latest state, which needs no archive node."""
+    wallet_provider = make_wallet_provider(
+        [token_created_log(MOCK_TOKEN_A, "Alpha", "ALPHA", 10)], 200
+    )
+
+    token_index.sync(wallet_provider)
+
+    assert {
+        call.kwargs.get("block_identifier", "latest")
+        for call in wallet_provider.read_contract.call_args_list
+    } == {"latest"}
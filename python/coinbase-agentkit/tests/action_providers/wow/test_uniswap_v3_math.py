@@ -0,0 +1,114 @@
+"""Tests for the Uniswap V3 swap math port.
+
+Expected values are the reference vectors of the v3-core TickMath and SwapMath tests,
+so they were produced by the Solidity libraries the port must match bit for bit.
+"""
+
+import math
+
+import pytest
+
+from coinbase_agentkit.action_providers.wow.uniswap.v3_math import (
+    MAX_SQRT_RATIO,
+    MAX_TICK,
+    MIN_SQRT_RATIO,
+    MIN_TICK,
+    Q96,
+    compute_swap_step,
+    get_sqrt_ratio_at_tick,
+    get_tick_at_sqrt_ratio,
+)
+
+# (sqrt price, target sqrt price, liquidity, amount remaining, fee pips) ->
+# (sqrt price after, amount in, amount out, fee amount)
+SWAP_STEP_VECTORS = [
+    # exact amount in that gets capped at the price target, one for zero
+    (
+        (79228162514264337593543950336, 79623317895830914510639640423, 2 * 10**18, 10**18, 600),
+        (79623317895830914510639640423, 9975124224178055, 9925619580021728, 5988667735148),
+    ),
+    # exact amount in that is fully spent, one for zero
+    (
+        (79228162514264337593543950336, 250541448375047931186413801569, 2 * 10**18, 10**18, 600),
+        (118818475322642227089037862318, 999400000000000000, 666399946655997866, 600000000000000),
+    ),
+    # exact amount out that gets capped at the price target, one for zero
+    (
+        (79228162514264337593543950336, 79623317895830914510639640423, 2 * 10**18, -(10**18), 600),
+        (79623317895830914510639640423, 9975124224178055, 9925619580021728, 5988667735148),
+    ),
+    # amount out is capped at the desired amount out
+    (
+        (
+            417332158212080721273783715441582,
+            1452870262520218020823638996,
+            159344665391607089467575320103,
+            -1,
+            1,
+        ),
+        (417332158212080721273783715441581, 1, 1, 1),
+    ),
+    # entire input amount taken as fee
+    (
+        (2413, 79887613182836312, 1985041575832132834610021537970, 10, 1872),
+        (2413, 0, 0, 10),
+    ),
+    # intermediate insufficient liquidity in zero for one exact output case
+    (
+        (
+            20282409603651670423947251286016,
+            22310650564016837466341976414617,
+            1024,
+            -4,
+            3000,
+        ),
+        (22310650564016837466341976414617, 26215, 0, 79),
+    ),
+    # intermediate insufficient liquidity in one for zero exact output case
+    (
+        (
+            20282409603651670423947251286016,
+            18254168643286503381552526157414,
+            1024,
+            -263000,
+            3000,
+        ),
+        (18254168643286503381552526157414, 1, 26214, 1),
+    ),
+]
+
+
+def test_sqrt_ratio_at_tick_bounds():
+    """Test the sqrt price at the minimum, maximum and zero ticks."""
+    assert get_sqrt_ratio_at_tick(MIN_TICK) == MIN_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(MAX_TICK) == MAX_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(0) == Q96
+
+    with pytest.raises(ValueError, match="out of range"):
+        get_sqrt_ratio_at_tick(MAX_TICK + 1)
+
+
+@pytest.mark.parametrize(
+    "tick", [1 << bit for bit in range(20)] + [-(1 << bit) for bit in range(20)]
+)
+def test_sqrt_ratio_at_tick_matches_price(tick):
+    """Test that every tick bit multiplier yields sqrt(1.0001^tick) * 2^96."""
+    expected = math.exp(tick * math.log(1.0001) / 2) * Q96
+
+    assert get_sqrt_ratio_at_tick(tick) == pytest.approx(expected, rel=1e-9)
+
+
+@pytest.mark.parametrize("tick", [MIN_TICK, -60000, -1, 0, 1, 12345, MAX_TICK - 1])
+def test_tick_at_sqrt_ratio_round_trips(tick):
+    """Test that a tick's sqrt price and the sqrt price just below it map to the right ticks."""
+    sqrt_price_x96 = get_sqrt_ratio_at_tick(tick)
+
+    assert get_tick_at_sqrt_ratio(sqrt_price_x96) == tick
+    if tick > MIN_TICK:
+        assert get_tick_at_sqrt_ratio(sqrt_price_x96 - 1) == tick - 1
+
+
+@pytest.mark.parametrize("args,expected", SWAP_STEP_VECTORS)
+def test_compute_swap_step_reference_vectors(args, expected):
+    """Test swap steps against the v3-core SwapMath reference vectors."""
+    assert compute_swap_step(*args) == expected
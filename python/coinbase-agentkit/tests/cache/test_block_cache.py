@@ -0,0 +1,103 @@
+"""Tests for the block-scoped cache."""
+
+from unittest.mock import Mock, patch
+
+from coinbase_agentkit.cache import BlockCache, ChainBlockCaches
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+
+
+def test_get_or_fetch_reuses_value_within_block():
+    """Test that a value is only fetched once per block."""
+    get_block_number = Mock(return_value=100)
+    fetch = Mock(return_value=42)
+    cache = BlockCache(get_block_number, poll_interval=0)
+
+    assert cache.get_or_fetch("key", fetch) == 42
+    assert cache.get_or_fetch("key", fetch) == 42
+
+    fetch.assert_called_once_with(100)
+
+
+def test_get_or_fetch_refetches_on_new_block():
+    """Test that a new block invalidates cached values."""
+    get_block_number = Mock(side_effect=[100, 101, 101])
+    fetch = Mock(side_effect=[1, 2])
+    cache = BlockCache(get_block_number, poll_interval=0)
+
+    assert cache.get_or_fetch("key", fetch) == 1
+    assert cache.get_or_fetch("key", fetch) == 2
+
+    assert fetch.call_count == 2
+    fetch.assert_called_with(101)
+
+
+def test_get_or_fetch_refresh_bypasses_cache():
+    """Test that refresh forces a new read."""
+    fetch = Mock(side_effect=[1, 2])
+    cache = BlockCache(Mock(return_value=100), poll_interval=0)
+
+    assert cache.get_or_fetch("key", fetch) == 1
+    assert cache.get_or_fetch("key", fetch, refresh=True) == 2
+    assert cache.get_or_fetch("key", fetch) == 2
+
+
+def test_invalidate_drops_entries():
+    """Test that invalidate drops a single key or all keys."""
+    cache = BlockCache(Mock(return_value=100), poll_interval=0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.invalidate()
+    assert cache.get("b") is None
+
+
+def test_block_number_is_polled_at_most_once_per_interval():
+    """Test that the block number lookup is throttled by the poll interval."""
+    get_block_number = Mock(side_effect=[100, 101])
+    cache = BlockCache(get_block_number, poll_interval=10)
+
+    with patch("coinbase_agentkit.cache.block_cache.time.monotonic", side_effect=[0, 5, 11]):
+        assert cache.block_number() == 100
+        assert cache.block_number() == 100
+        assert cache.block_number() == 101
+
+    assert get_block_number.call_count == 2
+
+
+def test_get_drops_stale_entry_once():
+    """Test that a stale entry replaced by another thread is neither dropped nor returned."""
+    cache = BlockCache(Mock(side_effect=[100, 101]), poll_interval=0)
+    cache.set("key", 1)
+
+    original_block_number = cache.block_number
+
+    def block_number_after_replacement():
+        # Another thread stores a fresh value between the read and the staleness check
+        cache._entries["key"] = (101, 2)
+        return original_block_number()
+
+    with patch.object(cache, "block_number", side_effect=block_number_after_replacement):
+        assert cache.get("key") is None
+
+    assert cache._entries["key"] == (101, 2)
+
+
+def test_chain_block_caches_are_keyed_by_chain():
+    """Test that one block cache is created per chain and backed by that chain's provider."""
+    caches = ChainBlockCaches(poll_interval=0)
+    base, other_base, optimism = (Mock(spec=EvmWalletProvider) for _ in range(3))
+    base.get_network.return_value = other_base.get_network.return_value = Network(
+        protocol_family="evm", chain_id="8453"
+    )
+    optimism.get_network.return_value = Network(protocol_family="evm", chain_id="10")
+    base.get_block_number.return_value = 100
+
+    assert caches.get(base) is caches.get(other_base)
+    assert caches.get(base) is not caches.get(optimism)
+    assert caches.get(other_base).block_number() == 100
+    other_base.get_block_number.assert_not_called()
@@ -0,0 +1,49 @@
+"""Tests for the key-value stores."""
+
+from unittest.mock import patch
+
+from coinbase_agentkit.cache import JsonFileStore, default_cache_dir
+
+
+def test_json_file_store_persists_across_instances(tmp_path):
+    """Test that values written by one store are read by another on the same file."""
+    path = tmp_path / "nested" / "store.json"
+    JsonFileStore(path).set("key", {"value": [1, 2, 3]})
+
+    assert JsonFileStore(path).get("key") == {"value": [1, 2, 3]}
+
+
+def test_json_file_store_max_age(tmp_path):
+    """Test that values older than max_age are ignored."""
+    store = JsonFileStore(tmp_path / "store.json")
+
+    with patch("coinbase_agentkit.cache.store.time.time", side_effect=[0, 5, 20]):
+        store.set("key", "value")
+        assert store.get("key", max_age=10) == "value"
+        assert store.get("key", max_age=10) is None
+
+
+def test_json_file_store_delete(tmp_path):
+    """Test that deleted values are removed from the file."""
+    path = tmp_path / "store.json"
+    store = JsonFileStore(path)
+    store.set("key", "value")
+    store.delete("key")
+
+    assert JsonFileStore(path).get("key") is None
+
+
+def test_json_file_store_ignores_corrupt_file(tmp_path):
+    """Test that a corrupt file is treated as empty."""
+    path = tmp_path / "store.json"
+    path.write_text("{not json")
+
+    assert JsonFileStore(path).get("key") is None
+
+
+def test_named_store_uses_cache_dir(tmp_path, monkeypatch):
+    """Test that named stores live in the configured cache directory."""
+    monkeypatch.setenv("AGENTKIT_CACHE_DIR", str(tmp_path))
+
+    assert default_cache_dir() == tmp_path
+    assert JsonFileStore.named("tokens").path == tmp_path / "tokens.json"
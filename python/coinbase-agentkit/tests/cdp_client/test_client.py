@@ -0,0 +1,197 @@
+"""Tests for the shared CDP API client."""
+
+from unittest.mock import Mock, patch
+
+import jwt
+import pytest
+from cdp import Cdp
+from cdp.errors import InvalidAPIKeyFormatError
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from coinbase_agentkit.cdp_client import CdpClientManager, PooledCdpApiClient, TokenBucket
+
+MOCK_API_KEY_NAME = "organizations/test/apiKeys/test"
+MOCK_SIGNING_KEY = ec.generate_private_key(ec.SECP256R1())
+MOCK_PRIVATE_KEY = MOCK_SIGNING_KEY.private_bytes(
+    serialization.Encoding.PEM,
+    serialization.PrivateFormat.PKCS8,
+    serialization.NoEncryption(),
+).decode()
+MOCK_URL = "https://api.cdp.coinbase.com/platform/v1/wallets"
+
+
+def mock_response(status: int, retry_after: str | None = None) -> Mock:
+    """Create a mock REST response."""
+    response = Mock(status=status)
+    response.getheader.side_effect = lambda name, default=None: (
+        retry_after if name == "Retry-After" else default
+    )
+    return response
+
+
+@pytest.fixture
+def send_request():
+    """Patch the underlying HTTP call and the retry sleep."""
+    with (
+        patch("cdp.client.api_client.ApiClient.call_api") as mock_call_api,
+        patch("coinbase_agentkit.cdp_client.client.time.sleep") as mock_sleep,
+    ):
+        yield mock_call_api, mock_sleep
+
+
+def test_invalid_private_key_fails_on_init():
+    """Test that an unparseable private key is rejected when the client is created."""
+    with pytest.raises(InvalidAPIKeyFormatError):
+        PooledCdpApiClient(MOCK_API_KEY_NAME, "not-a-pem")
+
+
+def test_build_jwt_uses_cached_signing_key():
+    """Test that JWTs are signed without re-parsing the private key."""
+    client = PooledCdpApiClient(MOCK_API_KEY_NAME, MOCK_PRIVATE_KEY)
+
+    with patch("cdp.cdp_api_client.serialization.load_pem_private_key") as mock_load:
+        token = client._build_jwt(MOCK_URL, "POST")
+
+    mock_load.assert_not_called()
+    claims = jwt.decode(
+        token, MOCK_SIGNING_KEY.public_key(), algorithms=["ES256"], audience="cdp_service"
+    )
+    assert claims["sub"] == MOCK_API_KEY_NAME
+    assert claims["uris"] == ["POST api.cdp.coinbase.com/platform/v1/wallets"]
+
+
+def test_other_sdk_releases_use_the_sdk_hooks():
+    """Test that the private SDK overrides are skipped unless the pinned cdp-sdk is installed."""
+    with patch("coinbase_agentkit.cdp_client.client._sdk_overrides_supported", return_value=False):
+        client = PooledCdpApiClient(MOCK_API_KEY_NAME, MOCK_PRIVATE_KEY, max_network_retries=2)
+
+        with patch("cdp.cdp_api_client.CdpApiClient._build_jwt", return_value="sdk") as mock_jwt:
+            assert client._build_jwt(MOCK_URL, "POST") == "sdk"
+
+    mock_jwt.assert_called_once_with(MOCK_URL, "POST")
+    assert 500 in client.configuration.retries.status_forcelist
+
+
+def test_rate_limited_request_is_retried(send_request):
+    """Test that 429 responses are retried, honoring Retry-After, for any method."""
+    mock_call_api, mock_sleep = send_request
+    mock_call_api.side_effect = [mock_response(429, retry_after="2"), mock_response(200)]
+    client = PooledCdpApiClient(MOCK_API_KEY_NAME, MOCK_PRIVATE_KEY)
+
+    response = client.call_api("POST", MOCK_URL)
+
+    assert response.status == 200
+    assert mock_call_api.call_count == 2
+    mock_sleep.assert_called_once_with(2.0)
+
+    first_headers = mock_call_api.call_args_list[0].args[2]
+    second_headers = mock_call_api.call_args_list[1].args[2]
+    assert first_headers["Authorization"] != second_headers["Authorization"]
+
+    stats = client.stats
+    assert stats.requests == 2
+    assert stats.retries == 1
+    assert stats.rate_limited_responses == 1
+
+
+def test_server_errors_are_retried_with_backoff_for_idempotent_methods(send_request):
+    """Test that 5xx responses to GET requests are retried with capped jittered backoff."""
+    mock_call_api, mock_sleep = send_request
+    mock_call_api.side_effect = [mock_response(503), mock_response(502), mock_response(200)]
+    client = PooledCdpApiClient(MOCK_API_KEY_NAME, MOCK_PRIVATE_KEY, backoff_base=1.0)
+
+    assert client.call_api("GET", MOCK_URL).status == 200
+
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert len(delays) == 2
+    assert 0 <= delays[0] <= 1.0
+    assert 0 <= delays[1] <= 2.0
+    assert client.stats.server_error_responses == 2
+
+
+def test_server_errors_are_not_retried_for_post(send_request):
+    """Test that 5xx responses to POST requests are returned without resending."""
+    mock_call_api, mock_sleep = send_request
+    mock_call_api.return_value = mock_response(500)
+    client = PooledCdpApiClient(MOCK_API_KEY_NAME, MOCK_PRIVATE_KEY)
+
+    assert client.call_api("POST", MOCK_URL).status == 500
+    assert mock_call_api.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_retries_stop_at_max_network_retries(send_request):
+    """Test that the last response is returned once retries are exhausted."""
+    mock_call_api, _ = send_request
+    mock_call_api.return_value = mock_response(429)
+    client = PooledCdpApiClient(MOCK_API_KEY_NAME, MOCK_PRIVATE_KEY, max_network_retries=2)
+
+    assert client.call_api("GET", MOCK_URL).status == 429
+    assert mock_call_api.call_count == 3
+
+
+def test_token_bucket_waits_when_empty():
+    """Test that the bucket allows a burst and then paces requests."""
+    clock = [0.0]
+
+    def sleep(seconds: float) -> None:
+        clock[0] += seconds
+
+    with (
+        patch("coinbase_agentkit.cdp_client.rate_limiter.time.monotonic", lambda: clock[0]),
+        patch("coinbase_agentkit.cdp_client.rate_limiter.time.sleep", side_effect=sleep),
+    ):
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == pytest.approx(0.1)
+        assert bucket.acquire() == pytest.approx(0.1)
+        assert clock[0] == pytest.approx(0.2)
+
+
+def test_manager_shares_one_client_per_key():
+    """Test that configuring the same key twice reuses the client and installs it in the SDK."""
+    manager = CdpClientManager(requests_per_second=5)
+
+    first = manager.configure(MOCK_API_KEY_NAME, MOCK_PRIVATE_KEY)
+    api_clients = Cdp.api_clients
+    second = manager.configure(MOCK_API_KEY_NAME, MOCK_PRIVATE_KEY)
+
+    assert first is second
+    assert Cdp.api_clients is api_clients
+    assert Cdp.api_clients._cdp_client is first
+    assert Cdp.api_key_name == MOCK_API_KEY_NAME
+    assert first.rate_limiter.rate == 5
+    assert first.configuration.connection_pool_maxsize == manager.pool_maxsize
+    assert MOCK_API_KEY_NAME in manager.stats()
+
+
+def test_manager_configure_resets_sdk_settings_like_cdp_configure():
+    """Test that configure resets the server signer and debugging flags and does not throttle."""
+    manager = CdpClientManager()
+
+    client = manager.configure(
+        MOCK_API_KEY_NAME, MOCK_PRIVATE_KEY, use_server_signer=True, debugging=True
+    )
+    assert Cdp.use_server_signer
+    assert Cdp.debugging
+    assert client.rate_limiter is None
+
+    other = manager.configure(MOCK_API_KEY_NAME, MOCK_PRIVATE_KEY)
+    assert not Cdp.use_server_signer
+    assert not Cdp.debugging
+    assert other is not client
+
+
+def test_manager_configure_from_json(tmp_path):
+    """Test that the manager reads the downloaded CDP API key file."""
+    key_file = tmp_path / "cdp_api_key.json"
+    key_file.write_text(
+        f'{{"name": "{MOCK_API_KEY_NAME}", "privateKey": {MOCK_PRIVATE_KEY!r}}}'.replace("'", '"')
+    )
+
+    client = CdpClientManager().configure_from_json(str(key_file))
+
+    assert client.api_key == MOCK_API_KEY_NAME
@@ -0,0 +1,9 @@
+"""Shared test fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep persistent caches written during tests out of the user's cache directory."""
+    monkeypatch.setenv("AGENTKIT_CACHE_DIR", str(tmp_path / "agentkit_cache"))
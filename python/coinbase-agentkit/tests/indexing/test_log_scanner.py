@@ -0,0 +1,84 @@
+"""Tests for chunked log scanning."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from coinbase_agentkit.indexing import LogScanner, is_range_error
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+
+MOCK_FILTER = {"address": "0x1234567890123456789012345678901234567890"}
+
+
+def _log(block_number, log_index=0):
+    return {"blockNumber": block_number, "logIndex": log_index, "topics": []}
+
+
+def test_scan_requests_chunks_in_order():
+    """Test that a range is read in chunks of the configured size."""
+    wallet = Mock(spec=EvmWalletProvider)
+    wallet.get_logs.side_effect = lambda params: [_log(params["fromBlock"])]
+
+    chunks = list(LogScanner(chunk_size=10).scan(wallet, MOCK_FILTER, 0, 24))
+
+    assert [(chunk.from_block, chunk.to_block) for chunk in chunks] == [
+        (0, 9),
+        (10, 19),
+        (20, 24),
+    ]
+    assert [chunk.logs[0]["blockNumber"] for chunk in chunks] == [0, 10, 20]
+
+
+def test_scan_splits_range_on_too_many_results():
+    """Test that a rejected range is halved and the smaller size is kept."""
+    wallet = Mock(spec=EvmWalletProvider)
+
+    def get_logs(params):
+        if params["toBlock"] - params["fromBlock"] + 1 > 25:
+            raise ValueError({"code": -32005, "message": "query returned more than 10000 results"})
+        return []
+
+    wallet.get_logs.side_effect = get_logs
+    scanner = LogScanner(chunk_size=100)
+
+    chunks = list(scanner.scan(wallet, MOCK_FILTER, 0, 99))
+
+    assert [(chunk.from_block, chunk.to_block) for chunk in chunks] == [
+        (0, 24),
+        (25, 49),
+        (50, 74),
+        (75, 99),
+    ]
+    assert scanner.chunk_size == 25
+
+
+def test_scan_raises_other_errors():
+    """Test that errors unrelated to the range size are not retried."""
+    wallet = Mock(spec=EvmWalletProvider)
+    wallet.get_logs.side_effect = ConnectionError("connection refused")
+
+    with pytest.raises(ConnectionError):
+        list(LogScanner(chunk_size=100).scan(wallet, MOCK_FILTER, 0, 99))
+
+    assert wallet.get_logs.call_count == 1
+
+
+def test_scan_merges_filters_without_duplicates():
+    """Test that logs matching several filters are merged in order and kept once."""
+    wallet = Mock(spec=EvmWalletProvider)
+    wallet.get_logs.side_effect = [[_log(5, 1), _log(3)], [_log(5, 1), _log(4)]]
+
+    (chunk,) = LogScanner().scan(wallet, [MOCK_FILTER, MOCK_FILTER], 0, 9)
+
+    assert [(log["blockNumber"], log["logIndex"]) for log in chunk.logs] == [
+        (3, 0),
+        (4, 0),
+        (5, 1),
+    ]
+
+
+def test_is_range_error():
+    """Test detection of getLogs range errors."""
+    assert is_range_error(Exception("Log response size exceeded"))
+    assert is_range_error(Exception("eth_getLogs is limited to a 10,000 block range"))
+    assert not is_range_error(Exception("execution reverted"))
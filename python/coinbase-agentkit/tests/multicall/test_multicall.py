@@ -0,0 +1,98 @@
+"""Tests for Multicall3 batching."""
+
+from unittest.mock import Mock
+
+from eth_abi import encode
+from web3 import Web3
+
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
+from coinbase_agentkit.multicall import (
+    MULTICALL3_ABI,
+    MULTICALL3_ADDRESS,
+    Call,
+    get_function_codec,
+    multicall,
+)
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+
+MOCK_TOKEN = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+MOCK_HOLDER = "0x1234567890123456789012345678901234567890"
+
+OWNER_ABI = [
+    {
+        "type": "function",
+        "name": "owner",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"type": "address"}],
+    },
+]
+
+
+def test_codec_matches_web3_encoding():
+    """Test that the codec produces the same calldata as a web3 contract."""
+    codec = get_function_codec(ERC20_ABI, "balanceOf")
+    contract = Web3().eth.contract(address=MOCK_TOKEN, abi=ERC20_ABI)
+
+    assert Web3.to_hex(codec.encode([MOCK_HOLDER])) == contract.encode_abi(
+        "balanceOf", [MOCK_HOLDER]
+    )
+    assert codec.decode(encode(["uint256"], [42])) == 42
+    assert get_function_codec(ERC20_ABI, "balanceOf") is codec
+
+
+def test_codec_checksums_decoded_addresses():
+    """Test that decoded addresses are checksummed like web3 call results."""
+    codec = get_function_codec(OWNER_ABI, "owner")
+
+    assert codec.decode(encode(["address"], [MOCK_TOKEN.lower()])) == MOCK_TOKEN
+
+
+def test_multicall_batches_calls_into_one_read():
+    """Test that all calls are sent in one aggregate3 read and decoded in order."""
+    wallet_provider = Mock(spec=EvmWalletProvider)
+    wallet_provider.read_contract.return_value = [
+        (True, encode(["uint8"], [6])),
+        (False, b""),
+        (True, encode(["uint256"], [1_500_000])),
+    ]
+    calls = [
+        Call(MOCK_TOKEN, ERC20_ABI, "decimals"),
+        Call(MOCK_TOKEN, ERC20_ABI, "symbol"),
+        Call(MOCK_TOKEN, ERC20_ABI, "balanceOf", (MOCK_HOLDER,)),
+    ]
+
+    results = multicall(wallet_provider, calls, block_identifier=123)
+
+    wallet_provider.read_contract.assert_called_once()
+    kwargs = wallet_provider.read_contract.call_args.kwargs
+    assert kwargs["contract_address"] == MULTICALL3_ADDRESS
+    assert kwargs["abi"] == MULTICALL3_ABI
+    assert kwargs["function_name"] == "aggregate3"
+    assert kwargs["block_identifier"] == 123
+    assert [request[0] for request in kwargs["args"][0]] == [MOCK_TOKEN] * 3
+
+    assert [result.success for result in results] == [True, False, True]
+    assert results[0].value == 6
+    assert results[2].value == 1_500_000
+
+
+def test_multicall_falls_back_to_individual_reads():
+    """Test that calls are read one by one when the multicall request fails."""
+    wallet_provider = Mock(spec=EvmWalletProvider)
+    wallet_provider.read_contract.side_effect = [
+        Exception("no multicall3"),
+        6,
+        Exception("execution reverted"),
+    ]
+    calls = [
+        Call(MOCK_TOKEN, ERC20_ABI, "decimals"),
+        Call(MOCK_TOKEN, ERC20_ABI, "symbol"),
+    ]
+
+    results = multicall(wallet_provider, calls)
+
+    assert wallet_provider.read_contract.call_count == 3
+    assert results[0].success and results[0].value == 6
+    assert not results[1].success
+    assert results[1].error == "execution reverted"
@@ -0,0 +1,38 @@
+"""Tests for local namehash computation."""
+
+from web3 import Web3
+
+from coinbase_agentkit.names import namehash, normalize_name, reverse_node
+
+
+def test_namehash_matches_eip137_vectors():
+    """Test namehash against the EIP-137 reference vectors."""
+    assert namehash("") == b"\0" * 32
+    assert namehash("eth").hex() == (
+        "93cdeb708b7545dc668eb9280176169d1c33cfd8ed6f04690a0bcc88a93fc4ae"
+    )
+    assert namehash("foo.eth").hex() == (
+        "de9b09fd7c5f901e23a3f19fecc54828e9c848539801e86591bd9801b019f84f"
+    )
+
+
+def test_namehash_normalizes_case():
+    """Test that ASCII names are hashed lowercased."""
+    assert normalize_name(" Alice.Base.ETH ") == "alice.base.eth"
+    assert namehash("Alice.Base.ETH") == namehash("alice.base.eth")
+
+
+def test_namehash_extends_parent_node():
+    """Test that a name's node is derived from its parent's node and label hash."""
+    expected = Web3.keccak(namehash("base.eth") + Web3.keccak(text="alice"))
+
+    assert namehash("alice.base.eth") == expected
+
+
+def test_reverse_node_uses_lowercase_address():
+    """Test that reverse nodes hash the address without prefix under the reverse suffix."""
+    address = "0x1234567890AbcdEF1234567890aBcdef12345678"
+
+    assert reverse_node(address, "80002105.reverse") == namehash(
+        "1234567890abcdef1234567890abcdef12345678.80002105.reverse"
+    )
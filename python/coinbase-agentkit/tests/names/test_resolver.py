@@ -0,0 +1,207 @@
+"""Tests for the Basename and ENS name resolver."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from eth_abi import encode
+
+from coinbase_agentkit.action_providers.erc721 import erc721_action_provider
+from coinbase_agentkit.action_providers.morpho.morpho_action_provider import (
+    morpho_action_provider,
+)
+from coinbase_agentkit.cache import InMemoryStore
+from coinbase_agentkit.names import (
+    NameResolver,
+    get_default_resolver,
+    is_name,
+    resolve_address,
+    resolve_addresses,
+)
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.validators.eth import validate_eth_address_or_name
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+
+ALICE = "0x1234567890AbcdEF1234567890aBcdef12345678"
+BOB = "0x9876543210987654321098765432109876543210"
+RESOLVER = "0xC6d566A56A1aFf6508b41f6c90ff131615583BCD"
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def mock_wallet_provider(chain_id: str = "8453") -> Mock:
+    """Create a mock wallet provider on a chain."""
+    wallet_provider = Mock(spec=EvmWalletProvider)
+    wallet_provider.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id=chain_id
+    )
+    return wallet_provider
+
+
+def results(abi_type: str, *values) -> list[tuple[bool, bytes]]:
+    """Encode multicall results holding one value each."""
+    return [(True, encode([abi_type], [value])) for value in values]
+
+
+@pytest.fixture(autouse=True)
+def reset_default_resolver():
+    """Clear the shared resolver's cache between tests."""
+    get_default_resolver().store = InMemoryStore()
+
+
+def test_is_name():
+    """Test that dotted names are told apart from addresses."""
+    assert is_name("alice.base.eth")
+    assert not is_name(ALICE)
+    assert not is_name("alice")
+
+
+def test_resolve_batches_and_caches():
+    """Test that names resolve with two multicalls, then from the cache."""
+    wallet_provider = mock_wallet_provider()
+    wallet_provider.read_contract.side_effect = [
+        results("address", RESOLVER, ZERO_ADDRESS),
+        results("address", ALICE),
+    ]
+    resolver = NameResolver(store=InMemoryStore())
+
+    resolved = resolver.resolve(wallet_provider, ["alice.base.eth", "nobody.base.eth"])
+
+    assert resolved == {"alice.base.eth": ALICE, "nobody.base.eth": None}
+    assert wallet_provider.read_contract.call_count == 2
+
+    assert resolver.resolve(wallet_provider, ["Alice.base.eth", "nobody.base.eth"]) == {
+        "Alice.base.eth": ALICE,
+        "nobody.base.eth": None,
+    }
+    assert wallet_provider.read_contract.call_count == 2
+
+
+def test_resolve_expires_after_ttl():
+    """Test that resolutions older than the TTL are read again."""
+    wallet_provider = mock_wallet_provider()
+    wallet_provider.read_contract.side_effect = [
+        results("address", RESOLVER),
+        results("address", ALICE),
+        results("address", RESOLVER),
+        results("address", BOB),
+    ]
+    resolver = NameResolver(store=InMemoryStore(), ttl=60)
+
+    with patch("coinbase_agentkit.cache.store.time.time", return_value=1000.0):
+        assert resolver.resolve(wallet_provider, ["alice.base.eth"])["alice.base.eth"] == ALICE
+    with patch("coinbase_agentkit.cache.store.time.time", return_value=1061.0):
+        assert resolver.resolve(wallet_provider, ["alice.base.eth"])["alice.base.eth"] == BOB
+
+
+def test_resolve_rejects_names_of_other_chains():
+    """Test that names are only resolved on the chain of their registry."""
+    resolver = NameResolver(store=InMemoryStore())
+
+    with pytest.raises(ValueError, match=r"Cannot resolve alice\.eth on chain 8453"):
+        resolver.resolve(mock_wallet_provider(), ["alice.eth"])
+    with pytest.raises(ValueError, match="not supported on chain 10"):
+        resolver.resolve(mock_wallet_provider("10"), ["alice.base.eth"])
+
+
+def test_lookup_reads_verified_primary_names():
+    """Test that reverse lookups only return names resolving back to the address."""
+    wallet_provider = mock_wallet_provider()
+    wallet_provider.read_contract.side_effect = [
+        results("address", RESOLVER, RESOLVER, RESOLVER),
+        results("string", "alice.base.eth", "alice.base.eth", ""),
+        results("address", RESOLVER),
+        results("address", ALICE),
+    ]
+    resolver = NameResolver(store=InMemoryStore())
+
+    assert resolver.lookup(wallet_provider, [ALICE, BOB, RESOLVER]) == {
+        ALICE: "alice.base.eth",
+        BOB: None,
+        RESOLVER: None,
+    }
+
+
+def test_lookup_ignores_names_of_other_chains():
+    """Test that claimed names outside the chain's name service are not returned."""
+    wallet_provider = mock_wallet_provider()
+    wallet_provider.read_contract.side_effect = [
+        results("address", RESOLVER),
+        results("string", "alice.eth"),
+    ]
+    resolver = NameResolver(store=InMemoryStore())
+
+    assert resolver.lookup(wallet_provider, [ALICE]) == {ALICE: None}
+    assert wallet_provider.read_contract.call_count == 2
+
+
+def test_resolve_addresses_with_the_given_wallet_provider():
+    """Test that names resolve with the wallet provider passed in, in one lookup."""
+    wallet_provider = mock_wallet_provider("84532")
+    wallet_provider.read_contract.side_effect = [
+        results("address", RESOLVER),
+        results("address", ALICE),
+    ]
+
+    assert resolve_addresses(
+        wallet_provider, ["alice.basetest.eth", BOB.lower(), "alice.basetest.eth"]
+    ) == [ALICE, BOB, ALICE]
+    assert resolve_address(wallet_provider, "alice.basetest.eth") == ALICE
+    assert wallet_provider.read_contract.call_count == 2
+
+
+def test_resolve_address_errors():
+    """Test that invalid addresses and unresolved names are rejected."""
+    wallet_provider = mock_wallet_provider()
+    wallet_provider.read_contract.side_effect = [results("address", ZERO_ADDRESS)]
+
+    with pytest.raises(ValueError, match="does not resolve"):
+        resolve_address(wallet_provider, "nobody.base.eth")
+    with pytest.raises(ValueError, match="Invalid Ethereum address"):
+        resolve_address(wallet_provider, "0xinvalid")
+
+
+def test_validate_eth_address_or_name_keeps_names():
+    """Test that the schema validator leaves names unresolved and checks addresses."""
+    assert validate_eth_address_or_name(" alice.base.eth ") == "alice.base.eth"
+    assert validate_eth_address_or_name(ALICE.lower()) == ALICE
+    with pytest.raises(ValueError, match="Invalid Ethereum address"):
+        validate_eth_address_or_name("0xinvalid")
+
+
+def test_actions_resolve_names_with_their_wallet_provider():
+    """Test that names in an action's arguments are resolved with the wallet it runs with."""
+    wallet_provider = mock_wallet_provider()
+    wallet_provider.get_name.return_value = "mock"
+    wallet_provider.get_address.return_value = BOB
+    wallet_provider.read_contract.side_effect = [
+        results("address", RESOLVER),
+        results("address", ALICE),
+    ]
+    wallet_provider.send_transaction.return_value = "0xhash"
+
+    with patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"):
+        response = erc721_action_provider().mint(
+            wallet_provider, {"contract_address": BOB, "destination": "alice.base.eth"}
+        )
+
+    assert response == f"Successfully minted NFT {BOB} to {ALICE}"
+
+
+def test_morpho_resolves_owner_with_its_wallet():
+    """Test that the Morpho position owner is resolved with the action's wallet."""
+    wallet_provider = mock_wallet_provider()
+    wallet_provider.get_name.return_value = "mock"
+    wallet_provider.get_address.return_value = BOB
+    wallet_provider.read_contract.side_effect = [
+        results("address", RESOLVER),
+        results("address", ALICE),
+    ]
+    vault_reader = Mock()
+    vault_reader.get_positions.return_value = [ValueError("unreadable")]
+
+    with patch("coinbase_agentkit.action_providers.action_decorator.send_analytics_event"):
+        response = morpho_action_provider(vault_reader).get_vault_position(
+            wallet_provider, {"vault_addresses": [BOB], "owner": "alice.base.eth"}
+        )
+
+    assert response.startswith(f"Morpho Vault positions of {ALICE}")
+    vault_reader.get_positions.assert_called_once_with(wallet_provider, [BOB], ALICE)
@@ -0,0 +1,105 @@
+"""Tests for the token metadata registry."""
+
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+from eth_abi import encode
+from web3 import Web3
+
+from coinbase_agentkit.cache import InMemoryStore, JsonFileStore
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.tokens import TokenMetadata, TokenRegistry, format_units, parse_units
+from coinbase_agentkit.tokens.constants import KNOWN_TOKENS
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+
+BASE_USDC = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+MOCK_TOKEN = "0x1234567890123456789012345678901234567890"
+OTHER_TOKEN = "0x9876543210987654321098765432109876543210"
+
+
+def mock_wallet_provider() -> Mock:
+    """Create a mock wallet provider on Base."""
+    wallet_provider = Mock(spec=EvmWalletProvider)
+    wallet_provider.get_network.return_value = Network(
+        protocol_family="evm", network_id="base-mainnet", chain_id="8453"
+    )
+    return wallet_provider
+
+
+def test_known_tokens_are_checksummed():
+    """Test that every bundled token address is a valid checksummed address."""
+    for tokens in KNOWN_TOKENS.values():
+        for address, _, _, _ in tokens:
+            assert Web3.to_checksum_address(address) == address
+
+
+def test_known_token_needs_no_rpc():
+    """Test that bundled tokens resolve without onchain reads, whatever the address case."""
+    wallet_provider = mock_wallet_provider()
+    registry = TokenRegistry(store=InMemoryStore())
+
+    resolved = registry.resolve(wallet_provider, [BASE_USDC.lower()])
+
+    wallet_provider.read_contract.assert_not_called()
+    assert resolved[BASE_USDC.lower()].symbol == "USDC"
+    assert resolved[BASE_USDC.lower()].decimals == 6
+
+
+def test_resolved_metadata_is_persisted(tmp_path):
+    """Test that tokens read onchain once are served from the store by later registries."""
+    store_path = tmp_path / "tokens.json"
+    wallet_provider = mock_wallet_provider()
+    wallet_provider.read_contract.return_value = [
+        (True, encode(["string"], ["Mock Token"])),
+        (True, encode(["string"], ["MOCK"])),
+        (True, encode(["uint8"], [8])),
+    ]
+
+    TokenRegistry(store=JsonFileStore(store_path)).resolve(wallet_provider, [MOCK_TOKEN])
+    metadata = TokenRegistry(store=JsonFileStore(store_path)).get("8453", MOCK_TOKEN)
+
+    wallet_provider.read_contract.assert_called_once()
+    assert metadata == TokenMetadata("8453", MOCK_TOKEN, "Mock Token", "MOCK", 8)
+
+
+def test_non_erc20_contracts_are_not_cached():
+    """Test that tokens without symbol or decimals resolve to None and are retried later."""
+    wallet_provider = mock_wallet_provider()
+    wallet_provider.read_contract.return_value = [(False, b"")] * 3
+    registry = TokenRegistry(store=InMemoryStore())
+
+    assert registry.resolve(wallet_provider, [MOCK_TOKEN]) == {MOCK_TOKEN: None}
+    assert registry.get("8453", MOCK_TOKEN) is None
+
+
+def test_lru_evicts_least_recently_used_from_memory_only():
+    """Test that evicted tokens are still served from the persistent store."""
+    store = InMemoryStore()
+    registry = TokenRegistry(store=store, max_size=1)
+    first = TokenMetadata("8453", MOCK_TOKEN, "First", "ONE", 18)
+    second = TokenMetadata("8453", OTHER_TOKEN, "Second", "TWO", 6)
+
+    registry.add(first)
+    registry.add(second)
+
+    assert len(registry._entries) == 1
+    assert registry.get("8453", MOCK_TOKEN) == first
+
+
+def test_format_units():
+    """Test formatting raw amounts in whole units."""
+    assert format_units(1_500_000, 6) == "1.5"
+    assert format_units(10**18, 18) == "1"
+    assert format_units(1, 18) == "0.000000000000000001"
+    assert format_units(123, 0) == "123"
+
+
+def test_parse_units():
+    """Test converting whole units to raw amounts without floating point rounding."""
+    assert parse_units("1.5", 6) == 1_500_000
+    assert parse_units(Decimal("0.1"), 18) == 10**17
+    assert parse_units("123", 0) == 123
+
+    with pytest.raises(ValueError, match="more than 6 decimal places"):
+        parse_units("0.0000001", 6)
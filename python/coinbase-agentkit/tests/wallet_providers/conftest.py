@@ -0,0 +1,44 @@
+"""Fixtures for wallet provider tests."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from eth_account import Account
+
+from coinbase_agentkit.wallet_providers import CdpWalletProvider, CdpWalletProviderConfig
+
+MOCK_PRIVATE_KEY = "0x" + "11" * 32
+MOCK_ACCOUNT = Account.from_key(MOCK_PRIVATE_KEY)
+MOCK_API_SIGNATURE = "0x" + "ab" * 65
+
+
+@pytest.fixture
+def mock_cdp_wallet():
+    """Create a mock CDP wallet holding its seed locally."""
+    wallet = Mock()
+    wallet.can_sign = True
+    wallet.network_id = "base-sepolia"
+    wallet.default_address.address_id = MOCK_ACCOUNT.address
+    wallet.default_address.key = MOCK_ACCOUNT
+    wallet.sign_payload.return_value.signature = MOCK_API_SIGNATURE
+    return wallet
+
+
+@pytest.fixture
+def cdp_wallet_provider_factory(mock_cdp_wallet):
+    """Create CdpWalletProvider instances backed by the mock CDP wallet."""
+
+    def factory(**config) -> CdpWalletProvider:
+        with (
+            patch("coinbase_agentkit.wallet_providers.cdp_wallet_provider.configure_cdp"),
+            patch("coinbase_agentkit.wallet_providers.cdp_wallet_provider.Wallet") as mock_wallet,
+            patch("coinbase_agentkit.wallet_providers.wallet_provider.send_analytics_event"),
+        ):
+            mock_wallet.create.return_value = mock_cdp_wallet
+            return CdpWalletProvider(
+                CdpWalletProviderConfig(
+                    api_key_name="test-key", api_key_private_key="test-private-key", **config
+                )
+            )
+
+    return factory
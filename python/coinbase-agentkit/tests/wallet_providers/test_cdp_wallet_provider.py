@@ -0,0 +1,308 @@
+"""Tests for the CDP wallet provider."""
+
+import importlib.metadata
+import json
+import re
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from cdp import Wallet as CdpWallet
+from eth_account import Account
+from eth_account.messages import encode_defunct, encode_typed_data
+from web3 import Web3
+
+from coinbase_agentkit.cache import InMemoryStore
+from coinbase_agentkit.wallet_providers import CdpWalletProvider, CdpWalletProviderConfig
+from coinbase_agentkit.wallet_providers.cdp_wallet_provider import (
+    WALLET_CACHE_CDP_SDK_VERSION,
+    _mnemonic_seed,
+    _restore_wallet,
+    _snapshot_wallet,
+)
+
+from .conftest import MOCK_ACCOUNT, MOCK_API_SIGNATURE
+
+MOCK_TYPED_DATA = {
+    "types": {
+        "EIP712Domain": [
+            {"name": "name", "type": "string"},
+            {"name": "chainId", "type": "uint256"},
+        ],
+        "Mail": [{"name": "contents", "type": "string"}],
+    },
+    "primaryType": "Mail",
+    "domain": {"name": "Test", "chainId": 84532},
+    "message": {"contents": "hello"},
+}
+
+
+def test_sign_message_uses_api_by_default(cdp_wallet_provider_factory, mock_cdp_wallet):
+    """Test that signing goes through the CDP API unless local signing is enabled."""
+    provider = cdp_wallet_provider_factory()
+
+    assert provider.sign_message("hello") == MOCK_API_SIGNATURE
+    mock_cdp_wallet.sign_payload.assert_called_once()
+
+
+def test_sign_message_locally(cdp_wallet_provider_factory, mock_cdp_wallet):
+    """Test that local signing produces an EIP-191 signature without an API call."""
+    provider = cdp_wallet_provider_factory(local_signing=True)
+
+    expected = MOCK_ACCOUNT.sign_message(encode_defunct(text="hello")).signature
+
+    assert provider.sign_message("hello") == Web3.to_hex(expected)
+    mock_cdp_wallet.sign_payload.assert_not_called()
+
+
+def test_sign_typed_data_locally(cdp_wallet_provider_factory, mock_cdp_wallet):
+    """Test that local signing produces an EIP-712 signature without an API call."""
+    provider = cdp_wallet_provider_factory(local_signing=True)
+
+    expected = MOCK_ACCOUNT.sign_message(encode_typed_data(full_message=MOCK_TYPED_DATA)).signature
+
+    assert provider.sign_typed_data(MOCK_TYPED_DATA) == Web3.to_hex(expected)
+    mock_cdp_wallet.sign_payload.assert_not_called()
+
+
+def test_sign_transaction_locally(cdp_wallet_provider_factory, mock_cdp_wallet):
+    """Test that local transaction signatures recover to the wallet address."""
+    provider = cdp_wallet_provider_factory(local_signing=True)
+    transaction = {
+        "chainId": 84532,
+        "nonce": 0,
+        "maxPriorityFeePerGas": 1,
+        "maxFeePerGas": 2,
+        "gas": 21000,
+        "to": MOCK_ACCOUNT.address,
+        "value": 1,
+        "data": "0x",
+    }
+
+    signature = provider.sign_transaction(transaction)
+    expected = MOCK_ACCOUNT.sign_transaction(transaction)
+
+    assert Web3.to_bytes(hexstr=signature)[:64] == expected.r.to_bytes(
+        32, "big"
+    ) + expected.s.to_bytes(32, "big")
+    mock_cdp_wallet.sign_payload.assert_not_called()
+
+
+def test_local_signing_falls_back_to_api_for_server_signer(
+    cdp_wallet_provider_factory, mock_cdp_wallet
+):
+    """Test that wallets without a local key keep signing through the CDP API."""
+    mock_cdp_wallet.can_sign = False
+    provider = cdp_wallet_provider_factory(local_signing=True)
+
+    assert provider.sign_message("hello") == MOCK_API_SIGNATURE
+    mock_cdp_wallet.sign_payload.assert_called_once()
+
+
+def build_cdp_wallet(seed: str):
+    """Build a CDP SDK wallet with one address derived from the seed, without API calls."""
+    from cdp import Wallet
+    from cdp.client.models.address import Address as AddressModel
+    from cdp.client.models.feature_set import FeatureSet
+    from cdp.client.models.wallet import Wallet as WalletModel
+
+    wallet_model = WalletModel(
+        id="wallet-id",
+        network_id="base-sepolia",
+        feature_set=FeatureSet(
+            faucet=True,
+            server_signer=False,
+            transfer=True,
+            trade=False,
+            stake=False,
+            gasless_send=False,
+        ),
+    )
+    wallet = Wallet(wallet_model, seed)
+    address_id = Account.from_key(wallet._derive_key(0).PrivateKey().Raw().ToHex()).address
+    address_model = AddressModel(
+        wallet_id="wallet-id",
+        network_id="base-sepolia",
+        public_key="0x00",
+        address_id=address_id,
+        index=0,
+    )
+    wallet_model.default_address = address_model
+    wallet._addresses = [wallet._build_wallet_address(address_model, 0)]
+    return wallet
+
+
+def test_wallet_cache_skips_import_on_restart():
+    """Test that a cached wallet is restored without calling the CDP API."""
+    seed = "22" * 64
+    wallet = build_cdp_wallet(seed)
+    wallet_data = json.dumps({"wallet_id": "wallet-id", "seed": seed, "network_id": "base-sepolia"})
+    store = InMemoryStore()
+
+    def create_provider():
+        return CdpWalletProvider(
+            CdpWalletProviderConfig(
+                api_key_name="test-key",
+                api_key_private_key="test-private-key",
+                wallet_data=wallet_data,
+                wallet_cache=store,
+            )
+        )
+
+    with (
+        patch(
+            "coinbase_agentkit.wallet_providers.cdp_wallet_provider.Cdp", api_key_name="test-key"
+        ),
+        patch("coinbase_agentkit.wallet_providers.cdp_wallet_provider.configure_cdp"),
+        patch("coinbase_agentkit.wallet_providers.wallet_provider.send_analytics_event"),
+        patch.object(CdpWallet, "import_data", return_value=wallet) as mock_import_data,
+    ):
+        first = create_provider()
+        second = create_provider()
+
+    mock_import_data.assert_called_once()
+    assert second.get_address() == first.get_address() == wallet.default_address.address_id
+    assert second._wallet.can_sign
+    assert seed not in json.dumps(store._entries)
+
+
+def test_wallet_cache_ignores_stale_entries():
+    """Test that entries older than the TTL trigger a fresh import."""
+    seed = "33" * 64
+    wallet = build_cdp_wallet(seed)
+    wallet_data = json.dumps({"wallet_id": "wallet-id", "seed": seed, "network_id": "base-sepolia"})
+    store = InMemoryStore()
+    config = CdpWalletProviderConfig(
+        api_key_name="test-key",
+        api_key_private_key="test-private-key",
+        wallet_data=wallet_data,
+        wallet_cache=store,
+        wallet_cache_ttl=0,
+    )
+
+    with (
+        patch(
+            "coinbase_agentkit.wallet_providers.cdp_wallet_provider.Cdp", api_key_name="test-key"
+        ),
+        patch("coinbase_agentkit.wallet_providers.cdp_wallet_provider.configure_cdp"),
+        patch("coinbase_agentkit.wallet_providers.wallet_provider.send_analytics_event"),
+        patch.object(CdpWallet, "import_data", return_value=wallet) as mock_import_data,
+        patch("coinbase_agentkit.cache.store.time.time", side_effect=[0, 10, 10]),
+    ):
+        CdpWalletProvider(config)
+        CdpWalletProvider(config)
+
+    assert mock_import_data.call_count == 2
+
+
+def test_wallet_cache_bypassed_on_other_cdp_sdk_releases():
+    """Test that wallets are imported through the CDP API when the SDK is not the pinned one."""
+    seed = "44" * 64
+    wallet = build_cdp_wallet(seed)
+    wallet_data = json.dumps({"wallet_id": "wallet-id", "seed": seed, "network_id": "base-sepolia"})
+    store = InMemoryStore()
+    config = CdpWalletProviderConfig(
+        api_key_name="test-key",
+        api_key_private_key="test-private-key",
+        wallet_data=wallet_data,
+        wallet_cache=store,
+    )
+
+    with (
+        patch(
+            "coinbase_agentkit.wallet_providers.cdp_wallet_provider.Cdp", api_key_name="test-key"
+        ),
+        patch("coinbase_agentkit.wallet_providers.cdp_wallet_provider.configure_cdp"),
+        patch("coinbase_agentkit.wallet_providers.wallet_provider.send_analytics_event"),
+        patch.object(CdpWallet, "import_data", return_value=wallet) as mock_import_data,
+        patch("importlib.metadata.version", return_value="0.18.0"),
+    ):
+        CdpWalletProvider(config)
+        CdpWalletProvider(config)
+
+    assert mock_import_data.call_count == 2
+    assert store._entries == {}
+
+
+def test_wallet_cache_matches_pinned_cdp_sdk():
+    """Test that the wallet cache targets the pinned cdp-sdk and round-trips its wallets."""
+    pyproject = (Path(__file__).parents[2] / "pyproject.toml").read_text()
+    pinned = re.search(r'^cdp-sdk = "(.+)"$', pyproject, re.MULTILINE).group(1)
+    assert pinned == WALLET_CACHE_CDP_SDK_VERSION
+    assert importlib.metadata.version("cdp-sdk") == pinned
+
+    wallet = build_cdp_wallet("55" * 64)
+    restored = _restore_wallet(json.loads(json.dumps(_snapshot_wallet(wallet))), "55" * 64)
+
+    assert restored.default_address.address_id == wallet.default_address.address_id
+    assert restored.can_sign
+
+
+def test_mnemonic_seed_matches_bip39_vector():
+    """Test mnemonic seed derivation against the BIP-39 reference vector."""
+    assert _mnemonic_seed(" ".join(["abandon"] * 11 + ["about"])) == (
+        "5eb00bbddcf069084889a8ab9155568165f5c453ccb85e70811aaed6f6da5fc1"
+        "9a5ac40b389cd370d086206dec8aa6c43daea6690f20ad3d8d48b2d2ce9e38e4"
+    )
+
+
+def test_send_transaction_pipelines_local_nonces(cdp_wallet_provider_factory):
+    """Test that back to back sends use consecutive nonces from one pending count read."""
+    provider = cdp_wallet_provider_factory(local_signing=True)
+    provider._web3 = Mock()
+    provider._web3.eth.get_transaction_count.return_value = 5
+    transaction = {"to": MOCK_ACCOUNT.address, "value": 1, "gas": 21000}
+
+    with (
+        patch.object(provider, "_estimate_fees", return_value=(1, 2)),
+        patch("coinbase_agentkit.wallet_providers.cdp_wallet_provider.ExternalAddress"),
+    ):
+        first = dict(transaction)
+        second = dict(transaction)
+        provider.send_transaction(first)
+        provider.send_transaction(second)
+
+    assert (first["nonce"], second["nonce"]) == (5, 6)
+    provider._web3.eth.get_transaction_count.assert_called_once_with(
+        MOCK_ACCOUNT.address, "pending"
+    )
+    provider._web3.eth.estimate_gas.assert_not_called()
+
+
+def test_send_transaction_failure_resets_nonce(cdp_wallet_provider_factory):
+    """Test that a failed broadcast makes the next send read the nonce from the network."""
+    provider = cdp_wallet_provider_factory(local_signing=True)
+    provider._web3 = Mock()
+    provider._web3.eth.get_transaction_count.side_effect = [5, 5]
+    transaction = {"to": MOCK_ACCOUNT.address, "value": 1, "gas": 21000}
+
+    with (
+        patch.object(provider, "_estimate_fees", return_value=(1, 2)),
+        patch(
+            "coinbase_agentkit.wallet_providers.cdp_wallet_provider.ExternalAddress"
+        ) as mock_external_address,
+    ):
+        broadcast = mock_external_address.return_value.broadcast_external_transaction
+        broadcast.side_effect = [Exception("broadcast failed"), Mock()]
+
+        with pytest.raises(Exception, match="broadcast failed"):
+            provider.send_transaction(dict(transaction))
+        retried = dict(transaction)
+        provider.send_transaction(retried)
+
+    assert retried["nonce"] == 5
+
+
+def test_trade_drops_cached_balance(cdp_wallet_provider_factory, mock_cdp_wallet):
+    """Test that a trade makes the next balance read go through the CDP API in the same block."""
+    provider = cdp_wallet_provider_factory()
+    provider._web3 = Mock()
+    provider._web3.eth.block_number = 10
+    mock_cdp_wallet.balance.side_effect = [1, 2]
+
+    assert provider.get_balance() == Web3.to_wei(1, "ether")
+    assert provider.get_balance() == Web3.to_wei(1, "ether")
+    provider.trade("1", "eth", "usdc")
+
+    assert provider.get_balance() == Web3.to_wei(2, "ether")
+    assert mock_cdp_wallet.balance.call_count == 2
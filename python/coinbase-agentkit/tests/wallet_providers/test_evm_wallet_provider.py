@@ -0,0 +1,118 @@
+"""Tests for the default implementations of the EVM wallet provider base class."""
+
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+
+from coinbase_agentkit.network import Network
+from coinbase_agentkit.wallet_providers import EvmWalletProvider
+
+MOCK_ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+class MinimalEvmWalletProvider(EvmWalletProvider):
+    """A provider implementing only the methods every EVM wallet provider must implement."""
+
+    def __init__(self, network: Network):
+        self._network = network
+
+    def get_address(self) -> str:
+        """Get the wallet address."""
+        return MOCK_ADDRESS
+
+    def get_network(self) -> Network:
+        """Get the current network."""
+        return self._network
+
+    def get_balance(self) -> Decimal:
+        """Get the wallet balance in native currency."""
+        return Decimal(0)
+
+    def get_name(self) -> str:
+        """Get the name of the wallet provider."""
+        return "minimal_wallet_provider"
+
+    def native_transfer(self, to: str, value: Decimal) -> str:
+        """Transfer the native asset of the network."""
+        raise NotImplementedError
+
+    def sign_message(self, message):
+        """Sign a message using the wallet's private key."""
+        raise NotImplementedError
+
+    def sign_typed_data(self, typed_data):
+        """Sign typed data according to EIP-712 standard."""
+        raise NotImplementedError
+
+    def sign_transaction(self, transaction):
+        """Sign an EVM transaction."""
+        raise NotImplementedError
+
+    def send_transaction(self, transaction):
+        """Send a signed transaction to the network."""
+        raise NotImplementedError
+
+    def wait_for_transaction_receipt(self, tx_hash, timeout=120, poll_latency=0.1):
+        """Wait for transaction confirmation and return receipt."""
+        raise NotImplementedError
+
+    def read_contract(
+        self, contract_address, abi, function_name, args=None, block_identifier="latest"
+    ):
+        """Read data from a smart contract."""
+        raise NotImplementedError
+
+
+@pytest.fixture
+def base_sepolia_provider():
+    """Create a minimal provider on Base Sepolia identified by chain ID only."""
+    return MinimalEvmWalletProvider(Network(protocol_family="evm", chain_id="84532"))
+
+
+def test_estimate_gas_defaults_to_network_rpc(base_sepolia_provider):
+    """Test that subclasses without estimate_gas estimate through the network's RPC endpoint."""
+    with patch(
+        "coinbase_agentkit.wallet_providers.evm_wallet_provider.estimate_gas_batch",
+        return_value=[21000],
+    ) as mock_estimate_gas_batch:
+        assert base_sepolia_provider.estimate_gas([{"to": MOCK_ADDRESS}]) == [21000]
+
+    web3, transactions = mock_estimate_gas_batch.call_args.args
+    assert web3.provider.endpoint_uri == "https://sepolia.base.org"
+    assert transactions == [{"to": MOCK_ADDRESS, "from": MOCK_ADDRESS}]
+    assert base_sepolia_provider._default_web3() is web3
+
+
+def test_default_web3_requires_known_network():
+    """Test that the defaults fail clearly on networks without a known RPC endpoint."""
+    provider = MinimalEvmWalletProvider(Network(protocol_family="evm", chain_id="999999"))
+
+    with pytest.raises(ValueError, match="No default RPC endpoint for network 999999"):
+        provider.estimate_gas([{"to": MOCK_ADDRESS}])
+
+
+def test_call_defaults_to_network_rpc(base_sepolia_provider):
+    """Test that subclasses without call execute calls through the network's RPC endpoint."""
+    web3 = Mock()
+    web3.eth.call.return_value = b"\x01"
+
+    with patch.object(base_sepolia_provider, "_default_web3", return_value=web3):
+        result = base_sepolia_provider.call({"to": MOCK_ADDRESS, "data": "0x"}, 123)
+
+    assert result == b"\x01"
+    web3.eth.call.assert_called_once_with({"to": MOCK_ADDRESS, "data": "0x"}, 123)
+
+
+def test_block_reads_default_to_network_rpc(base_sepolia_provider):
+    """Test that subclasses without block reads make them through the network's RPC endpoint."""
+    web3 = Mock()
+    web3.eth.block_number = 42
+    web3.eth.get_logs.return_value = ({"blockNumber": 41},)
+    filter_params = {"fromBlock": 40, "toBlock": 42, "topics": []}
+
+    with patch.object(base_sepolia_provider, "_default_web3", return_value=web3):
+        assert base_sepolia_provider.get_block_number() == 42
+        assert base_sepolia_provider.get_logs(filter_params) == [{"blockNumber": 41}]
+
+    web3.eth.get_logs.assert_called_once_with(filter_params)
@@ -0,0 +1,100 @@
+"""Tests for base fee estimation."""
+
+from unittest.mock import Mock
+
+import pytest
+from web3.exceptions import Web3RPCError
+
+from coinbase_agentkit.wallet_providers.fee_estimation import get_base_fee_per_gas
+
+
+def mock_web3(endpoint_uri: str) -> Mock:
+    """Create a mock web3 instance connected to the given endpoint."""
+    web3 = Mock()
+    web3.provider.endpoint_uri = endpoint_uri
+    web3.eth.fee_history.return_value = {"baseFeePerGas": [100, 110]}
+    web3.eth.gas_price = 120
+    web3.eth.get_block.return_value = {"baseFeePerGas": 100}
+    return web3
+
+
+def test_uses_fee_history_when_supported():
+    """Test that eth_feeHistory is preferred and reads the next block's base fee."""
+    web3 = mock_web3("https://fee-history.example")
+
+    assert get_base_fee_per_gas(web3) == 110
+
+    web3.eth.fee_history.assert_called_once_with(1, "latest")
+    web3.eth.get_block.assert_not_called()
+
+
+def test_falls_back_to_gas_price_and_remembers_it():
+    """Test that the detected method is reused for later calls on the same endpoint."""
+    web3 = mock_web3("https://gas-price.example")
+    web3.eth.fee_history.side_effect = Exception("method not found")
+
+    assert get_base_fee_per_gas(web3) == 120
+    assert get_base_fee_per_gas(web3) == 120
+
+    web3.eth.fee_history.assert_called_once()
+    web3.eth.get_block.assert_not_called()
+
+
+def test_falls_back_to_latest_block():
+    """Test that the full block is only read when nothing else is supported."""
+    web3 = Mock()
+    web3.provider.endpoint_uri = "https://block.example"
+    web3.eth.fee_history.side_effect = Exception("method not found")
+    type(web3.eth).gas_price = property(Mock(side_effect=Exception("method not found")))
+    web3.eth.get_block.return_value = {"baseFeePerGas": 100}
+
+    assert get_base_fee_per_gas(web3) == 100
+
+    web3.eth.get_block.assert_called_once_with("latest")
+
+
+def test_redetects_when_method_becomes_unsupported():
+    """Test that a detected method reported as not implemented triggers detection again."""
+    web3 = mock_web3("https://migrated.example")
+    assert get_base_fee_per_gas(web3) == 110
+
+    web3.eth.fee_history.side_effect = Web3RPCError(
+        "the method eth_feeHistory does not exist/is not available",
+        rpc_response={"jsonrpc": "2.0", "id": 1, "error": {"code": -32601, "message": "x"}},
+    )
+
+    assert get_base_fee_per_gas(web3) == 120
+    assert get_base_fee_per_gas(web3) == 120
+    assert web3.eth.fee_history.call_count == 3
+
+
+def test_transient_errors_do_not_change_detected_method():
+    """Test that errors other than unsupported methods are raised without downgrading."""
+    web3 = mock_web3("https://flaky.example")
+    web3.eth.fee_history.side_effect = TimeoutError("read timed out")
+
+    with pytest.raises(TimeoutError):
+        get_base_fee_per_gas(web3)
+
+    web3.eth.fee_history.side_effect = [
+        {"baseFeePerGas": [100, 110]},
+        TimeoutError("read timed out"),
+        {"baseFeePerGas": [1, 2]},
+    ]
+
+    assert get_base_fee_per_gas(web3) == 110
+    with pytest.raises(TimeoutError):
+        get_base_fee_per_gas(web3)
+    assert get_base_fee_per_gas(web3) == 2
+
+
+def test_raises_when_nothing_is_supported():
+    """Test that an error is raised when no method works."""
+    web3 = Mock()
+    web3.provider.endpoint_uri = "https://broken.example"
+    web3.eth.fee_history.side_effect = Exception("method not found")
+    type(web3.eth).gas_price = property(Mock(side_effect=Exception("method not found")))
+    web3.eth.get_block.side_effect = Exception("method not found")
+
+    with pytest.raises(Exception, match="Failed to estimate base fee"):
+        get_base_fee_per_gas(web3)
@@ -0,0 +1,69 @@
+"""Tests for local nonce tracking and batched gas estimation."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+from coinbase_agentkit.wallet_providers.gas_estimation import estimate_gas_batch
+from coinbase_agentkit.wallet_providers.nonce_manager import NonceManager
+
+MOCK_ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+def test_nonces_are_allocated_locally():
+    """Test that the pending count is read once and later nonces are consecutive."""
+    get_pending_transaction_count = Mock(return_value=7)
+    nonce_manager = NonceManager(get_pending_transaction_count)
+
+    assert [nonce_manager.next_nonce() for _ in range(3)] == [7, 8, 9]
+    get_pending_transaction_count.assert_called_once()
+
+
+def test_reset_reads_nonce_from_network_again():
+    """Test that a reset resynchronizes the nonce with the network."""
+    get_pending_transaction_count = Mock(side_effect=[7, 8])
+    nonce_manager = NonceManager(get_pending_transaction_count)
+
+    assert nonce_manager.next_nonce() == 7
+    assert nonce_manager.next_nonce() == 8
+    nonce_manager.reset()
+
+    assert nonce_manager.next_nonce() == 8
+    assert get_pending_transaction_count.call_count == 2
+
+
+def test_idle_account_resyncs_from_network():
+    """Test that a nonce allocated after an idle period is read from the network again."""
+    # A transaction with nonce 8 was dropped, so the pending count went back to 8
+    get_pending_transaction_count = Mock(side_effect=[7, 8])
+    nonce_manager = NonceManager(get_pending_transaction_count, idle_resync_interval=3)
+
+    with patch(
+        "coinbase_agentkit.wallet_providers.nonce_manager.time.monotonic",
+        side_effect=[100, 101, 103.5, 110],
+    ):
+        assert nonce_manager.next_nonce() == 7
+        assert nonce_manager.next_nonce() == 8
+        assert nonce_manager.next_nonce() == 9
+        assert nonce_manager.next_nonce() == 8
+
+    assert get_pending_transaction_count.call_count == 2
+
+
+def test_estimate_gas_batch_uses_one_batch_request():
+    """Test that several transactions are estimated in one batch request."""
+    web3 = MagicMock()
+    batch = web3.batch_requests.return_value.__enter__.return_value
+    batch.execute.return_value = [21000, 50000]
+    transactions = [{"from": MOCK_ADDRESS, "to": MOCK_ADDRESS}] * 2
+
+    assert estimate_gas_batch(web3, transactions) == [21000, 50000]
+    assert batch.add.call_count == 2
+
+
+def test_estimate_gas_batch_falls_back_to_individual_requests():
+    """Test that estimates are made one by one when batching is not supported."""
+    web3 = Mock()
+    web3.batch_requests.side_effect = Exception("batching not supported")
+    web3.eth.estimate_gas.side_effect = [21000, 50000]
+    transactions = [{"from": MOCK_ADDRESS, "to": MOCK_ADDRESS}] * 2
+
+    assert estimate_gas_batch(web3, transactions) == [21000, 50000]
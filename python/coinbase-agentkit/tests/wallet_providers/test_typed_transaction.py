@@ -0,0 +1,97 @@
+"""Tests for EIP-1559 transaction encoding."""
+
+import pytest
+from eth_account import Account
+from eth_account.typed_transactions import DynamicFeeTransaction
+
+from coinbase_agentkit.wallet_providers.typed_transaction import encode_dynamic_fee_transaction
+
+MOCK_PRIVATE_KEY = "0x" + "11" * 32
+MOCK_TO = "0x5555555555555555555555555555555555555555"
+
+
+def transaction_params(**overrides):
+    """Build a prepared EIP-1559 transaction."""
+    params = {
+        "type": 2,
+        "chainId": 84532,
+        "nonce": 7,
+        "maxPriorityFeePerGas": 100_000_000,
+        "maxFeePerGas": 1_100_000_000,
+        "gas": 65_000,
+        "to": MOCK_TO,
+        "value": 10**15,
+        "data": "0xa9059cbb",
+    }
+    params.update(overrides)
+    return params
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {"data": "0x", "value": 0},
+        {"to": bytes.fromhex(MOCK_TO[2:]), "data": bytes.fromhex("a9059cbb")},
+        {"accessList": [{"address": MOCK_TO, "storageKeys": ["0x" + "00" * 32]}]},
+        # Fields shorter than 56 bytes take a single-byte list prefix
+        {
+            "chainId": 1,
+            "nonce": 0,
+            "maxPriorityFeePerGas": 1,
+            "maxFeePerGas": 2,
+            "gas": 21_000,
+            "value": 0,
+            "data": "0x",
+        },
+        # Fields longer than 255 bytes take a multi-byte length in the list prefix
+        {"data": "0x" + "ab" * 300},
+    ],
+)
+def test_signing_hash_matches_eth_account(overrides):
+    """Test that the signing hash matches eth-account's typed transaction hash."""
+    params = transaction_params(**overrides)
+    expected = DynamicFeeTransaction.from_dict(
+        {
+            **params,
+            "to": params["to"]
+            if isinstance(params["to"], bytes)
+            else bytes.fromhex(params["to"][2:]),
+            "data": params["data"]
+            if isinstance(params["data"], bytes)
+            else bytes.fromhex(params["data"][2:]),
+            "accessList": params.get("accessList", []),
+        }
+    ).hash()
+
+    assert encode_dynamic_fee_transaction(params).signing_hash() == expected
+
+
+def test_signed_payload_matches_eth_account():
+    """Test that the signed payload matches a transaction signed by eth-account."""
+    params = transaction_params()
+    account = Account.from_key(MOCK_PRIVATE_KEY)
+    expected = account.sign_transaction(params).raw_transaction
+
+    encoded = encode_dynamic_fee_transaction(params)
+    signed_hash = account.unsafe_sign_hash(encoded.signing_hash())
+
+    assert encoded.signed(signed_hash.signature) == bytes(expected)
+
+
+def test_signed_accepts_zero_based_recovery_id():
+    """Test that v is accepted as either 27/28 or 0/1."""
+    encoded = encode_dynamic_fee_transaction(transaction_params())
+    signature = Account.from_key(MOCK_PRIVATE_KEY).unsafe_sign_hash(encoded.signing_hash())
+    raw_signature = bytes(signature.signature)
+    zero_based = raw_signature[:64] + bytes([raw_signature[64] - 27])
+
+    assert encoded.signed(zero_based) == encoded.signed(raw_signature)
+
+
+def test_signed_rejects_invalid_signature_length():
+    """Test that a malformed signature is rejected."""
+    encoded = encode_dynamic_fee_transaction(transaction_params())
+
+    with pytest.raises(ValueError, match="Invalid signature length"):
+        encoded.signed(b"\x00" * 64)